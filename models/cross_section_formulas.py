@@ -0,0 +1,3689 @@
+"""
+The BKM10 cross-section, written once for any array library. The formulas of the
+CrossSectionLayer live here, in a class that does all of its arithmetic through
+`self.xp`, the array namespace of a backend: TensorFlow for the Keras layer in
+`models/architecture.py`, and NumPy for the one in `models/numpy_backend.py`.
+Nothing in this file imports TensorFlow.
+"""
+
+# 3rd Party Library | NumPy
+import numpy as np
+
+from statics.constants import _MASS_OF_PROTON_IN_GEV, _ELECTROMAGNETIC_FINE_STRUCTURE_CONSTANT, _ELECTRIC_FORM_FACTOR_CONSTANT, _PROTON_MAGNETIC_MOMENT
+
+SETTING_VERBOSE = True
+SETTING_DEBUG = False
+
+# (X): The names of the twelve CFF-independent weights on the curly C's, in the
+# | order returned by `CrossSectionLayer.calculate_interference_harmonic_weights`:
+_INTERFERENCE_WEIGHT_FIELDS = (
+    "weight_c", "weight_c_v", "weight_c_a", "weight_c_eff", "weight_c_v_eff", "weight_c_a_eff",
+    "weight_s", "weight_s_v", "weight_s_a", "weight_s_eff", "weight_s_v_eff", "weight_s_a_eff")
+
+# (X): The number of CFFs that come out of the DNN:
+_NUMBER_OF_CFFS = 8
+
+# (X): The entries of the 8 x 8 matrix of the |DVCS|² bilinear form, row by row --- see
+# | `CrossSectionLayer.calculate_dvcs_bilinear_form`:
+_DVCS_MATRIX_FIELDS = tuple(
+    f"dvcs_matrix_{row}_{column}"
+    for row in range(_NUMBER_OF_CFFS)
+    for column in range(_NUMBER_OF_CFFS))
+
+# (X): The columns of a kinematic bundle, in order --- see `CrossSectionLayer.precompute_kinematic_bundle`:
+_KINEMATIC_BUNDLE_FIELDS = (
+    ("q_squared", "x_bjorken", "t", "xi", "f1", "f2") +
+    _INTERFERENCE_WEIGHT_FIELDS +
+    ("bh_contribution", "lepton_propagator_product") +
+    _DVCS_MATRIX_FIELDS)
+
+# (X): The number of columns of a design matrix --- see `CrossSectionLayer.precompute_design_matrix`:
+_NUMBER_OF_DESIGN_MATRIX_COLUMNS = 2 * _NUMBER_OF_CFFS + 1 + _NUMBER_OF_CFFS**2
+
+# (X): The harmonics of the cross-section in the (Trento) angle π - φ, in the order
+# | returned by `CrossSectionLayer.compute_fourier_harmonics`:
+_FOURIER_HARMONICS = ("cos_0", "cos_1", "cos_2", "cos_3", "sin_1", "sin_2", "sin_3")
+
+# (X): The number of equally-spaced φ nodes that the harmonics are projected from. Anything
+# | above twice the highest harmonic (3) makes the projection exact:
+_NUMBER_OF_FOURIER_NODES = 8
+
+# (X): The lepton beam charges that the CrossSectionLayer understands: electrons (-1) and positrons (+1):
+_LEPTON_BEAM_CHARGES = (-1.0, 1.0)
+
+# (X): The floating-point policies that the CrossSectionLayer understands --- see its `precision` argument:
+_PRECISION_POLICIES = ("float32", "float64", "mixed")
+
+
+def backend_function(method):
+    """
+    ## Description:
+    Mark a formula that the TensorFlow backend runs as a `tf.function(reduce_retracing = True)`
+    --- see `models.architecture`. The NumPy backend runs it as it is.
+    """
+    method.is_backend_function = True
+
+    return method
+
+class CrossSectionFormulas:
+    """
+    ## Description:
+    Everything that goes into the cross-section: the settings of the layer, the
+    kinematics, the form factors, every c_{n} and s_{n}, the kinematic bundle, the
+    design matrix, and the φ harmonics. A backend subclasses this and sets `xp`.
+    """
+
+    # (X): The array namespace of the backend, e.g. `tf`:
+    xp = None
+
+    def __init__(
+            self,
+            target_polarization = 0.0,
+            lepton_beam_polarization = 0.0,
+            lepton_beam_charge = -1.0,
+            polarization_channels = None,
+            using_ww = True,
+            jit_compile = False,
+            use_kinematic_bundle = False,
+            use_design_matrix = False,
+            precision = "float32",
+            analytic_cff_gradient = False,
+            **kwargs):
+        
+        # (1): Inherit the properties of the backend's layer class:
+        super().__init__(**kwargs)
+
+        # (2): Obtain the target polarization --- the layer only has the unpolarized-target BKM10 coefficients:
+        if target_polarization != 0.:
+            raise NotImplementedError(f"> [ERROR]: The target polarization you have chosen, {target_polarization}, is not supported.")
+
+        self.target_polarization = target_polarization
+
+        # (3): Obtain the beam polarization:
+        self.lepton_beam_polarization = lepton_beam_polarization
+
+        # (3.1): Obtain the beam charge --- -1 for electrons, +1 for positrons:
+        if lepton_beam_charge not in _LEPTON_BEAM_CHARGES:
+            raise ValueError(f"> [ERROR]: The lepton beam charge must be one of {_LEPTON_BEAM_CHARGES}, not {lepton_beam_charge}.")
+
+        self.lepton_beam_charge = lepton_beam_charge
+
+        # (3.2): Optionally, *several* (beam helicity, beam charge) configurations,
+        # | which the layer then returns side by side --- see `combine_cross_section_parts`:
+        self.polarization_channels = self.validate_polarization_channels(polarization_channels)
+
+        # (4): Decide if we're using the WW relations:
+        self.using_ww = using_ww
+
+        # (5): Decide if we lower the entire cross-section computation into one XLA kernel
+        # | (only the TensorFlow backend can):
+        self.jit_compile = jit_compile
+
+        # (6): Decide if the layer receives a precomputed kinematic bundle instead of [Q², x_B, t, k, φ]:
+        self.use_kinematic_bundle = use_kinematic_bundle
+
+        # (7): ... or a precomputed design matrix:
+        self.use_design_matrix = use_design_matrix
+
+        if self.use_kinematic_bundle and self.use_design_matrix:
+            raise ValueError("> [ERROR]: Choose *one* of `use_kinematic_bundle` and `use_design_matrix`.")
+
+        # (8): The number of leading input columns that are *not* CFFs:
+        if self.use_design_matrix:
+            self.number_of_kinematic_inputs = _NUMBER_OF_DESIGN_MATRIX_COLUMNS
+        elif self.use_kinematic_bundle:
+            self.number_of_kinematic_inputs = len(_KINEMATIC_BUNDLE_FIELDS)
+        else:
+            self.number_of_kinematic_inputs = 5
+
+        # (9): Decide the floating-point type that the cross-section is computed in:
+        # | "float32": everything in float32,
+        # | "float64": everything in float64,
+        # | "mixed": float32, except for t_min and K̃, which are computed in float64.
+        if precision not in _PRECISION_POLICIES:
+            raise ValueError(f"> [ERROR]: Unknown precision policy '{precision}'. Choose one of {_PRECISION_POLICIES}.")
+
+        self.precision = precision
+        self.kernel_dtype = self.xp.float64 if self.precision == "float64" else self.xp.float32
+
+        # (10): Decide if backpropagation uses the closed-form ∂σ/∂CFF instead of autodiff
+        # | --- see `compute_cross_section_parts_with_analytic_gradient`:
+        self.analytic_cff_gradient = analytic_cff_gradient
+
+    def get_config(self):
+        """
+        ## Description:
+        Required so that `.keras` files remember how the layer was configured
+        --- in particular, what the layer expects as inputs.
+        """
+        config = super().get_config()
+        config.update({
+            "target_polarization": self.target_polarization,
+            "lepton_beam_polarization": self.lepton_beam_polarization,
+            "lepton_beam_charge": self.lepton_beam_charge,
+            "polarization_channels": self.polarization_channels,
+            "using_ww": self.using_ww,
+            "jit_compile": self.jit_compile,
+            "use_kinematic_bundle": self.use_kinematic_bundle,
+            "use_design_matrix": self.use_design_matrix,
+            "precision": self.precision,
+            "analytic_cff_gradient": self.analytic_cff_gradient,
+        })
+        return config
+
+    def validate_polarization_channels(self, polarization_channels):
+        """
+        ## Description:
+        Check the (λ, e_ℓ) = (beam helicity, beam charge) configurations asked for
+        with `polarization_channels` and return them as a tuple of tuples of floats
+        --- or `None` if there are none.
+
+        ## Notes:
+        The target is always unpolarized: the layer only has the unpolarized-target
+        BKM10 coefficients, so there are no channels for a polarized target.
+        """
+
+        if polarization_channels is None:
+            return None
+
+        validated_channels = []
+
+        for channel in polarization_channels:
+
+            # (1): Every channel is a pair:
+            if len(channel) != 2:
+                raise ValueError(f"> [ERROR]: A polarization channel is a pair (beam helicity, beam charge), not {channel}.")
+
+            lepton_beam_polarization, lepton_beam_charge = (float(value) for value in channel)
+
+            if lepton_beam_polarization not in (-1.0, 0.0, 1.0):
+                raise ValueError(f"> [ERROR]: The lepton beam polarization of a channel must be -1, 0, or +1, not {lepton_beam_polarization}.")
+
+            if lepton_beam_charge not in _LEPTON_BEAM_CHARGES:
+                raise ValueError(f"> [ERROR]: The lepton beam charge of a channel must be one of {_LEPTON_BEAM_CHARGES}, not {lepton_beam_charge}.")
+
+            validated_channels.append((lepton_beam_polarization, lepton_beam_charge))
+
+        if len(validated_channels) == 0:
+            raise ValueError("> [ERROR]: Ask for at least one polarization channel.")
+
+        return tuple(validated_channels)
+
+    def call(self, inputs):
+        """
+        ## Description:
+        This function is *required* in order to tell TF what to do when we register this
+        as a layer of some ANN. It should contain all the logic that is needed. Our goal here 
+        is to anticipate the passage of 5 + 4 different values --- in order, they are: lepton
+        beam energy, photon virtuality, Bjorken x, hadronic momentum transfer, the azimuthal 
+        angle phi, and the four CFFs. With these 9 inputs, we *compute* a single output that 
+        we call the cross section.
+        """
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Received inputs: {inputs}")
+        
+        # (0): Remember what came in --- the cross-section goes out in the same dtype:
+        input_dtype = inputs.dtype
+        inputs = self.xp.cast(inputs, self.kernel_dtype)
+
+        # (1): Extract only the kinematics, which are *in order*: [Q², x_B, t, k, φ]
+        # | (or the kinematic bundle, in the order of `_KINEMATIC_BUNDLE_FIELDS`):
+        kinematics = inputs[..., :self.number_of_kinematic_inputs]
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Extracted kinematics part of TF layer inputs: {kinematics}")
+
+        # (2): Extract only the CFFs, what are *in order*: [Re[H], Im[H], Re[Ht], Im[Ht], Re[E], Im[H], Re[Et], Im[Et]]:
+        cffs = inputs[..., self.number_of_kinematic_inputs:]
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Extracted CFF part of TF layer inputs: {cffs}")
+
+        # (3): To please TF, concatenate the inputs first:
+        concatenated_layer_input = [kinematics, cffs]
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Casted/concatenated kinematics and CFFs for passage into TF layer: {concatenated_layer_input}")
+
+        # (4): Immediately pass the concatenated array into the layer's "computation function":
+        if self.jit_compile:
+            differential_cross_section = self.compute_cross_section_compiled(kinematics, cffs)
+        else:
+            differential_cross_section = self.compute_cross_section(concatenated_layer_input)
+
+        # (Note): We were not able to successfully use the bkm10 library here due to its complicated
+        # | use of the native `complex` class. When `complex` multiplies floats in standard Python or
+        # | NumPy, everything is fine. But when TF tries to do this, it requires that essentially
+        # | everything be `complex64` because the CFFs are of this type. It will require major 
+        # | refactoring in order to discard the use of the `complex` data type in the bkm10 lib, and
+        # | we do not have time at the moment to do it.
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed cross section values:\n{differential_cross_section}")
+
+        # (5): Return the computation: a *single value* for the cross-section (or one per polarization channel):
+        return self.xp.cast(differential_cross_section, input_dtype)
+    
+    @backend_function
+    def compute_cross_section(self, inputs):
+        """
+        ## Description:
+        Compute the cross-section for the lepton beam polarization and charge of
+        this layer --- or for every one of its `polarization_channels`. The coefficients
+        are only evaluated once, in `compute_cross_section_parts`, and the
+        configuration only decides how the three parts get combined:
+
+            σ(λ, e_ℓ) = σ_BH + σ_DVCS - e_ℓ (I_even + λ * I_odd)
+
+        so that an unpolarized beam (the average over λ = ±1) only needs I_even.
+        """
+
+        # (1): Compute the charge-even and the two interference parts of the cross-section:
+        cross_section_parts = self.compute_cross_section_parts(inputs)
+
+        # (2): Combine them for the configuration(s) of this layer:
+        return self.combine_cross_section_parts(cross_section_parts)
+
+    def combine_cross_section_parts(self, cross_section_parts):
+        """
+        ## Description:
+        Assemble the output of the layer from the output of `compute_cross_section_parts`:
+        a tensor of shape (N,) for the configuration of the layer, or, if the layer was
+        built with `polarization_channels`, one column per channel, (N, C). All of the
+        channels share the same three parts, so every extra channel costs two additions.
+        """
+
+        # (1): One configuration --- the one the layer was built with:
+        if self.polarization_channels is None:
+            return self.combine_polarization_channel(
+                cross_section_parts,
+                self.lepton_beam_polarization,
+                self.lepton_beam_charge)
+
+        # (2): Several configurations, side by side:
+        return self.xp.stack([
+            self.combine_polarization_channel(cross_section_parts, lepton_beam_polarization, lepton_beam_charge)
+            for lepton_beam_polarization, lepton_beam_charge in self.polarization_channels],
+            axis = -1)
+
+    def combine_polarization_channel(
+            self,
+            cross_section_parts,
+            lepton_beam_polarization,
+            lepton_beam_charge):
+        """
+        ## Description:
+        σ(λ, e_ℓ) = σ_BH + σ_DVCS - e_ℓ (I_even + λ * I_odd) for one configuration.
+
+        ## Notes:
+        The interference is the only term that is odd in the lepton charge e_ℓ,
+        and the BKM10 coefficients are written for an electron beam, e_ℓ = -1.
+        """
+
+        # (1): Unpack the three parts:
+        cross_section_charge_even, interference_even, interference_odd = cross_section_parts
+
+        if lepton_beam_polarization == 0.:
+
+            if SETTING_DEBUG:
+                print(f"> [DEBUG]: Lepton beam detected to be unpolarized: {lepton_beam_polarization}")
+
+            # (2): The helicity-odd part averages out:
+            interference = interference_even
+
+        elif lepton_beam_polarization in (1.0, -1.0):
+
+            if SETTING_DEBUG:
+                print(f"> [DEBUG]: Lepton beam detected to be polarized: {lepton_beam_polarization}")
+
+            # (3): Add the helicity-odd part with the right sign:
+            interference = interference_even + self.xp.constant(lepton_beam_polarization, dtype = self.kernel_dtype) * interference_odd
+
+        else:
+
+            raise NotImplementedError(f"> [ERROR]: The lepton beam value you have chosen, {lepton_beam_polarization}, is not supported.")
+
+        # (4): An electron beam takes the interference as it is; a positron beam flips it:
+        if lepton_beam_charge == -1.0:
+            return cross_section_charge_even + interference
+
+        return cross_section_charge_even - interference
+
+    @backend_function
+    def compute_cross_section_helicity_parts(self, inputs):
+        """
+        ## Description:
+        The cross-section for the beam charge of this layer in two pieces: the
+        part that does not depend on the lepton helicity and the part that is
+        linear in it (evaluated at λ = +1).
+        """
+
+        # (1): The three parts of the cross-section:
+        cross_section_charge_even, interference_even, interference_odd = self.compute_cross_section_parts(inputs)
+
+        # (2): An electron beam takes the interference as it is; a positron beam flips it:
+        if self.lepton_beam_charge == -1.0:
+            return cross_section_charge_even + interference_even, interference_odd
+
+        return cross_section_charge_even - interference_even, -interference_odd
+
+    @backend_function
+    def compute_cross_section_parts(self, inputs):
+        """
+        ## Description:
+        This is a *panic* function that will compute ALL of the required
+        coefficients that go into the cross section *and* the cross-section
+        itself. The cross-section comes back in three pieces, from which
+        every beam helicity and beam charge follows:
+
+            1. σ_BH + σ_DVCS, which depends on neither,
+            2. I_even, the helicity-independent part of the interference, and
+            3. I_odd, the part of the interference that is linear in λ (at λ = +1),
+
+        for an electron beam.
+
+        ## Notes:
+        If the layer was built with `use_kinematic_bundle = True`, then the
+        first of the `inputs` is *already* the output of `precompute_kinematic_bundle`.
+        With `use_design_matrix = True`, it is the output of `precompute_design_matrix`.
+        Otherwise, we compute the bundle here, on every call.
+
+        With `analytic_cff_gradient = True`, the parts always come from a design
+        matrix (built from the bundle if need be), with their closed-form gradient.
+        """
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Received inputs: {inputs}")
+
+        # (1): Unpack the inputs into the CFFs and the kinematics (or the kinematic bundle):
+        kinematics, cffs = inputs
+
+        # (X): With a design matrix, the whole thing is two dot products and one quadratic form:
+        if self.use_design_matrix:
+            design_matrix = kinematics
+
+        else:
+
+            # (2): Obtain everything that does not depend on the CFFs:
+            if self.use_kinematic_bundle:
+                kinematic_bundle = kinematics
+            else:
+                kinematic_bundle = self.precompute_kinematic_bundle(kinematics)
+
+            # (3): Do the CFF-dependent arithmetic:
+            if not self.analytic_cff_gradient:
+                return self.compute_cross_section_parts_from_bundle([kinematic_bundle, cffs])
+
+            # (3.1): ... or turn the bundle into a design matrix first:
+            design_matrix = self.compute_design_matrix_from_bundle(kinematic_bundle)
+
+        if self.analytic_cff_gradient:
+            return self.compute_cross_section_parts_with_analytic_gradient(design_matrix, cffs)
+
+        return self.compute_cross_section_parts_from_design_matrix([design_matrix, cffs])
+
+    @backend_function
+    def precompute_kinematic_bundle(self, kinematics):
+        """
+        ## Description:
+        Evaluate everything in the cross-section that depends *only* on the
+        kinematics [Q², x_B, t, k, φ] --- ε, y, ξ, t_min, t', K̃, K, k.Δ, the 
+        propagators, the form factors, every c_{n} and s_{n}, and the prefactors ---
+        and pack it into one tensor of shape (N, len(_KINEMATIC_BUNDLE_FIELDS)).
+
+        In a fit, the kinematics never change, so this only needs to be done 
+        once per dataset. Feed the result to a layer built with 
+        `use_kinematic_bundle = True` instead of the raw kinematics.
+
+        ## Notes:
+        The columns are in the order of `_KINEMATIC_BUNDLE_FIELDS`. The twelve
+        harmonic weights already include the BKM10 prefactor, the interference
+        prefactor, and the conversion to nb/GeV⁴. So do the BH term and the
+        64 entries of the |DVCS|² matrix. The product of the lepton propagators,
+        P_{1} P_{2}, is kept for `compute_fourier_harmonics`.
+        """
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Obtained kinematics from inputs: {kinematics}")
+
+        # (3): Extract the kinematics from the DNN:
+        q_squared, x_bjorken, t, k, phi = self.xp.unstack(kinematics, axis = -1)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Unstacked kinematics\n> {q_squared, x_bjorken, t, k, phi}")
+
+        # (4): Compute epsilon:
+        epsilon = self.calculate_kinematics_epsilon(q_squared, x_bjorken)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed epsilon: {epsilon[0]}")
+
+        # (5): Compute "y":
+        y = self.calculate_kinematics_lepton_energy_fraction_y(q_squared, k, epsilon)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed lepton_energy_fraction: {y[0]}")
+
+        # (6): Comute skewness "xi":
+        xi = self.calculate_kinematics_skewness_parameter(q_squared, x_bjorken, t)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed skewness: {xi[0]}")
+
+        # (7): Calculate t_minimum
+        if self.precision == "mixed":
+            t_min_float64 = self.calculate_kinematics_t_min(
+                self.xp.cast(q_squared, self.xp.float64), self.xp.cast(x_bjorken, self.xp.float64), self.xp.cast(epsilon, self.xp.float64))
+            t_min = self.xp.cast(t_min_float64, self.kernel_dtype)
+        else:
+            t_min = self.calculate_kinematics_t_min(q_squared, x_bjorken, epsilon)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed t mimumum: {t_min[0]}")
+
+        # (8): Calculate t':
+        t_prime = self.calculate_kinematics_t_prime(t, t_min)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed t prime: {t_prime[0]}")
+
+        # (9): Calculate Ktilde:
+        if self.precision == "mixed":
+            k_tilde = self.xp.cast(self.calculate_kinematics_k_tilde(
+                self.xp.cast(q_squared, self.xp.float64), self.xp.cast(x_bjorken, self.xp.float64), self.xp.cast(y, self.xp.float64),
+                self.xp.cast(t, self.xp.float64), self.xp.cast(epsilon, self.xp.float64), t_min_float64), self.kernel_dtype)
+        else:
+            k_tilde = self.calculate_kinematics_k_tilde(q_squared, x_bjorken, y, t, epsilon, t_min)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed K tilde: {k_tilde[0]}")
+
+        # (10): Calculate K:
+        capital_k = self.calculate_kinematics_k(q_squared, y, epsilon, k_tilde)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed K: {capital_k[0]}")
+
+        # (11): Calculate k.delta:
+        k_dot_delta = self.calculate_k_dot_delta(q_squared, x_bjorken, t, phi, epsilon, y, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed K.delta: {k_dot_delta}")
+
+        # (12): Calculate P_{1}:
+        p1 = self.calculate_lepton_propagator_p1(q_squared, k_dot_delta)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed propagator p1: {p1}")
+
+        # (13): Calculate P_{2}:
+        p2 = self.calculate_lepton_propagator_p2(q_squared, t, k_dot_delta)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed propagator p2: {p2}")
+
+        # (14): Calculate the Electric Form Factor
+        fe = self.calculate_form_factor_electric(t)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed F_E: {fe[0]}")
+
+        # (15): Calculate the Magnetic Form Factor
+        fg = self.calculate_form_factor_magnetic(fe)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed F_G: {fg[0]}")
+
+        # (16): Calculate the Pauli Form Factor, F2:
+        f2 = self.calculate_form_factor_pauli_f2(t, fe, fg)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed F_2: {f2[0]}")
+
+        # (17): Calculate the Dirac Form Factor, F1:
+        f1 = self.calculate_form_factor_dirac_f1(fg, f2)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed F_1: {f1[0]}")
+
+        # (18): Calculate prefactor:
+        prefactor = self.calculate_bkm10_cross_section_prefactor(q_squared, x_bjorken, epsilon, y)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed BKM10 cross-section prefactor: {prefactor}")
+
+        # (X): Obtain the prefactor for the interference contribution:
+        interference_prefactor = self.xp.constant(1.0, dtype = self.kernel_dtype) / (x_bjorken * y**3 * t * p1 * p2)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed interference contribution prefactor: {interference_prefactor}")
+
+        # (19): Obtain the CFF-independent weights on each of the curly C's:
+        harmonic_weights = self.calculate_interference_harmonic_weights(
+            q_squared, x_bjorken, t, phi, epsilon, y, t_prime, k_tilde, capital_k)
+
+        # (20): Everything that multiplies the interference term, in nb/GeV⁴:
+        cross_section_scale = self.convert_to_nb_over_gev4(prefactor * interference_prefactor)
+
+        # (21): The |BH|² term does not depend on the CFFs at all:
+        bh_contribution = self.calculate_bethe_heitler_contribution(
+            q_squared, x_bjorken, t, phi, epsilon, y, capital_k, p1, p2, f1, f2)
+
+        # (22): The |DVCS|² term is a quadratic form in the CFFs --- keep its (N, 8, 8) matrix:
+        dvcs_matrix = self.calculate_dvcs_bilinear_form(q_squared, x_bjorken, t, phi, epsilon, y, xi, capital_k)
+
+        # (23): Stack everything in the order of `_KINEMATIC_BUNDLE_FIELDS`:
+        return self.xp.concat([
+            self.xp.stack(
+                [q_squared, x_bjorken, t, xi, f1, f2] +
+                [cross_section_scale * weight for weight in harmonic_weights] +
+                [bh_contribution, p1 * p2],
+                axis = -1),
+            self.xp.reshape(dvcs_matrix, [-1, len(_DVCS_MATRIX_FIELDS)])],
+            axis = -1)
+
+    @backend_function
+    def compute_cross_section_parts_from_bundle(self, inputs):
+        """
+        ## Description:
+        The CFF-dependent part of the cross-section: given the output of
+        `precompute_kinematic_bundle` and the eight CFFs, compute the three parts
+        of `compute_cross_section_parts` in nb/GeV⁴.
+        """
+
+        # (1): Unpack the bundle and the CFFs:
+        kinematic_bundle, cffs = inputs
+
+        # (2): The BH term was computed with the rest of the bundle:
+        bh_contribution = kinematic_bundle[..., _KINEMATIC_BUNDLE_FIELDS.index("bh_contribution")]
+
+        # (3): Compute the interference term:
+        interference_even, interference_odd = self.compute_interference_from_bundle(kinematic_bundle, cffs)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Calculated helicity-even and helicity-odd interference contributions: {interference_even}, {interference_odd}")
+
+        # (4): The |DVCS|² term, CFFs^T D CFFs:
+        # | (For an unpolarized target, it has no helicity-odd part --- see `calculate_dvcs_bilinear_form`.)
+        dvcs_contribution = self.contract_dvcs_bilinear_form(
+            kinematic_bundle[..., _KINEMATIC_BUNDLE_FIELDS.index(_DVCS_MATRIX_FIELDS[0]):],
+            cffs)
+
+        # (5): The part of the cross-section that is even in the beam charge:
+        cross_section_charge_even = bh_contribution + dvcs_contribution
+
+        # (X): A first pass of computing the cross section:
+        # cross_section = real_H**2 + imag_H**2 + tf.constant(0.5, dtype = tf.float32) * tf.cos(phi) * real_E + 0.1 * q_ssquared
+
+        # (X): A second pass of computing the cross section:
+        # | This is important: If you do not use *all* of the inputs given to the network, then
+        # | TensorFlow will complain that there is nothing to compute gradients with respect to.
+        # | This second pass revealed this. The earlier version of it did NOT include any CFFs,
+        # | and TensorFlow complained that there were no gradients. All we had to do was multiply by a 
+        # | single CFF, and everything worked.
+        # cross_section = (prefactor * c0pp_tf * tf.cos(0. * phi)) * real_H**2 + imag_H**2 + tf.constant(0.5, dtype = tf.fdloat32) * tf.cos(phi) * real_E + 0.1 * q_squared
+
+        return cross_section_charge_even, interference_even, interference_odd
+
+    @backend_function
+    def contract_dvcs_bilinear_form(self, flattened_dvcs_matrix, cffs):
+        """
+        ## Description:
+        The |DVCS|² term, CFFs^T D CFFs, from the 64 flattened entries of D
+        per point --- one `einsum` for the whole batch.
+        """
+        dvcs_matrix = self.xp.reshape(flattened_dvcs_matrix, [-1, _NUMBER_OF_CFFS, _NUMBER_OF_CFFS])
+
+        return self.xp.einsum("ni,nij,nj->n", cffs, dvcs_matrix, cffs)
+
+    @backend_function
+    def compute_interference_from_bundle(self, kinematic_bundle, cffs):
+        """
+        ## Description:
+        The interference term (helicity-even and helicity-odd parts, in nb/GeV⁴)
+        from a kinematic bundle and the eight CFFs. This is *linear* in the CFFs,
+        which is what `precompute_design_matrix` relies on.
+        """
+
+        # (1): Give the columns of the bundle their names back:
+        bundle = dict(zip(_KINEMATIC_BUNDLE_FIELDS, self.xp.unstack(kinematic_bundle, axis = -1)))
+
+        # (2): Extract the eight CFFs from the DNN:
+        real_H, imag_H, real_E, imag_E, real_Ht, imag_Ht, real_Et, imag_Et = self.xp.unstack(cffs, axis = -1)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Unstacked CFFs\n> {real_H, imag_H, real_E, imag_E, real_Ht, imag_Ht, real_Et, imag_Et}")
+
+        # (3): Contract the curly C's against the (already-scaled) harmonic weights:
+        # | The CFFs go in by name: the columns are [H, E, Ht, Et], the arguments are not.
+        return self.contract_interference_harmonic_weights(
+            tuple(bundle[field] for field in _INTERFERENCE_WEIGHT_FIELDS),
+            bundle["q_squared"], bundle["x_bjorken"], bundle["t"], bundle["f1"], bundle["f2"], bundle["xi"],
+            real_H = real_H, imag_H = imag_H,
+            real_Ht = real_Ht, imag_Ht = imag_Ht,
+            real_E = real_E, imag_E = imag_E)
+
+    @backend_function
+    def precompute_design_matrix(self, kinematics):
+        """
+        ## Description:
+        The interference term is linear in the eight CFFs and the |DVCS|² term is
+        quadratic, so for every point we can write the cross-section as
+
+            σ_even = A_even · CFFs + b + CFFs^T D CFFs,     σ_odd = A_odd · CFFs
+
+        where b is the (CFF-independent) BH term. Here, we compute A_even and A_odd
+        once by running each of the eight unit vectors in CFF space through the
+        same contraction the layer always uses, so the result agrees with the 
+        standard path up to floating-point rounding. D is taken from the bundle.
+
+        ## Returns:
+            A tensor of shape (N, 81): the eight columns of A_even, the eight
+            columns of A_odd, b, and then the 64 entries of D, row by row. Columns
+            follow the CFF order of the network:
+            [Re[H], Im[H], Re[E], Im[E], Re[Ht], Im[Ht], Re[Et], Im[Et]].
+        """
+
+        # (1): Everything that does not depend on the CFFs:
+        kinematic_bundle = self.precompute_kinematic_bundle(kinematics)
+
+        # (2): Fold it into the design matrix:
+        return self.compute_design_matrix_from_bundle(kinematic_bundle)
+
+    @backend_function
+    def compute_design_matrix_from_bundle(self, kinematic_bundle):
+        """
+        ## Description:
+        The (N, 81) design matrix from an (already computed) kinematic bundle ---
+        see `precompute_design_matrix`.
+        """
+
+        # (1): How many kinematic points there are:
+        number_of_points = self.xp.shape(kinematic_bundle)[0]
+
+        # (2): Pair every point with each of the eight unit vectors in CFF space:
+        repeated_bundle = self.xp.repeat(kinematic_bundle, repeats = _NUMBER_OF_CFFS, axis = 0)
+        tiled_cff_basis = self.xp.tile(self.xp.eye(_NUMBER_OF_CFFS, dtype = kinematic_bundle.dtype), [number_of_points, 1])
+
+        # (3): Each evaluation is one column of the design matrix:
+        interference_even, interference_odd = self.compute_interference_from_bundle(repeated_bundle, tiled_cff_basis)
+
+        # (4): Reshape back into (N, 8):
+        design_matrix_even = self.xp.reshape(interference_even, [number_of_points, _NUMBER_OF_CFFS])
+        design_matrix_odd = self.xp.reshape(interference_odd, [number_of_points, _NUMBER_OF_CFFS])
+
+        # (5): The constant term:
+        bh_contribution = kinematic_bundle[:, _KINEMATIC_BUNDLE_FIELDS.index("bh_contribution")]
+
+        # (6): The quadratic term:
+        flattened_dvcs_matrix = kinematic_bundle[:, _KINEMATIC_BUNDLE_FIELDS.index(_DVCS_MATRIX_FIELDS[0]):]
+
+        return self.xp.concat([design_matrix_even, design_matrix_odd, bh_contribution[:, self.xp.newaxis], flattened_dvcs_matrix], axis = -1)
+
+    @backend_function
+    def compute_cross_section_parts_from_design_matrix(self, inputs):
+        """
+        ## Description:
+        The three parts of `compute_cross_section_parts` from the output of `precompute_design_matrix`: 
+        two dot products per point with the eight CFFs, plus the |DVCS|² quadratic form.
+        """
+
+        # (1): Unpack the design matrix and the CFFs:
+        design_matrix, cffs = inputs
+
+        # (2): The part that is even in the beam charge, b + CFFs^T D CFFs:
+        cross_section_charge_even = (
+            design_matrix[..., 2 * _NUMBER_OF_CFFS] +
+            self.contract_dvcs_bilinear_form(design_matrix[..., 2 * _NUMBER_OF_CFFS + 1:], cffs))
+
+        # (3): The helicity-even part of the interference, A_even · CFFs:
+        interference_even = self.xp.reduce_sum(design_matrix[..., :_NUMBER_OF_CFFS] * cffs, axis = -1)
+
+        # (4): The helicity-odd part of the interference, A_odd · CFFs:
+        interference_odd = self.xp.reduce_sum(design_matrix[..., _NUMBER_OF_CFFS:2 * _NUMBER_OF_CFFS] * cffs, axis = -1)
+
+        return cross_section_charge_even, interference_even, interference_odd
+
+    def compute_cross_section_parts_with_analytic_gradient(self, design_matrix, cffs):
+        """
+        ## Description:
+        `compute_cross_section_parts_from_design_matrix`, for a layer built with
+        `analytic_cff_gradient = True`. A backend that differentiates attaches the
+        closed-form gradient here --- the forward pass is the same.
+        """
+        return self.compute_cross_section_parts_from_design_matrix([design_matrix, cffs])
+
+    @backend_function
+    def compute_helicity_difference(self, inputs):
+        """
+        ## Description:
+        The helicity-difference cross-section, σ(λ = +1) - σ(λ = -1). Everything
+        that does not depend on the helicity cancels, so this is just twice the
+        helicity-odd part.
+        """
+        _, cross_section_odd = self.compute_cross_section_helicity_parts(inputs)
+
+        return self.xp.constant(2.0, dtype = self.kernel_dtype) * cross_section_odd
+
+    @backend_function
+    def compute_fourier_harmonics(self, kinematics):
+        """
+        ## Description:
+        At fixed (Q², x_B, t, k), the only φ-dependence of the cross-section is
+        through cos(n(π - φ)), sin(n(π - φ)), and the lepton propagators, and
+
+            P_{1} P_{2} σ(φ) = Σ_{n} [a_{n} cos(n(π - φ)) + b_{n} sin(n(π - φ))],   n ≤ 3
+
+        column by column of the design matrix. (P_{1} P_{2} itself is a polynomial
+        of degree 2 in cos(π - φ).) Here, we compute those harmonic coefficients for
+        every kinematic setting from the design matrix at `_NUMBER_OF_FOURIER_NODES`
+        values of φ. Then `evaluate_fourier_harmonics` gives the design matrix at
+        *any* φ for the price of a few multiplications.
+
+        ## Arguments:
+            kinematics: tf.Tensor
+                The kinematic settings [Q², x_B, t, k] --- no φ --- of shape (M, 4).
+
+        ## Returns:
+            A tensor of shape (M, 7, 82): for every harmonic in the order of
+            `_FOURIER_HARMONICS`, the coefficients of P_{1} P_{2} times the 81 columns
+            of the design matrix, and then of P_{1} P_{2} itself.
+        """
+
+        # (1): How many kinematic settings there are:
+        number_of_settings = self.xp.shape(kinematics)[0]
+
+        # (2): The equally-spaced nodes, in degrees:
+        phi_nodes = self.xp.range(_NUMBER_OF_FOURIER_NODES, dtype = self.kernel_dtype) * self.xp.constant(360.0 / _NUMBER_OF_FOURIER_NODES, dtype = self.kernel_dtype)
+
+        # (3): Pair every kinematic setting with every node:
+        node_kinematics = self.xp.concat([
+            self.xp.repeat(kinematics, repeats = _NUMBER_OF_FOURIER_NODES, axis = 0),
+            self.xp.tile(phi_nodes, [number_of_settings])[:, self.xp.newaxis]],
+            axis = -1)
+
+        # (4): The bundle and the design matrix at the nodes:
+        kinematic_bundle = self.precompute_kinematic_bundle(node_kinematics)
+        design_matrix = self.compute_design_matrix_from_bundle(kinematic_bundle)
+
+        # (5): Clear the denominator so that every column is a pure Fourier sum:
+        propagator_product = kinematic_bundle[:, _KINEMATIC_BUNDLE_FIELDS.index("lepton_propagator_product"), self.xp.newaxis]
+        node_values = self.xp.reshape(
+            self.xp.concat([design_matrix * propagator_product, propagator_product], axis = -1),
+            [number_of_settings, _NUMBER_OF_FOURIER_NODES, _NUMBER_OF_DESIGN_MATRIX_COLUMNS + 1])
+
+        # (6): The discrete Fourier transform: 1/N for the constant term, 2/N for the others:
+        normalization = self.xp.constant(
+            [1.0 if harmonic == "cos_0" else 2.0 for harmonic in _FOURIER_HARMONICS],
+            dtype = self.kernel_dtype) / self.xp.constant(_NUMBER_OF_FOURIER_NODES, dtype = self.kernel_dtype)
+        projection = self.calculate_fourier_basis(phi_nodes) * normalization
+
+        return self.xp.einsum("jh,mjc->mhc", projection, node_values)
+
+    @backend_function
+    def calculate_fourier_basis(self, phi):
+        """
+        ## Description:
+        cos(n(π - φ)) and sin(n(π - φ)) in the order of `_FOURIER_HARMONICS`, for
+        φ in degrees. The result has shape (P, 7).
+        """
+        shifted_phi = self.xp.constant(np.pi, dtype = self.kernel_dtype) - self.convert_degrees_to_radians(phi)
+
+        return self.xp.stack([
+            self.xp.cos(self.xp.constant(0.0, dtype = self.kernel_dtype) * shifted_phi),
+            self.xp.cos(shifted_phi),
+            self.xp.cos(self.xp.constant(2.0, dtype = self.kernel_dtype) * shifted_phi),
+            self.xp.cos(self.xp.constant(3.0, dtype = self.kernel_dtype) * shifted_phi),
+            self.xp.sin(shifted_phi),
+            self.xp.sin(self.xp.constant(2.0, dtype = self.kernel_dtype) * shifted_phi),
+            self.xp.sin(self.xp.constant(3.0, dtype = self.kernel_dtype) * shifted_phi)],
+            axis = -1)
+
+    @backend_function
+    def evaluate_fourier_harmonics(self, fourier_harmonics, phi):
+        """
+        ## Description:
+        The design matrix at every φ of a grid, from the output of
+        `compute_fourier_harmonics`.
+
+        ## Arguments:
+            fourier_harmonics: tf.Tensor
+                Shape (M, 7, 82).
+
+            phi: tf.Tensor
+                The φ values in degrees, shape (P,), shared by every kinematic setting.
+
+        ## Returns:
+            A tensor of shape (M, P, 81).
+        """
+
+        # (1): Sum the harmonics:
+        node_values = self.xp.einsum("ph,mhc->mpc", self.calculate_fourier_basis(phi), fourier_harmonics)
+
+        # (2): Divide P_{1} P_{2} back out:
+        return node_values[..., :_NUMBER_OF_DESIGN_MATRIX_COLUMNS] / node_values[..., _NUMBER_OF_DESIGN_MATRIX_COLUMNS:]
+
+    @backend_function
+    def compute_cross_section_from_fourier_harmonics(self, fourier_harmonics, cffs, phi):
+        """
+        ## Description:
+        The cross-section (for the beam polarization and charge of this layer) at every φ
+        of a grid, for M kinematic settings with CFFs of shape (M, 8). The result
+        has shape (M, P), or (M, P, C) for a layer with C `polarization_channels`.
+        """
+
+        # (1): The design matrix at every (setting, φ):
+        design_matrices = self.evaluate_fourier_harmonics(fourier_harmonics, phi)
+
+        # (2): How many angles there are:
+        number_of_angles = self.xp.shape(phi)[0]
+
+        # (3): The usual dot products, with the CFFs of each setting repeated over φ:
+        cross_section_parts = self.compute_cross_section_parts_from_design_matrix([
+            self.xp.reshape(design_matrices, [-1, _NUMBER_OF_DESIGN_MATRIX_COLUMNS]),
+            self.xp.repeat(cffs, repeats = number_of_angles, axis = 0)])
+
+        # (4): Combine them for the configuration(s) of this layer:
+        cross_section = self.combine_cross_section_parts(cross_section_parts)
+
+        if self.polarization_channels is None:
+            return self.xp.reshape(cross_section, [-1, number_of_angles])
+
+        return self.xp.reshape(cross_section, [-1, number_of_angles, len(self.polarization_channels)])
+
+    @backend_function
+    def compute_cross_section_on_phi_grid(self, kinematics, cffs, phi):
+        """
+        ## Description:
+        The cross-section at every φ of a grid, for M kinematic settings [Q², x_B, t, k]
+        and their CFFs: `compute_fourier_harmonics` followed by
+        `compute_cross_section_from_fourier_harmonics`. The cost is that of
+        `_NUMBER_OF_FOURIER_NODES` kinematic points per setting, however dense the grid.
+        """
+        return self.compute_cross_section_from_fourier_harmonics(self.compute_fourier_harmonics(kinematics), cffs, phi)
+
+    @backend_function
+    def calculate_interference_contribution(
+        self,
+        lepton_helicity,
+        q_squared,
+        x_bjorken,
+        t,
+        phi,
+        f1,
+        f2,
+        real_H,
+        imag_H,
+        real_Ht,
+        imag_Ht,
+        real_E,
+        imag_E,
+        epsilon,
+        y,
+        xi,
+        t_prime,
+        k_tilde,
+        capital_k):
+        """
+        ## Description:
+        The interference contribution for a *single* lepton helicity. This 
+        is just the helicity-even part plus `lepton_helicity` times the 
+        helicity-odd part from `calculate_interference_helicity_parts`.
+        """
+        helicity_even, helicity_odd = self.calculate_interference_helicity_parts(
+            q_squared, x_bjorken, t, phi, f1, f2,
+            real_H = real_H, imag_H = imag_H,
+            real_Ht = real_Ht, imag_Ht = imag_Ht,
+            real_E = real_E, imag_E = imag_E,
+            epsilon = epsilon, y = y, xi = xi, t_prime = t_prime, k_tilde = k_tilde, capital_k = capital_k)
+
+        return helicity_even + lepton_helicity * helicity_odd
+
+    @backend_function
+    def calculate_interference_helicity_parts(
+        self,
+        q_squared,
+        x_bjorken,
+        t,
+        phi,
+        f1,
+        f2,
+        real_H,
+        imag_H,
+        real_Ht,
+        imag_Ht,
+        real_E,
+        imag_E,
+        epsilon,
+        y,
+        xi,
+        t_prime,
+        k_tilde,
+        capital_k):
+        """
+        ## Description:
+        Compute the interference contribution split by how it depends on the
+        lepton helicity λ:
+
+            I(λ) = I_even + λ * I_odd
+
+        The c_{n} coefficients do not depend on λ at all, and every s_{n} is
+        *linear* in λ. So, we evaluate the s_{n} once at λ = +1 and never 
+        again: the unpolarized, λ = ±1, and helicity-difference observables
+        all follow from the two returned tensors.
+
+        ## Returns:
+            1. helicity_even (tf.Tensor): Σ c_{n} cos(n(π - φ))
+            2. helicity_odd (tf.Tensor): Σ s_{n} sin(n(π - φ)) at λ = +1
+        """
+
+        # (1): Everything that does not care about the CFFs:
+        harmonic_weights = self.calculate_interference_harmonic_weights(
+            q_squared, x_bjorken, t, phi, epsilon, y, t_prime, k_tilde, capital_k)
+
+        # (2): Everything that does:
+        return self.contract_interference_harmonic_weights(
+            harmonic_weights, q_squared, x_bjorken, t, f1, f2, xi,
+            real_H = real_H, imag_H = imag_H,
+            real_Ht = real_Ht, imag_Ht = imag_Ht,
+            real_E = real_E, imag_E = imag_E)
+
+    @backend_function
+    def calculate_interference_harmonic_weights(
+        self,
+        q_squared,
+        x_bjorken,
+        t,
+        phi,
+        epsilon,
+        y,
+        t_prime,
+        k_tilde,
+        capital_k):
+        """
+        ## Description:
+        The interference term is Σ (c_{n} cos(n(π - φ)) + s_{n} sin(n(π - φ))), 
+        and each c_{n} (s_{n}) is a sum of six kinematic coefficients multiplied by
+        the real (imaginary) part of one of the six curly C's. Here, we collect the
+        *kinematic* side of that: for each curly C, the φ-dependent weight that 
+        multiplies it. None of these depend on the CFFs, so they can be computed
+        once per dataset.
+
+        ## Returns:
+            A tuple of twelve tensors, in this order:
+            1-6. the helicity-even weights on Re[C], Re[C^V], Re[C^A], Re[C_eff], Re[C^V_eff], Re[C^A_eff]
+            7-12. the helicity-odd weights (λ = +1) on the imaginary parts, in the same order
+
+        ## Notes:
+        The curly C's with effective CFFs carry a factor of sqrt(2/Q²) K̃/(2 - x_B),
+        and it is folded into the weights here. The powers of that factor are the
+        ones `calculate_interference_contribution` has always applied: squared on
+        Re[C_eff], absent on Im[C^A_eff], and once everywhere else.
+        """
+
+        # (X): The s_{n} are linear in the helicity, so we only ever need λ = +1:
+        lepton_helicity = self.xp.constant(1.0, dtype = self.kernel_dtype)
+
+        if self.target_polarization != 0.:
+
+            if SETTING_DEBUG:
+                print(f"> [DEBUG]: Target detected to be polarized: {self.target_polarization}")
+
+            raise NotImplementedError("Not yet...")
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Target is unpolarized: {self.target_polarization}")
+
+        # (22): Calculate the common factor:
+        common_factor = (self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype) / q_squared) * k_tilde / (self.xp.constant(2.0, dtype = self.kernel_dtype) - x_bjorken))
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed modulating factor on all Curly C^I with effective CFFs: {common_factor}")
+
+        # (X): Compute the three C++(n = 0) unpolarized coefficients with TF:
+        c0pp_tf = self.calculate_c_0_plus_plus_unpolarized(q_squared, x_bjorken, t, epsilon, y, k_tilde)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized C0++ (c0pp_tf): {c0pp_tf[0]}")
+
+        c0ppv_tf = self.calculate_c_0_plus_plus_unpolarized_V(q_squared, x_bjorken, t, epsilon, y, k_tilde)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CV0++ (c0ppv_tf): {c0ppv_tf[0]}")
+
+        c0ppa_tf = self.calculate_c_0_plus_plus_unpolarized_A(q_squared, x_bjorken, t, epsilon, y, k_tilde)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CA0++ (c0ppa_tf): {c0ppa_tf[0]}")
+
+        # (X): Compute the three C++(n = 1) unpolaried coefficients with TF:
+        c1pp_tf = self.calculate_c_1_plus_plus_unpolarized(q_squared, x_bjorken, t, epsilon, y, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized C1++ (c1pp_tf): {c1pp_tf[0]}")
+
+        c1ppv_tf = self.calculate_c_1_plus_plus_unpolarized_V(q_squared, x_bjorken, t, epsilon, y, t_prime, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CV1++ (c1ppv_tf): {c1ppv_tf[0]}")
+
+        c1ppa_tf = self.calculate_c_1_plus_plus_unpolarized_A(q_squared, x_bjorken, t, epsilon, y, t_prime, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CA1++ (c1ppa_tf): {c1ppa_tf[0]}")
+
+        # (X): Compute the three C++(n = 2) unpolaried coefficients with TF:
+        c2pp_tf = self.calculate_c_2_plus_plus_unpolarized(q_squared, x_bjorken, t, epsilon, y, t_prime, k_tilde)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized C2++ (c2pp_tf): {c2pp_tf[0]}")
+
+        c2ppv_tf = self.calculate_c_2_plus_plus_unpolarized_V(q_squared, x_bjorken, t, epsilon, y, t_prime, k_tilde)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CV2++ (c2ppv_tf): {c2ppv_tf[0]}")
+            
+        c2ppa_tf = self.calculate_c_2_plus_plus_unpolarized_A(q_squared, x_bjorken, t, epsilon, y, t_prime, k_tilde)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CA2++ (c2ppa_tf): {c2ppa_tf[0]}")
+
+        # (X): Compute the three C++(n = 3) unpolaried coefficients with TF:
+        c3pp_tf = self.calculate_c_3_plus_plus_unpolarized(q_squared, x_bjorken, t, epsilon, y, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized C3++ (c3pp_tf): {c3pp_tf[0]}")
+            
+        c3ppv_tf = self.calculate_c_3_plus_plus_unpolarized_V(q_squared, x_bjorken, t, epsilon, y, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CV3++ (c3ppv_tf): {c3ppv_tf[0]}")
+
+        c3ppa_tf = self.calculate_c_3_plus_plus_unpolarized_A(q_squared, x_bjorken, t, epsilon, y, t_prime, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CA3++ (c3ppa_tf): {c3ppa_tf[0]}")
+
+        # (X): Compute the three C0+(n = 0) unpolarized coefficients with TF:
+        c00p_tf = self.calculate_c_0_zero_plus_unpolarized(q_squared, x_bjorken, t, epsilon, y, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized C0+ (c00p_tf): {c00p_tf[0]}")
+
+        c00pv_tf = self.calculate_c_0_zero_plus_unpolarized_V(q_squared, x_bjorken, t, epsilon, y, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CV00+ (c00pv_tf): {c00pv_tf[0]}")
+
+        c00pa_tf = self.calculate_c_0_zero_plus_unpolarized_A(q_squared, x_bjorken, t, epsilon, y, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CA00+ (c00pa_tf): {c00pa_tf[0]}")
+
+        # (X): Compute the three C0+(n = 1) unpolaried coefficients with TF:
+        c10p_tf = self.calculate_c_1_zero_plus_unpolarized(q_squared, x_bjorken, t, epsilon, y, t_prime)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized C1++ (c10p_tf): {c10p_tf[0]}")
+
+        c10pv_tf  = self.calculate_c_1_zero_plus_unpolarized_V(q_squared, x_bjorken, t, epsilon, y, k_tilde)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CV10+ (c10pv_tf): {c10pv_tf[0]}")
+
+        c10pa_tf  = self.calculate_c_1_zero_plus_unpolarized_A(q_squared, x_bjorken, t, epsilon, y, k_tilde)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CA10+ (c10pa_tf): {c10pa_tf[0]}")
+
+        # (X): Compute the three C0+(n = 2) unpolaried coefficients with TF:
+        c20p_tf = self.calculate_c_2_zero_plus_unpolarized(q_squared, x_bjorken, t, epsilon, y, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized C2++ (c20p_tf): {c20p_tf[0]}")
+
+        c20pv_tf = self.calculate_c_2_zero_plus_unpolarized_V(q_squared, x_bjorken, t, epsilon, y, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CV20+ (c20pv_tf): {c20pv_tf[0]}")
+
+        c20pa_tf = self.calculate_c_2_zero_plus_unpolarized_A(q_squared, x_bjorken, t, epsilon, y, t_prime, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CA20+ (c20pa_tf): {c20pa_tf[0]}")
+
+        # (X): Compute the three C0+(n = 3) unpolaried coefficients with TF:
+        c30p_tf = self.xp.zeros_like(c0pp_tf)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized C3++ (c30p_tf): {c30p_tf[0]}")
+
+        c30pv_tf = self.xp.zeros_like(c0pp_tf)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CV30+ (c30pv_tf): {c30pv_tf[0]}")
+
+        c30pa_tf = self.xp.zeros_like(c0pp_tf)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized CA30+ (c30pa_tf): {c30pa_tf[0]}")
+
+        # (X): Compute the three S++(n = 1) unpolaried coefficients with TF:
+        s1pp_tf = self.calculate_s_1_plus_plus_unpolarized(lepton_helicity, q_squared, x_bjorken, epsilon, y, t_prime, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized S1++ (s1pp_tf): {s1pp_tf[0]}")
+
+        s1ppv_tf = self.calculate_s_1_plus_plus_unpolarized_V(lepton_helicity, q_squared, x_bjorken, t, epsilon, y, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized S1V++ (s1ppv_tf): {s1ppv_tf[0]}")
+
+        s1ppa_tf = self.calculate_s_1_plus_plus_unpolarized_A(lepton_helicity, q_squared, x_bjorken, t, epsilon, y, t_prime, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized S1A++ (s1ppa_tf): {s1ppa_tf[0]}")
+
+        # (X): Compute the three S++(n = 2) unpolaried coefficients with TF:
+        s2pp_tf = self.calculate_s_2_plus_plus_unpolarized(lepton_helicity, q_squared, x_bjorken, epsilon, y, t_prime)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized S2++ (s2pp_tf): {s2pp_tf[0]}")
+            
+        s2ppv_tf = self.calculate_s_2_plus_plus_unpolarized_V(lepton_helicity, q_squared, x_bjorken, t, epsilon, y)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized S2V++ (s2ppv_tf): {s2ppv_tf[0]}")
+
+        s2ppa_tf = self.calculate_s_2_plus_plus_unpolarized_A(lepton_helicity, q_squared, x_bjorken, t, epsilon, y, t_prime)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized SA2++ (s2ppa_tf): {s2ppa_tf[0]}")
+
+        # (X): Compute the three S0+(n = 1) unpolaried coefficients with TF:
+        s10p_tf = self.calculate_s_1_zero_plus_unpolarized(lepton_helicity, q_squared, epsilon, y, k_tilde)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized S10+ (s10p_tf): {s10p_tf[0]}")
+
+        s10pv_tf  = self.calculate_s_1_zero_plus_unpolarized_V(lepton_helicity, q_squared, x_bjorken, t, epsilon, y)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized SV10+ (s10pv_tf): {s10pv_tf[0]}")
+
+        s10pa_tf  = self.calculate_s_1_zero_plus_unpolarized_A(lepton_helicity, q_squared, x_bjorken, t, epsilon, y, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized SA10+ (s10pa_tf): {s10pa_tf[0]}")
+
+        # (X): Compute the three S0+(n = 2) unpolaried coefficients with TF:
+        s20p_tf = self.calculate_s_2_zero_plus_unpolarized(lepton_helicity, q_squared, x_bjorken, t, epsilon, y, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized S20+ (s20p_tf): {s20p_tf[0]}")
+
+        s20pv_tf = self.calculate_s_2_zero_plus_unpolarized_V(lepton_helicity, q_squared, x_bjorken, t, epsilon, y, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized S2V0+ (s20pv_tf): {s20pv_tf[0]}")
+
+        s20pa_tf = self.calculate_s_2_zero_plus_unpolarized_A(lepton_helicity, q_squared, x_bjorken, t, epsilon, y, capital_k)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed unpolarized S2A0+ (s20pa_tf): {s20pa_tf[0]}")
+        
+        # (X): The shifted azimuthal angle, π - φ, that every harmonic is evaluated at:
+        shifted_phi = self.xp.constant(np.pi, dtype = self.kernel_dtype) - self.convert_degrees_to_radians(phi)
+
+        # (X): The cosine harmonics, cos(n(π - φ)) for n = 0, 1, 2, 3:
+        cosine_0 = self.xp.cos(self.xp.constant(0.0, dtype = self.kernel_dtype) * shifted_phi)
+        cosine_1 = self.xp.cos(self.xp.constant(1.0, dtype = self.kernel_dtype) * shifted_phi)
+        cosine_2 = self.xp.cos(self.xp.constant(2.0, dtype = self.kernel_dtype) * shifted_phi)
+        cosine_3 = self.xp.cos(self.xp.constant(3.0, dtype = self.kernel_dtype) * shifted_phi)
+
+        # (X): The sine harmonics, sin(n(π - φ)) for n = 1, 2:
+        sine_1 = self.xp.sin(self.xp.constant(1.0, dtype = self.kernel_dtype) * shifted_phi)
+        sine_2 = self.xp.sin(self.xp.constant(2.0, dtype = self.kernel_dtype) * shifted_phi)
+
+        # (X): The weights on the real parts of the curly C's:
+        weight_c = c0pp_tf * cosine_0 + c1pp_tf * cosine_1 + c2pp_tf * cosine_2 + c3pp_tf * cosine_3
+        weight_c_v = c0ppv_tf * cosine_0 + c1ppv_tf * cosine_1 + c2ppv_tf * cosine_2 + c3ppv_tf * cosine_3
+        weight_c_a = c0ppa_tf * cosine_0 + c1ppa_tf * cosine_1 + c2ppa_tf * cosine_2 + c3ppa_tf * cosine_3
+        weight_c_eff = common_factor**2 * (c00p_tf * cosine_0 + c10p_tf * cosine_1 + c20p_tf * cosine_2 + c30p_tf * cosine_3)
+        weight_c_v_eff = common_factor * (c00pv_tf * cosine_0 + c10pv_tf * cosine_1 + c20pv_tf * cosine_2 + c30pv_tf * cosine_3)
+        weight_c_a_eff = common_factor * (c00pa_tf * cosine_0 + c10pa_tf * cosine_1 + c20pa_tf * cosine_2 + c30pa_tf * cosine_3)
+
+        # (X): The weights on the imaginary parts of the curly C's:
+        weight_s = s1pp_tf * sine_1 + s2pp_tf * sine_2
+        weight_s_v = s1ppv_tf * sine_1 + s2ppv_tf * sine_2
+        weight_s_a = s1ppa_tf * sine_1 + s2ppa_tf * sine_2
+        weight_s_eff = common_factor * (s10p_tf * sine_1 + s20p_tf * sine_2)
+        weight_s_v_eff = common_factor * (s10pv_tf * sine_1 + s20pv_tf * sine_2)
+        weight_s_a_eff = s10pa_tf * sine_1 + s20pa_tf * sine_2
+
+        return (
+            weight_c, weight_c_v, weight_c_a, weight_c_eff, weight_c_v_eff, weight_c_a_eff,
+            weight_s, weight_s_v, weight_s_a, weight_s_eff, weight_s_v_eff, weight_s_a_eff)
+
+    @backend_function
+    def contract_interference_harmonic_weights(
+        self,
+        harmonic_weights,
+        q_squared,
+        x_bjorken,
+        t,
+        f1,
+        f2,
+        xi,
+        real_H,
+        imag_H,
+        real_Ht,
+        imag_Ht,
+        real_E,
+        imag_E):
+        """
+        ## Description:
+        The CFF-dependent half of the interference term: build the six curly C's
+        from the CFFs and contract them against the weights from 
+        `calculate_interference_harmonic_weights`.
+
+        ## Returns:
+            1. helicity_even (tf.Tensor)
+            2. helicity_odd (tf.Tensor), at λ = +1
+        """
+
+        # (1): Unpack the weights:
+        (weight_c, weight_c_v, weight_c_a, weight_c_eff, weight_c_v_eff, weight_c_a_eff,
+         weight_s, weight_s_v, weight_s_a, weight_s_eff, weight_s_v_eff, weight_s_a_eff) = harmonic_weights
+
+        # (2): Calculate the Curly C:
+        curly_c_i_real, curly_c_i_imag = self.calculate_curly_C_unpolarized_interference(
+            q_squared, x_bjorken, t, f1, f2, real_H, imag_H, real_Ht, imag_Ht, real_E, imag_E)
+
+        # (3): Calculate the Curly C,V:
+        curly_c_i_v_real, curly_c_i_v_imag = self.calculate_curly_C_unpolarized_interference_V(
+            q_squared, x_bjorken, t, f1, f2, real_H, imag_H, real_E, imag_E)
+
+        # (4): Calculate the Curly C,A:
+        curly_c_i_a_real, curly_c_i_a_imag = self.calculate_curly_C_unpolarized_interference_A(
+            q_squared, x_bjorken, t, f1, f2, real_Ht, imag_Ht)
+
+        # (5): Calculate the Curly C with effective form factors:
+        # | (The common factor lives in the weights.)
+        curly_c_i_real_eff, curly_c_i_imag_eff = self.calculate_curly_C_unpolarized_interference(
+            q_squared, x_bjorken, t, f1, f2,
+            self.compute_cff_effective(xi, real_H, self.using_ww),
+            self.compute_cff_effective(xi, imag_H, self.using_ww),
+            self.compute_cff_effective(xi, real_Ht, self.using_ww),
+            self.compute_cff_effective(xi, imag_Ht, self.using_ww),
+            self.compute_cff_effective(xi, real_E, self.using_ww),
+            self.compute_cff_effective(xi, imag_E, self.using_ww))
+
+        # (6): Calculate the Curly C,V with effective form factors:
+        curly_c_i_v_real_eff, curly_c_i_v_imag_eff = self.calculate_curly_C_unpolarized_interference_V(
+            q_squared, x_bjorken, t, f1, f2,
+            self.compute_cff_effective(xi, real_H, self.using_ww),
+            self.compute_cff_effective(xi, imag_H, self.using_ww),
+            self.compute_cff_effective(xi, real_E, self.using_ww),
+            self.compute_cff_effective(xi, imag_E, self.using_ww))
+
+        # (7): Calculate the Curly C,A with effective form factors:
+        curly_c_i_a_real_eff, curly_c_i_a_imag_eff = self.calculate_curly_C_unpolarized_interference_A(
+            q_squared, x_bjorken, t, f1, f2,
+            self.compute_cff_effective(xi, real_Ht, self.using_ww),
+            self.compute_cff_effective(xi, imag_Ht, self.using_ww))
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Computed real parts of the Curly C's: {curly_c_i_real[0]}, {curly_c_i_v_real[0]}, {curly_c_i_a_real[0]}")
+            print(f"> [DEBUG]: Computed imaginary parts of the Curly C's: {curly_c_i_imag[0]}, {curly_c_i_v_imag[0]}, {curly_c_i_a_imag[0]}")
+
+        # (8): The helicity-independent harmonics:
+        helicity_even = (
+            weight_c * curly_c_i_real + weight_c_v * curly_c_i_v_real + weight_c_a * curly_c_i_a_real +
+            weight_c_eff * curly_c_i_real_eff + weight_c_v_eff * curly_c_i_v_real_eff + weight_c_a_eff * curly_c_i_a_real_eff)
+
+        # (9): The harmonics that flip sign with the helicity (evaluated at λ = +1):
+        helicity_odd = (
+            weight_s * curly_c_i_imag + weight_s_v * curly_c_i_v_imag + weight_s_a * curly_c_i_a_imag +
+            weight_s_eff * curly_c_i_imag_eff + weight_s_v_eff * curly_c_i_v_imag_eff + weight_s_a_eff * curly_c_i_a_imag_eff)
+
+        return helicity_even, helicity_odd
+    
+    @backend_function
+    def convert_degrees_to_radians(self, degrees):
+        """
+        ## Description:
+        Converts a number in degrees (0-360) to radians
+        using the standard formula.
+        """
+        return (degrees * self.xp.constant(np.pi, dtype = self.kernel_dtype) / self.xp.constant(180.0, dtype = self.kernel_dtype))
+    
+    @backend_function
+    def convert_to_nb_over_gev4(self, number: float) -> float:
+        """
+        ## Description:
+        Convert a number in units of GeV^{-6} to nb/GeV^{4}. For reference,
+        the number is 389379 or about 3.9e6 (= 4.0e6), and it is 
+        multiplied by whatever `number` is passed in.
+
+        ## Arguments:
+
+            1. number (float)
+
+        ## Returns:
+
+            1. number_in_nb_over_GeV4 (float)
+        """
+        _CONVERSION_FACTOR = .389379 * 1000000.
+        number_in_nb_over_GeV4 = self.xp.constant(_CONVERSION_FACTOR, dtype = self.kernel_dtype) * number
+        return number_in_nb_over_GeV4
+
+    @backend_function
+    def calculate_kinematics_epsilon(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate Epsilon right away:
+            epsilon = (self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken * _MASS_OF_PROTON_IN_GEV) / self.xp.sqrt(squared_Q_momentum_transfer)
+
+            # (tf.constant(1.0, dtype = tf.float32)1): If verbose, print the result:
+            if verbose:
+                self.xp.print(f"> Calculated epsilon to be:\n{epsilon}")
+
+            # (2): Return Epsilon:
+            return epsilon
+        
+        except Exception as ERROR:
+            self.xp.print(f"> Error in computing kinematic epsilon:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+    
+    @backend_function
+    def calculate_kinematics_lepton_energy_fraction_y(
+        self,
+        squared_Q_momentum_transfer: float,
+        lab_kinematics_k: float,
+        epsilon: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the y right away:
+            lepton_energy_fraction_y = self.xp.sqrt(squared_Q_momentum_transfer) / (epsilon * lab_kinematics_k)
+
+            # (tf.constant(1.0, dtype = tf.float32)1): If verbose output, then print the result:
+            if verbose:
+                self.xp.print(f"> Calculated y to be:\n{lepton_energy_fraction_y}")
+
+            # (2): Return the calculation:
+            return lepton_energy_fraction_y
+        
+        except Exception as ERROR:
+            self.xp.print(f"> Error in computing lepton_energy_fraction_y:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_kinematics_skewness_parameter(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): The Numerator:
+            numerator = (self.xp.constant(1.0, dtype = self.kernel_dtype) + (squared_hadronic_momentum_transfer_t / (self.xp.constant(2.0, dtype = self.kernel_dtype) * squared_Q_momentum_transfer)))
+
+            # (2): The Denominator:
+            denominator = (self.xp.constant(2.0, dtype = self.kernel_dtype) - x_Bjorken + (x_Bjorken * squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer))
+
+            # (3): Calculate the Skewness Parameter:
+            skewness_parameter = x_Bjorken * numerator / denominator
+
+            # (3.1): If verbose, print the output:
+            if verbose:
+                self.xp.print(f"> Calculated skewness xi to be:\n{skewness_parameter}")
+
+            # (4): Return Xi:
+            return skewness_parameter
+        
+        except Exception as ERROR:
+            self.xp.print(f"> Error in computing skewness xi:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+    
+    @backend_function
+    def calculate_kinematics_t_min(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        epsilon: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (0): Under the "mixed" precision policy, this runs in float64, so take the dtype from the inputs:
+            # | 1 - sqrt(1 + ε²) loses most of its digits in float32 when ε is small.
+            # (1): Calculate 1 - x_{B}:
+            one_minus_xb = self.xp.constant(1.0, dtype = x_Bjorken.dtype) - x_Bjorken
+
+            # (2): Calculate the numerator:
+            numerator = (self.xp.constant(2.0, dtype = x_Bjorken.dtype) * one_minus_xb * (self.xp.constant(1.0, dtype = x_Bjorken.dtype) - self.xp.sqrt(self.xp.constant(1.0, dtype = x_Bjorken.dtype) + epsilon**2))) + epsilon**2
+
+            # (3): Calculate the denominator:
+            denominator = (self.xp.constant(4.0, dtype = x_Bjorken.dtype) * x_Bjorken * one_minus_xb) + epsilon**2
+
+            # (4): Obtain the t minimum
+            t_minimum = -self.xp.constant(1.0, dtype = x_Bjorken.dtype) * squared_Q_momentum_transfer * numerator / denominator
+
+            # (tf.constant(4.0, dtype = tf.float32)1): If verbose, print the result:
+            if verbose:
+                self.xp.print(f"> Calculated t_minimum to be:\n{t_minimum}")
+
+            # (5): Print the result:
+            return t_minimum
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error calculating t_minimum: \n> {ERROR}")
+            return self.xp.constant(0.0, dtype = x_Bjorken.dtype)
+        
+    @backend_function
+    def calculate_kinematics_t_prime(
+        self,
+        squared_hadronic_momentum_transfer_t: float,
+        squared_hadronic_momentum_transfer_t_minimum: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Obtain the t_prime immediately
+            t_prime = squared_hadronic_momentum_transfer_t - squared_hadronic_momentum_transfer_t_minimum
+
+            # (tf.constant(1.0, dtype = tf.float32)1): If verbose, print the result:
+            if verbose:
+                self.xp.print(f"> Calculated t prime to be:\n{t_prime}")
+
+            # (2): Return t_prime
+            return t_prime
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error calculating t_prime:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_kinematics_k_tilde(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        lepton_energy_fraction_y: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        squared_hadronic_momentum_transfer_t_minimum: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (0): Under the "mixed" precision policy, this runs in float64, so take the dtype from the inputs:
+            # | t_min - t nearly cancels close to the kinematic boundary.
+            # (1): Calculate recurring quantity t_{min} - t
+            tmin_minus_t = squared_hadronic_momentum_transfer_t_minimum - squared_hadronic_momentum_transfer_t
+
+            # (2): Calculate the duplicate quantity 1 - x_{B}
+            one_minus_xb = self.xp.constant(1.0, dtype = x_Bjorken.dtype) - x_Bjorken
+
+            # (3): Calculate the crazy root quantity:
+            second_root_quantity = (one_minus_xb * self.xp.sqrt((self.xp.constant(1.0, dtype = x_Bjorken.dtype) + epsilon**2))) + ((tmin_minus_t * (epsilon**2 + (self.xp.constant(4.0, dtype = x_Bjorken.dtype) * one_minus_xb * x_Bjorken))) / (self.xp.constant(4.0, dtype = x_Bjorken.dtype) * squared_Q_momentum_transfer))
+
+            # (4): Calculate the first annoying root quantity:
+            first_root_quantity = self.xp.sqrt(self.xp.constant(1.0, dtype = x_Bjorken.dtype) - lepton_energy_fraction_y - lepton_energy_fraction_y**2 * epsilon**2 / self.xp.constant(4.0, dtype = x_Bjorken.dtype))
+            
+            # (5): Calculate K_tilde
+            k_tilde = self.xp.sqrt(tmin_minus_t) * self.xp.sqrt(second_root_quantity)
+
+            # (6): Print the result of the calculation:
+            if verbose:
+                self.xp.print(f"> Calculated k_tilde to be:\n{k_tilde}")
+
+            # (7) Return:
+            return k_tilde
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating K_tilde:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = x_Bjorken.dtype)
+        
+    @backend_function
+    def calculate_kinematics_k(
+        self,
+        squared_Q_momentum_transfer: float,
+        lepton_energy_fraction_y: float,
+        epsilon: float,
+        k_tilde: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the amazing prefactor:
+            prefactor = self.xp.sqrt(((self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y + (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))) / squared_Q_momentum_transfer))
+
+            # (2): Calculate the remaining part of the term:
+            kinematic_k = prefactor * k_tilde
+
+            # (tf.constant(2.0, dtype = tf.float32)1); If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated kinematic K to be:\n{kinematic_k}")
+
+            # (3): Return the value:
+            return kinematic_k
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating derived kinematic K:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_k_dot_delta(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        azimuthal_phi: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        kinematic_k: float,
+        verbose: bool = False):
+        try:
+        
+            # (1): The prefactor: \frac{Q^{2}}{2 y (1 + \varepsilon^{2})}
+            prefactor = squared_Q_momentum_transfer / (self.xp.constant(2.0, dtype = self.kernel_dtype) * lepton_energy_fraction_y * (self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2))
+
+            # (2): Second term in parentheses: Phi-Dependent Term: 2 K tf.cos(\phi)
+            phi_dependence = self.xp.constant(2.0, dtype = self.kernel_dtype) * kinematic_k * self.xp.cos(self.xp.constant(np.pi, dtype = self.kernel_dtype) - self.convert_degrees_to_radians(azimuthal_phi))
+            
+            # (3): Prefactor of third term in parentheses: \frac{t}{Q^{2}}
+            ratio_delta_to_q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (4): Second term in the third term's parentheses: x_{B} (2 - y)
+            bjorken_scaling = x_Bjorken * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y)
+
+            # (5): Third term in the third term's parentheses: \frac{y \varepsilon^{2}}{2}
+            ratio_y_epsilon = lepton_energy_fraction_y * epsilon**2 / self.xp.constant(2.0, dtype = self.kernel_dtype)
+
+            # (6): Adding up all the "correction" pieces to the prefactor, written as (1 + correction)
+            correction = phi_dependence - (ratio_delta_to_q_squared * (self.xp.constant(1.0, dtype = self.kernel_dtype) - bjorken_scaling + ratio_y_epsilon)) + (ratio_y_epsilon)
+
+            # (7): Writing it explicitly as "1 + correction"
+            in_parentheses = self.xp.constant(1.0, dtype = self.kernel_dtype) + correction
+
+            # (8): The actual equation:
+            k_dot_delta_result = -self.xp.constant(1.0, dtype = self.kernel_dtype) * prefactor * in_parentheses
+
+            # (9): If verbose, print the output:
+            if verbose:
+                self.xp.print(f"> Calculated k dot delta: {k_dot_delta_result}")
+
+            # (9): Return the number:
+            return k_dot_delta_result
+        
+        except Exception as E:
+            self.xp.print(f"> Error in calculating k.Delta:\n> {E}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_lepton_propagator_p1(
+        self,
+        squared_Q_momentum_transfer: float,
+        k_dot_delta: float,
+        verbose:bool = False) -> float:
+        try:
+            p1_propagator = self.xp.constant(1.0, dtype = self.kernel_dtype) + (self.xp.constant(2.0, dtype = self.kernel_dtype) * (k_dot_delta / squared_Q_momentum_transfer))
+            
+            if verbose:
+                self.xp.print(f"> Computed the P1 propagator to be:\n{p1_propagator}")
+
+            return p1_propagator
+        
+        except Exception as E:
+            self.xp.print(f"> Error in computing p1 propagator:\n> {E}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_lepton_propagator_p2(
+        self,
+        squared_Q_momentum_transfer: float,
+        squared_hadronic_momentum_transfer_t: float,
+        k_dot_delta: float,
+        verbose: bool = False) -> float:
+        try:
+            p2_propagator = (-self.xp.constant(2.0, dtype = self.kernel_dtype) * (k_dot_delta / squared_Q_momentum_transfer)) + (squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer)
+            
+            if verbose:
+                self.xp.print(f"> Computed the P2 propagator to be:\n{p2_propagator}")
+
+            return p2_propagator
+        
+        except Exception as E:
+            self.xp.print(f"> Error in computing p2 propagator:\n> {E}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_form_factor_electric(
+        self,
+        squared_hadronic_momentum_transfer_t: float,
+        verbose: bool = False) -> float:
+        try:
+            
+            # (1): Calculate the mysterious denominator:
+            denominator = self.xp.constant(1.0, dtype = self.kernel_dtype) - (squared_hadronic_momentum_transfer_t / _ELECTRIC_FORM_FACTOR_CONSTANT)
+
+            # (2): Calculate the F_{E}:
+            form_factor_electric = self.xp.constant(1.0, dtype = self.kernel_dtype) / (denominator**2)
+
+            if verbose:
+                self.xp.print(f"> Calculated electric form factor as: {form_factor_electric}")
+
+            return form_factor_electric
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating electric form factor:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_form_factor_magnetic(
+        self,
+        electric_form_factor: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the F_{M}:
+            form_factor_magnetic = _PROTON_MAGNETIC_MOMENT * electric_form_factor
+
+            if verbose:
+                self.xp.print(f"> Calculated magnetic form factor as: {form_factor_magnetic}")
+
+            return form_factor_magnetic
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating magnetic form factor:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_form_factor_pauli_f2(
+        self,
+        squared_hadronic_momentum_transfer_t: float,
+        electric_form_factor: float,
+        magnetic_form_factor: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate tau:
+            tau = -self.xp.constant(1.0, dtype = self.kernel_dtype) * squared_hadronic_momentum_transfer_t / (self.xp.constant(4.0, dtype = self.kernel_dtype) * _MASS_OF_PROTON_IN_GEV**2)
+
+            # (2): Calculate the numerator:
+            numerator = magnetic_form_factor - electric_form_factor
+
+            # (3): Calculate the denominator:
+            denominator = self.xp.constant(1.0, dtype = self.kernel_dtype) + tau
+        
+            # (4): Calculate the Pauli form factor:
+            pauli_form_factor = numerator / denominator
+
+            if verbose:
+                self.xp.print(f"> Calculated Fermi form factor as: {pauli_form_factor}")
+
+            return pauli_form_factor
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating Fermi form factor:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_form_factor_dirac_f1(
+        self,
+        magnetic_form_factor: float,
+        pauli_f2_form_factor: float,
+        verbose: bool = False) -> float:
+        try:
+        
+            # (1): Calculate the Dirac form factor:
+            dirac_form_factor = magnetic_form_factor - pauli_f2_form_factor
+
+            if verbose:
+                self.xp.print(f"> Calculated Dirac form factor as: {dirac_form_factor}")
+
+            return dirac_form_factor
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating Dirac form factor:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def compute_cff_effective(
+        self,
+        skewness_parameter: float,
+        compton_form_factor: complex,
+        use_ww: bool = False,
+        verbose: bool = False) -> complex:
+        try:
+
+            # (1): Do the calculation in one line:
+            if use_ww:
+                cff_effective = self.xp.constant(2.0, dtype = self.kernel_dtype) * compton_form_factor / (self.xp.constant(1.0, dtype = self.kernel_dtype) + skewness_parameter)
+            else:
+                cff_effective = -self.xp.constant(2.0, dtype = self.kernel_dtype) * skewness_parameter * compton_form_factor / (self.xp.constant(1.0, dtype = self.kernel_dtype) + skewness_parameter)
+
+            # (tf.constant(1.0, dtype = tf.float32)1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Computed the CFF effective to be:\n{cff_effective}")
+
+            # (2): Return the output:
+            return cff_effective
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating F_effective:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_bkm10_cross_section_prefactor(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the numerator of the prefactor
+            numerator = _ELECTROMAGNETIC_FINE_STRUCTURE_CONSTANT**3 * lepton_energy_fraction_y**2 * x_Bjorken
+
+            # (2): Calculate the denominator of the prefactor:
+            denominator = self.xp.constant(8.0, dtype = self.kernel_dtype) * self.xp.constant(np.pi, dtype = self.kernel_dtype) * squared_Q_momentum_transfer**2 * self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (3): Construct the prefactor:
+            prefactor = numerator / denominator
+
+            if verbose:
+                self.xp.print(f"> Calculated BKM10 cross-section prefactor to be:\n{prefactor}")
+
+            # (4): Return the prefactor:
+            return prefactor
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error calculating BKM10 cross section prefactor:\n> {ERROR}")
+            return 0
+
+    @backend_function
+    def calculate_bethe_heitler_contribution(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        azimuthal_phi: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        lepton_propagator_p1: float,
+        lepton_propagator_p2: float,
+        Dirac_form_factor_F1: float,
+        Pauli_form_factor_F2: float,
+        verbose: bool = False) -> float:
+        """
+        ## Description:
+        The |BH|² contribution to the cross-section in nb/GeV⁴: the Fourier
+        sum of c_{0}^{BH}, c_{1}^{BH}, and c_{2}^{BH} over π - φ, times the BH
+        prefactor 1 / (x_B² y² (1 + ε²)² t P1 P2) and the BKM10 prefactor.
+
+        ## Notes:
+        1. The BH amplitude does not know about the CFFs, so in a fit this only
+        needs to be evaluated once per dataset (and beam/target polarization) ---
+        see `precompute_kinematic_bundle`.
+
+        2. For an unpolarized target, |BH|² does not depend on the beam helicity
+        and s_{1}^{BH} = 0. The longitudinally-polarized target terms are not
+        needed until the layer supports a polarized target.
+        """
+        try:
+
+            # (1): Compute c_{0}^{BH}:
+            c_0_bh = self.calculate_c_0_bh_unpolarized(
+                squared_Q_momentum_transfer,
+                x_Bjorken,
+                squared_hadronic_momentum_transfer_t,
+                epsilon,
+                lepton_energy_fraction_y,
+                shorthand_k,
+                Dirac_form_factor_F1,
+                Pauli_form_factor_F2)
+
+            # (2): Compute c_{1}^{BH}:
+            c_1_bh = self.calculate_c_1_bh_unpolarized(
+                squared_Q_momentum_transfer,
+                x_Bjorken,
+                squared_hadronic_momentum_transfer_t,
+                epsilon,
+                lepton_energy_fraction_y,
+                shorthand_k,
+                Dirac_form_factor_F1,
+                Pauli_form_factor_F2)
+
+            # (3): Compute c_{2}^{BH}:
+            c_2_bh = self.calculate_c_2_bh_unpolarized(
+                x_Bjorken,
+                squared_hadronic_momentum_transfer_t,
+                shorthand_k,
+                Dirac_form_factor_F1,
+                Pauli_form_factor_F2)
+
+            # (4): Same (Trento) convention for φ as the interference term:
+            shifted_phi = self.xp.constant(np.pi, dtype = self.kernel_dtype) - self.convert_degrees_to_radians(azimuthal_phi)
+
+            # (5): Sum the Fourier modes:
+            fourier_sum = c_0_bh + c_1_bh * self.xp.cos(shifted_phi) + c_2_bh * self.xp.cos(self.xp.constant(2.0, dtype = self.kernel_dtype) * shifted_phi)
+
+            # (6): The BH prefactor:
+            bh_prefactor = self.xp.constant(1.0, dtype = self.kernel_dtype) / (
+                x_Bjorken**2 * lepton_energy_fraction_y**2 * (self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)**2 *
+                squared_hadronic_momentum_transfer_t * lepton_propagator_p1 * lepton_propagator_p2)
+
+            # (7): The overall BKM10 prefactor:
+            cross_section_prefactor = self.calculate_bkm10_cross_section_prefactor(
+                squared_Q_momentum_transfer,
+                x_Bjorken,
+                epsilon,
+                lepton_energy_fraction_y)
+
+            # (8): Put it together in nb/GeV⁴:
+            bh_contribution = self.convert_to_nb_over_gev4(cross_section_prefactor * bh_prefactor * fourier_sum)
+
+            # (8.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated BH contribution to be:\n{bh_contribution}")
+
+            # (9): Return the contribution:
+            return bh_contribution
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating the BH contribution:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_c_0_bh_unpolarized(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        Dirac_form_factor_F1: float,
+        Pauli_form_factor_F2: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the common appearance of (F1 + F2)^{2}:
+            addition_of_form_factors_squared = (Dirac_form_factor_F1 + Pauli_form_factor_F2)**2
+
+            # (2): Calculate the common appearance of a weighted combination of F1 and F2:
+            weighted_combination_of_form_factors = Dirac_form_factor_F1**2 - (squared_hadronic_momentum_transfer_t * Pauli_form_factor_F2**2 / (self.xp.constant(4.0, dtype = self.kernel_dtype) * _MASS_OF_PROTON_IN_GEV**2))
+
+            # (3): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (4): The first line:
+            first_line = self.xp.constant(8.0, dtype = self.kernel_dtype) * shorthand_k**2 * (((self.xp.constant(2.0, dtype = self.kernel_dtype) + self.xp.constant(3.0, dtype = self.kernel_dtype) * epsilon**2) * weighted_combination_of_form_factors / t_over_Q_squared) + (self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken**2 * addition_of_form_factors_squared))
+
+            # (5): The first part of the second line:
+            second_line_first_part = (self.xp.constant(2.0, dtype = self.kernel_dtype) + epsilon**2) * ((self.xp.constant(4.0, dtype = self.kernel_dtype) * x_Bjorken**2 * _MASS_OF_PROTON_IN_GEV**2 / squared_hadronic_momentum_transfer_t) * (self.xp.constant(1.0, dtype = self.kernel_dtype) + t_over_Q_squared)**2 + self.xp.constant(4.0, dtype = self.kernel_dtype) * (self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken) * (self.xp.constant(1.0, dtype = self.kernel_dtype) + (x_Bjorken * t_over_Q_squared))) * weighted_combination_of_form_factors
+
+            # (6): The second part of the second line:
+            second_line_second_part = self.xp.constant(4.0, dtype = self.kernel_dtype) * x_Bjorken**2 * (x_Bjorken + (self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken + (epsilon**2 / self.xp.constant(2.0, dtype = self.kernel_dtype))) * (self.xp.constant(1.0, dtype = self.kernel_dtype) - t_over_Q_squared)**2 - x_Bjorken * (self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * t_over_Q_squared**2) * addition_of_form_factors_squared
+
+            # (7): The second line in its entirety:
+            second_line = (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y)**2 * (second_line_first_part + second_line_second_part)
+
+            # (8): The third line:
+            third_line = self.xp.constant(8.0, dtype = self.kernel_dtype) * (self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2) * (self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))) * (self.xp.constant(2.0, dtype = self.kernel_dtype) * epsilon**2 * (self.xp.constant(1.0, dtype = self.kernel_dtype) - (squared_hadronic_momentum_transfer_t / (self.xp.constant(4.0, dtype = self.kernel_dtype) * _MASS_OF_PROTON_IN_GEV**2))) * weighted_combination_of_form_factors - x_Bjorken**2 * (self.xp.constant(1.0, dtype = self.kernel_dtype) - t_over_Q_squared)**2 * addition_of_form_factors_squared)
+
+            # (9): Add everything up:
+            c_0_bh_unp = first_line + second_line + third_line
+
+            # (9.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_0_bh_unp to be:\n{c_0_bh_unp}")
+
+            # (10): Return the coefficient:
+            return c_0_bh_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_0_bh_unp for BH Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_c_1_bh_unpolarized(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        Dirac_form_factor_F1: float,
+        Pauli_form_factor_F2: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the common appearance of (F1 + F2)^{2}:
+            addition_of_form_factors_squared = (Dirac_form_factor_F1 + Pauli_form_factor_F2)**2
+
+            # (2): Calculate the common appearance of a weighted combination of F1 and F2:
+            weighted_combination_of_form_factors = Dirac_form_factor_F1**2 - ((squared_hadronic_momentum_transfer_t / (self.xp.constant(4.0, dtype = self.kernel_dtype) * _MASS_OF_PROTON_IN_GEV**2)) * Pauli_form_factor_F2**2)
+
+            # (3): The first part of the bracket:
+            first_part = ((self.xp.constant(4.0, dtype = self.kernel_dtype) * x_Bjorken**2 * _MASS_OF_PROTON_IN_GEV**2 / squared_hadronic_momentum_transfer_t) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken - epsilon**2) * weighted_combination_of_form_factors
+
+            # (4): The second part of the bracket:
+            second_part = self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken**2 * (self.xp.constant(1.0, dtype = self.kernel_dtype) - (self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * (squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer)) * addition_of_form_factors_squared
+
+            # (5): Multiply by the prefactor:
+            c_1_bh_unp = self.xp.constant(8.0, dtype = self.kernel_dtype) * shorthand_k * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * (first_part + second_part)
+
+            # (5.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_1_bh_unp to be:\n{c_1_bh_unp}")
+
+            # (6): Return the coefficient:
+            return c_1_bh_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_1_bh_unp for BH Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_c_2_bh_unpolarized(
+        self,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        shorthand_k: float,
+        Dirac_form_factor_F1: float,
+        Pauli_form_factor_F2: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the common appearance of (F1 + F2)^{2}:
+            addition_of_form_factors_squared = (Dirac_form_factor_F1 + Pauli_form_factor_F2)**2
+
+            # (2): Calculate the common appearance of a weighted combination of F1 and F2:
+            weighted_combination_of_form_factors = Dirac_form_factor_F1**2 - ((squared_hadronic_momentum_transfer_t / (self.xp.constant(4.0, dtype = self.kernel_dtype) * _MASS_OF_PROTON_IN_GEV**2)) * Pauli_form_factor_F2**2)
+
+            # (3): A quick scaling of the weighted combination of F1 and F2:
+            first_part = (self.xp.constant(4.0, dtype = self.kernel_dtype) * _MASS_OF_PROTON_IN_GEV**2 / squared_hadronic_momentum_transfer_t) * weighted_combination_of_form_factors
+
+            # (4): Multiply by the prefactor:
+            c_2_bh_unp = self.xp.constant(8.0, dtype = self.kernel_dtype) * x_Bjorken**2 * shorthand_k**2 * (first_part + self.xp.constant(2.0, dtype = self.kernel_dtype) * addition_of_form_factors_squared)
+
+            # (4.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_2_bh_unp to be:\n{c_2_bh_unp}")
+
+            # (5): Return the coefficient:
+            return c_2_bh_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_2_bh_unp for BH Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_dvcs_bilinear_form(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        azimuthal_phi: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        skewness_parameter: float,
+        shorthand_k: float,
+        verbose: bool = False):
+        """
+        ## Description:
+        The |DVCS|² contribution to the cross-section, in nb/GeV⁴, is a quadratic
+        form in the eight (real) CFFs: CFFs^T D CFFs. Here, we compute the (N, 8, 8)
+        matrix D, which does not depend on the CFFs, in the CFF order of the network:
+        [Re[H], Im[H], Re[E], Im[E], Re[Ht], Im[Ht], Re[Et], Im[Et]].
+
+        ## Notes:
+        1. The effective CFFs are a *real* multiple κ of the CFFs, so every curly
+        C^{DVCS} in c_{0}^{DVCS} and c_{1}^{DVCS} is κ^{0, 1, 2} times the same 
+        curly C^{DVCS}(F | F*), which is real. That is what makes D one matrix per point
+        instead of one per Fourier mode.
+
+        2. For the same reason, s_{1}^{DVCS} ~ Im[C^{DVCS}(F_eff | F*)] = 0, and there
+        is no helicity-odd |DVCS|² term for an unpolarized target.
+        """
+        try:
+
+            # (1): The 4 x 4 matrix of C^{DVCS}(F | F*) in the basis [H, E, Ht, Et]:
+            curly_c_dvcs_matrix = self.calculate_curly_C_unpolarized_dvcs_matrix(
+                squared_Q_momentum_transfer,
+                x_Bjorken,
+                squared_hadronic_momentum_transfer_t,
+                epsilon)
+
+            # (2): The effective CFFs are F_eff = κ F --- obtain κ by "effectivizing" 1:
+            kappa = self.compute_cff_effective(skewness_parameter, self.xp.ones_like(skewness_parameter), self.using_ww)
+
+            # (3): Calculate the recurrent quantity 1 + ε²:
+            one_plus_epsilon_squared = self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2
+
+            # (4): c_{0}^{DVCS} in units of C^{DVCS}(F | F*):
+            c_0_dvcs = (
+                self.xp.constant(2.0, dtype = self.kernel_dtype) * (self.xp.constant(2.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * lepton_energy_fraction_y + lepton_energy_fraction_y**2 + (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(2.0, dtype = self.kernel_dtype))) / one_plus_epsilon_squared +
+                self.xp.constant(16.0, dtype = self.kernel_dtype) * shorthand_k**2 * kappa**2 / ((self.xp.constant(2.0, dtype = self.kernel_dtype) - x_Bjorken)**2 * one_plus_epsilon_squared))
+
+            # (5): c_{1}^{DVCS} in units of C^{DVCS}(F | F*):
+            c_1_dvcs = self.xp.constant(8.0, dtype = self.kernel_dtype) * shorthand_k * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * kappa / ((self.xp.constant(2.0, dtype = self.kernel_dtype) - x_Bjorken) * one_plus_epsilon_squared)
+
+            # (6): Same (Trento) convention for φ as the other terms:
+            shifted_phi = self.xp.constant(np.pi, dtype = self.kernel_dtype) - self.convert_degrees_to_radians(azimuthal_phi)
+
+            # (7): The DVCS prefactor 1 / (y² Q²), the BKM10 prefactor, and the conversion to nb/GeV⁴:
+            dvcs_scale = self.convert_to_nb_over_gev4(
+                self.calculate_bkm10_cross_section_prefactor(squared_Q_momentum_transfer, x_Bjorken, epsilon, lepton_energy_fraction_y) *
+                (c_0_dvcs + c_1_dvcs * self.xp.cos(shifted_phi)) /
+                (lepton_energy_fraction_y**2 * squared_Q_momentum_transfer))
+
+            # (8): |F|² = Re[F]² + Im[F]², so the real and imaginary parts see the same matrix:
+            dvcs_matrix = self.xp.einsum(
+                "nab,rs->narbs",
+                dvcs_scale[:, self.xp.newaxis, self.xp.newaxis] * curly_c_dvcs_matrix,
+                self.xp.eye(2, dtype = self.kernel_dtype))
+
+            # (9): ... and interleaving them gives the CFF order of the network:
+            dvcs_matrix = self.xp.reshape(dvcs_matrix, [-1, _NUMBER_OF_CFFS, _NUMBER_OF_CFFS])
+
+            # (9.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated the DVCS bilinear form to be:\n{dvcs_matrix}")
+
+            # (10): Return the matrix:
+            return dvcs_matrix
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating the DVCS bilinear form:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_curly_C_unpolarized_dvcs_matrix(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        verbose: bool = False):
+        """
+        ## Description:
+        C^{DVCS}(F | F*) is a Hermitian form in the four complex CFFs. Here, we return
+        its (real, symmetric) matrix M of shape (N, 4, 4) in the basis [H, E, Ht, Et],
+        so that C^{DVCS}(F | F*) = Re[F]^T M Re[F] + Im[F]^T M Im[F].
+        """
+        try:
+
+            # (1): Calculate the appearance of Q^{2} + x_{B} t:
+            sum_Q_squared_xb_t = squared_Q_momentum_transfer + x_Bjorken * squared_hadronic_momentum_transfer_t
+
+            # (2): Calculate (2 - x_{B})Q^{2} + x_{B} t:
+            weighted_sum_Q_squared_xb_t = (self.xp.constant(2.0, dtype = self.kernel_dtype) - x_Bjorken) * squared_Q_momentum_transfer + x_Bjorken * squared_hadronic_momentum_transfer_t
+
+            # (3): Calculate Q^{2} (Q^{2} + x_{B} t):
+            Q_squared_times_sum = squared_Q_momentum_transfer * sum_Q_squared_xb_t
+
+            # (4): The overall prefactor of the bracket:
+            prefactor = Q_squared_times_sum / weighted_sum_Q_squared_xb_t**2
+
+            # (5): The coefficient of H H*:
+            coefficient_h_h = self.xp.constant(4.0, dtype = self.kernel_dtype) * (self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken)
+
+            # (6): The coefficient of Ht Ht*:
+            coefficient_ht_ht = self.xp.constant(4.0, dtype = self.kernel_dtype) * (self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken + ((self.xp.constant(2.0, dtype = self.kernel_dtype) * squared_Q_momentum_transfer + squared_hadronic_momentum_transfer_t) * epsilon**2 / (self.xp.constant(4.0, dtype = self.kernel_dtype) * sum_Q_squared_xb_t)))
+
+            # (7): The coefficient of (H E* + E H*) --- each of the two off-diagonal entries gets it once:
+            coefficient_h_e = -x_Bjorken**2 * (squared_Q_momentum_transfer + squared_hadronic_momentum_transfer_t)**2 / Q_squared_times_sum
+
+            # (8): The coefficient of (Ht Et* + Et Ht*):
+            coefficient_ht_et = -x_Bjorken**2 * squared_Q_momentum_transfer / sum_Q_squared_xb_t
+
+            # (9): The coefficient of E E*:
+            coefficient_e_e = -(weighted_sum_Q_squared_xb_t**2 * squared_hadronic_momentum_transfer_t / (self.xp.constant(4.0, dtype = self.kernel_dtype) * _MASS_OF_PROTON_IN_GEV**2 * Q_squared_times_sum)) + coefficient_h_e
+
+            # (10): The coefficient of Et Et*:
+            coefficient_et_et = -x_Bjorken**2 * squared_Q_momentum_transfer * squared_hadronic_momentum_transfer_t / (self.xp.constant(4.0, dtype = self.kernel_dtype) * _MASS_OF_PROTON_IN_GEV**2 * sum_Q_squared_xb_t)
+
+            # (11): Assemble the matrix in the basis [H, E, Ht, Et]:
+            zeros = self.xp.zeros_like(coefficient_h_h)
+            curly_c_dvcs_matrix = prefactor[:, self.xp.newaxis, self.xp.newaxis] * self.xp.stack([
+                self.xp.stack([coefficient_h_h, coefficient_h_e, zeros, zeros], axis = -1),
+                self.xp.stack([coefficient_h_e, coefficient_e_e, zeros, zeros], axis = -1),
+                self.xp.stack([zeros, zeros, coefficient_ht_ht, coefficient_ht_et], axis = -1),
+                self.xp.stack([zeros, zeros, coefficient_ht_et, coefficient_et_et], axis = -1)],
+                axis = -2)
+
+            # (11.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated the curly C DVCS matrix to be:\n{curly_c_dvcs_matrix}")
+
+            # (12): Return the matrix:
+            return curly_c_dvcs_matrix
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating the curly C DVCS matrix:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_curly_C_unpolarized_interference(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        Dirac_form_factor_F1: float,
+        Pauli_form_factor_F2: float,
+        real_H,
+        imag_H,
+        real_Ht,
+        imag_Ht,
+        real_E,
+        imag_E,
+        verbose: bool = False) -> float:
+
+        # (1): Calculate the first two terms: weighted CFFs:
+        weighted_cffs_real = (Dirac_form_factor_F1 * real_H) - (squared_hadronic_momentum_transfer_t * Pauli_form_factor_F2 * real_E / (self.xp.constant(4.0, dtype = self.kernel_dtype) * _MASS_OF_PROTON_IN_GEV**2))
+        weighted_cffs_imag = (Dirac_form_factor_F1 * imag_H) - (squared_hadronic_momentum_transfer_t * Pauli_form_factor_F2 * imag_E / (self.xp.constant(4.0, dtype = self.kernel_dtype) * _MASS_OF_PROTON_IN_GEV**2))
+
+        # (2): Calculate the next term:
+        second_term_real = x_Bjorken * (Dirac_form_factor_F1 + Pauli_form_factor_F2) * real_Ht / (self.xp.constant(2.0, dtype = self.kernel_dtype) - x_Bjorken + (x_Bjorken * squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer))
+        second_term_imag = x_Bjorken * (Dirac_form_factor_F1 + Pauli_form_factor_F2) * imag_Ht / (self.xp.constant(2.0, dtype = self.kernel_dtype) - x_Bjorken + (x_Bjorken * squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer))
+
+        # (3): Add them together:
+        curly_C_unpolarized_interference_real = weighted_cffs_real + second_term_real
+        curly_C_unpolarized_interference_imag = weighted_cffs_imag + second_term_imag
+
+        # (tf.constant(4.0, dtype = tf.float32)1): If verbose, print the calculation:
+        if verbose:
+            self.xp.print(f"> Calculated Curly C interference unpolarized target to be:\n{curly_C_unpolarized_interference_real. curly_C_unpolarized_interference_imag}")
+
+        # (5): Return the output:
+        return curly_C_unpolarized_interference_real, curly_C_unpolarized_interference_imag
+
+    @backend_function
+    def calculate_curly_C_unpolarized_interference_V(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        Dirac_form_factor_F1: float,
+        Pauli_form_factor_F2: float,
+        real_H,
+        imag_H,
+        real_E,
+        imag_E,
+        verbose: bool = False) -> float:
+
+        # (1): Calculate the first two terms: weighted CFFs:
+        cff_term_real = real_H + real_E
+        cff_term_imag = imag_H + imag_E
+
+        # (2): Calculate the next term:
+        second_term = x_Bjorken * (Dirac_form_factor_F1 + Pauli_form_factor_F2) / (self.xp.constant(2.0, dtype = self.kernel_dtype) - x_Bjorken + (x_Bjorken * squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer))
+
+        # (3): Add them together:
+        curly_C_unpolarized_interference_V_real = cff_term_real * second_term
+        curly_C_unpolarized_interference_V_imag = cff_term_imag * second_term
+
+        # (tf.constant(4.0, dtype = tf.float32)1): If verbose, print the calculation:
+        if verbose:
+            self.xp.print(f"> Calculated Curly C interference V unpolarized target to be:\n{curly_C_unpolarized_interference_V_real}")
+
+        # (5): Return the output:
+        return curly_C_unpolarized_interference_V_real, curly_C_unpolarized_interference_V_imag
+        
+    @backend_function
+    def calculate_curly_C_unpolarized_interference_A(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        Dirac_form_factor_F1: float,
+        Pauli_form_factor_F2: float,
+        real_Ht,
+        imag_Ht,
+        verbose: bool = False) -> float:
+
+        # (1): Calculate the next term:
+        xb_modulation = x_Bjorken * (Dirac_form_factor_F1 + Pauli_form_factor_F2) / (self.xp.constant(2.0, dtype = self.kernel_dtype) - x_Bjorken + (x_Bjorken * squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer))
+
+        # (2): Add them together:
+        curly_C_unpolarized_interference_A_real = real_Ht * xb_modulation
+        curly_C_unpolarized_interference_A_imag = imag_Ht * xb_modulation
+
+        # (3.1): If verbose, print the calculation:
+        if verbose:
+            self.xp.print(f"> Calculated Curly C interference A unpolarized target to be:\n{curly_C_unpolarized_interference_A_real}")
+
+        # (4): Return the output:
+        return curly_C_unpolarized_interference_A_real, curly_C_unpolarized_interference_A_imag
+    
+    @backend_function
+    def calculate_c_0_plus_plus_unpolarized(
+        self,
+        squared_Q_momentum_transfer,
+        x_Bjorken,
+        squared_hadronic_momentum_transfer_t,
+        epsilon,
+        lepton_energy_fraction_y,
+        k_tilde):
+        """
+        """
+
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate 1 + sqrt(1 + epsilon^{2}):
+            one_plus_root_epsilon_stuff = self.xp.constant(1.0, dtype = self.kernel_dtype) + root_one_plus_epsilon_squared
+
+            # (4): Calculate 2 - x_{B}:
+            two_minus_xb = self.xp.constant(2.0, dtype = self.kernel_dtype) - x_Bjorken
+
+            # (5): Caluclate 2 - y:
+            two_minus_y = self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y
+
+            # (6): Calculate the first term in the brackets:
+            first_term_in_brackets = k_tilde**2 * two_minus_y**2 / (squared_Q_momentum_transfer * root_one_plus_epsilon_squared)
+
+            # (7): Calculate the first part of the second term in brackets:
+            second_term_in_brackets_first_part = t_over_Q_squared * two_minus_xb * (self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)))
+            
+            # (8): Calculate the numerator of the second part of the second term in brackets:
+            second_term_in_brackets_second_part_numerator = self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken * t_over_Q_squared * (two_minus_xb + self.xp.constant(0.5, dtype = self.kernel_dtype) * (root_one_plus_epsilon_squared - self.xp.constant(1.0, dtype = self.kernel_dtype)) + self.xp.constant(0.5, dtype = self.kernel_dtype) * epsilon**2 / x_Bjorken) + epsilon**2
+            
+            # (9): Calculate the second part of the second term in brackets:
+            second_term_in_brackets_second_part =  self.xp.constant(1.0, dtype = self.kernel_dtype) + second_term_in_brackets_second_part_numerator / (two_minus_xb * one_plus_root_epsilon_stuff)
+            
+            # (10): Calculate the prefactor:
+            prefactor = -self.xp.constant(4.0, dtype = self.kernel_dtype) * two_minus_y * one_plus_root_epsilon_stuff / self.xp.pow(root_one_plus_epsilon_squared, 4)
+
+            # (11): Calculate the coefficient
+            c_0_plus_plus_unp = prefactor * (first_term_in_brackets + second_term_in_brackets_first_part * second_term_in_brackets_second_part)
+
+            # (12): Return the coefficient:
+            return c_0_plus_plus_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_0_plus_plus_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_c_0_plus_plus_unpolarized_V(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        k_tilde: float,
+        verbose: bool = False) -> float:
+
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate the recurrent quantity 1 + sqrt(1 + epsilon^2):
+            one_plus_root_epsilon_stuff = self.xp.constant(1.0, dtype = self.kernel_dtype) + root_one_plus_epsilon_squared
+
+            # (4): Compute the first term in the brackets:
+            first_term_in_brackets = (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y)**2 * k_tilde**2 / (root_one_plus_epsilon_squared * squared_Q_momentum_transfer)
+
+            # (5): First multiplicative term in the second term in the brackets:
+            second_term_first_multiplicative_term = self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))
+
+            # (6): Second multiplicative term in the second term in the brackets:
+            second_term_second_multiplicative_term = one_plus_root_epsilon_stuff / self.xp.constant(2.0, dtype = self.kernel_dtype)
+
+            # (7): Third multiplicative term in the second term in the brackets:
+            second_term_third_multiplicative_term = self.xp.constant(1.0, dtype = self.kernel_dtype) + t_over_Q_squared
+
+            # (8): Fourth multiplicative term numerator in the second term in the brackets:
+            second_term_fourth_multiplicative_term = self.xp.constant(1.0, dtype = self.kernel_dtype) + (root_one_plus_epsilon_squared - self.xp.constant(1.0, dtype = self.kernel_dtype) + (self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken)) * t_over_Q_squared / one_plus_root_epsilon_stuff
+
+            # (9): Fourth multiplicative term in its entirety:
+            second_term_in_brackets = second_term_first_multiplicative_term * second_term_second_multiplicative_term * second_term_third_multiplicative_term * second_term_fourth_multiplicative_term
+
+            # (10): The prefactor in front of the brackets:
+            coefficient_prefactor = self.xp.constant(8.0, dtype = self.kernel_dtype) * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * x_Bjorken * t_over_Q_squared / root_one_plus_epsilon_squared**4
+
+            # (11): The entire thing:
+            c_0_plus_plus_V_unp = coefficient_prefactor * (first_term_in_brackets + second_term_in_brackets)
+
+            # (11.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_0_plus_plus_V_unp to be:\n{c_0_plus_plus_V_unp}")
+
+            # (12): Return the coefficient:
+            return c_0_plus_plus_V_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_0_plus_plus_V_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)    
+
+    @backend_function
+    def calculate_c_0_plus_plus_unpolarized_A(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        k_tilde: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate the recurrent quantity 1 + sqrt(1 + epsilon^2):
+            one_plus_root_epsilon_stuff = self.xp.constant(1.0, dtype = self.kernel_dtype) + root_one_plus_epsilon_squared
+
+            # (4): Calculate 2 - y:
+            two_minus_y = self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y
+
+            # (5): Calculate Ktilde^{2}/squaredQ:
+            ktilde_over_Q_squared = k_tilde**2 / squared_Q_momentum_transfer
+
+            # (6): Calculate the first term in the curly brackets:
+            curly_bracket_first_term = two_minus_y**2 * ktilde_over_Q_squared * (one_plus_root_epsilon_stuff - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) / (self.xp.constant(2.0, dtype = self.kernel_dtype) * root_one_plus_epsilon_squared)
+
+            # (7): Calculate inner parentheses term:
+            deepest_parentheses_term = (x_Bjorken * (self.xp.constant(2.0, dtype = self.kernel_dtype) + one_plus_root_epsilon_stuff - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) / one_plus_root_epsilon_stuff + (one_plus_root_epsilon_stuff - self.xp.constant(2.0, dtype = self.kernel_dtype))) * t_over_Q_squared
+
+            # (8): Calculate the square-bracket term:
+            square_bracket_term = one_plus_root_epsilon_stuff * (one_plus_root_epsilon_stuff - x_Bjorken + deepest_parentheses_term) / self.xp.constant(2.0, dtype = self.kernel_dtype) - (self.xp.constant(2.0, dtype = self.kernel_dtype) * ktilde_over_Q_squared)
+
+            # (9): Calculate the second bracket term:
+            curly_bracket_second_term = (self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)) * square_bracket_term
+
+            # (10): Calculate the prefactor: 
+            coefficient_prefactor = self.xp.constant(8.0, dtype = self.kernel_dtype) * two_minus_y * t_over_Q_squared / root_one_plus_epsilon_squared**4
+
+            # (11): The entire thing:
+            c_0_plus_plus_A_unp = coefficient_prefactor * (curly_bracket_first_term + curly_bracket_second_term)
+
+            # (11.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_0_plus_plus_A_unp to be:\n{c_0_plus_plus_A_unp}")
+
+            # (12): Return the coefficient:
+            return c_0_plus_plus_A_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_0_plus_plus_A_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_c_1_plus_plus_unpolarized(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate 1 + sqrt(1 + epsilon^{2}):
+            one_plus_root_epsilon_stuff = self.xp.constant(1.0, dtype = self.kernel_dtype) + root_one_plus_epsilon_squared
+
+            # (4): Calculate first term in first brackets
+            first_bracket_first_term = (self.xp.constant(1.0, dtype = self.kernel_dtype) + (self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken) * (root_one_plus_epsilon_squared - self.xp.constant(1.0, dtype = self.kernel_dtype)) / (self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) + epsilon**2 / (self.xp.constant(4.0, dtype = self.kernel_dtype) * x_Bjorken)) * x_Bjorken * t_over_Q_squared
+
+            # (5): Calculate the first bracket term:
+            first_bracket_term = first_bracket_first_term - 3. * epsilon**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)
+
+            # (6): Calculate the second bracket term:
+            second_bracket_term = self.xp.constant(1.0, dtype = self.kernel_dtype) - (self.xp.constant(1.0, dtype = self.kernel_dtype) - 3. * x_Bjorken) * t_over_Q_squared + (self.xp.constant(1.0, dtype = self.kernel_dtype) - root_one_plus_epsilon_squared + 3. * epsilon**2) * x_Bjorken * t_over_Q_squared / (one_plus_root_epsilon_stuff - epsilon**2)
+
+            # (7): Calculate the crazy coefficient with all the y's:
+            fancy_y_coefficient = self.xp.constant(2.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * lepton_energy_fraction_y + lepton_energy_fraction_y**2 + epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(2.0, dtype = self.kernel_dtype)
+
+            # (8): Calculate the entire second term:
+            second_term = -self.xp.constant(4.0, dtype = self.kernel_dtype) * shorthand_k * fancy_y_coefficient * (one_plus_root_epsilon_stuff - epsilon**2) * second_bracket_term / root_one_plus_epsilon_squared**5
+
+            # (9): Calculate the first term:
+            first_term = -self.xp.constant(16.0, dtype = self.kernel_dtype) * shorthand_k * (self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)) * first_bracket_term / root_one_plus_epsilon_squared**5
+
+            # (10): Calculate the coefficient
+            c_1_plus_plus_unp = first_term + second_term
+            
+            # (11.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_1_plus_plus_unp to be:\n{c_1_plus_plus_unp}")
+
+            # (12): Return the coefficient:
+            return c_1_plus_plus_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_1_plus_plus_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_c_1_plus_plus_unpolarized_V(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        t_prime: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+        root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+        # (2): Calculate the recurrent quantity t/Q^{2}:
+        t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+        # (3): Calculate the first bracket term:
+        first_bracket_term = (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y)**2 * (self.xp.constant(1.0, dtype = self.kernel_dtype) - (self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * t_over_Q_squared)
+
+        # (4): Compute the first part of the second term in brackets:
+        second_bracket_term_first_part = self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)
+
+        # (5): Compute the second part of the second term in brackets:
+        second_bracket_term_second_part = self.xp.constant(0.5, dtype = self.kernel_dtype) * (self.xp.constant(1.0, dtype = self.kernel_dtype) + root_one_plus_epsilon_squared - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * t_prime / squared_Q_momentum_transfer
+
+        # (6): The prefactor in front of the brackets:
+        coefficient_prefactor = self.xp.constant(16.0, dtype = self.kernel_dtype) * shorthand_k * x_Bjorken * t_over_Q_squared / self.xp.pow(root_one_plus_epsilon_squared, 5)
+
+        # (7): The entire thing:
+        c_1_plus_plus_V_unp = coefficient_prefactor * (first_bracket_term + second_bracket_term_first_part * second_bracket_term_second_part)
+
+        # (7.1): If verbose, log the output:
+        if verbose:
+            self.xp.print(f"> Calculated c_1_plus_plus_V_unp to be:\n{c_1_plus_plus_V_unp}")
+
+        # (12): Return the coefficient:
+        return c_1_plus_plus_V_unp
+
+    @backend_function
+    def calculate_c_1_plus_plus_unpolarized_A(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        t_prime: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate t'/Q^{2}
+            t_prime_over_Q_squared = t_prime / squared_Q_momentum_transfer
+
+            # (4): Calculate 1 - x_{B}:
+            one_minus_xb = self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken
+
+            # (5): Calculate 1 - 2 x_{B}:
+            one_minus_2xb = self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken
+
+            # (6): Calculate a fancy, annoying quantity:
+            fancy_y_stuff = self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)
+
+            # (7): Calculate the second contribution to the first term in brackets:
+            first_bracket_term_second_part = self.xp.constant(1.0, dtype = self.kernel_dtype) - one_minus_2xb * t_over_Q_squared + (self.xp.constant(4.0, dtype = self.kernel_dtype) * x_Bjorken * one_minus_xb + epsilon**2) * t_prime_over_Q_squared / (self.xp.constant(4.0, dtype = self.kernel_dtype) * root_one_plus_epsilon_squared)
+
+            # (8): Calculate the second bracket term:
+            second_bracket_term = self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(0.5, dtype = self.kernel_dtype) * x_Bjorken + self.xp.constant(0.25, dtype = self.kernel_dtype) * (one_minus_2xb + root_one_plus_epsilon_squared) * (self.xp.constant(1.0, dtype = self.kernel_dtype) - t_over_Q_squared) + (self.xp.constant(4.0, dtype = self.kernel_dtype) * x_Bjorken * one_minus_xb + epsilon**2) * t_prime_over_Q_squared / (self.xp.constant(2.0, dtype = self.kernel_dtype) * root_one_plus_epsilon_squared)
+
+            # (9): Calculate the prefactor:
+            prefactor = -self.xp.constant(16.0, dtype = self.kernel_dtype) * shorthand_k * t_over_Q_squared / root_one_plus_epsilon_squared**4
+            
+            # (10): The entire thing:
+            c_1_plus_plus_A_unp = prefactor * (fancy_y_stuff * first_bracket_term_second_part - (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y)**2 * second_bracket_term)
+
+            # (10.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_1_plus_plus_A_unp to be:\n{c_1_plus_plus_A_unp}")
+
+            # (11): Return the coefficient:
+            return c_1_plus_plus_A_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_1_plus_plus_A_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_c_2_plus_plus_unpolarized(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        t_prime: float,
+        k_tilde: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate the first bracket quantity:
+            first_bracket_term = self.xp.constant(2.0, dtype = self.kernel_dtype) * epsilon**2 * k_tilde**2 / (root_one_plus_epsilon_squared * (self.xp.constant(1.0, dtype = self.kernel_dtype) + root_one_plus_epsilon_squared) * squared_Q_momentum_transfer)
+        
+            # (4): Calculate the second bracket quantity:
+            second_bracket_term = x_Bjorken * t_prime * t_over_Q_squared * (self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken - self.xp.constant(0.5, dtype = self.kernel_dtype) * (root_one_plus_epsilon_squared - self.xp.constant(1.0, dtype = self.kernel_dtype)) + self.xp.constant(0.5, dtype = self.kernel_dtype) * epsilon**2 / x_Bjorken) / squared_Q_momentum_transfer
+
+            # (5): Calculate the prefactor:
+            prefactor = self.xp.constant(8.0, dtype = self.kernel_dtype) * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * (self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)) / root_one_plus_epsilon_squared**4
+            
+            # (6): Calculate the coefficient
+            c_2_plus_plus_unp = prefactor * (first_bracket_term + second_bracket_term)
+            
+            # (6.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_2_plus_plus_unp to be:\n{c_2_plus_plus_unp}")
+
+            # (7): Return the coefficient:
+            return c_2_plus_plus_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_2_plus_plus_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_c_2_plus_plus_unpolarized_V(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        t_prime: float,
+        k_tilde: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate t'/Q^{2}
+            t_prime_over_Q_squared = t_prime / squared_Q_momentum_transfer
+
+            # (4): Calculate the major term:
+            major_term = (self.xp.constant(4.0, dtype = self.kernel_dtype) * k_tilde**2 / (root_one_plus_epsilon_squared * squared_Q_momentum_transfer)) + self.xp.constant(0.5, dtype = self.kernel_dtype) * (self.xp.constant(1.0, dtype = self.kernel_dtype) + root_one_plus_epsilon_squared - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * (self.xp.constant(1.0, dtype = self.kernel_dtype) + t_over_Q_squared) * t_prime_over_Q_squared
+
+            # (5): Calculate the prefactor: 
+            prefactor = self.xp.constant(8.0, dtype = self.kernel_dtype) * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * (self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)) * x_Bjorken * t_over_Q_squared / root_one_plus_epsilon_squared**4
+            
+            # (6): The entire thing:
+            c_2_plus_plus_V_unp = prefactor * major_term
+
+            # (6.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_2_plus_plus_V_unp to be:\n{c_2_plus_plus_V_unp}")
+
+            # (7): Return the coefficient:
+            return c_2_plus_plus_V_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_2_plus_plus_V_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_c_2_plus_plus_unpolarized_A(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        t_prime: float,
+        k_tilde: float,
+        verbose: bool = False) -> float:
+
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate t'/Q^{2}
+            t_prime_over_Q_squared = t_prime / squared_Q_momentum_transfer
+
+            # (4): Calculate the first bracket term:
+            first_bracket_term = self.xp.constant(4.0, dtype = self.kernel_dtype) * (self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * k_tilde**2 / (root_one_plus_epsilon_squared * squared_Q_momentum_transfer)
+
+            # (5): Calculate the second bracket term:
+            second_bracket_term = (3.  - root_one_plus_epsilon_squared - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken + epsilon**2 / x_Bjorken ) * x_Bjorken * t_prime_over_Q_squared
+
+            # (6): Calculate the prefactor: 
+            prefactor = self.xp.constant(4.0, dtype = self.kernel_dtype) * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * (self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)) * t_over_Q_squared / root_one_plus_epsilon_squared**4
+            
+            # (7): The entire thing:
+            c_2_plus_plus_A_unp = prefactor * (first_bracket_term - second_bracket_term)
+
+            # (7.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_2_plus_plus_A_unp to be:\n{c_2_plus_plus_A_unp}")
+
+            # (8): Return the coefficient:
+            return c_2_plus_plus_A_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_2_plus_plus_A_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_c_3_plus_plus_unpolarized(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate the major term:
+            major_term = (self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken) * t_over_Q_squared + self.xp.constant(0.5, dtype = self.kernel_dtype) * (root_one_plus_epsilon_squared - self.xp.constant(1.0, dtype = self.kernel_dtype)) * (self.xp.constant(1.0, dtype = self.kernel_dtype) + t_over_Q_squared)
+        
+            # (4): Calculate the "intermediate" term:
+            intermediate_term = (root_one_plus_epsilon_squared - self.xp.constant(1.0, dtype = self.kernel_dtype)) / root_one_plus_epsilon_squared**5
+
+            # (5): Calculate the prefactor:
+            prefactor = -self.xp.constant(8.0, dtype = self.kernel_dtype) * shorthand_k * (self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))
+            
+            # (6): Calculate the coefficient
+            c_3_plus_plus_unp = prefactor * intermediate_term * major_term
+            
+            # (6.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_3_plus_plus_unp to be:\n{c_3_plus_plus_unp}")
+
+            # (7): Return the coefficient:
+            return c_3_plus_plus_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_3_plus_plus_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_c_3_plus_plus_unpolarized_V(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate the major term:
+            major_term = root_one_plus_epsilon_squared - self.xp.constant(1.0, dtype = self.kernel_dtype) + (self.xp.constant(1.0, dtype = self.kernel_dtype) + root_one_plus_epsilon_squared - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * t_over_Q_squared
+
+            # (4): Calculate he prefactor:
+            prefactor = -self.xp.constant(8.0, dtype = self.kernel_dtype) * shorthand_k * (self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)) * x_Bjorken * t_over_Q_squared / root_one_plus_epsilon_squared**5
+            
+            # (5): The entire thing:
+            c_3_plus_plus_V_unp = prefactor * major_term
+
+            # (5.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_3_plus_plus_V_unp to be:\n{c_3_plus_plus_V_unp}")
+
+            # (7): Return the coefficient:
+            return c_3_plus_plus_V_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_3_plus_plus_V_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_c_3_plus_plus_unpolarized_A(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        t_prime: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        """
+        """
+
+        try:
+
+            # (1): Calculate the main term:
+            main_term = squared_hadronic_momentum_transfer_t * t_prime * (x_Bjorken * (self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken) + epsilon**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)) / squared_Q_momentum_transfer**2
+
+            # (2): Calculate the prefactor:
+            prefactor = self.xp.constant(16.0, dtype = self.kernel_dtype) * shorthand_k * (self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)) / (self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)**2.5
+            
+            # (3): The entire thing:
+            c_3_plus_plus_A_unp = prefactor * main_term
+
+            # (3.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_3_plus_plus_A_unp to be:\n{c_3_plus_plus_A_unp}")
+
+            # (4): Return the coefficient:
+            return c_3_plus_plus_A_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_2_plus_plus_A_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+
+    @backend_function
+    def calculate_c_0_zero_plus_unpolarized(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the bracket quantity:
+            bracket_quantity = epsilon**2 + squared_hadronic_momentum_transfer_t * (self.xp.constant(2.0, dtype = self.kernel_dtype) - self.xp.constant(6.0, dtype = self.kernel_dtype) * x_Bjorken - epsilon**2) / (self.xp.constant(3.0, dtype = self.kernel_dtype) * squared_Q_momentum_transfer)
+            
+            # (2): Calculate part of the prefactor:
+            prefactor = self.xp.constant(12.0, dtype = self.kernel_dtype) * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype)) * shorthand_k * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))) / self.xp.pow(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2, self.xp.constant(2.5, dtype = self.kernel_dtype))
+            
+            # (3): Calculate the coefficient:
+            c_0_zero_plus_unp = prefactor * bracket_quantity
+            
+            # (3.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_0_zero_plus_unp to be:\n{c_0_zero_plus_unp}")
+
+            # (4): Return the coefficient:
+            return c_0_zero_plus_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_0_zero_plus_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_c_0_zero_plus_unpolarized_V(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (2): Calculate the main part of the thing:
+            main_part = x_Bjorken * t_over_Q_squared * (self.xp.constant(1.0, dtype = self.kernel_dtype) - (self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * t_over_Q_squared)
+
+            # (3): Calculate the prefactor:
+            prefactor = self.xp.constant(24.0, dtype = self.kernel_dtype) * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype)) * shorthand_k * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (lepton_energy_fraction_y**2 * epsilon**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))) / (self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)**2.5
+
+            # (4): Stitch together the coefficient:
+            c_0_zero_plus_V_unp = prefactor * main_part
+
+            # (tf.constant(4.0, dtype = tf.float32)1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_0_zero_plus_V_unp to be:\n{c_0_zero_plus_V_unp}")
+
+            # (5): Return the coefficient:
+            return c_0_zero_plus_V_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_0_zero_plus_V_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_c_0_zero_plus_unpolarized_A(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (2): Calculate the recurrent quantity 8 - 6x_{B} + 5 epsilon^{2}:
+            fancy_xb_epsilon_term = self.xp.constant(8.0, dtype = self.kernel_dtype) - self.xp.constant(6.0, dtype = self.kernel_dtype) * x_Bjorken + self.xp.constant(5.0, dtype = self.kernel_dtype) * epsilon**2
+
+            # (3): Compute the bracketed term:
+            brackets_term = self.xp.constant(1.0, dtype = self.kernel_dtype) - t_over_Q_squared * (self.xp.constant(2.0, dtype = self.kernel_dtype) - self.xp.constant(12.0, dtype = self.kernel_dtype) * x_Bjorken * (self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken) - epsilon**2) / fancy_xb_epsilon_term
+
+            # (4): Calculate the prefactor:
+            prefactor = self.xp.constant(4.0, dtype = self.kernel_dtype) * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype)) * shorthand_k * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (lepton_energy_fraction_y**2 * epsilon**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))) / self.xp.pow(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2, self.xp.constant(2.5, dtype = self.kernel_dtype))
+
+            # (5): Stitch together the coefficient:
+            c_0_zero_plus_A_unp = prefactor * t_over_Q_squared * fancy_xb_epsilon_term * brackets_term
+
+            # (5.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_0_zero_plus_A_unp to be:\n{c_0_zero_plus_A_unp}")
+
+            # (6): Return the coefficient:
+            return c_0_zero_plus_A_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_0_zero_plus_A_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_c_1_zero_plus_unpolarized(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        t_prime: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate t'/Q^{2}
+            t_prime_over_Q_squared = t_prime / squared_Q_momentum_transfer
+
+            # (4): Calculate 1 - x_{B}:
+            one_minus_xb = self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken
+
+            # (5): Calculate the annoying y quantity:
+            y_quantity = self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))
+
+            # (6): Calculate the first term:
+            first_bracket_term = (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y)**2 * t_prime_over_Q_squared * (one_minus_xb + (one_minus_xb * x_Bjorken + (epsilon**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))) * t_prime_over_Q_squared / root_one_plus_epsilon_squared)
+            
+            # (7): Calculate the second term:
+            second_bracket_term = y_quantity * (self.xp.constant(1.0, dtype = self.kernel_dtype) - (self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * t_over_Q_squared) * (epsilon**2 - self.xp.constant(2.0, dtype = self.kernel_dtype) * (self.xp.constant(1.0, dtype = self.kernel_dtype) + (epsilon**2 / (self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken))) * x_Bjorken * t_over_Q_squared) / root_one_plus_epsilon_squared
+            
+            # (8): Calculate part of the prefactor:
+            prefactor = self.xp.constant(8.0, dtype = self.kernel_dtype) * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype) * y_quantity) / root_one_plus_epsilon_squared**4
+            
+            # (9): Calculate the coefficient:
+            c_1_zero_plus_unp = prefactor * (first_bracket_term + second_bracket_term)
+            
+            # (9.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_1_zero_plus_unp to be:\n{c_1_zero_plus_unp}")
+
+            # (9): Return the coefficient:
+            return c_1_zero_plus_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_1_zero_plus_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_c_1_zero_plus_unpolarized_V(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        k_tilde: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (2): Calculate the huge y quantity:
+            y_quantity = self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))
+
+            # (3): Calculate the major part:
+            major_part = (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y)**2 * k_tilde**2 / squared_Q_momentum_transfer + (self.xp.constant(1.0, dtype = self.kernel_dtype) - (self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * t_over_Q_squared)**2 * y_quantity
+
+            # (4): Calculate the prefactor:
+            prefactor = self.xp.constant(16.0, dtype = self.kernel_dtype) * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype) * y_quantity) * x_Bjorken * t_over_Q_squared / (self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)**2.5
+
+            # (5): Stitch together the coefficient:
+            c_1_zero_plus_V_unp = prefactor * major_part
+
+            # (5.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_1_zero_plus_V_unp to be:\n{c_1_zero_plus_V_unp}")
+
+            # (6): Return the coefficient:
+            return c_1_zero_plus_V_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_1_zero_plus_V_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_c_1_zero_plus_unpolarized_A(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        k_tilde: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate 1 - 2x_{B}:
+            one_minus_2xb = self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken
+
+            # (4): Calculate the annoying y quantity:
+            y_quantity = self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))
+
+            # (5): Calculate the first part of the second term:
+            second_term_first_part = (self.xp.constant(1.0, dtype = self.kernel_dtype) - one_minus_2xb * t_over_Q_squared) * y_quantity
+
+            # (6); Calculate the second part of the second term:
+            second_term_second_part = self.xp.constant(4.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken + 3. * epsilon**2 + t_over_Q_squared * (self.xp.constant(4.0, dtype = self.kernel_dtype) * x_Bjorken * (self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken) + epsilon**2)
+            
+            # (7): Calculate the first term:
+            first_term = k_tilde**2 * one_minus_2xb * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y)**2 / squared_Q_momentum_transfer
+            
+            # (8): Calculate part of the prefactor:
+            prefactor = self.xp.constant(8.0, dtype = self.kernel_dtype) * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype) * y_quantity) * t_over_Q_squared / root_one_plus_epsilon_squared**5
+            
+            # (9): Calculate the coefficient:
+            c_1_zero_plus_unp_A = prefactor * (first_term + second_term_first_part * second_term_second_part)
+            
+            # (9.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_1_zero_plus_unp_A to be:\n{c_1_zero_plus_unp_A}")
+
+            # (10): Return the coefficient:
+            return c_1_zero_plus_unp_A
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_1_zero_plus_unp_A for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_c_2_zero_plus_unpolarized(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity epsilon^2/2:
+            epsilon_squared_over_2 = epsilon**2 / self.xp.constant(2.0, dtype = self.kernel_dtype)
+
+            # (3): Calculate the annoying y quantity:
+            y_quantity = self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))
+
+            # (4): Calculate the bracket term:
+            bracket_term = self.xp.constant(1.0, dtype = self.kernel_dtype) + ((self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon_squared_over_2 / x_Bjorken) / (self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon_squared_over_2)) * x_Bjorken * squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (5): Calculate the prefactor:
+            prefactor = -self.xp.constant(8.0, dtype = self.kernel_dtype) * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype) * y_quantity) * shorthand_k * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) / root_one_plus_epsilon_squared**5
+            
+            # (6): Calculate the coefficient:
+            c_2_zero_plus_unp = prefactor * (self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon_squared_over_2) * bracket_term
+            
+            # (6.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_2_zero_plus_unp to be:\n{c_2_zero_plus_unp}")
+
+            # (7): Return the coefficient:
+            return c_2_zero_plus_unp
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_2_zero_plus_unp for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_c_2_zero_plus_unpolarized_V(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate the annoying y quantity:
+            y_quantity = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)))
+
+            # (4): Calculate the prefactor:
+            prefactor = self.xp.constant(8.0, dtype = self.kernel_dtype) * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype)) * y_quantity * shorthand_k * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * x_Bjorken * t_over_Q_squared / root_one_plus_epsilon_squared**5
+            
+            # (5): Calculate the coefficient:
+            c_2_zero_plus_unp_V = prefactor * (self.xp.constant(1.0, dtype = self.kernel_dtype) - (self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * t_over_Q_squared)
+            
+            # (5.1): If verbose, log the output:
+            if verbose:
+                self.xp.print(f"> Calculated c_2_zero_plus_unp_V to be:\n{c_2_zero_plus_unp_V}")
+
+            # (6): Return the coefficient:
+            return c_2_zero_plus_unp_V
+
+        except Exception as ERROR:
+            self.xp.print(f"> Error in calculating c_2_zero_plus_unp_V for Interference Term:\n> {ERROR}")
+            return self.xp.constant(0.0, dtype = self.kernel_dtype)
+        
+    @backend_function
+    def calculate_c_2_zero_plus_unpolarized_A(
+        self,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        t_prime: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+        root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+        # (2): Calculate the recurrent quantity t/Q^{2}:
+        t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+        # (3): Calculate t'/Q^{2}
+        t_prime_over_Q_squared = t_prime / squared_Q_momentum_transfer
+
+        # (4): Calculate 1 - x_{B}:
+        one_minus_xb = self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken
+
+        # (5): Calculate the annoying y quantity:
+        y_quantity = self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))
+
+        # (6): Calculate the bracket term:
+        bracket_term = one_minus_xb + self.xp.constant(0.5, dtype = self.kernel_dtype) * t_prime_over_Q_squared * (self.xp.constant(4.0, dtype = self.kernel_dtype) * x_Bjorken * one_minus_xb + epsilon**2) / root_one_plus_epsilon_squared
+        
+        # (7): Calculate part of the prefactor:
+        prefactor = self.xp.constant(8.0, dtype = self.kernel_dtype) * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype) * y_quantity) * shorthand_k * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * t_over_Q_squared / root_one_plus_epsilon_squared**4
+        
+        # (8): Calculate the coefficient:
+        c_2_zero_plus_unp_A = prefactor * bracket_term
+        
+        # (tf.constant(8.0, dtype = tf.float32)1): If verbose, log the output:
+        if verbose:
+            self.xp.print(f"> Calculated c_2_zero_plus_unp_A to be:\n{c_2_zero_plus_unp_A}")
+
+        # (9): Return the coefficient:
+        return c_2_zero_plus_unp_A
+
+    @backend_function
+    def calculate_s_1_plus_plus_unpolarized(
+        self,
+        lepton_helicity: float,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        t_prime: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the quantity t'/Q^{2}: 
+            tPrime_over_Q_squared = t_prime / squared_Q_momentum_transfer
+
+            # (3): Calculate the bracket term:
+            bracket_term = self.xp.constant(1.0, dtype = self.kernel_dtype) + ((self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken + self.xp.constant(0.5, dtype = self.kernel_dtype) * (root_one_plus_epsilon_squared - self.xp.constant(1.0, dtype = self.kernel_dtype))) / root_one_plus_epsilon_squared**2) * tPrime_over_Q_squared
+            
+            # (4): Calculate the prefactor:
+            prefactor = self.xp.constant(8.0, dtype = self.kernel_dtype) * lepton_helicity * shorthand_k * lepton_energy_fraction_y * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) / root_one_plus_epsilon_squared**2
+
+            # (5): Calculate the coefficient
+            s_1_plus_plus_unp = prefactor * bracket_term
+            
+            # (5.1): If verbose, log the output:
+            if verbose:
+                print(f"> Calculated s_1_plus_plus_unp to be:\n{s_1_plus_plus_unp}")
+
+            # (6): Return the coefficient:
+            return s_1_plus_plus_unp
+
+        except Exception as ERROR:
+            print(f"> Error in calculating s_1_plus_plus_unp for Interference Term:\n> {ERROR}")
+            return 0.
+
+    @backend_function
+    def calculate_s_1_plus_plus_unpolarized_V(
+        self,
+        lepton_helicity: float,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate the bracket term:
+            bracket_term = root_one_plus_epsilon_squared - self.xp.constant(1.0, dtype = self.kernel_dtype) + (self.xp.constant(1.0, dtype = self.kernel_dtype) + root_one_plus_epsilon_squared - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * t_over_Q_squared
+
+            # (4): Calculate the prefactor:
+            prefactor = -self.xp.constant(8.0, dtype = self.kernel_dtype) * lepton_helicity * shorthand_k * lepton_energy_fraction_y * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * x_Bjorken * t_over_Q_squared / root_one_plus_epsilon_squared**4
+
+            # (5): Calculate the coefficient
+            s_1_plus_plus_unp_V = prefactor * bracket_term
+            
+            # (5.1): If verbose, log the output:
+            if verbose:
+                print(f"> Calculated s_1_plus_plus_unp_V to be:\n{s_1_plus_plus_unp_V}")
+
+            # (6): Return the coefficient:
+            return s_1_plus_plus_unp_V
+
+        except Exception as ERROR:
+            print(f"> Error in calculating s_1_plus_plus_unp_V for Interference Term:\n> {ERROR}")
+            return 0.
+        
+    @backend_function
+    def calculate_s_1_plus_plus_unpolarized_A(
+        self,
+        lepton_helicity: float,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        t_prime: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate the quantity t'/Q^{2}:
+            tPrime_over_Q_squared = t_prime / squared_Q_momentum_transfer
+
+            # (4): Calculate the bracket term:
+            one_minus_2xb = self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken
+
+            # (5): Calculate the bracket term:
+            bracket_term = self.xp.constant(1.0, dtype = self.kernel_dtype) - one_minus_2xb * (one_minus_2xb + root_one_plus_epsilon_squared) * tPrime_over_Q_squared / (self.xp.constant(2.0, dtype = self.kernel_dtype) * root_one_plus_epsilon_squared)
+
+            # (6): Calculate the prefactor:
+            prefactor = self.xp.constant(8.0, dtype = self.kernel_dtype) * lepton_helicity * shorthand_k * lepton_energy_fraction_y * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * t_over_Q_squared / root_one_plus_epsilon_squared**2
+
+            # (7): Calculate the coefficient
+            s_1_plus_plus_unp_A = prefactor * bracket_term
+            
+            # (7.1): If verbose, log the output:
+            if verbose:
+                print(f"> Calculated s_1_plus_plus_unp_A to be:\n{s_1_plus_plus_unp_A}")
+
+            # (8): Return the coefficient:
+            return s_1_plus_plus_unp_A
+
+        except Exception as ERROR:
+            print(f"> Error in calculating s_1_plus_plus_unp_A for Interference Term:\n> {ERROR}")
+            return 0.
+
+    @backend_function
+    def calculate_s_2_plus_plus_unpolarized(
+        self,
+        lepton_helicity: float,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        t_prime: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the quantity t'/Q^{2}:
+            tPrime_over_Q_squared = t_prime / squared_Q_momentum_transfer
+
+            # (3): Calculate a fancy, annoying quantity:
+            fancy_y_stuff = self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)
+
+            # (4): Calculate the first bracket term:
+            first_bracket_term = (epsilon**2 - x_Bjorken * (root_one_plus_epsilon_squared - 1.)) / (self.xp.constant(1.0, dtype = self.kernel_dtype) + root_one_plus_epsilon_squared - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken)
+
+            # (5): Calculate the second bracket term:
+            second_bracket_term = (self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken + epsilon**2) * tPrime_over_Q_squared / (self.xp.constant(2.0, dtype = self.kernel_dtype) * root_one_plus_epsilon_squared)
+
+            # (6): Calculate the prefactor:
+            prefactor = -self.xp.constant(4.0, dtype = self.kernel_dtype) * lepton_helicity * fancy_y_stuff * lepton_energy_fraction_y * (self.xp.constant(1.0, dtype = self.kernel_dtype) + root_one_plus_epsilon_squared - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * tPrime_over_Q_squared / root_one_plus_epsilon_squared**3
+
+            # (7): Calculate the coefficient
+            s_2_plus_plus_unp = prefactor * (first_bracket_term - second_bracket_term)
+            
+            # (7.1): If verbose, log the output:
+            if verbose:
+                print(f"> Calculated s_2_plus_plus_unp to be:\n{s_2_plus_plus_unp}")
+
+            # (6): Return the coefficient:
+            return s_2_plus_plus_unp
+
+        except Exception as ERROR:
+            print(f"> Error in calculating s_2_plus_plus_unp for Interference Term:\n> {ERROR}")
+            return 0.
+        
+    @backend_function
+    def calculate_s_2_plus_plus_unpolarized_V(
+        self,
+        lepton_helicity: float,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate a fancy, annoying quantity:
+            fancy_y_stuff = self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)
+
+            # (4): Calculate the bracket term:
+            one_minus_2xb = self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken
+
+            # (5): Calculate the bracket term:
+            bracket_term = root_one_plus_epsilon_squared - self.xp.constant(1.0, dtype = self.kernel_dtype) + (one_minus_2xb + root_one_plus_epsilon_squared) * t_over_Q_squared
+
+            # (6): Calculate the parentheses term:
+            parentheses_term = self.xp.constant(1.0, dtype = self.kernel_dtype) - one_minus_2xb * t_over_Q_squared
+
+            # (7): Calculate the prefactor:
+            prefactor = -self.xp.constant(4.0, dtype = self.kernel_dtype) * lepton_helicity * fancy_y_stuff * lepton_energy_fraction_y * x_Bjorken * t_over_Q_squared / root_one_plus_epsilon_squared**4
+
+            # (8): Calculate the coefficient
+            s_2_plus_plus_unp_V = prefactor * parentheses_term * bracket_term
+            
+            # (8.1): If verbose, log the output:
+            if verbose:
+                print(f"> Calculated s_2_plus_plus_unp_V to be:\n{s_2_plus_plus_unp_V}")
+
+            # (9): Return the coefficient:
+            return s_2_plus_plus_unp_V
+
+        except Exception as ERROR:
+            print(f"> Error in calculating s_2_plus_plus_unp_V for Interference Term:\n> {ERROR}")
+            return
+        
+    @backend_function
+    def calculate_s_2_plus_plus_unpolarized_A(
+        self,
+        lepton_helicity: float,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        t_prime: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate the quantity t'/Q^{2}:
+            tPrime_over_Q_squared = t_prime / squared_Q_momentum_transfer
+
+            # (4): Calculate a fancy, annoying quantity:
+            fancy_y_stuff = self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)
+
+            # (5): Calculate the last term:
+            last_term = self.xp.constant(1.0, dtype = self.kernel_dtype) + (self.xp.constant(4.0, dtype = self.kernel_dtype) * (self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken) * x_Bjorken + epsilon**2) * t_over_Q_squared / (4. - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken + 3. * epsilon**2)
+
+            # (6): Calculate the middle term:
+            middle_term = self.xp.constant(1.0, dtype = self.kernel_dtype) + root_one_plus_epsilon_squared - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken
+
+            # (7): Calculate the prefactor:
+            prefactor = -self.xp.constant(8.0, dtype = self.kernel_dtype) * lepton_helicity * fancy_y_stuff * lepton_energy_fraction_y * t_over_Q_squared * tPrime_over_Q_squared / root_one_plus_epsilon_squared**4
+
+            # (8): Calculate the coefficient
+            s_2_plus_plus_unp_A = prefactor * middle_term * last_term
+            
+            # (8.1): If verbose, log the output:
+            if verbose:
+                print(f"> Calculated s_2_plus_plus_unp_A to be:\n{s_2_plus_plus_unp_A}")
+
+            # (9): Return the coefficient:
+            return s_2_plus_plus_unp_A
+
+        except Exception as ERROR:
+            print(f"> Error in calculating s_2_plus_plus_unp_A for Interference Term:\n> {ERROR}")
+            return 0.
+        
+    @backend_function
+    def calculate_s_1_zero_plus_unpolarized(
+        self,
+        lepton_helicity: float,
+        squared_Q_momentum_transfer: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        k_tilde: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the  quantity (1 + epsilon^2)^{2}:
+            root_one_plus_epsilon_squared = (self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)**2
+
+            # (2): Calculate the huge y quantity:
+            y_quantity = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)))
+
+            # (3): Calculate the coefficient
+            s_1_zero_plus_unp = self.xp.constant(8.0, dtype = self.kernel_dtype) * lepton_helicity * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype)) * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * lepton_energy_fraction_y * y_quantity * k_tilde**2 / (root_one_plus_epsilon_squared * squared_Q_momentum_transfer)
+            
+            # (3.1): If verbose, log the output:
+            if verbose:
+                print(f"> Calculated s_1_zero_plus_unp to be:\n{s_1_zero_plus_unp}")
+
+            # (4): Return the coefficient:
+            return s_1_zero_plus_unp
+
+        except Exception as ERROR:
+            print(f"> Error in calculating s_1_zero_plus_unp for Interference Term:\n> {ERROR}")
+            return 0.   
+        
+    @backend_function
+    def calculate_s_1_zero_plus_unpolarized_V(
+        self,
+        lepton_helicity: float,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the quantity (1 + epsilon^2)^{2}:
+            one_plus_epsilon_squared_squared = (self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)**2
+
+            # (2): Calculate the quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate a fancy, annoying quantity:
+            fancy_y_stuff = self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)
+
+            # (4): Calculate the bracket term:
+            bracket_term = self.xp.constant(4.0, dtype = self.kernel_dtype) * (self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * t_over_Q_squared * (self.xp.constant(1.0, dtype = self.kernel_dtype) + x_Bjorken * t_over_Q_squared) + epsilon**2 * (self.xp.constant(1.0, dtype = self.kernel_dtype) + t_over_Q_squared)**2
+
+            # (5): Calculate the prefactor:
+            prefactor = self.xp.constant(4.0, dtype = self.kernel_dtype) * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype) * fancy_y_stuff) * lepton_helicity * lepton_energy_fraction_y * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * x_Bjorken * t_over_Q_squared / one_plus_epsilon_squared_squared
+
+            # (6): Calculate the coefficient
+            s_1_zero_plus_unp_V = prefactor * bracket_term
+            
+            # (6.1): If verbose, log the output:
+            if verbose:
+                print(f"> Calculated s_1_zero_plus_unp_V to be:\n{s_1_zero_plus_unp_V}")
+
+            # (7): Return the coefficient:
+            return s_1_zero_plus_unp_V
+
+        except Exception as ERROR:
+            print(f"> Error in calculating s_1_zero_plus_unp_V for Interference Term:\n> {ERROR}")
+            return 0.
+    
+    @backend_function
+    def calculate_s_1_zero_plus_unpolarized_A(
+        self,
+        lepton_helicity: float,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the quantity (1 + epsilon^2)^{2}:
+            one_plus_epsilon_squared_squared = (self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)**2
+
+            # (2): Calculate a fancy, annoying quantity:
+            fancy_y_stuff = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))
+
+            # (3): Calculate the prefactor:
+            prefactor = -self.xp.constant(8.0, dtype = self.kernel_dtype) * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype)) * lepton_helicity * lepton_energy_fraction_y * (self.xp.constant(2.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y) * (self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) / one_plus_epsilon_squared_squared
+
+            # (4): Calculate the coefficient
+            s_1_zero_plus_unp_A = prefactor * fancy_y_stuff * squared_hadronic_momentum_transfer_t * shorthand_k**2 / squared_Q_momentum_transfer
+            
+            # (4.1): If verbose, log the output:
+            if verbose:
+                print(f"> Calculated s_1_zero_plus_unp_A to be:\n{s_1_zero_plus_unp_A}")
+
+            # (5): Return the coefficient:
+            return s_1_zero_plus_unp_A
+
+        except Exception as ERROR:
+            print(f"> Error in calculating s_1_zero_plus_unp_A for Interference Term:\n> {ERROR}")
+            return 0.
+        
+    @backend_function
+    def calculate_s_2_zero_plus_unpolarized(
+        self,
+        lepton_helicity: float,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        """
+        """
+
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity epsilon^2/2:
+            epsilon_squared_over_2 = epsilon**2 / 2.
+
+            # (3): Calculate the annoying y quantity:
+            y_quantity = self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))
+
+            # (4): Calculate the bracket term:
+            bracket_term = self.xp.constant(1.0, dtype = self.kernel_dtype) + ((self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon_squared_over_2 / x_Bjorken) / (self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon_squared_over_2)) * x_Bjorken * squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (5): Calculate the prefactor:
+            prefactor = self.xp.constant(8.0, dtype = self.kernel_dtype) * lepton_helicity * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype) * y_quantity) * shorthand_k * lepton_energy_fraction_y / root_one_plus_epsilon_squared**4
+            
+            # (6): Calculate the coefficient:
+            s_2_zero_plus_unp = prefactor * (self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon_squared_over_2) * bracket_term
+            
+            # (6.1): If verbose, log the output:
+            if verbose:
+                print(f"> Calculated s_2_zero_plus_unp to be:\n{s_2_zero_plus_unp}")
+
+            # (7): Return the coefficient:
+            return s_2_zero_plus_unp
+
+        except Exception as ERROR:
+            print(f"> Error in calculating s_2_zero_plus_unp for Interference Term:\n> {ERROR}")
+            return 0.
+        
+    @backend_function
+    def calculate_s_2_zero_plus_unpolarized_V(
+        self,
+        lepton_helicity: float,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate the annoying y quantity:
+            y_quantity = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype)))
+
+            # (4): Calculate the prefactor:
+            prefactor = -self.xp.constant(8.0, dtype = self.kernel_dtype) * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype)) * lepton_helicity * y_quantity * shorthand_k * lepton_energy_fraction_y * x_Bjorken * t_over_Q_squared / root_one_plus_epsilon_squared**4
+            
+            # (5): Calculate the coefficient:
+            s_2_zero_plus_unp_V = prefactor * (self.xp.constant(1.0, dtype = self.kernel_dtype) - (self.xp.constant(1.0, dtype = self.kernel_dtype) - self.xp.constant(2.0, dtype = self.kernel_dtype) * x_Bjorken) * t_over_Q_squared)
+            
+            # (5.1): If verbose, log the output:
+            if verbose:
+                print(f"> Calculated s_2_zero_plus_unp_V to be:\n{s_2_zero_plus_unp_V}")
+
+            # (6): Return the coefficient:
+            return s_2_zero_plus_unp_V
+
+        except Exception as ERROR:
+            print(f"> Error in calculating s_2_zero_plus_unp_V for Interference Term:\n> {ERROR}")
+            return 0.
+        
+    @backend_function
+    def calculate_s_2_zero_plus_unpolarized_A(
+        self,
+        lepton_helicity: float,
+        squared_Q_momentum_transfer: float,
+        x_Bjorken: float,
+        squared_hadronic_momentum_transfer_t: float,
+        epsilon: float,
+        lepton_energy_fraction_y: float,
+        shorthand_k: float,
+        verbose: bool = False) -> float:
+        try:
+
+            # (1): Calculate the recurrent quantity sqrt(1 + epsilon^2):
+            root_one_plus_epsilon_squared = self.xp.sqrt(self.xp.constant(1.0, dtype = self.kernel_dtype) + epsilon**2)
+
+            # (2): Calculate the recurrent quantity t/Q^{2}:
+            t_over_Q_squared = squared_hadronic_momentum_transfer_t / squared_Q_momentum_transfer
+
+            # (3): Calculate 1 - x_{B}:
+            one_minus_xb = self.xp.constant(1.0, dtype = self.kernel_dtype) - x_Bjorken
+
+            # (4): Calculate the annoying y quantity:
+            y_quantity = self.xp.constant(1.0, dtype = self.kernel_dtype) - lepton_energy_fraction_y - (epsilon**2 * lepton_energy_fraction_y**2 / self.xp.constant(4.0, dtype = self.kernel_dtype))
+
+            # (5): Calculate the main term:
+            main_term = self.xp.constant(4.0, dtype = self.kernel_dtype) * one_minus_xb + self.xp.constant(2.0, dtype = self.kernel_dtype) * epsilon**2 + self.xp.constant(4.0, dtype = self.kernel_dtype) * t_over_Q_squared * (self.xp.constant(4.0, dtype = self.kernel_dtype) * x_Bjorken * one_minus_xb + epsilon**2)
+            
+            # (6): Calculate part of the prefactor:
+            prefactor = -self.xp.constant(2.0, dtype = self.kernel_dtype) * self.xp.sqrt(self.xp.constant(2.0, dtype = self.kernel_dtype) * y_quantity) * lepton_helicity * shorthand_k * lepton_energy_fraction_y * t_over_Q_squared / root_one_plus_epsilon_squared**4
+            
+            # (7): Calculate the coefficient:
+            c_2_zero_plus_unp_A = prefactor * main_term
+            
+            # (7.1): If verbose, log the output:
+            if verbose:
+                print(f"> Calculated c_2_zero_plus_unp_A to be:\n{c_2_zero_plus_unp_A}")
+
+            # (8): Return the coefficient:
+            return c_2_zero_plus_unp_A
+
+        except Exception as ERROR:
+            print(f"> Error in calculating c_2_zero_plus_unp_A for Interference Term:\n> {ERROR}")
+            return 0.
@@ -0,0 +1,286 @@
+"""
+Full-batch, second-order fits for the models of `build_simultaneous_model`. A
+local fit has a handful of data points, so every iteration can see all of them:
+instead of Adam's many small steps, we take few, well-informed ones --- with
+L-BFGS, or with Gauss-Newton --- and stop once the loss has converged rather than
+after a fixed number of epochs.
+"""
+
+# Native Library | time
+import time
+
+# 3rd Party Library | NumPy
+import numpy as np
+
+# 3rd Party Library | SciPy
+import scipy.optimize
+
+# 3rd Party Library | TensorFlow
+import tensorflow as tf
+
+# static_strings > tolerance of the full-batch fits
+from statics.static_strings import _HYPERPARAMETER_FULL_BATCH_TOLERANCE
+
+# static_strings > maximum number of iterations of the full-batch fits
+from statics.static_strings import _HYPERPARAMETER_FULL_BATCH_MAXIMUM_ITERATIONS
+
+SETTING_VERBOSE = True
+SETTING_DEBUG = False
+
+# (X): The optimizers of `fit_full_batch` --- "adam" is the ordinary `model.fit`:
+_FULL_BATCH_METHODS = ("lbfgs", "gauss-newton")
+
+# (X): How much the Levenberg-Marquardt damping shrinks after a good step, and grows after a bad one:
+_DAMPING_DECREASE_FACTOR = 3.
+_DAMPING_INCREASE_FACTOR = 4.
+
+# (X): Past this (relative) damping, Gauss-Newton steps are too small to get anywhere:
+_MAXIMUM_RELATIVE_DAMPING = 1e12
+
+def _get_flat_weights(variables) -> np.ndarray:
+    """
+    ## Description:
+    All of the `variables` as one float64 vector.
+    """
+    return np.concatenate([variable.numpy().ravel() for variable in variables]).astype(np.float64)
+
+def _assign_flat_weights(variables, flat_weights: np.ndarray):
+    """
+    ## Description:
+    The inverse of `_get_flat_weights`.
+    """
+    offset = 0
+
+    for variable in variables:
+        size = int(np.prod(variable.shape))
+        variable.assign(np.reshape(flat_weights[offset:offset + size], variable.shape).astype(tf.as_dtype(variable.dtype).as_numpy_dtype))
+        offset += size
+
+def _compute_residuals(dnn_model, model_inputs, targets):
+    """
+    ## Description:
+    (Prediction - data) at every point, in the dtype of the data.
+    """
+    return tf.cast(tf.reshape(dnn_model(model_inputs, training = True), [-1]), targets.dtype) - targets
+
+def fit_full_batch(
+        dnn_model,
+        model_inputs,
+        targets,
+        validation_data = None,
+        method: str = "lbfgs",
+        tolerance: float = _HYPERPARAMETER_FULL_BATCH_TOLERANCE,
+        maximum_iterations: int = _HYPERPARAMETER_FULL_BATCH_MAXIMUM_ITERATIONS) -> tf.keras.callbacks.History:
+    """
+    ## Description:
+    Fit `dnn_model` to the MSE on *all* of the data in every iteration, until the
+    relative decrease of the loss in an iteration is below `tolerance`.
+
+    ## Arguments:
+        method: str
+            "lbfgs": SciPy's L-BFGS, on the loss and its gradient.
+
+            "gauss-newton": Gauss-Newton with Levenberg-Marquardt damping. Every step
+            solves the linearized least-squares problem. The cross-section is nearly
+            linear in the CFFs, and the CFFs are linear in the last layer, so the
+            linearization is a good one. With N points and P weights, the step is
+            computed from the N x N matrix J Jᵀ, which is cheap for a local fit.
+
+        validation_data: tuple
+            (inputs, targets), whose MSE is recorded in every iteration.
+
+    ## Returns:
+        A Keras `History`, like `model.fit`: one "epoch" per iteration, with "loss"
+        (and "val_loss"). Its `params` has the iterations, whether the fit converged,
+        and its wall time.
+    """
+    if method not in _FULL_BATCH_METHODS:
+        raise ValueError(f"> [ERROR]: Unknown full-batch method '{method}'. Choose one of {_FULL_BATCH_METHODS}.")
+
+    if len(dnn_model.outputs) != 1:
+        raise ValueError("> [ERROR]: The full-batch fits only fit the cross-section --- fit a model with a BSA output (`fit_bsa = True`) with Adam.")
+
+    # (1): The data, as tensors, once:
+    targets = tf.reshape(tf.convert_to_tensor(targets, dtype = tf.float32), [-1])
+
+    # (2): Every iteration records the (validation) loss:
+    history = {"loss": [], "val_loss": []} if validation_data is not None else {"loss": []}
+
+    if validation_data is not None:
+        validation_inputs, validation_targets = validation_data
+        validation_targets = tf.reshape(tf.convert_to_tensor(validation_targets, dtype = tf.float32), [-1])
+
+        compute_validation_loss = tf.function(lambda: tf.reduce_mean(tf.square(_compute_residuals(dnn_model, validation_inputs, validation_targets))))
+
+    def record_iteration(loss):
+        history["loss"].append(float(loss))
+
+        if validation_data is not None:
+            history["val_loss"].append(float(compute_validation_loss()))
+
+    # (3): Run the fit:
+    start_time = time.perf_counter()
+
+    if method == "lbfgs":
+        converged = _minimize_with_lbfgs(dnn_model, model_inputs, targets, tolerance, maximum_iterations, record_iteration)
+
+    else:
+        converged = _minimize_with_gauss_newton(dnn_model, model_inputs, targets, tolerance, maximum_iterations, record_iteration)
+
+    wall_time_in_seconds = time.perf_counter() - start_time
+
+    if SETTING_VERBOSE:
+        print(f"> [VERBOSE]: Full-batch {method} {'converged' if converged else 'stopped'} after {len(history['loss'])} iterations in {wall_time_in_seconds:.2f} s, with a loss of {history['loss'][-1]:.4e}.")
+
+    # (4): Hand back what `model.fit` would have:
+    training_history = tf.keras.callbacks.History()
+    training_history.history = history
+    training_history.epoch = list(range(len(history["loss"])))
+    training_history.params = {
+        "method": method,
+        "iterations": len(history["loss"]),
+        "converged": converged,
+        "wall_time_in_seconds": wall_time_in_seconds}
+
+    return training_history
+
+def _minimize_with_lbfgs(dnn_model, model_inputs, targets, tolerance, maximum_iterations, record_iteration) -> bool:
+    """
+    ## Description:
+    The L-BFGS branch of `fit_full_batch`. The loss includes whatever the model
+    adds to it (e.g. a `KM15PriorLayer`).
+    """
+    trainable_variables = dnn_model.trainable_variables
+
+    @tf.function
+    def compute_loss_and_gradient():
+        with tf.GradientTape() as tape:
+            loss = tf.reduce_mean(tf.square(_compute_residuals(dnn_model, model_inputs, targets)))
+
+            if dnn_model.losses:
+                loss += tf.cast(tf.add_n(dnn_model.losses), loss.dtype)
+
+        return loss, tape.gradient(loss, trainable_variables)
+
+    def compute_flat_loss_and_gradient(flat_weights):
+        _assign_flat_weights(trainable_variables, flat_weights)
+        loss, gradients = compute_loss_and_gradient()
+
+        return float(loss), np.concatenate([gradient.numpy().ravel() for gradient in gradients]).astype(np.float64)
+
+    # (1): The loss before the first iteration, to compare the first decrease to:
+    previous_loss = [float(compute_loss_and_gradient()[0])]
+    converged = [False]
+
+    # (2): We stop the way Gauss-Newton does (SciPy's `ftol` is relative to max(loss, 1), which is useless for losses of 1e-5):
+    def record_lbfgs_iteration(intermediate_result):
+
+        # (2.1): SciPy may have evaluated trial points since the iterate, so put it back first:
+        _assign_flat_weights(trainable_variables, intermediate_result.x)
+        record_iteration(intermediate_result.fun)
+
+        relative_decrease = (previous_loss[0] - intermediate_result.fun) / max(previous_loss[0], np.finfo(np.float64).tiny)
+        previous_loss[0] = intermediate_result.fun
+
+        if relative_decrease < tolerance:
+            converged[0] = True
+            raise StopIteration
+
+    optimization_result = scipy.optimize.minimize(
+        compute_flat_loss_and_gradient,
+        _get_flat_weights(trainable_variables),
+        jac = True,
+        method = "L-BFGS-B",
+        callback = record_lbfgs_iteration,
+        options = {"maxiter": maximum_iterations, "ftol": 0., "gtol": 0.})
+
+    # (3): The weights end up at the solution:
+    _assign_flat_weights(trainable_variables, optimization_result.x)
+
+    if not optimization_result.nit:
+        record_iteration(optimization_result.fun)
+
+    # (4): L-BFGS also stops when its line search cannot lower the loss any more (in float32) --- a minimum, too:
+    return converged[0] or optimization_result.status == 2
+
+def _minimize_with_gauss_newton(dnn_model, model_inputs, targets, tolerance, maximum_iterations, record_iteration) -> bool:
+    """
+    ## Description:
+    The Gauss-Newton branch of `fit_full_batch`: with the residuals r and their
+    Jacobian J with respect to the weights, the damped step is
+
+        δ = -Jᵀ (J Jᵀ + λ I)⁻¹ r,
+
+    which equals -(JᵀJ + λ I)⁻¹ Jᵀ r, but only needs an N x N solve. A step that
+    lowers the loss is taken, and λ shrinks; otherwise λ grows, and we try again.
+    """
+    trainable_variables = dnn_model.trainable_variables
+
+    # (1): Gauss-Newton needs the loss as a sum of squares, and nothing else:
+    dnn_model(model_inputs)
+
+    if dnn_model.losses:
+        raise ValueError("> [ERROR]: Gauss-Newton only fits the MSE --- not a model with extra losses (e.g. a KM15 prior). Use L-BFGS.")
+
+    @tf.function
+    def compute_residuals_and_jacobian():
+        with tf.GradientTape() as tape:
+            residuals = _compute_residuals(dnn_model, model_inputs, targets)
+
+        jacobians = tape.jacobian(residuals, trainable_variables)
+
+        return residuals, tf.concat([tf.reshape(jacobian, [tf.shape(residuals)[0], -1]) for jacobian in jacobians], axis = 1)
+
+    compute_loss = tf.function(lambda: tf.reduce_mean(tf.square(_compute_residuals(dnn_model, model_inputs, targets))))
+
+    # (2): Start from the current weights:
+    flat_weights = _get_flat_weights(trainable_variables)
+    residuals, jacobian = (tensor.numpy().astype(np.float64) for tensor in compute_residuals_and_jacobian())
+    loss = np.mean(residuals**2)
+
+    # (3): The damping is relative to the scale of J Jᵀ:
+    jacobian_gram_matrix = jacobian @ jacobian.T
+    damping_scale = max(np.mean(np.diag(jacobian_gram_matrix)), np.finfo(np.float64).tiny)
+    relative_damping = 1e-3
+
+    for iteration in range(maximum_iterations):
+
+        # (3.1): Damp the step until it lowers the loss:
+        while relative_damping < _MAXIMUM_RELATIVE_DAMPING:
+            damped_gram_matrix = jacobian_gram_matrix + relative_damping * damping_scale * np.eye(len(residuals))
+            step = -jacobian.T @ np.linalg.solve(damped_gram_matrix, residuals)
+
+            _assign_flat_weights(trainable_variables, flat_weights + step)
+            trial_loss = float(compute_loss())
+
+            if trial_loss < loss:
+                break
+
+            relative_damping *= _DAMPING_INCREASE_FACTOR
+
+        # (3.2): No step helps any more --- we are at a minimum (as far as float32 can tell):
+        else:
+            _assign_flat_weights(trainable_variables, flat_weights)
+            record_iteration(loss)
+
+            return True
+
+        # (3.3): Take the step:
+        flat_weights = flat_weights + step
+        relative_decrease = (loss - trial_loss) / loss
+        loss = trial_loss
+        relative_damping = max(relative_damping / _DAMPING_DECREASE_FACTOR, 1e-12)
+
+        record_iteration(loss)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Gauss-Newton iteration {iteration + 1}: loss {loss:.4e}, relative damping {relative_damping:.1e}")
+
+        if relative_decrease < tolerance:
+            return True
+
+        # (3.4): Linearize again, at the new weights:
+        residuals, jacobian = (tensor.numpy().astype(np.float64) for tensor in compute_residuals_and_jacobian())
+        jacobian_gram_matrix = jacobian @ jacobian.T
+
+    return False
@@ -0,0 +1,157 @@
+"""
+The KM15 CFFs in TensorFlow, so that they can sit inside the training graph ---
+as a prior, a warm-start target, or a regularizer --- without a round-trip to
+SciPy on every step. The parametrization is the very same one as in
+`utilities/km15.py`, and so are the fixed quadrature nodes of the dispersion integrals.
+"""
+
+# Native Library | math
+from math import pi
+
+# 3rd Party Library | NumPy
+import numpy as np
+
+# 3rd Party Library | TensorFlow
+import tensorflow as tf
+
+# 3rd Party Library | TensorFlow:
+from tensorflow.keras.utils import register_keras_serializable
+
+# utilities > km15
+from utilities.km15 import C0, Msub, rpi, Mpi
+from utilities.km15 import _compute_km15_imag_h, _compute_km15_imag_ht
+from utilities.km15 import _KM15_DISPERSION_INTEGRAL_LOWER_LIMIT, _KM15_NUMBER_OF_QUADRATURE_NODES
+
+# (X): Which of the eight CFFs of the network, [Re[H], Im[H], Re[E], Im[E], Re[Ht], Im[Ht], Re[Et], Im[Et]],
+# | KM15 says something about. It sets Im[E] and Im[Et] to zero, but does not *model* them:
+_KM15_CFF_MASK = (1., 1., 1., 0., 1., 1., 1., 0.)
+
+def _compute_principal_value_integral_tf(numerator, xi, t):
+    """
+    ## Description:
+    The TensorFlow version of `utilities.km15._compute_principal_value_integral`:
+    the same subtraction, the same three panels, and the same nodes.
+    """
+
+    # (1): Gauss-Legendre nodes and weights, mapped from [-1, 1] onto [0, 1]:
+    nodes, weights = np.polynomial.legendre.leggauss(_KM15_NUMBER_OF_QUADRATURE_NODES)
+    nodes = tf.constant(0.5 * (nodes + 1.), dtype = tf.float64)
+    weights = tf.constant(0.5 * weights, dtype = tf.float64)
+
+    # (2): Every point gets a row of nodes:
+    xi = xi[:, tf.newaxis]
+    t = t[:, tf.newaxis]
+    lower_limit = tf.constant(_KM15_DISPERSION_INTEGRAL_LOWER_LIMIT, dtype = tf.float64)
+
+    # (3): The value at the pole, which we subtract:
+    numerator_at_pole = numerator(xi, t)
+
+    # (4): Where the logarithmic panel above the pole hands over to the last one:
+    x_crossover = 0.5 * (1. + xi)
+
+    # (5): Below the pole --- logarithmically-spaced x:
+    log_ratio_below = tf.math.log(xi / lower_limit)
+    x_below = lower_limit * tf.exp(nodes * log_ratio_below)
+    jacobian_below = x_below * log_ratio_below
+
+    # (6): Just above the pole --- logarithmically-spaced x again:
+    log_ratio_above = tf.math.log(x_crossover / xi)
+    x_above = xi * tf.exp(nodes * log_ratio_above)
+    jacobian_above = x_above * log_ratio_above
+
+    # (7): Up to x = 1 --- x bunched up towards x = 1:
+    x_upper = 1. - (1. - x_crossover) * (1. - nodes)**2
+    jacobian_upper = 2. * (1. - x_crossover) * (1. - nodes)
+
+    # (8): The subtracted integral on all three panels:
+    subtracted_integral = tf.add_n([
+        tf.reduce_sum(weights * (numerator(x, t) - numerator_at_pole) / (x - xi) * jacobian, axis = -1)
+        for x, jacobian in ((x_below, jacobian_below), (x_above, jacobian_above), (x_upper, jacobian_upper))])
+
+    # (9): Add back the pole term, which is just a logarithm:
+    return subtracted_integral + numerator_at_pole[:, 0] * tf.math.log((1. - xi[:, 0]) / (xi[:, 0] - lower_limit))
+
+@tf.function(reduce_retracing = True)
+def compute_km15_cffs_tf(kinematics):
+    """
+    ## Description:
+    The KM15 CFFs for a batch of kinematics, in TensorFlow. Everything is done in
+    float64 (the subtraction in the dispersion integrals needs it) and cast back
+    to the dtype of `kinematics` at the end.
+
+    ## Arguments:
+        kinematics: tf.Tensor
+            Shape (N, 3) or more: [Q², x_B, t, ...], e.g. the (N, 5) input of the DNN.
+
+    ## Returns:
+        A tensor of shape (N, 8), in the CFF order of the network:
+        [Re[H], Im[H], Re[E], Im[E], Re[Ht], Im[Ht], Re[Et], Im[Et]], with Im[E] = Im[Et] = 0.
+    """
+
+    # (1): Only x_B and t matter:
+    kinematics_float64 = tf.cast(kinematics, tf.float64)
+    x_bjorken = kinematics_float64[:, 1]
+    t = kinematics_float64[:, 2]
+
+    # (2): Calculate the skewnesss, xi:
+    xi = x_bjorken / (2. - x_bjorken)
+
+    Ct = C0 / (1. - t / Msub**2)**2
+
+    # (3): The two dispersion integrals:
+    DR_ReH = _compute_principal_value_integral_tf(lambda x, t: -2. * x / (x + xi[:, tf.newaxis]) * _compute_km15_imag_h(x, t), xi, t)
+    DR_ReHt = _compute_principal_value_integral_tf(lambda x, t: -2. * xi[:, tf.newaxis] / (x + xi[:, tf.newaxis]) * _compute_km15_imag_ht(x, t), xi, t)
+
+    # (4): Assemble the CFFs in the order of the network:
+    zeros = tf.zeros_like(xi)
+    km15_cffs = tf.stack([
+        DR_ReH / pi - Ct,
+        _compute_km15_imag_h(xi, t),
+        Ct,
+        zeros,
+        DR_ReHt / pi,
+        _compute_km15_imag_ht(xi, t),
+        rpi / xi * 2.164 / ((0.0196 - t) * (1. - t / Mpi**2)**2),
+        zeros], axis = -1)
+
+    return tf.cast(km15_cffs, kinematics.dtype)
+
+@register_keras_serializable()
+class KM15PriorLayer(tf.keras.layers.Layer):
+    """
+    ## Description:
+    Pulls the CFFs of the DNN towards KM15: the layer passes the CFFs through
+    unchanged and adds
+
+        prior_weight * mean((CFFs - CFFs_KM15)²)
+
+    to the loss, over the six CFFs that KM15 models. KM15 is computed in the
+    graph, from the same kinematics the DNN sees.
+    """
+
+    def __init__(self, prior_weight = 1.0, **kwargs):
+
+        super().__init__(**kwargs)
+
+        self.prior_weight = prior_weight
+
+    def get_config(self):
+        config = super().get_config()
+        config.update({"prior_weight": self.prior_weight})
+
+        return config
+
+    def call(self, inputs):
+
+        # (1): Unpack the kinematics [Q², x_B, t, k, φ] and the CFFs:
+        kinematics, cffs = inputs
+
+        # (2): KM15 at the same kinematics --- a constant, as far as the DNN is concerned:
+        km15_cffs = tf.stop_gradient(compute_km15_cffs_tf(kinematics))
+
+        # (3): The penalty, only over the CFFs that KM15 models:
+        km15_mask = tf.constant(_KM15_CFF_MASK, dtype = cffs.dtype)
+        squared_deviation = km15_mask * tf.square(cffs - tf.cast(km15_cffs, cffs.dtype))
+        self.add_loss(self.prior_weight * tf.reduce_sum(squared_deviation) / (tf.reduce_sum(km15_mask) * tf.cast(tf.shape(cffs)[0], cffs.dtype)))
+
+        return cffs
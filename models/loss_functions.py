@@ -25,4 +25,53 @@ def simultaneous_fit_loss(true_values, predicted_values, kinematic_settings):
         compton_form_factor_e = complex(1., 1.),
         compton_form_factor_e_tilde = complex(1., 1.))
     
-    return tf.reduce_mean(tf.square(predicted_values - true_values))
\ No newline at end of file
+    return tf.reduce_mean(tf.square(predicted_values - true_values))
+
+def ensemble_training_loss(true_values, predicted_values):
+    """
+    ### Description:
+    The loss of a replica ensemble (see `build_ensemble_model`): the sum over
+    replicas of each replica's own MSE, over the rows that are in *its* training set.
+    `true_values` has shape (N, 2R): the R pseudodata columns, and then R columns
+    that are 1 for training rows and 0 for held-out ones.
+    """
+    number_of_replicas = tf.shape(predicted_values)[-1]
+
+    # (X): Split the targets from the masks:
+    targets = true_values[:, :number_of_replicas]
+    training_mask = true_values[:, number_of_replicas:]
+
+    # (X): Every replica gets its own mean, so that they do not know about each other:
+    squared_error = training_mask * tf.square(predicted_values - targets)
+
+    return tf.reduce_sum(tf.reduce_sum(squared_error, axis = 0) / tf.maximum(tf.reduce_sum(training_mask, axis = 0), 1.))
+
+def ensemble_validation_loss(true_values, predicted_values):
+    """
+    ### Description:
+    `ensemble_training_loss` on the held-out rows instead, averaged over the
+    replicas --- the ensemble's version of `val_loss`.
+    """
+    number_of_replicas = tf.shape(predicted_values)[-1]
+
+    # (X): Flip the masks around:
+    held_out_values = tf.concat([true_values[:, :number_of_replicas], 1. - true_values[:, number_of_replicas:]], axis = -1)
+
+    return ensemble_training_loss(held_out_values, predicted_values) / tf.cast(number_of_replicas, predicted_values.dtype)
+
+def masked_mean_squared_error(true_values, predicted_values):
+    """
+    ### Description:
+    The MSE over the rows where the observable was measured: the pseudodata has
+    NaN wherever a data point does not have the observable (e.g. a cross-section
+    without a BSA), and those rows are left out of the mean.
+    """
+    true_values = tf.reshape(tf.cast(true_values, predicted_values.dtype), tf.shape(predicted_values))
+
+    # (X): Where there is a measurement:
+    measured = tf.math.is_finite(true_values)
+
+    # (X): NaN targets must not reach the gradient, not even multiplied by zero:
+    squared_error = tf.where(measured, tf.square(predicted_values - tf.where(measured, true_values, tf.zeros_like(true_values))), tf.zeros_like(true_values))
+
+    return tf.reduce_sum(squared_error) / tf.maximum(tf.reduce_sum(tf.cast(measured, predicted_values.dtype)), 1.)
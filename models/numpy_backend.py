@@ -0,0 +1,162 @@
+"""
+A TensorFlow-free way to evaluate the BKM10 cross-section. The formulas of the
+CrossSectionLayer are written against an array namespace --- see
+`models/cross_section_formulas.py` --- and here we hand them NumPy, so that
+analysis scripts and notebooks can score a few cross-sections without importing
+TensorFlow or tracing a single graph.
+"""
+
+# 3rd Party Library | NumPy
+import numpy as np
+
+# models > cross_section_formulas > CrossSectionFormulas
+from models.cross_section_formulas import CrossSectionFormulas
+
+# (X): The backends that `get_cross_section_layer` understands:
+_CROSS_SECTION_BACKENDS = ("tensorflow", "numpy")
+
+class _NumPyOperations:
+    """
+    ## Description:
+    The (small) part of the TensorFlow API that `CrossSectionFormulas` uses,
+    written in NumPy. It is the `xp` of the NumPyCrossSectionLayer.
+    """
+
+    # (X): Data types:
+    float32 = np.float32
+    float64 = np.float64
+
+    # (X): Indexing:
+    newaxis = np.newaxis
+
+    # (X): Elementwise math:
+    cos = staticmethod(np.cos)
+    sin = staticmethod(np.sin)
+    sqrt = staticmethod(np.sqrt)
+    pow = staticmethod(np.power)
+    ones_like = staticmethod(np.ones_like)
+    zeros_like = staticmethod(np.zeros_like)
+
+    # (X): Contractions and reductions:
+    einsum = staticmethod(np.einsum)
+
+    # (X): `tf.print` is just `print`:
+    print = staticmethod(print)
+
+    @staticmethod
+    def constant(value, dtype = None):
+        return np.asarray(value, dtype = dtype)
+
+    @staticmethod
+    def cast(x, dtype):
+        return np.asarray(x).astype(dtype, copy = False)
+
+    @staticmethod
+    def shape(x):
+        return np.shape(x)
+
+    @staticmethod
+    def reshape(tensor, shape):
+        return np.reshape(tensor, shape)
+
+    @staticmethod
+    def stack(values, axis = 0):
+        return np.stack(values, axis = axis)
+
+    @staticmethod
+    def unstack(value, axis = 0):
+        return list(np.moveaxis(value, axis, 0))
+
+    @staticmethod
+    def concat(values, axis):
+        return np.concatenate(values, axis = axis)
+
+    @staticmethod
+    def repeat(x, repeats, axis = None):
+        return np.repeat(x, repeats, axis = axis)
+
+    @staticmethod
+    def tile(x, multiples):
+        return np.tile(x, multiples)
+
+    @staticmethod
+    def range(limit, dtype = None):
+        return np.arange(limit, dtype = dtype)
+
+    @staticmethod
+    def eye(number_of_rows, dtype = None):
+        return np.eye(number_of_rows, dtype = dtype)
+
+    @staticmethod
+    def reduce_sum(x, axis = None):
+        return np.sum(x, axis = axis)
+
+class _NumPyLayerBase:
+    """
+    ## Description:
+    Takes the place of `tf.keras.layers.Layer`: it accepts (and forgets) the
+    Keras keyword arguments such as `name` or `autocast`, and calling the layer
+    calls its `call`.
+    """
+
+    def __init__(self, name = None, **kwargs):
+        self.name = name
+
+    def get_config(self):
+        return {"name": self.name}
+
+    def __call__(self, inputs):
+        return self.call(np.asarray(inputs))
+
+class NumPyCrossSectionLayer(CrossSectionFormulas, _NumPyLayerBase):
+    """
+    ## Description:
+    The CrossSectionLayer, evaluated with NumPy. It takes the same settings
+    and the same inputs ([Q², x_B, t, k, φ] and the eight CFFs, or a kinematic
+    bundle/design matrix instead of the kinematics), and every method ---
+    `compute_cross_section_helicity_parts`, `precompute_design_matrix`,
+    `compute_cross_section_on_phi_grid`, ... --- returns a NumPy array.
+
+    ## Notes:
+    1. There is nothing to compile, so `jit_compile` is not allowed.
+
+    2. Unlike the Keras layer, float64 inputs are not autocast to float32: the
+    cross-section is computed in the precision policy of the layer and comes back
+    in the dtype of the inputs.
+    """
+
+    # (X): The formulas run on NumPy:
+    xp = _NumPyOperations
+
+    def __init__(self, jit_compile = False, **kwargs):
+
+        if jit_compile:
+            raise ValueError("> [ERROR]: `jit_compile` needs the TensorFlow backend.")
+
+        super().__init__(**kwargs)
+
+def get_cross_section_layer(backend: str = "tensorflow", **layer_settings):
+    """
+    ## Description:
+    Obtain a CrossSectionLayer for the given backend: "tensorflow" gives the
+    Keras layer in `models.architecture`, and "numpy" gives the `NumPyCrossSectionLayer`,
+    which never imports TensorFlow. Both are called the same way.
+
+    ## Arguments:
+    backend: str
+        "tensorflow" or "numpy".
+
+    layer_settings:
+        Passed on to the layer, e.g. `lepton_beam_polarization` or `precision`.
+    """
+
+    if backend not in _CROSS_SECTION_BACKENDS:
+        raise ValueError(f"> [ERROR]: Unknown backend '{backend}'. Choose one of {_CROSS_SECTION_BACKENDS}.")
+
+    if backend == "numpy":
+        return NumPyCrossSectionLayer(**layer_settings)
+
+    # (X): Only now do we pay for importing TensorFlow:
+    from models.architecture import CrossSectionLayer
+
+    return CrossSectionLayer(**layer_settings)
@@ -0,0 +1,510 @@
+"""
+This script measures how long a single training step (and a single
+full-batch forward pass) of the simultaneous-fit model takes with the
+different CrossSectionLayer execution modes so that we can decide which
+one to use for the replica runs. It also times the CrossSectionLayer on
+its own (forward and backward over the full dataset), and measures how far
+each mode is from a CrossSectionLayer evaluated entirely in float64.
+
+With `--latency`, it instead compares the TensorFlow and NumPy backends
+on the small batches that analysis scripts evaluate. With `--optimizers`, it
+compares how long a replica takes to fit with Adam and with the full-batch
+optimizers of `fit_full_batch`, and how good each fit is.
+"""
+
+# Native Library | argparse
+import argparse
+
+# Native Library | os
+import os
+
+# Native Library | time
+import time
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | Pandas:
+import pandas as pd
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# (X): Class | model > architecture > CrossSectionLayer
+from models.architecture import CrossSectionLayer
+
+# (X): Function | model > architecture > build_simultaneous_model
+from models.architecture import build_simultaneous_model
+
+# (X): Function | model > architecture > precompute_kinematic_bundle
+from models.architecture import precompute_kinematic_bundle
+
+# (X): Function | model > architecture > precompute_design_matrix
+from models.architecture import precompute_design_matrix
+
+# (X): Function | model > full_batch_fit > fit_full_batch
+from models.full_batch_fit import fit_full_batch
+
+# (X): Function | model > numpy_backend > get_cross_section_layer
+from models.numpy_backend import get_cross_section_layer
+
+# static_strings > "k"
+from statics.static_strings import _COLUMN_NAME_LEPTON_MOMENTUM
+
+# static_strings > "x_b"
+from statics.static_strings import _COLUMN_NAME_X_BJORKEN
+
+# static_strings > "q_squared"
+from statics.static_strings import _COLUMN_NAME_Q_SQUARED
+
+# static_strings > "t"
+from statics.static_strings import _COLUMN_NAME_T_MOMENTUM_CHANGE
+
+# static_strings > "phi"
+from statics.static_strings import _COLUMN_NAME_AZIMUTHAL_PHI
+
+# static_strings > "sigma"
+from statics.static_strings import _COLUMN_NAME_CROSS_SECTION
+
+# static_strings > batch size for training
+from statics.static_strings import _HYPERPARAMETER_BATCH_SIZE
+
+# static_strings > number of epochs for training
+from statics.static_strings import _HYPERPARAMETER_NUMBER_OF_EPOCHS
+
+# static_strings > LR "patience"
+from statics.static_strings import _HYPERPARAMETER_LR_PATIENCE
+
+# static_strings > LR factor
+from statics.static_strings import _HYPERPARAMETER_LR_FACTOR
+
+# static_strings > EarlyStop "patience"
+from statics.static_strings import _HYPERPARAMETER_EARLYSTOP_PATIENCE_INTEGER
+
+# static_strings > train/test split
+from statics.static_strings import _DNN_TRAIN_TEST_SPLIT_PERCENTAGE
+
+SETTING_VERBOSE = True
+SETTING_DEBUG = False
+
+# (X): The two fits we care about: a single kinematic set and the full data file:
+_BENCHMARK_DATA_FILES = {
+    "kinematic_set_1.csv": 100,
+    "revised_data.csv": 3,
+}
+
+# (X): How many full-batch forward passes to average over:
+_BENCHMARK_NUMBER_OF_FORWARD_CALLS = 50
+
+# (X): The (small) batch sizes of the backend latency comparison:
+_BENCHMARK_LATENCY_BATCH_SIZES = (1, 10, 100, 1000)
+
+# (X): The local fit of the optimizer comparison:
+_BENCHMARK_OPTIMIZER_DATA_FILE = "kinematic_set_1.csv"
+
+# (X): The optimizers of the comparison --- Adam is the baseline of `train_replica`:
+_BENCHMARK_OPTIMIZERS = ("adam", "lbfgs", "gauss-newton")
+
+def load_benchmark_data(data_file_name: str):
+    """
+    ## Description:
+    Read one of the `.csv` files in `data/` and return the kinematics and
+    cross-section as float32 NumPy arrays in the order expected by the model.
+    """
+
+    # (1): Read the file with Pandas:
+    dataframe = pd.read_csv(os.path.join('data', data_file_name))
+
+    # (2): The kinematics *in order*: [Q², x_B, t, k, φ]:
+    kinematics = dataframe[[
+        _COLUMN_NAME_Q_SQUARED,
+        _COLUMN_NAME_X_BJORKEN,
+        _COLUMN_NAME_T_MOMENTUM_CHANGE,
+        _COLUMN_NAME_LEPTON_MOMENTUM,
+        _COLUMN_NAME_AZIMUTHAL_PHI]].to_numpy(dtype = np.float32)
+
+    # (3): The observable:
+    cross_section = dataframe[_COLUMN_NAME_CROSS_SECTION].to_numpy(dtype = np.float32)
+
+    return kinematics, cross_section
+
+def build_model_inputs(kinematics: np.ndarray, **model_settings):
+    """
+    ## Description:
+    Whatever the model built with `model_settings` expects as its inputs. The
+    precomputation is done here, *outside* of the timed region, because in a
+    fit it is done once per dataset.
+    """
+    # (1): The precomputation has to use the same floating-point policy as the layer:
+    precision = model_settings.get("precision", "float32")
+
+    if model_settings.get("use_kinematic_bundle", False):
+        return [kinematics, precompute_kinematic_bundle(kinematics, precision = precision)]
+
+    if model_settings.get("use_design_matrix", False):
+        return [kinematics, precompute_design_matrix(kinematics, precision = precision)]
+
+    return kinematics
+
+def time_training_steps(
+        kinematics: np.ndarray,
+        cross_section: np.ndarray,
+        number_of_epochs: int,
+        **model_settings) -> float:
+    """
+    ## Description:
+    Build a fresh model with `model_settings`, run one warm-up epoch so that
+    tracing/compilation is *not* part of the measurement, and then return
+    the average wall time (in milliseconds) of one optimizer step.
+    """
+
+    # (1): Initialize the model:
+    dnn_model = build_simultaneous_model(**model_settings)
+
+    # (2): Obtain the inputs of the model:
+    model_inputs = build_model_inputs(kinematics, **model_settings)
+
+    # (3): Warm-up epoch --- this is where TF traces and XLA compiles:
+    dnn_model.fit(model_inputs, cross_section, batch_size = _HYPERPARAMETER_BATCH_SIZE, epochs = 1, verbose = 0)
+
+    # (4): Compute the number of optimizer steps per epoch:
+    steps_per_epoch = int(np.ceil(kinematics.shape[0] / _HYPERPARAMETER_BATCH_SIZE))
+
+    # (5): Time the actual training:
+    start_time = time.perf_counter()
+    dnn_model.fit(model_inputs, cross_section, batch_size = _HYPERPARAMETER_BATCH_SIZE, epochs = number_of_epochs, verbose = 0)
+    elapsed_time = time.perf_counter() - start_time
+
+    return 1000. * elapsed_time / (number_of_epochs * steps_per_epoch)
+
+def time_forward_pass(
+        kinematics: np.ndarray,
+        number_of_calls: int,
+        **model_settings) -> float:
+    """
+    ## Description:
+    Build a fresh model with `model_settings` and return the average wall
+    time (in milliseconds) of one full-batch forward pass, which is what the
+    plotting and prediction code in `train_local_fit.py` does.
+    """
+
+    # (1): Initialize the model:
+    dnn_model = build_simultaneous_model(**model_settings)
+
+    # (2): Obtain the inputs of the model:
+    model_inputs = build_model_inputs(kinematics, **model_settings)
+
+    # (3): Warm-up call for the tracing/compilation:
+    dnn_model.predict_on_batch(model_inputs)
+
+    # (4): Time the repeated calls:
+    start_time = time.perf_counter()
+    for _ in range(number_of_calls):
+        dnn_model.predict_on_batch(model_inputs)
+    elapsed_time = time.perf_counter() - start_time
+
+    return 1000. * elapsed_time / number_of_calls
+
+def time_layer_gradient(
+        kinematics: np.ndarray,
+        number_of_calls: int,
+        **model_settings) -> float:
+    """
+    ## Description:
+    Time *only* the CrossSectionLayer: one forward pass plus the gradient with
+    respect to the CFFs, over the full dataset at once. This takes the DNN and
+    the Keras overhead out of the picture.
+    """
+
+    # (1): Initialize the layer:
+    cross_section_layer = CrossSectionLayer(**model_settings)
+
+    # (2): Whatever the layer wants in front of the CFFs:
+    model_inputs = build_model_inputs(kinematics, **model_settings)
+    layer_kinematics = model_inputs[1] if isinstance(model_inputs, list) else model_inputs
+
+    # (3): Some reasonable CFFs:
+    cffs = np.random.default_rng(0).uniform(-3., 3., size = (kinematics.shape[0], 8))
+
+    # (4): Concatenate into the layer input:
+    layer_input = tf.constant(np.concatenate([layer_kinematics, cffs], axis = 1), dtype = tf.float32)
+
+    @tf.function
+    def forward_and_backward(layer_input):
+        with tf.GradientTape() as tape:
+            tape.watch(layer_input)
+            cross_section = tf.reduce_sum(cross_section_layer(layer_input))
+        return tape.gradient(cross_section, layer_input)
+
+    # (5): Warm-up call for the tracing/compilation:
+    forward_and_backward(layer_input)
+
+    # (6): Time the repeated calls:
+    start_time = time.perf_counter()
+    for _ in range(number_of_calls):
+        forward_and_backward(layer_input)
+    elapsed_time = time.perf_counter() - start_time
+
+    return 1000. * elapsed_time / number_of_calls
+
+def measure_layer_accuracy(
+        kinematics: np.ndarray,
+        **model_settings) -> float:
+    """
+    ## Description:
+    The largest relative deviation of the CrossSectionLayer in this mode from
+    the same layer evaluated entirely in float64, on the same (float32) inputs.
+    """
+
+    # (1): Some reasonable CFFs:
+    cffs = np.random.default_rng(0).uniform(-3., 3., size = (kinematics.shape[0], 8)).astype(np.float32)
+
+    # (2): The reference --- `autocast = False` stops Keras from casting the inputs back down to float32:
+    reference_layer = CrossSectionLayer(precision = "float64", autocast = False)
+    reference_cross_section = reference_layer(
+        tf.constant(np.concatenate([kinematics, cffs], axis = 1), dtype = tf.float64)).numpy()
+
+    # (3): The layer in this mode, fed exactly like in the fit:
+    cross_section_layer = CrossSectionLayer(**model_settings)
+    model_inputs = build_model_inputs(kinematics, **model_settings)
+    layer_kinematics = model_inputs[1] if isinstance(model_inputs, list) else model_inputs
+    cross_section = cross_section_layer(
+        tf.constant(np.concatenate([layer_kinematics, cffs], axis = 1), dtype = tf.float32)).numpy()
+
+    return float(np.max(np.abs(cross_section - reference_cross_section) / np.abs(reference_cross_section)))
+
+def time_backend_latency(
+        kinematics: np.ndarray,
+        batch_size: int,
+        number_of_calls: int,
+        backend: str) -> tuple:
+    """
+    ## Description:
+    Time a freshly-constructed CrossSectionLayer of the given backend on one
+    batch of `batch_size` rows, the way an analysis script would use it. Return
+    the wall time (in milliseconds) of the *first* call, which for TensorFlow
+    includes the graph tracing, and the average of the calls after it.
+    """
+
+    # (1): The first `batch_size` rows of the data (repeated if there are not enough):
+    batch_kinematics = np.resize(kinematics, (batch_size, kinematics.shape[1]))
+
+    # (2): Some reasonable CFFs:
+    cffs = np.random.default_rng(0).uniform(-3., 3., size = (batch_size, 8))
+
+    # (3): The layer input:
+    layer_input = np.concatenate([batch_kinematics, cffs], axis = 1).astype(np.float32)
+
+    # (4): Initialize the layer:
+    cross_section_layer = get_cross_section_layer(backend)
+
+    # (5): Time the first call:
+    start_time = time.perf_counter()
+    np.asarray(cross_section_layer(layer_input))
+    first_call_time = time.perf_counter() - start_time
+
+    # (6): Time the repeated calls:
+    start_time = time.perf_counter()
+    for _ in range(number_of_calls):
+        np.asarray(cross_section_layer(layer_input))
+    elapsed_time = time.perf_counter() - start_time
+
+    return 1000. * first_call_time, 1000. * elapsed_time / number_of_calls
+
+def main_latency():
+    """
+    ## Description:
+    Compare the TensorFlow and NumPy backends of the CrossSectionLayer on
+    small batches and print a small table of latencies.
+    """
+
+    # (1): The full data file has enough rows for every batch size:
+    kinematics, _ = load_benchmark_data("revised_data.csv")
+
+    # (2): Initialize a list of the rows of the final table:
+    results = []
+
+    # (3): Iterate over the batch sizes and the backends:
+    for batch_size in _BENCHMARK_LATENCY_BATCH_SIZES:
+        for backend in ("tensorflow", "numpy"):
+
+            first_call_time, call_time = time_backend_latency(kinematics, batch_size, _BENCHMARK_NUMBER_OF_FORWARD_CALLS, backend)
+
+            if SETTING_VERBOSE:
+                print(f"> [VERBOSE]: {batch_size} rows | {backend}: {first_call_time:.3f} ms first call, {call_time:.3f} ms/call")
+
+            results.append((batch_size, backend, first_call_time, call_time))
+
+    # (4): Print the summary:
+    print(f"{'rows':>6} {'backend':<12} {'ms first call':>14} {'ms/call':>10}")
+    for batch_size, backend, first_call_time, call_time in results:
+        print(f"{batch_size:>6} {backend:<12} {first_call_time:>14.3f} {call_time:>10.3f}")
+
+    return results
+
+def time_optimizer_fit(
+        kinematics: np.ndarray,
+        cross_section: np.ndarray,
+        optimizer: str) -> tuple:
+    """
+    ## Description:
+    Fit one replica the way `train_replica` does --- same model, same split, and
+    (for Adam) the same epochs and callbacks --- and return the wall time of the
+    fit in seconds, including tracing, the number of epochs/iterations that it
+    ran, and its final training and validation losses. Every optimizer starts
+    from the same initial weights.
+    """
+
+    # (1): The same split and the same initial weights for every optimizer:
+    row_indices = np.random.default_rng(0).permutation(kinematics.shape[0])
+    number_of_validation_rows = int(np.ceil(_DNN_TRAIN_TEST_SPLIT_PERCENTAGE * kinematics.shape[0]))
+    training_indices, validation_indices = row_indices[number_of_validation_rows:], row_indices[:number_of_validation_rows]
+
+    tf.keras.utils.set_random_seed(0)
+    dnn_model = build_simultaneous_model(use_kinematic_bundle = True)
+
+    # (2): The inputs of the model, outside of the timed region:
+    model_inputs = build_model_inputs(kinematics, use_kinematic_bundle = True)
+    training_inputs = [tf.gather(model_input, training_indices) for model_input in model_inputs]
+    validation_inputs = [tf.gather(model_input, validation_indices) for model_input in model_inputs]
+
+    # (3): Time the whole fit:
+    start_time = time.perf_counter()
+
+    if optimizer == "adam":
+        training_history = dnn_model.fit(
+            training_inputs,
+            cross_section[training_indices],
+            validation_data = (validation_inputs, cross_section[validation_indices]),
+            batch_size = _HYPERPARAMETER_BATCH_SIZE,
+            epochs = _HYPERPARAMETER_NUMBER_OF_EPOCHS,
+            callbacks = [
+                tf.keras.callbacks.ReduceLROnPlateau(monitor = 'loss', factor = _HYPERPARAMETER_LR_FACTOR, patience = _HYPERPARAMETER_LR_PATIENCE),
+                tf.keras.callbacks.EarlyStopping(monitor = 'loss', patience = _HYPERPARAMETER_EARLYSTOP_PATIENCE_INTEGER)],
+            verbose = 0)
+
+    else:
+        training_history = fit_full_batch(
+            dnn_model,
+            training_inputs,
+            cross_section[training_indices],
+            validation_data = (validation_inputs, cross_section[validation_indices]),
+            method = optimizer)
+
+    elapsed_time = time.perf_counter() - start_time
+
+    return elapsed_time, len(training_history.epoch), training_history.history["loss"][-1], training_history.history["val_loss"][-1]
+
+def main_optimizers():
+    """
+    ## Description:
+    Compare the wall time to fit one replica, and the losses it ends up with,
+    of Adam and of the full-batch optimizers, and print a small table.
+    """
+
+    # (1): One local fit:
+    kinematics, cross_section = load_benchmark_data(_BENCHMARK_OPTIMIZER_DATA_FILE)
+
+    # (2): Initialize a list of the rows of the final table:
+    results = []
+
+    # (3): Iterate over the optimizers:
+    for optimizer in _BENCHMARK_OPTIMIZERS:
+
+        fit_time, number_of_iterations, training_loss, validation_loss = time_optimizer_fit(kinematics, cross_section, optimizer)
+
+        if SETTING_VERBOSE:
+            print(f"> [VERBOSE]: {_BENCHMARK_OPTIMIZER_DATA_FILE} | {optimizer}: {fit_time:.2f} s for {number_of_iterations} epochs/iterations, loss {training_loss:.3e}, validation loss {validation_loss:.3e}")
+
+        results.append((optimizer, fit_time, number_of_iterations, training_loss, validation_loss))
+
+    # (4): Print the summary, with Adam as the baseline:
+    print(f"{'optimizer':<14} {'s to fit':>9} {'speedup':>8} {'iterations':>11} {'loss':>11} {'val. loss':>11}")
+    for optimizer, fit_time, number_of_iterations, training_loss, validation_loss in results:
+        print(f"{optimizer:<14} {fit_time:>9.2f} {results[0][1] / fit_time:>7.1f}x {number_of_iterations:>11} {training_loss:>11.3e} {validation_loss:>11.3e}")
+
+    return results
+
+def main(modes: dict):
+    """
+    ## Description:
+    Run every benchmark mode over every benchmark data file and print a
+    small table of step times.
+    """
+
+    # (1): Initialize a list of the rows of the final table:
+    results = []
+
+    # (2): Iterate over the data files:
+    for data_file_name, number_of_epochs in _BENCHMARK_DATA_FILES.items():
+
+        # (2.1): Load the data once per file:
+        kinematics, cross_section = load_benchmark_data(data_file_name)
+
+        # (2.2): Iterate over all the modes:
+        for mode_name, model_settings in modes.items():
+
+            step_time = time_training_steps(kinematics, cross_section, number_of_epochs, **model_settings)
+
+            forward_time = time_forward_pass(kinematics, _BENCHMARK_NUMBER_OF_FORWARD_CALLS, **model_settings)
+
+            layer_time = time_layer_gradient(kinematics, _BENCHMARK_NUMBER_OF_FORWARD_CALLS, **model_settings)
+
+            relative_error = measure_layer_accuracy(kinematics, **model_settings)
+
+            if SETTING_VERBOSE:
+                print(f"> [VERBOSE]: {data_file_name} ({kinematics.shape[0]} rows) | {mode_name}: {step_time:.3f} ms/step, {forward_time:.3f} ms/forward, {layer_time:.3f} ms/layer gradient, {relative_error:.2e} max. rel. error")
+
+            results.append((data_file_name, kinematics.shape[0], mode_name, step_time, forward_time, layer_time, relative_error))
+
+    # (3): Print the summary:
+    print(f"{'data file':<22} {'rows':>6} {'mode':<14} {'ms/step':>10} {'ms/forward':>12} {'ms/layer grad':>14} {'max rel. err':>13}")
+    for data_file_name, number_of_rows, mode_name, step_time, forward_time, layer_time, relative_error in results:
+        print(f"{data_file_name:<22} {number_of_rows:>6} {mode_name:<14} {step_time:>10.3f} {forward_time:>12.3f} {layer_time:>14.3f} {relative_error:>13.2e}")
+
+    return results
+
+# (X): The different CrossSectionLayer execution modes we compare:
+_BENCHMARK_MODES = {
+    "standard": {},
+    "xla": {"jit_compile": True},
+    "bundle": {"use_kinematic_bundle": True},
+    "design_matrix": {"use_design_matrix": True},
+    "float64": {"precision": "float64"},
+    "mixed": {"precision": "mixed"},
+}
+
+if __name__ == "__main__":
+
+    # (1): Create an instance of the ArgumentParser
+    parser = argparse.ArgumentParser(description = "Benchmark the CrossSectionLayer execution modes.")
+
+    # (2): Allow the user to only run some of the modes:
+    parser.add_argument(
+        '-m',
+        '--modes',
+        nargs = '+',
+        choices = list(_BENCHMARK_MODES.keys()),
+        default = list(_BENCHMARK_MODES.keys()),
+        help = 'Which CrossSectionLayer modes to benchmark.')
+
+    # (3): ... or compare the TensorFlow and NumPy backends instead:
+    parser.add_argument(
+        '--latency',
+        action = 'store_true',
+        help = 'Compare the small-batch latency of the TensorFlow and NumPy backends instead.')
+
+    # (4): ... or compare Adam with the full-batch optimizers:
+    parser.add_argument(
+        '--optimizers',
+        action = 'store_true',
+        help = 'Compare the time to fit a replica with Adam, L-BFGS, and Gauss-Newton instead.')
+
+    arguments = parser.parse_args()
+
+    if arguments.latency:
+        main_latency()
+    elif arguments.optimizers:
+        main_optimizers()
+    else:
+        main({mode_name: _BENCHMARK_MODES[mode_name] for mode_name in arguments.modes})
@@ -8,6 +8,9 @@ import os
 # Native Library | glob
 import glob
 
+# Native Library | hashlib
+import hashlib
+
 # Native Library | re
 import re
 
@@ -23,18 +26,34 @@ import matplotlib.pyplot as plt
 SETTING_VERBOSE = True
 SETTING_DEBUG = True
 
-def generate_replica_data(pandas_dataframe: pd.DataFrame):
+# (X): The random streams of every replica --- for its pseudodata, its train/validation split, and the order of its training batches:
+_RANDOM_STREAM_PSEUDODATA = 0
+_RANDOM_STREAM_TRAINING_SPLIT = 1
+_RANDOM_STREAM_TRAINING_SHUFFLE = 2
+
+# (X): The Cholesky factors of the covariance matrices that we have sampled from, by dataset:
+_COVARIANCE_FACTOR_CACHE = {}
+
+def compute_observable_base_name(column_name: str) -> str:
     """
     ## Description:
-    Generates a replica dataset by sampling a given observable 
-    within a Normal Distribution within its standard deviation.
+    The name of an observable without its "unit brackets", e.g. "sigma [nb]" -> "sigma".
+    The uncertainty columns of the observable are named after it: "sigma_stat_plus", ...
     """
+    return re.sub(r'\s*\[.*?\]', '', column_name).strip()
 
-    # (1): We first copy the original DF:
-    pseudodata_dataframe = pandas_dataframe.copy()
+def find_sampled_observables(pandas_dataframe: pd.DataFrame):
+    """
+    ## Description:
+    Find the observables in a given DF that the replica method resamples, and
+    the column of the uncertainty that each one is sampled with.
+
+    ## Returns:
+        A list of (observable column, uncertainty column) pairs.
+    """
 
     # (2): We extract the *names* of the columns to determine what observables are in them:
-    all_columns = pseudodata_dataframe.columns
+    all_columns = pandas_dataframe.columns
 
     # (3): Initialize an empty array to hold names of columns corresponding to observables:
     names_of_columns = []
@@ -52,7 +71,7 @@ def generate_replica_data(pandas_dataframe: pd.DataFrame):
             continue
 
         # (5.2): Otherwise, we first turn the corresponding column into a Series type with no NaNs:
-        series = pseudodata_dataframe[column].dropna().astype(str)
+        series = pandas_dataframe[column].dropna().astype(str)
 
         # (5.3): We check if the created Series has any (non!)-empty strings:
         # | This is done to *include* columns containing *some* experimental data
@@ -114,6 +133,9 @@ def generate_replica_data(pandas_dataframe: pd.DataFrame):
             "> Detected beam charge asymmetry observable.",
     }
 
+    # (X): The observables, each with the column of its uncertainty:
+    sampled_observables = []
+
     # (X): Iterate over the collected observables from the last *for* loop:
     for column_name in names_of_columns:
 
@@ -131,7 +153,7 @@ def generate_replica_data(pandas_dataframe: pd.DataFrame):
 
             # (): Rely on RegEx to eliminate "unit brackets" around names of observables,
             # | then strip any whitespace:
-            column_base_name = re.sub(r'\s*\[.*?\]', '', column_name).strip()
+            column_base_name = compute_observable_base_name(column_name)
 
             if SETTING_DEBUG:
                 print(f"> [DEBUG]: Stripped column name to: {column_base_name}")
@@ -144,70 +166,422 @@ def generate_replica_data(pandas_dataframe: pd.DataFrame):
             # (): Same as above except the systematic uncertainty:
             observable_statistical_uncertainty = f"{column_base_name}_sys_plus"
 
-            # (X): Obtain a Series consisting of *the untouched*, raw, experimental observable values:
-            mean_values = pandas_dataframe[column_name]
+            sampled_observables.append((column_name, observable_statistical_uncertainty))
 
-            if SETTING_DEBUG:
-                print(f"> [DEBUG]: Successfully queried corresponding Series values:\n{mean_values}")
+    return sampled_observables
 
-            # (X): Obtain a Series of the above's corresponding uncertainty:
-            standard_deviations = pandas_dataframe[observable_statistical_uncertainty]
+def generate_replica_data(pandas_dataframe: pd.DataFrame):
+    """
+    ## Description:
+    Generates a replica dataset by sampling a given observable 
+    within a Normal Distribution within its standard deviation.
+    """
 
-            if SETTING_DEBUG:
-                print(f"> [DEBUG]: Successfully queried observable's corresponding errors:\n{standard_deviations}")
-
-            # (X): Perform element-wise Normal Distribution sampling to construct a *new* Series
-            # | column --- this is the "pseudodata representation" of the original observable:
-            pseudodata_dataframe[column_name] = np.random.normal(
-                loc = mean_values,
-                scale = standard_deviations)
-            
-            if SETTING_DEBUG:
-                print(f"> [DEBUG]: Randomly sampled U(mean_values, standard_deviations) to obtain new Series:\n{pseudodata_dataframe[column_name] }")
-
-            # figure_instance_pseudodata = plt.figure(figsize = (10, 5.5))
-
-            # axis_instance_pseudodata = figure_instance_pseudodata.add_subplot(1, 1, 1)
-
-            # axis_instance_pseudodata.set_title("Data from .csv")
-            # axis_instance_pseudodata.set_xlabel(r"$\phi$")
-            # axis_instance_pseudodata.set_ylabel("Observable")
-
-            # axis_instance_pseudodata.errorbar(
-            #     x = pandas_dataframe['phi'],
-            #     y = pandas_dataframe[column_name],
-            #     yerr = pandas_dataframe[observable_statistical_uncertainty],
-            #     marker = 'o',
-            #     linestyle = '',
-            #     markersize = 3.0,
-            #     ecolor = 'black',
-            #     elinewidth = 0.5,
-            #     capsize = 1,
-            #     color = 'black',
-            #     label = "Raw Data")
-            
-            # axis_instance_pseudodata.errorbar(
-            #     x = pseudodata_dataframe['phi'],
-            #     y = pseudodata_dataframe[column_name],
-            #     yerr = pandas_dataframe[observable_statistical_uncertainty],
-            #     marker = 'o',
-            #     linestyle = '',
-            #     markersize = 3.0,
-            #     ecolor = 'black',
-            #     elinewidth = 0.5,
-            #     capsize = 1,
-            #     color = 'orange',
-            #     label = "Generated Pseudodata")
-            
-            # plt.legend()
-
-            # plt.show()
-            # plt.close()
+    # (1): We first copy the original DF:
+    pseudodata_dataframe = pandas_dataframe.copy()
+
+    # (2): Sample every observable that we find in the DF:
+    for column_name, observable_statistical_uncertainty in find_sampled_observables(pandas_dataframe):
+
+        # (X): Obtain a Series consisting of *the untouched*, raw, experimental observable values:
+        mean_values = pandas_dataframe[column_name]
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Successfully queried corresponding Series values:\n{mean_values}")
+
+        # (X): Obtain a Series of the above's corresponding uncertainty:
+        standard_deviations = pandas_dataframe[observable_statistical_uncertainty]
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Successfully queried observable's corresponding errors:\n{standard_deviations}")
+
+        # (X): Perform element-wise Normal Distribution sampling to construct a *new* Series
+        # | column --- this is the "pseudodata representation" of the original observable:
+        pseudodata_dataframe[column_name] = np.random.normal(
+            loc = mean_values,
+            scale = standard_deviations)
+
+        if SETTING_DEBUG:
+            print(f"> [DEBUG]: Randomly sampled U(mean_values, standard_deviations) to obtain new Series:\n{pseudodata_dataframe[column_name] }")
+
+        # figure_instance_pseudodata = plt.figure(figsize = (10, 5.5))
+
+        # axis_instance_pseudodata = figure_instance_pseudodata.add_subplot(1, 1, 1)
+
+        # axis_instance_pseudodata.set_title("Data from .csv")
+        # axis_instance_pseudodata.set_xlabel(r"$\phi$")
+        # axis_instance_pseudodata.set_ylabel("Observable")
+
+        # axis_instance_pseudodata.errorbar(
+        #     x = pandas_dataframe['phi'],
+        #     y = pandas_dataframe[column_name],
+        #     yerr = pandas_dataframe[observable_statistical_uncertainty],
+        #     marker = 'o',
+        #     linestyle = '',
+        #     markersize = 3.0,
+        #     ecolor = 'black',
+        #     elinewidth = 0.5,
+        #     capsize = 1,
+        #     color = 'black',
+        #     label = "Raw Data")
+
+        # axis_instance_pseudodata.errorbar(
+        #     x = pseudodata_dataframe['phi'],
+        #     y = pseudodata_dataframe[column_name],
+        #     yerr = pandas_dataframe[observable_statistical_uncertainty],
+        #     marker = 'o',
+        #     linestyle = '',
+        #     markersize = 3.0,
+        #     ecolor = 'black',
+        #     elinewidth = 0.5,
+        #     capsize = 1,
+        #     color = 'orange',
+        #     label = "Generated Pseudodata")
+
+        # plt.legend()
+
+        # plt.show()
+        # plt.close()
 
     # pseudodata_dataframe.to_csv("test1.csv")
 
     return pseudodata_dataframe
 
+def find_experiments(pandas_dataframe: pd.DataFrame) -> np.ndarray:
+    """
+    ## Description:
+    Which experiment every row of the DF belongs to. The table of every experiment
+    gives its `link` in its first row only, so a row belongs to the last link
+    above it. A DF without links is one experiment.
+    """
+    if "link" not in pandas_dataframe.columns:
+        return np.zeros(len(pandas_dataframe), dtype = int)
+
+    return pd.factorize(pandas_dataframe["link"].ffill(), use_na_sentinel = False)[0]
+
+def symmetrize_uncertainties(pandas_dataframe: pd.DataFrame, column_base_name: str, uncertainty_kind: str):
+    """
+    ## Description:
+    The asymmetric `stat` or `sys` uncertainty of an observable, as a symmetric
+    width, (|σ+| + |σ-|)/2, and a shift of the central value, (|σ+| - |σ-|)/2,
+    for every data point at once. (The data tables do not agree on the sign of σ-.)
+    A missing σ- is taken to be σ+, and the other way around.
+
+    ## Returns:
+        The widths and the shifts, or `None` if the DF has neither column.
+    """
+
+    # (1): Read whichever of the two columns there are --- as numbers, where they are numbers:
+    plus_uncertainty, minus_uncertainty = [
+        np.abs(pd.to_numeric(pandas_dataframe[column_name], errors = "coerce").to_numpy(dtype = np.float64))
+        if column_name in pandas_dataframe.columns else None
+        for column_name in (f"{column_base_name}_{uncertainty_kind}_plus", f"{column_base_name}_{uncertainty_kind}_minus")]
+
+    if plus_uncertainty is None and minus_uncertainty is None:
+        return None
+
+    # (2): One of them stands in for the other, if it has to:
+    if plus_uncertainty is None:
+        plus_uncertainty = minus_uncertainty
+
+    if minus_uncertainty is None:
+        minus_uncertainty = plus_uncertainty
+
+    # (3): A point without an uncertainty has none:
+    plus_uncertainty, minus_uncertainty = np.nan_to_num(plus_uncertainty), np.nan_to_num(minus_uncertainty)
+
+    return 0.5 * (plus_uncertainty + minus_uncertainty), 0.5 * (plus_uncertainty - minus_uncertainty)
+
+def build_observable_covariance(
+        pandas_dataframe: pd.DataFrame,
+        column_name: str,
+        systematic_correlation: float = 1.0,
+        normalization_uncertainty: float = 0.0):
+    """
+    ## Description:
+    The central values and the covariance matrix of an observable, over the rows
+    of the DF where it was measured:
+
+        C = diag(σ_stat²) + (1 - ρ) diag(σ_sys²) + [same experiment] (ρ σ_sys σ_sysᵀ + f² μ μᵀ)
+
+    with the (symmetrized) statistical uncertainties uncorrelated, a fraction ρ =
+    `systematic_correlation` of the systematic uncertainties fully correlated
+    within an experiment, and a relative normalization uncertainty f =
+    `normalization_uncertainty` common to all the points of an experiment.
+
+    ## Returns:
+        The rows where the observable was measured, its central values (shifted
+        for asymmetric uncertainties), and its covariance matrix.
+    """
+
+    # (1): Only the rows where the observable was measured:
+    observable_values = pd.to_numeric(pandas_dataframe[column_name], errors = "coerce").to_numpy(dtype = np.float64)
+    measured_rows = np.flatnonzero(np.isfinite(observable_values))
+
+    # (2): The symmetrized uncertainties --- the observable has to have at least one kind:
+    column_base_name = compute_observable_base_name(column_name)
+    statistical_uncertainties = symmetrize_uncertainties(pandas_dataframe, column_base_name, "stat")
+    systematic_uncertainties = symmetrize_uncertainties(pandas_dataframe, column_base_name, "sys")
+
+    if statistical_uncertainties is None and systematic_uncertainties is None:
+        raise KeyError(f"{column_base_name}_stat_plus")
+
+    no_uncertainties = (np.zeros_like(observable_values), np.zeros_like(observable_values))
+    statistical_widths, statistical_shifts = (statistical_uncertainties or no_uncertainties)
+    systematic_widths, systematic_shifts = (systematic_uncertainties or no_uncertainties)
+
+    # (3): The asymmetries of the uncertainties move the central values:
+    central_values = (observable_values + statistical_shifts + systematic_shifts)[measured_rows]
+    statistical_widths, systematic_widths = statistical_widths[measured_rows], systematic_widths[measured_rows]
+
+    # (4): The correlated parts only connect points of the same experiment:
+    experiments = find_experiments(pandas_dataframe)[measured_rows]
+    same_experiment = experiments[:, np.newaxis] == experiments[np.newaxis, :]
+
+    covariance = (
+        np.diag(statistical_widths**2 + (1. - systematic_correlation) * systematic_widths**2)
+        + same_experiment * (
+            systematic_correlation * np.outer(systematic_widths, systematic_widths)
+            + normalization_uncertainty**2 * np.outer(central_values, central_values)))
+
+    return measured_rows, central_values, covariance
+
+def factorize_covariance(covariance: np.ndarray) -> np.ndarray:
+    """
+    ## Description:
+    A matrix L with L Lᵀ = `covariance`: its Cholesky factor, or --- if the covariance
+    is only positive *semi*-definite, e.g. a point without any uncertainty ---
+    the square root from its eigendecomposition.
+    """
+    try:
+        return np.linalg.cholesky(covariance)
+
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+
+        return eigenvectors * np.sqrt(np.clip(eigenvalues, 0., None))
+
+def get_covariance_factors(
+        pandas_dataframe: pd.DataFrame,
+        observable_names: list,
+        data_hash: int,
+        systematic_correlation: float = 1.0,
+        normalization_uncertainty: float = 0.0) -> list:
+    """
+    ## Description:
+    `build_observable_covariance` and `factorize_covariance` for every observable
+    --- computed once per dataset, and then taken from the cache.
+
+    ## Returns:
+        For every observable: its measured rows, central values, and the factor of its covariance.
+    """
+    covariance_factors = []
+
+    for column_name in observable_names:
+        cache_key = (data_hash, column_name, systematic_correlation, normalization_uncertainty)
+
+        if cache_key not in _COVARIANCE_FACTOR_CACHE:
+            measured_rows, central_values, covariance = build_observable_covariance(
+                pandas_dataframe, column_name, systematic_correlation, normalization_uncertainty)
+
+            _COVARIANCE_FACTOR_CACHE[cache_key] = (measured_rows, central_values, factorize_covariance(covariance))
+
+        covariance_factors.append(_COVARIANCE_FACTOR_CACHE[cache_key])
+
+    return covariance_factors
+
+def draw_run_seed() -> int:
+    """
+    ## Description:
+    A fresh seed for a run, from the entropy of the OS.
+    """
+    return int(np.random.SeedSequence().generate_state(1, dtype = np.uint64)[0])
+
+def compute_data_hash(column_names, experimental_data) -> int:
+    """
+    ## Description:
+    A 64-bit fingerprint of the experimental data (its column names and its
+    numbers), so that the same seed never gives the same pseudodata for different data.
+    """
+    data_hash = hashlib.sha256()
+    data_hash.update("\0".join(str(column_name) for column_name in column_names).encode("utf-8"))
+    data_hash.update(np.ascontiguousarray(experimental_data, dtype = np.float64).tobytes())
+
+    return int.from_bytes(data_hash.digest()[:8], "little")
+
+def create_replica_random_generator(
+        run_seed: int,
+        replica_index: int,
+        data_hash: int,
+        random_stream: int = _RANDOM_STREAM_PSEUDODATA) -> np.random.Generator:
+    """
+    ## Description:
+    The random numbers of one replica, from a counter-based (Philox) generator:
+    the key comes from (run seed, data hash), and the replica index and the
+    stream sit in the upper words of the counter. So, every replica has its
+    own stream, which any process can recreate at any time, in any order.
+
+    ## Arguments:
+        random_stream: int
+            `_RANDOM_STREAM_PSEUDODATA`, `_RANDOM_STREAM_TRAINING_SPLIT`, or `_RANDOM_STREAM_TRAINING_SHUFFLE`.
+    """
+
+    # (1): The 128-bit key of the run and its data:
+    philox_key = np.random.SeedSequence([run_seed, data_hash]).generate_state(2, dtype = np.uint64)
+
+    # (2): The counter only ever runs in its lowest words --- the upper ones pick the stream:
+    philox_counter = np.array([0, 0, random_stream, replica_index], dtype = np.uint64)
+
+    return np.random.Generator(np.random.Philox(counter = philox_counter, key = philox_key))
+
+class ReplicaPseudodata:
+    """
+    ## Description:
+    The pseudodata of *every* replica of a run, next to the (numerical columns of
+    the) experimental data it was sampled from: `pseudodata[o, r, n]` is observable
+    `o` of replica `r` at data point `n`. It is stored in a single .npz file, along
+    with the seed of the run: any replica's pseudodata and train/validation split
+    can be recreated from it (see `create_replica_random_generator`).
+    """
+
+    def __init__(self, column_names, experimental_data, observable_names, pseudodata, run_seed: int):
+
+        # (1): The experimental DF, as a float matrix with its column names:
+        self.column_names = [str(column_name) for column_name in column_names]
+        self.experimental_data = np.asarray(experimental_data, dtype = np.float64)
+
+        # (2): The resampled observables, shape (O, R, N):
+        self.observable_names = [str(observable_name) for observable_name in observable_names]
+        self.pseudodata = np.asarray(pseudodata, dtype = np.float64)
+
+        # (3): Where all of the random numbers came from:
+        self.run_seed = int(run_seed)
+        self.data_hash = compute_data_hash(self.column_names, self.experimental_data)
+
+    @property
+    def number_of_replicas(self) -> int:
+        return self.pseudodata.shape[1]
+
+    def get_experimental_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame(self.experimental_data, columns = self.column_names)
+
+    def get_replica_dataframe(self, replica_index: int) -> pd.DataFrame:
+        """
+        ## Description:
+        What `generate_replica_data` would have given for replica `replica_index`:
+        the experimental DF with its observables replaced by the replica's pseudodata.
+        """
+        replica_dataframe = self.get_experimental_dataframe()
+
+        for observable_index, observable_name in enumerate(self.observable_names):
+            replica_dataframe[observable_name] = self.pseudodata[observable_index, replica_index]
+
+        return replica_dataframe
+
+    def get_column_for_all_replicas(self, column_name: str) -> np.ndarray:
+        """
+        ## Description:
+        Column `column_name` of every replica at once, shape (R, N). A column that
+        is not resampled is the same for every replica.
+        """
+        if column_name in self.observable_names:
+            return self.pseudodata[self.observable_names.index(column_name)]
+
+        column = self.experimental_data[:, self.column_names.index(column_name)]
+
+        return np.broadcast_to(column, (self.number_of_replicas, column.shape[0]))
+
+    def split_training_indices(self, replica_index: int, validation_fraction: float):
+        """
+        ## Description:
+        The train/validation split of replica `replica_index`: a shuffle of the
+        data points from the replica's own stream, split like `train_test_split`
+        splits (the first ceil(validation_fraction * N) points are for validation).
+
+        ## Returns:
+            The training indices, and the validation indices.
+        """
+        number_of_data_points = self.experimental_data.shape[0]
+        number_of_validation_points = int(np.ceil(validation_fraction * number_of_data_points))
+
+        random_generator = create_replica_random_generator(self.run_seed, replica_index, self.data_hash, _RANDOM_STREAM_TRAINING_SPLIT)
+        shuffled_indices = random_generator.permutation(number_of_data_points)
+
+        return shuffled_indices[number_of_validation_points:], shuffled_indices[:number_of_validation_points]
+
+    def draw_shuffle_seed(self, replica_index: int) -> int:
+        """
+        ## Description:
+        The seed with which replica `replica_index` shuffles its training batches.
+        """
+        random_generator = create_replica_random_generator(self.run_seed, replica_index, self.data_hash, _RANDOM_STREAM_TRAINING_SHUFFLE)
+
+        return int(random_generator.integers(2**31 - 1))
+
+    def save(self, file):
+        """
+        ## Description:
+        Write everything into one .npz file (a path, or an open binary file).
+        """
+        np.savez(
+            file,
+            column_names = np.array(self.column_names),
+            experimental_data = self.experimental_data,
+            observable_names = np.array(self.observable_names, dtype = str),
+            pseudodata = self.pseudodata,
+            run_seed = np.uint64(self.run_seed))
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path) as pseudodata_file:
+            return cls(
+                pseudodata_file["column_names"],
+                pseudodata_file["experimental_data"],
+                pseudodata_file["observable_names"],
+                pseudodata_file["pseudodata"],
+                pseudodata_file["run_seed"])
+
+def generate_replica_pseudodata(
+        pandas_dataframe: pd.DataFrame,
+        number_of_replicas: int,
+        run_seed: int = None,
+        systematic_correlation: float = 1.0,
+        normalization_uncertainty: float = 0.0) -> ReplicaPseudodata:
+    """
+    ## Description:
+    The pseudodata of `number_of_replicas` replicas at once. Every observable is
+    sampled from a multivariate Normal Distribution, with the statistical, the
+    (correlated) systematic, and the normalization uncertainties of its experiment
+    (see `build_observable_covariance`). Every replica draws from its own stream
+    (see `create_replica_random_generator`), so replica r has the same pseudodata
+    whether we generate 10 replicas or 1000 --- and for the same `run_seed`, always.
+    Rows where an observable was not measured stay NaN.
+    """
+
+    # (1): Only the numbers of the DF are kept (not e.g. the `link` column):
+    numeric_dataframe = pandas_dataframe.select_dtypes(include = "number")
+
+    if run_seed is None:
+        run_seed = draw_run_seed()
+
+    data_hash = compute_data_hash(numeric_dataframe.columns, numeric_dataframe.to_numpy(dtype = np.float64))
+
+    # (2): The observables in the DF, and the factors of their covariance matrices:
+    observable_names = [column_name for column_name, _ in find_sampled_observables(pandas_dataframe)]
+    covariance_factors = get_covariance_factors(pandas_dataframe, observable_names, data_hash, systematic_correlation, normalization_uncertainty)
+
+    # (3): Standard normal numbers, shape (O, R, N) --- one block from each replica's stream:
+    standard_normal_draws = np.stack([
+        create_replica_random_generator(run_seed, replica_index, data_hash).standard_normal((len(observable_names), len(pandas_dataframe)))
+        for replica_index in range(number_of_replicas)], axis = 1)
+
+    # (4): ... which become the pseudodata of all replicas in one matrix product per observable:
+    pseudodata = np.full(standard_normal_draws.shape, np.nan)
+
+    for observable_index, (measured_rows, central_values, covariance_factor) in enumerate(covariance_factors):
+        pseudodata[observable_index][:, measured_rows] = central_values + standard_normal_draws[observable_index][:, measured_rows] @ covariance_factor.T
+
+    return ReplicaPseudodata(numeric_dataframe.columns, numeric_dataframe.to_numpy(dtype = np.float64), observable_names, pseudodata, run_seed)
 
 # script_dir = os.path.dirname(os.path.abspath(__file__))
 # folder_path = os.path.abspath(os.path.join(script_dir, '..', 'data'))
@@ -9,9 +9,21 @@ import argparse
 # Native Library | datetime
 import datetime
 
+# Native Library | functools
+import functools
+
+# Native Library | multiprocessing
+import multiprocessing
+
 # Native Library | os
 import os
 
+# Native Library | shutil
+import shutil
+
+# Native Library | concurrent.futures
+from concurrent.futures import ProcessPoolExecutor
+
 # 3rd Party Library | NumPy:
 import numpy as np
 
@@ -30,9 +42,6 @@ import tensorflow as tf
 # 3rd Party Library | Keras:
 import keras
 
-# 3rd Party Library | sklearn:
-from sklearn.model_selection import train_test_split
-
 # 3rd Party Library | SciPy:
 from scipy.stats import norm
 
@@ -42,13 +51,26 @@ from tqdm import tqdm
 # (X): Function | model > architecture > build_simultaneous_model
 from models.architecture import build_simultaneous_model
 
+# (X): Function | model > architecture > build_ensemble_model, extract_replica_model
+from models.architecture import build_ensemble_model, extract_replica_model
+
+# (X): Function | model > full_batch_fit > fit_full_batch
+from models.full_batch_fit import fit_full_batch
+
+# (X): Function | model > architecture > precompute_kinematic_bundle
+from models.architecture import precompute_kinematic_bundle
+
+# (X): Function | model > architecture > precompute_design_matrix
+from models.architecture import precompute_design_matrix
+
 # (X): In order to correctly deserialize a TF model, you need to define
 # | custom objects when loading it. And so that requires that we
 # | actually import the damn custom layers we made:
 from models.architecture import CrossSectionLayer, BSALayer
+from models.km15 import KM15PriorLayer
 
-# (X): Function | scripts > replica_data > generate_replica_data
-from scripts.replica_data import generate_replica_data
+# (X): Function | scripts > replica_data > generate_replica_pseudodata
+from scripts.replica_data import ReplicaPseudodata, generate_replica_pseudodata
 
 # static_strings > argparse > description:
 from statics.static_strings import _ARGPARSE_DESCRIPTION
@@ -71,6 +93,48 @@ from statics.static_strings import _ARGPARSE_ARGUMENT_DESCRIPTION_NUMBER_REPLICA
 # static_strings > argparse > description for verbose:
 from statics.static_strings import _ARGPARSE_ARGUMENT_DESCRIPTION_VERBOSE
 
+# static_strings > argparse > ensemble:
+from statics.static_strings import _ARGPARSE_ARGUMENT_ENSEMBLE
+
+# static_strings > argparse > description for ensemble:
+from statics.static_strings import _ARGPARSE_ARGUMENT_DESCRIPTION_ENSEMBLE
+
+# static_strings > argparse > workers:
+from statics.static_strings import _ARGPARSE_ARGUMENT_WORKERS
+
+# static_strings > argparse > description for workers:
+from statics.static_strings import _ARGPARSE_ARGUMENT_DESCRIPTION_WORKERS
+
+# static_strings > argparse > run directory:
+from statics.static_strings import _ARGPARSE_ARGUMENT_RUN_DIRECTORY
+
+# static_strings > argparse > description for run directory:
+from statics.static_strings import _ARGPARSE_ARGUMENT_DESCRIPTION_RUN_DIRECTORY
+
+# static_strings > argparse > resume:
+from statics.static_strings import _ARGPARSE_ARGUMENT_RESUME
+
+# static_strings > argparse > description for resume:
+from statics.static_strings import _ARGPARSE_ARGUMENT_DESCRIPTION_RESUME
+
+# static_strings > argparse > seed:
+from statics.static_strings import _ARGPARSE_ARGUMENT_SEED
+
+# static_strings > argparse > description for seed:
+from statics.static_strings import _ARGPARSE_ARGUMENT_DESCRIPTION_SEED
+
+# static_strings > argparse > optimizer:
+from statics.static_strings import _ARGPARSE_ARGUMENT_OPTIMIZER
+
+# static_strings > argparse > description for optimizer:
+from statics.static_strings import _ARGPARSE_ARGUMENT_DESCRIPTION_OPTIMIZER
+
+# static_strings > argparse > stale claim timeout:
+from statics.static_strings import _ARGPARSE_ARGUMENT_STALE_CLAIM_TIMEOUT
+
+# static_strings > argparse > description for stale claim timeout:
+from statics.static_strings import _ARGPARSE_ARGUMENT_DESCRIPTION_STALE_CLAIM_TIMEOUT
+
 # static_strings > "k"
 from statics.static_strings import _COLUMN_NAME_LEPTON_MOMENTUM
 
@@ -92,6 +156,9 @@ from statics.static_strings import _COLUMN_NAME_CROSS_SECTION
 # static_strings > "F_err"
 from statics.static_strings import _COLUMN_NAME_CROSS_SECTION_ERROR
 
+# static_strings > ("ALU", "BSA")
+from statics.static_strings import _COLUMN_NAMES_BEAM_SPIN_ASYMMETRY
+
 # static_strings > /replicas
 from statics.static_strings import _DIRECTORY_REPLICAS
 
@@ -104,6 +171,12 @@ from statics.static_strings import _DIRECTORY_DATA_RAW
 # static_strings > /data/replicas
 from statics.static_strings import _DIRECTORY_DATA_REPLICAS
 
+# static_strings > /data/checkpoints
+from statics.static_strings import _DIRECTORY_DATA_CHECKPOINTS
+
+# static_strings > pseudodata.npz
+from statics.static_strings import _FILE_NAME_REPLICA_PSEUDODATA
+
 # static_strings > /replicas/losses
 from statics.static_strings import _DIRECTORY_REPLICAS_LOSSES
 
@@ -134,6 +207,9 @@ from statics.static_strings import _HYPERPARAMETER_NUMBER_OF_EPOCHS
 # static_strings > batch size for training
 from statics.static_strings import _HYPERPARAMETER_BATCH_SIZE
 
+# static_strings > epochs between checkpoints
+from statics.static_strings import _HYPERPARAMETER_CHECKPOINT_FREQUENCY_IN_EPOCHS
+
 # static_strings > learning rate patience parameter
 from statics.static_strings import _HYPERPARAMETER_LR_PATIENCE
 
@@ -149,8 +225,17 @@ from statics.static_strings import _DNN_VERBOSE_SETTING
 # static_strings > train/test split percentage
 from statics.static_strings import _DNN_TRAIN_TEST_SPLIT_PERCENTAGE
 
-# utilities > km15
-from utilities.km15 import compute_km15_cffs
+# utilities > km15_grid
+from utilities.km15_grid import load_km15_grid
+
+# utilities > replica_dataset
+from utilities.replica_dataset import ReplicaDatasets
+
+# utilities > replica_queue
+from utilities.replica_queue import ReplicaQueue, atomic_output_path, create_file_exclusively, wait_for_other_workers, work_on_replica_queue
+
+# utilities > replica_queue > how long a claim may go without a heartbeat
+from utilities.replica_queue import _REPLICA_QUEUE_STALE_CLAIM_TIMEOUT_IN_SECONDS
 
 # (X): We tell rcParams to use LaTeX. Note: this will *crash* your
 # | version of the code if you do not have TeX distribution installed!
@@ -229,6 +314,44 @@ def extract_kinematics(input_data):
     
     return q_squared, x_bjorken, t, k
 
+def compute_model_inputs(dnn_model, kinematics, use_cache = False):
+    """
+    ## Description:
+    A model built with `use_kinematic_bundle = True` wants the kinematic bundle
+    next to the kinematics, and one built with `use_design_matrix = True` the
+    design matrix --- its CrossSectionLayer knows which. Older, single-input
+    replica models only want the kinematics.
+    """
+    if len(dnn_model.inputs) == 1:
+        return kinematics
+
+    kinematics = np.asarray(kinematics, dtype = np.float32)
+
+    if find_cross_section_layer(dnn_model).use_design_matrix:
+        return [kinematics, precompute_design_matrix(kinematics, use_cache = use_cache)]
+
+    return [kinematics, precompute_kinematic_bundle(kinematics, use_cache = use_cache)]
+
+def predict_cross_section(dnn_model, kinematics):
+    """
+    ## Description:
+    The cross-section that `dnn_model` predicts at `kinematics`, as a flat array. A
+    model that fits the BSA, too, predicts [cross-section, BSA] --- we want the first.
+    """
+    predictions = dnn_model.predict(compute_model_inputs(dnn_model, kinematics))
+
+    if isinstance(predictions, (list, tuple)):
+        predictions = predictions[0]
+
+    return np.asarray(predictions).flatten()
+
+def find_cross_section_layer(dnn_model):
+    """
+    ## Description:
+    The CrossSectionLayer of `dnn_model` --- not its BSALayer, which is a CrossSectionLayer, too.
+    """
+    return next(layer for layer in dnn_model.layers if isinstance(layer, CrossSectionLayer) and not isinstance(layer, BSALayer))
+
 def plot_hyperplane_separations(
         current_replica_run_directory,
         replica_number,
@@ -242,7 +365,7 @@ def plot_hyperplane_separations(
     """
 
     # (X): Evaluate the network:
-    y_predictions = dnn_model.predict(x_training).flatten()
+    y_predictions = predict_cross_section(dnn_model, x_training)
 
     # (X): Compute residuals:
     residuals = np.abs(y_training - y_predictions)
@@ -311,7 +434,7 @@ def plot_cross_section_with_residuals_and_interpolation(
     """
 
     # (X): First, we need to predict the cross-section values:
-    predicted_values = dnn_model.predict(x_training).flatten()
+    predicted_values = predict_cross_section(dnn_model, x_training)
 
     # (X): Obtain the kinematic settings:
     q_squared_value, x_bjorken_value, t_value, k_value = extract_kinematics(x_training)
@@ -408,14 +531,18 @@ def plot_cross_section_with_residuals_and_interpolation(
     # (X): Construct a "densely-packed" array of azimuthal phi values for interpolation:
     phi_dense = np.linspace(0, 360, 500)
 
-    # (X): Now, attach the phi values to the rest of the kinematic values:
-    dense_inputs = np.column_stack([
-        np.tile(fixed_kinematics_except_phi, (phi_dense.shape[0], 1)),
-        phi_dense.reshape(-1, 1)
-    ]).astype(np.float32)
+    # (X): The CFFs only depend on (Q², x_B, t), so one evaluation of the DNN covers the whole curve:
+    fixed_kinematics_except_phi = np.asarray(fixed_kinematics_except_phi, dtype = np.float32).reshape(1, -1)
+    dense_cffs = extract_cff_layer_output(dnn_model, np.append(fixed_kinematics_except_phi, [[0.]], axis = 1))
+
+    # (X): Use the model's own CrossSectionLayer so that the settings (polarization, WW, precision) match:
+    cross_section_layer = find_cross_section_layer(dnn_model)
 
-    # (X): Run the inputs through the DNN model for predictions:
-    dnn_predictions_dense = dnn_model.predict(dense_inputs, verbose = 0).flatten()
+    # (X): Evaluate the cross-section from its φ harmonics --- a handful of kinematic points instead of 500:
+    dnn_predictions_dense = cross_section_layer.compute_cross_section_on_phi_grid(
+        tf.constant(fixed_kinematics_except_phi, dtype = cross_section_layer.kernel_dtype),
+        tf.constant(dense_cffs, dtype = cross_section_layer.kernel_dtype),
+        tf.constant(phi_dense, dtype = cross_section_layer.kernel_dtype)).numpy().flatten()
 
     # (X): Now actually *add* the interpolation:
     interplation_axis.plot(
@@ -463,11 +590,17 @@ def plot_cross_section_with_residuals_and_interpolation(
 def create_relevant_directories(
         data_file_name: str,
         number_of_replicas: int,
-        verbose: bool = False):
+        verbose: bool = False,
+        run_directory: str = None):
     """
     ## Description:
     A function that automates the construction of the several relevant folders
     used for the analysis of ML output.
+
+    ## Arguments:
+    run_directory: str
+        Use (or join) this run directory instead of a new, timestamped one. Any
+        number of workers can do this at the same time.
     """
 
     # (1): We create a *unique* timestamp to name the analysis folder:
@@ -483,7 +616,10 @@ def create_relevant_directories(
         print(f"> [DEBUG]: Computed current replica run to be: {current_run_name}")
 
     # (3): Use os.path to construct a path...
-    current_run_folder = os.path.join(f"{os.getcwd()}/analysis", current_run_name)
+    if run_directory is None:
+        current_run_folder = os.path.join(f"{os.getcwd()}/analysis", current_run_name)
+    else:
+        current_run_folder = os.path.abspath(run_directory)
 
     if SETTING_DEBUG:
         print(f"> [DEBUG]: Determined run folder to be: {current_run_folder}")
@@ -507,19 +643,24 @@ def create_relevant_directories(
     # | and other ANN stuff (e.g. hyperparameters):
     replicas_readme_file_path_and_name = os.path.join(current_run_folder, "data/replicas/README.md")
 
-    # (7): Open the data README file to prepare to write:
-    with open(
-        file = data_readme_file_path_and_name,
+    # (X): A run that we join, or resume, has its READMEs already:
+    if os.path.exists(replicas_readme_file_path_and_name):
+        return current_run_folder
+
+    # (7): Open the data README file to prepare to write --- atomically, as other workers may be writing it, too:
+    with atomic_output_path(data_readme_file_path_and_name) as temporary_data_readme_path, open(
+        file = temporary_data_readme_path,
         mode = "w",
         encoding = "utf-8") as new_data_readme:
         new_data_readme.write(f"# Raw Data for Replica Run on {timestamp}\n")
         new_data_readme.write("This folder contains the original data used to generate pseudodata for replicas.\n")
         new_data_readme.write(f"\n- Source data file: `{data_file_name}`\n")
+        new_data_readme.write(f"- Pseudodata of every replica: `{_FILE_NAME_REPLICA_PSEUDODATA}` (see `ReplicaPseudodata`)\n")
         new_data_readme.close()
 
     # (8): Open the replica README file to prepare to write:
-    with open(
-        file = replicas_readme_file_path_and_name,
+    with atomic_output_path(replicas_readme_file_path_and_name) as temporary_replica_readme_path, open(
+        file = temporary_replica_readme_path,
         mode = "w",
         encoding = "utf-8") as new_replica_readme:
         new_replica_readme.write(f"# Replicas for Replica Run on {timestamp} \n")
@@ -546,8 +687,9 @@ def extract_cff_layer_output(model, input_data):
     layer of 8 nodes that are *then* used to generate cross-
     section and BSA data.
     """
+    # (X): The CFFs only depend on the kinematics --- the first input:
     intermediate_layer_model = tf.keras.Model(
-        inputs = model.input,
+        inputs = model.inputs[0],
         outputs = model.get_layer("cff_output_layer").output)
     
     return intermediate_layer_model.predict(input_data)
@@ -563,7 +705,7 @@ def get_replica_model_paths(current_replica_run_path):
     return sorted([
         os.path.join(current_replica_run_path, filename)
         for filename in os.listdir(current_replica_run_path)
-        if filename.endswith(_TF_FORMAT_KERAS)
+        if filename.endswith(_TF_FORMAT_KERAS) and not filename.startswith(".")
     ])
 
 def make_predictions(current_replica_run_directory, input_data):
@@ -610,7 +752,8 @@ def make_predictions(current_replica_run_directory, input_data):
             compile = False,
             custom_objects = {
                 "CrossSectionLayer": CrossSectionLayer,
-                "BSALayer": BSALayer
+                "BSALayer": BSALayer,
+                "KM15PriorLayer": KM15PriorLayer
             })
 
         # (X.Y): Run through the models makingpredictions:
@@ -636,8 +779,11 @@ def make_predictions(current_replica_run_directory, input_data):
     # (X): Prepare to evaluate the KM15 model by extracting
     q_squared, x_bjorken, t = (input_data[_COLUMN_NAME_Q_SQUARED], input_data[_COLUMN_NAME_X_BJORKEN], input_data[_COLUMN_NAME_T_MOMENTUM_CHANGE])
 
-    # (X): Get the KM15 values of the CFFs:
-    real_h_km15, imag_h_km15, real_e_km15, real_ht_km15, imag_ht_km15, real_et_km15 = compute_km15_cffs(q_squared.values[0], x_bjorken.values[0], t.values[0])
+    # (X): Get the KM15 values of the CFFs at *every* row, and average them over the rows
+    # | just like the replica predictions above. They come from the KM15 table (built on
+    # | first use), and rows outside of it are computed exactly:
+    real_h_km15, imag_h_km15, real_e_km15, real_ht_km15, imag_ht_km15, real_et_km15 = (
+        np.mean(km15_values) for km15_values in load_km15_grid()(q_squared.values, x_bjorken.values, t.values))
 
     # (X): Package CFFs in list corresponding index-wise the the right CFF in `cff_names` above:
     km15_cff_values = [real_h_km15, imag_h_km15, real_e_km15, 0.0, real_ht_km15, imag_ht_km15, real_et_km15, 0.0]
@@ -727,159 +873,422 @@ def make_predictions(current_replica_run_directory, input_data):
     if SETTING_VERBOSE or SETTING_DEBUG:
         print("> [VERBOSE]: All histograms generated!")
 
-def main(
-        kinematics_dataframe_name: str,
-        number_of_replicas: int,
-        verbose: bool = False):
+def train_replica_ensemble(
+        current_replica_run_directory: str,
+        number_of_replicas: int):
     """
     ## Description:
-    Main entry point to the local fitting procedure.
+    Train all of the replicas at once: `build_ensemble_model` stacks the weights
+    of every replica, and one `fit` trains each of them on its own pseudodata and
+    its own train/validation split. Every replica is then saved (and plotted) just
+    like one that was trained on its own, so `make_predictions` cannot tell the difference.
+    The pseudodata is the run's (see `prepare_replica_pseudodata`).
+
+    ## Returns:
+        The kinematics of the data, for `make_predictions`.
     """
-    
-    # (1): Enforce creation of required directory structure:
-    current_replica_run_directory = create_relevant_directories(
-        data_file_name = kinematics_dataframe_name,
-        number_of_replicas = number_of_replicas)
-    
-    # (1): Begin iteratng over the replicas:
+
+    # (1): The pseudodata of every replica, and the experimental data it was sampled from:
+    replica_pseudodata = load_replica_pseudodata(current_replica_run_directory)
+    experimental_data_set = replica_pseudodata.get_experimental_dataframe()
+
+    # (2): The kinematics are the same for every replica --- and so are the tensors of the input pipeline:
+    raw_kinematics = experimental_data_set[[
+        _COLUMN_NAME_Q_SQUARED,
+        _COLUMN_NAME_X_BJORKEN,
+        _COLUMN_NAME_T_MOMENTUM_CHANGE,
+        _COLUMN_NAME_LEPTON_MOMENTUM,
+        _COLUMN_NAME_AZIMUTHAL_PHI]]
+
+    replica_datasets = load_replica_datasets(current_replica_run_directory)
+
+    # (X): The ensemble only has a cross-section output --- rather than drop the BSA, we refuse:
+    if find_beam_spin_asymmetry_column(replica_pseudodata) is not None:
+        raise ValueError(f"> [ERROR]: The ensemble only fits the cross-section, but the data has a BSA ('{find_beam_spin_asymmetry_column(replica_pseudodata)}'). Train the replicas one at a time to fit both.")
+
+    number_of_data_points = len(raw_kinematics)
+
+    # (3): One column of pseudodata, and one train/validation split, per replica:
+    replica_cross_sections = replica_pseudodata.get_column_for_all_replicas(_COLUMN_NAME_CROSS_SECTION).T.astype(np.float32)
+    replica_training_masks = np.zeros((number_of_data_points, number_of_replicas), dtype = np.float32)
+
     for replica_index in range(number_of_replicas):
 
-        # (1.1): Obtain the replica number by adding 1 to the index:
+        # (3.1): The very split that the replica gets when it is trained on its own:
+        training_indices, _ = replica_pseudodata.split_training_indices(replica_index, _DNN_TRAIN_TEST_SPLIT_PERCENTAGE)
+
+        replica_training_masks[training_indices, replica_index] = 1.
+
+    # (X): Detect if there are NaN values in the cross-section:
+    assert not np.any(np.isnan(replica_cross_sections)), "NaNs detected in cross section"
+
+    # (X): Detect if there are INFINITIES in the cross-section:
+    assert not np.any(np.isinf(replica_cross_sections)), "Infs detected in cross section"
+
+    # (4): Begin timing the ensemble:
+    start_time_in_milliseconds = datetime.datetime.now().replace(microsecond = 0)
+
+    if SETTING_DEBUG or SETTING_VERBOSE:
+        print(f"> [VERBOSE]: Ensemble of {number_of_replicas} replicas started at {start_time_in_milliseconds}...")
+
+    # (5): Initialize the ensemble:
+    ensemble_model = build_ensemble_model(number_of_replicas, use_kinematic_bundle = True)
+
+    # (6): The targets carry their own training masks --- see `ensemble_training_loss`:
+    ensemble_model.fit(
+        replica_datasets.get_ensemble_dataset(
+            replica_training_masks,
+            batch_size = _HYPERPARAMETER_BATCH_SIZE,
+            shuffle_seed = replica_pseudodata.run_seed % (2**31 - 1)),
+        shuffle = False,
+        epochs = _HYPERPARAMETER_NUMBER_OF_EPOCHS,
+        callbacks = [
+            tf.keras.callbacks.ReduceLROnPlateau(
+                monitor = 'loss',
+                factor = _HYPERPARAMETER_LR_FACTOR,
+                patience = _HYPERPARAMETER_LR_PATIENCE,
+                mode = 'auto'),
+            tf.keras.callbacks.EarlyStopping(
+                monitor = 'loss',
+                patience = _HYPERPARAMETER_EARLYSTOP_PATIENCE_INTEGER)
+        ],
+        verbose = _DNN_VERBOSE_SETTING)
+
+    if SETTING_VERBOSE:
+        print(f"> [VERBOSE]: Ensemble of {number_of_replicas} replicas finished in {datetime.datetime.now().replace(microsecond = 0) - start_time_in_milliseconds}!")
+
+    # (7): Split the ensemble back up into replicas:
+    for replica_index in range(number_of_replicas):
+
+        # (7.1): Obtain the replica number by adding 1 to the index:
         replica_number = replica_index + 1
 
-        if SETTING_DEBUG:
-            print(f"> [DEBUG]: Computed replica number to be: {replica_number}")
+        # (7.2): An ordinary replica model, with this replica's weights:
+        dnn_model = extract_replica_model(ensemble_model, replica_index, use_kinematic_bundle = True)
 
-        # (1.2): Propose a replica name:
-        current_replica_name = f"replica_{replica_number}"
+        # (7.3): Now, save the replica where `make_predictions` looks for it --- a model file means a finished replica, so only ever a complete one:
+        computed_path_of_replica_model = f"{current_replica_run_directory}/{_DIRECTORY_DATA}/{_DIRECTORY_DATA_REPLICAS}/replica_{replica_number}.{_TF_FORMAT_KERAS}"
+
+        with atomic_output_path(computed_path_of_replica_model) as temporary_replica_model_path:
+            dnn_model.save(temporary_replica_model_path)
 
         if SETTING_DEBUG:
-            print(f"> [DEBUG]: Computed replica name to be: {current_replica_name}")
+            print(f"> [VERBOSE] Saved replica to {computed_path_of_replica_model}")
 
-        # (1.3): Immediately construct the filetype for the replica:
-        model_file_name = f"{current_replica_name}.h5"
+        # (7.4): The plots of the replica, on its own training data:
+        is_training_row = replica_training_masks[:, replica_index] == 1.
+        x_training = raw_kinematics[is_training_row]
+        y_training = pd.Series(replica_cross_sections[is_training_row, replica_index], index = x_training.index)
 
-        if SETTING_DEBUG:
-            print(f"> [DEBUG]: Computed corresponding replica file name to be: {model_file_name}")
+        plot_hyperplane_separations(
+            current_replica_run_directory,
+            replica_number,
+            x_training,
+            y_training,
+            dnn_model)
+
+        fixed_kinematics_except_phi = x_training.iloc[0][
+                [_COLUMN_NAME_Q_SQUARED, _COLUMN_NAME_X_BJORKEN, _COLUMN_NAME_T_MOMENTUM_CHANGE, _COLUMN_NAME_LEPTON_MOMENTUM]
+            ].to_numpy()
 
-        # (X): Rely on Pandas to correctly read the just-generated .csv file:
-        kinematics_dataframe_path = os.path.join('data', kinematics_dataframe_name)
+        plot_cross_section_with_residuals_and_interpolation(
+            current_replica_run_directory,
+            replica_number,
+            x_training,
+            x_training[_COLUMN_NAME_AZIMUTHAL_PHI],
+            y_training,
+            dnn_model,
+            fixed_kinematics_except_phi)
 
-        if SETTING_DEBUG:
-            print(f"> [DEBUG]: Computed path to data .csv file: {kinematics_dataframe_path}")
+    return raw_kinematics
 
-        # (X): Use Pandas' `.read_csv()` method to generate a corresponding DF:
-        this_replica_data_set = pd.read_csv(kinematics_dataframe_path)
+def read_experimental_kinematics(kinematics_dataframe_name: str):
+    """
+    ## Description:
+    The kinematics [Q², x_B, t, k, φ] of the data file --- the same for every
+    replica, since only the cross-section is resampled.
+    """
+    return pd.read_csv(os.path.join('data', kinematics_dataframe_name))[[
+        _COLUMN_NAME_Q_SQUARED,
+        _COLUMN_NAME_X_BJORKEN,
+        _COLUMN_NAME_T_MOMENTUM_CHANGE,
+        _COLUMN_NAME_LEPTON_MOMENTUM,
+        _COLUMN_NAME_AZIMUTHAL_PHI]]
+
+def find_unfinished_replicas(current_replica_run_directory: str, number_of_replicas: int) -> list:
+    """
+    ## Description:
+    The replica indices (from 0) of a run directory that do not have a saved
+    model yet. Models are only ever saved in full (see `train_replica`), so a
+    model file means a finished replica.
+    """
+    return [
+        replica_index for replica_index in range(number_of_replicas)
+        if not os.path.exists(f"{current_replica_run_directory}/{_DIRECTORY_DATA}/{_DIRECTORY_DATA_REPLICAS}/replica_{replica_index + 1}.{_TF_FORMAT_KERAS}")]
 
-        if SETTING_DEBUG:
-            print(f"> [DEBUG]: Now printing the Pandas DF head using df.head():\n {this_replica_data_set.head()}")
+def prepare_replica_pseudodata(
+        current_replica_run_directory: str,
+        kinematics_dataframe_name: str,
+        number_of_replicas: int,
+        run_seed: int = None) -> ReplicaPseudodata:
+    """
+    ## Description:
+    Draw the pseudodata of every replica of the run at once, and store it in the
+    run directory --- unless it is there already: a resumed run, and every worker
+    that joins a run, use the very same pseudodata. Without a `run_seed`, the
+    run gets a fresh one, which is stored with the pseudodata.
+    """
 
-        # (X): We now compute a *given* replica's DF --- it will *not* be the same as the original DF!
-        generated_replica_data = generate_replica_data(pandas_dataframe = this_replica_data_set)
+    # (1): All of the replicas' pseudodata lives in one file:
+    replica_pseudodata_path = f"{current_replica_run_directory}/{_DIRECTORY_DATA}/{_DIRECTORY_DATA_RAW}/{_FILE_NAME_REPLICA_PSEUDODATA}"
 
-        if SETTING_DEBUG:
-            print(f"> [DEBUG]: Successfully generated replica data. Now displaying using df.head():\n {generated_replica_data.head()}")
+    # (2): Generate it, if nobody has --- if several workers race here, only one of them wins:
+    if not os.path.exists(replica_pseudodata_path):
+        replica_pseudodata = generate_replica_pseudodata(
+            pandas_dataframe = pd.read_csv(os.path.join('data', kinematics_dataframe_name)),
+            number_of_replicas = number_of_replicas,
+            run_seed = run_seed)
 
-        # (X): Use an f-string to compute the name *and location* of the file!
-        computed_path_and_name_of_replica_data = f"{current_replica_run_directory}/{_DIRECTORY_DATA}/{_DIRECTORY_DATA_RAW}/pseudodata_replica_{replica_number}_data.csv"
+        create_file_exclusively(replica_pseudodata_path, replica_pseudodata.save)
 
-        if SETTING_DEBUG:
-            print(f"> [DEBUG]: Computed path and file name of current replica data: {computed_path_and_name_of_replica_data}")
+    # (3): Whoever wrote it, this is the pseudodata of the run:
+    replica_pseudodata = load_replica_pseudodata(current_replica_run_directory)
 
-        # (X): We also store the pseudodata/replica data for reproducability purposes:
-        generated_replica_data.to_csv(
-            path_or_buf = computed_path_and_name_of_replica_data,
-            index_label = None)
-        
-        if SETTING_DEBUG:
-            print("> [DEBUG]: Saved replica data!")
-
-        # (X): Identify the "x values" for our model:
-        raw_kinematics = generated_replica_data[[
-            _COLUMN_NAME_Q_SQUARED,
-            _COLUMN_NAME_X_BJORKEN,
-            _COLUMN_NAME_T_MOMENTUM_CHANGE,
-            _COLUMN_NAME_LEPTON_MOMENTUM,
-            _COLUMN_NAME_AZIMUTHAL_PHI]]
+    if replica_pseudodata.number_of_replicas != number_of_replicas:
+        raise ValueError(f"> [ERROR]: {replica_pseudodata_path} has {replica_pseudodata.number_of_replicas} replicas, not {number_of_replicas}.")
+
+    if run_seed is not None and replica_pseudodata.run_seed != run_seed:
+        raise ValueError(f"> [ERROR]: {replica_pseudodata_path} was drawn with the seed {replica_pseudodata.run_seed}, not {run_seed}.")
+
+    if SETTING_VERBOSE:
+        print(f"> [VERBOSE]: The seed of this run is {replica_pseudodata.run_seed}.")
+
+    return replica_pseudodata
+
+@functools.lru_cache(maxsize = 1)
+def load_replica_pseudodata(current_replica_run_directory: str) -> ReplicaPseudodata:
+    """
+    ## Description:
+    The pseudodata of a run, read from its run directory once per process.
+    """
+    return ReplicaPseudodata.load(f"{current_replica_run_directory}/{_DIRECTORY_DATA}/{_DIRECTORY_DATA_RAW}/{_FILE_NAME_REPLICA_PSEUDODATA}")
+
+def find_beam_spin_asymmetry_column(replica_pseudodata: ReplicaPseudodata) -> str:
+    """
+    ## Description:
+    The BSA observable (see `_COLUMN_NAMES_BEAM_SPIN_ASYMMETRY`) of the pseudodata
+    of a run, or `None` if the data has none. If it has one, every replica fits
+    the BSA along with the cross-section.
+    """
+    return next((column_name for column_name in _COLUMN_NAMES_BEAM_SPIN_ASYMMETRY if column_name in replica_pseudodata.observable_names), None)
+
+@functools.lru_cache(maxsize = 1)
+def load_replica_datasets(current_replica_run_directory: str) -> ReplicaDatasets:
+    """
+    ## Description:
+    The tensors that the `tf.data` pipelines of all of the replicas of a run
+    share: made once per process, from the pseudodata of the run --- with the
+    BSA as a second target, if the data has one.
+    """
+    replica_pseudodata = load_replica_pseudodata(current_replica_run_directory)
+    beam_spin_asymmetry_column = find_beam_spin_asymmetry_column(replica_pseudodata)
+
+    # (1): The kinematics are the same for every replica --- and so is the kinematic bundle:
+    kinematics = replica_pseudodata.get_experimental_dataframe()[[
+        _COLUMN_NAME_Q_SQUARED,
+        _COLUMN_NAME_X_BJORKEN,
+        _COLUMN_NAME_T_MOMENTUM_CHANGE,
+        _COLUMN_NAME_LEPTON_MOMENTUM,
+        _COLUMN_NAME_AZIMUTHAL_PHI]].to_numpy(dtype = np.float32)
+
+    return ReplicaDatasets(
+        kinematics = kinematics,
+        kinematic_bundle = precompute_kinematic_bundle(kinematics),
+        replica_cross_sections = replica_pseudodata.get_column_for_all_replicas(_COLUMN_NAME_CROSS_SECTION),
+        replica_beam_spin_asymmetries = None if beam_spin_asymmetry_column is None else replica_pseudodata.get_column_for_all_replicas(beam_spin_asymmetry_column))
+
+def train_replica(
+        current_replica_run_directory: str,
+        replica_index: int,
+        optimizer: str = "adam"):
+    """
+    ## Description:
+    Train the DNN of one replica on its pseudodata (see `prepare_replica_pseudodata`),
+    and save the model and its plots into the run directory. This is one turn of
+    the replica loop in `main`, and it is also what every worker of `--workers` runs.
+
+    ## Arguments:
+    optimizer: str
+        "adam" trains for `_HYPERPARAMETER_NUMBER_OF_EPOCHS` epochs, in batches.
+        "lbfgs" and "gauss-newton" fit all of the training data at once, until the
+        loss converges --- see `fit_full_batch`. (Those have no checkpoints: an
+        interrupted replica starts over, which takes seconds.)
+
+    ## Notes:
+    If the data has a BSA column (`ALU` or `BSA`), the replica fits it, too: the
+    model gets a BSA output (`build_simultaneous_model(fit_bsa = True)`), and every
+    row counts for the observables it has. Only Adam fits the two together.
+
+    ## Returns:
+        The kinematics of the data, for `make_predictions`.
+    """
+
+    # (1): Obtain the replica number by adding 1 to the index:
+    replica_number = replica_index + 1
+
+    if SETTING_DEBUG:
+        print(f"> [DEBUG]: Computed replica number to be: {replica_number}")
+
+    # (2): Propose a replica name:
+    current_replica_name = f"replica_{replica_number}"
+
+    if SETTING_DEBUG:
+        print(f"> [DEBUG]: Computed replica name to be: {current_replica_name}")
+
+    # (3): Immediately construct the filetype for the replica:
+    model_file_name = f"{current_replica_name}.h5"
+
+    if SETTING_DEBUG:
+        print(f"> [DEBUG]: Computed corresponding replica file name to be: {model_file_name}")
+
+    # (X): The pseudodata of the whole run --- from memory, after the first replica:
+    replica_pseudodata = load_replica_pseudodata(current_replica_run_directory)
+
+    # (X): The experimental data that it was sampled from:
+    this_replica_data_set = replica_pseudodata.get_experimental_dataframe()
+
+    if SETTING_DEBUG:
+        print(f"> [DEBUG]: Now printing the Pandas DF head using df.head():\n {this_replica_data_set.head()}")
+
+    # (X): This replica's slice of the pseudodata --- it will *not* be the same as the original DF!
+    generated_replica_data = replica_pseudodata.get_replica_dataframe(replica_index)
+
+    if SETTING_DEBUG:
+        print(f"> [DEBUG]: Successfully obtained replica data. Now displaying using df.head():\n {generated_replica_data.head()}")
+
+    # (X): Identify the "x values" for our model:
+    raw_kinematics = generated_replica_data[[
+        _COLUMN_NAME_Q_SQUARED,
+        _COLUMN_NAME_X_BJORKEN,
+        _COLUMN_NAME_T_MOMENTUM_CHANGE,
+        _COLUMN_NAME_LEPTON_MOMENTUM,
+        _COLUMN_NAME_AZIMUTHAL_PHI]]
  
-        if SETTING_DEBUG:
-            print(f"> [DEBUG]: Obtained kinematic settings columns --- using .head() to display:\n{raw_kinematics.head()}")
+    if SETTING_DEBUG:
+        print(f"> [DEBUG]: Obtained kinematic settings columns --- using .head() to display:\n{raw_kinematics.head()}")
 
-        # (X): Obtain the cross section data from the replica dataframe:
-        raw_cross_section = generated_replica_data[_COLUMN_NAME_CROSS_SECTION]
+    # (X): Obtain the cross section data from the replica dataframe:
+    raw_cross_section = generated_replica_data[_COLUMN_NAME_CROSS_SECTION]
 
-        if SETTING_DEBUG:
-            print(f"> [DEBUG]: Obtained cross-section column --- using .head() to display:\n{raw_cross_section.head()}")
+    if SETTING_DEBUG:
+        print(f"> [DEBUG]: Obtained cross-section column --- using .head() to display:\n{raw_cross_section.head()}")
 
-        # (X): Obtain the associated cross section error from the replica dataframe:
-        # raw_cross_section_error = generated_replica_data[_COLUMN_NAME_CROSS_SECTION_ERROR]
+    # (X): The BSA of the replica, if the data has one --- then the replica fits it, too:
+    beam_spin_asymmetry_column = find_beam_spin_asymmetry_column(replica_pseudodata)
+    fit_bsa = beam_spin_asymmetry_column is not None
 
-        raw_cross_section_error = this_replica_data_set[_COLUMN_NAME_CROSS_SECTION_ERROR]
+    if fit_bsa and optimizer != "adam":
+        raise ValueError(f"> [ERROR]: The data has a BSA ('{beam_spin_asymmetry_column}'), which only Adam fits --- not {optimizer}.")
 
-        if SETTING_DEBUG:
-            print(f"> [DEBUG]: Obtained cross-section error column --- using .head() to display:\n{raw_cross_section_error.head()}")
+    if SETTING_VERBOSE and fit_bsa:
+        print(f"> [VERBOSE]: Replica #{replica_number} fits the BSA ('{beam_spin_asymmetry_column}') along with the cross-section.")
 
-        if SETTING_DEBUG:
-            print(f"> [DEBUG]: Example of numerical values of experimental kinematics: {raw_kinematics.iloc[0]}")
+    # (X): Obtain the associated cross section error from the replica dataframe:
+    # raw_cross_section_error = generated_replica_data[_COLUMN_NAME_CROSS_SECTION_ERROR]
 
-        if SETTING_DEBUG:
-            print(f"> [DEBUG] Now showing min/max and big picture of the kinematic values: {raw_kinematics.describe()}")
+    raw_cross_section_error = this_replica_data_set[_COLUMN_NAME_CROSS_SECTION_ERROR]
 
-        if SETTING_DEBUG:
-            print(f"> [DEBUG]: Example of numerical values of experimental cross-sections: {raw_cross_section.iloc[0]}")
+    if SETTING_DEBUG:
+        print(f"> [DEBUG]: Obtained cross-section error column --- using .head() to display:\n{raw_cross_section_error.head()}")
 
-        if SETTING_DEBUG:
-            print(f"> [DEBUG] Now showing min/max and big picture of the cross-section values: {raw_cross_section.describe()}")
+    if SETTING_DEBUG:
+        print(f"> [DEBUG]: Example of numerical values of experimental kinematics: {raw_kinematics.iloc[0]}")
 
-        if SETTING_DEBUG:
-            print("> [DEBUG]: Sanity check sample rows:")
-            for i in range(5):
-                print(f"> [DEBUG]: Row {i} — Kinematics: {raw_kinematics.iloc[i].to_dict()} — Cross Section: {raw_cross_section.iloc[i]}")
+    if SETTING_DEBUG:
+        print(f"> [DEBUG] Now showing min/max and big picture of the kinematic values: {raw_kinematics.describe()}")
 
-        # (X): Detect if there are NaN values in the cross-section:
+    if SETTING_DEBUG:
+        print(f"> [DEBUG]: Example of numerical values of experimental cross-sections: {raw_cross_section.iloc[0]}")
+
+    if SETTING_DEBUG:
+        print(f"> [DEBUG] Now showing min/max and big picture of the cross-section values: {raw_cross_section.describe()}")
+
+    if SETTING_DEBUG:
+        print("> [DEBUG]: Sanity check sample rows:")
+        for i in range(5):
+            print(f"> [DEBUG]: Row {i} — Kinematics: {raw_kinematics.iloc[i].to_dict()} — Cross Section: {raw_cross_section.iloc[i]}")
+
+    # (X): Detect if there are NaN values in the cross-section --- with a BSA, a row only needs one of the two:
+    if fit_bsa:
+        assert np.all(np.isfinite(raw_cross_section.values) | np.isfinite(generated_replica_data[beam_spin_asymmetry_column].values)), "Rows with neither a cross section nor a BSA"
+    else:
         assert not np.any(np.isnan(raw_cross_section.values)), "NaNs detected in cross section"
 
-        # (X): Detect if there are INFINITIES in the cross-section --- this will break
-        # | every TF thing we've ever done:
-        assert not np.any(np.isinf(raw_cross_section.values)), "Infs detected in cross section"
+    # (X): Detect if there are INFINITIES in the cross-section --- this will break
+    # | every TF thing we've ever done:
+    assert not np.any(np.isinf(raw_cross_section.values)), "Infs detected in cross section"
 
-        # (X): Use sklearn's traing/validation split function to split into training and testing data:
-        x_training, x_validation, y_training, y_validation = train_test_split(
-            raw_kinematics,
-            raw_cross_section,
-            test_size = _DNN_TRAIN_TEST_SPLIT_PERCENTAGE,)
-            # random_state = 42)
+    # (X): The tensors of the input pipeline --- including the kinematic bundle, which has
+    # | everything in the cross-section that does not depend on the CFFs. Only the cross-section
+    # | changes between replicas, so this is made for the first replica and then reused:
+    replica_datasets = load_replica_datasets(current_replica_run_directory)
 
-        if SETTING_DEBUG:
-            print(f"> [DEBUG]: Partitioned data into train/test with split percentage of: {_DNN_TRAIN_TEST_SPLIT_PERCENTAGE}")
+    # (X): Where the replica keeps its checkpoints while it trains:
+    replica_checkpoint_directory = f"{current_replica_run_directory}/{_DIRECTORY_DATA}/{_DIRECTORY_DATA_CHECKPOINTS}/replica_{replica_number}"
 
-        # (X): Begin timing the replica time:
-        start_time_in_milliseconds = datetime.datetime.now().replace(microsecond = 0)
-        
-        if SETTING_DEBUG or SETTING_VERBOSE:
-            print(f"> [VERBOSE]: Replica #{replica_index + 1} started at {start_time_in_milliseconds}...")
+    # (X): Split into training and validation data --- the split comes from the replica's own
+    # | random stream, so a resumed replica gets the very split that its checkpoints were trained with:
+    training_indices, validation_indices = replica_pseudodata.split_training_indices(replica_index, _DNN_TRAIN_TEST_SPLIT_PERCENTAGE)
+
+    # (X): The batches of this replica, with its own (reproducible) shuffle:
+    training_dataset = replica_datasets.get_dataset(
+        replica_index,
+        training_indices,
+        batch_size = _HYPERPARAMETER_BATCH_SIZE,
+        shuffle_seed = replica_pseudodata.draw_shuffle_seed(replica_index))
+
+    validation_dataset = replica_datasets.get_dataset(
+        replica_index,
+        validation_indices,
+        batch_size = _HYPERPARAMETER_BATCH_SIZE)
+
+    if SETTING_DEBUG:
+        print(f"> [DEBUG]: Partitioned data into train/test with split percentage of: {_DNN_TRAIN_TEST_SPLIT_PERCENTAGE}")
+
+    # (X): Begin timing the replica time:
+    start_time_in_milliseconds = datetime.datetime.now().replace(microsecond = 0)
+    
+    if SETTING_DEBUG or SETTING_VERBOSE:
+        print(f"> [VERBOSE]: Replica #{replica_index + 1} started at {start_time_in_milliseconds}...")
+
+    # (X): Initialize the model --- with a BSA output, if there is a BSA to fit:
+    dnn_model = build_simultaneous_model(use_kinematic_bundle = True, fit_bsa = fit_bsa)
+    
+    # (X): A full-batch fit sees all of the training data in every iteration, and stops once it has converged:
+    if optimizer != "adam":
+        neural_network_training_history = fit_full_batch(
+            dnn_model,
+            *replica_datasets.get_full_batch(replica_index, training_indices),
+            validation_data = replica_datasets.get_full_batch(replica_index, validation_indices),
+            method = optimizer)
+
+    else:
 
-        # (X): Initialize the model:
-        dnn_model = build_simultaneous_model()
-        
         # (X): Here, we run the fitting procedure:
         neural_network_training_history = dnn_model.fit(
 
-            # (X): Insert the training input-data here (independent variables):
-            x_training,
+            # (X): Insert the training data here --- (inputs, outputs) in batches of `_HYPERPARAMETER_BATCH_SIZE`:
+            training_dataset,
 
-            # (X): Insert the training output-data here (dependent variables):
-            y_training,
+            # (X): Insert the validation data, in the same format:
+            validation_data = validation_dataset,
 
-            # (X): Insert a tuple of validation data according to (input, output):
-            validation_data = (x_validation, y_validation),
+            # (X): The training dataset shuffles itself:
+            shuffle = False,
 
             # (X): Hyperparameter: Epoch number:
             epochs = _HYPERPARAMETER_NUMBER_OF_EPOCHS,
 
-            # (X): Hyperparameters: Batch size:
-            batch_size = _HYPERPARAMETER_BATCH_SIZE,
-
             # (X): A list of TF callbacks:
             callbacks = [
                 tf.keras.callbacks.ReduceLROnPlateau(
@@ -889,29 +1298,50 @@ def main(
                     mode = 'auto'),
                 tf.keras.callbacks.EarlyStopping(
                     monitor = 'loss',
-                    patience = _HYPERPARAMETER_EARLYSTOP_PATIENCE_INTEGER)
+                    patience = _HYPERPARAMETER_EARLYSTOP_PATIENCE_INTEGER),
+
+                # (X): Every so many epochs, checkpoint the weights, the optimizer, and the epoch --- and,
+                # | if the replica was interrupted before, start from its last checkpoint:
+                tf.keras.callbacks.BackupAndRestore(
+                    backup_dir = replica_checkpoint_directory,
+                    save_freq = _HYPERPARAMETER_CHECKPOINT_FREQUENCY_IN_EPOCHS * int(np.ceil(len(training_indices) / _HYPERPARAMETER_BATCH_SIZE)))
             ],
 
             # (X): TF verbose setting:
             verbose = _DNN_VERBOSE_SETTING)
-        
-        if SETTING_VERBOSE:
-            print(f"> [VERBOSE]: Replica #{replica_index + 1} finished running!")
+    
+    if SETTING_VERBOSE:
+        print(f"> [VERBOSE]: Replica #{replica_index + 1} finished running!")
 
-        # (X): Compute the path that we'll store the replica:
-        computed_path_of_replica_model = f"{current_replica_run_directory}/{_DIRECTORY_DATA}/{_DIRECTORY_DATA_REPLICAS}/replica_{replica_number}.{_TF_FORMAT_KERAS}"
+        # (X): Every replica builds a new layer, so this should be the same (small) number every time:
+        cross_section_layer = find_cross_section_layer(dnn_model)
+        print(f"> [VERBOSE]: Replica #{replica_index + 1} traced the cross-section {cross_section_layer.get_tracing_counts().get('compute_cross_section', 0)} time(s).")
 
-        if SETTING_DEBUG:
-            print(f"> [DEBYG]: Computed path to replica storage: {computed_path_of_replica_model}")
+    # (X): Compute the path that we'll store the replica:
+    computed_path_of_replica_model = f"{current_replica_run_directory}/{_DIRECTORY_DATA}/{_DIRECTORY_DATA_REPLICAS}/replica_{replica_number}.{_TF_FORMAT_KERAS}"
 
-        # (X): Now, save the replica:
-        dnn_model.save(computed_path_of_replica_model)
+    if SETTING_DEBUG:
+        print(f"> [DEBYG]: Computed path to replica storage: {computed_path_of_replica_model}")
 
-        if SETTING_VERBOSE:
-            print("> [VERBOSE] Saved replica!")
+    # (X): Now, save the replica --- other workers, and the merge step, only ever see a complete file:
+    with atomic_output_path(computed_path_of_replica_model) as temporary_replica_model_path:
+        dnn_model.save(temporary_replica_model_path)
 
-        if SETTING_DEBUG:
-            print(f"> [VERBOSE] Saved replica to {computed_path_of_replica_model}")
+    # (X): The replica is complete, so it will never be resumed:
+    shutil.rmtree(replica_checkpoint_directory, ignore_errors = True)
+
+    if SETTING_VERBOSE:
+        print("> [VERBOSE] Saved replica!")
+
+    # (X): The plots want the training data as DFs --- the rows that have a cross-section:
+    x_training, y_training = raw_kinematics.iloc[training_indices], raw_cross_section.iloc[training_indices]
+    x_training, y_training = x_training[y_training.notna()], y_training[y_training.notna()]
+
+    if SETTING_DEBUG:
+        print(f"> [VERBOSE] Saved replica to {computed_path_of_replica_model}")
+
+    # (X): Data with only a BSA has no cross-section to plot:
+    if len(y_training) > 0:
 
         plot_hyperplane_separations(
             current_replica_run_directory,
@@ -933,87 +1363,387 @@ def main(
             dnn_model,
             fixed_kinematics_except_phi)
 
-        # (X): Extract the 'loss' key from TF's history object. It has
-        # | loss vs. epoch data on it:
-        training_loss_data = neural_network_training_history.history['loss']
+    # (X): Extract the 'loss' key from TF's history object. It has
+    # | loss vs. epoch data on it:
+    training_loss_data = neural_network_training_history.history['loss']
 
-        # (X): Extract the 'val_loss' (validation loss) from the TF history object:
-        validation_loss_history_array = neural_network_training_history.history['val_loss']
-            
-        # (X): Define a Figure object for plotting network loss:
-        evaluation_figure = plt.figure(
-            figsize = (10, 5.5))
-        
-        # (X): Add the subplot, which returns an Axes:
-        evaluation_axis = evaluation_figure.add_subplot(1, 1, 1)
-        
-        # (X): Add a simple horizonal line that shows the *initial value* of the MSEl
-        evaluation_axis.plot(
-            np.arange(0, _HYPERPARAMETER_NUMBER_OF_EPOCHS, 1),
-            np.array([np.max(training_loss_data) for number in training_loss_data]),
-            color = "red",
-            label = "Initial MSE Loss")
-        
-        # (X): Add a simple horizonal line that shows where MSE = 0:
-        evaluation_axis.plot(
-            np.arange(0, _HYPERPARAMETER_NUMBER_OF_EPOCHS, 1),
-            np.zeros(shape = _HYPERPARAMETER_NUMBER_OF_EPOCHS),
-            color = "green",
-            label = r"MSE $=0$")
-        
-        # (X): Add a line plot that shows MSE loss vs. epoch:
-        evaluation_axis.plot(
-            np.arange(0, _HYPERPARAMETER_NUMBER_OF_EPOCHS, 1),
-            training_loss_data,
-            color = "blue",
-            label = "MSE Loss")
-        
-        # (X): Add a line plot that shows the trend of validation loss vs. epoch:
-        evaluation_axis.plot(
-            np.arange(0, _HYPERPARAMETER_NUMBER_OF_EPOCHS, 1),
-            validation_loss_history_array,
-            color = "purple",
-            label = "Validation Loss")
-        
-        # (X): Add a descriptive title:
-        evaluation_axis.set_title(rf"Replica ${replica_number}$ Learning Curves")
+    # (X): Extract the 'val_loss' (validation loss) from the TF history object:
+    validation_loss_history_array = neural_network_training_history.history['val_loss']
+
+    # (X): The epochs that *this* fit ran --- fewer than all of them, if it was resumed or stopped early:
+    trained_epochs = np.array(neural_network_training_history.epoch)
         
-        # (X): Add the x-label:
-        evaluation_axis.set_xlabel('Epoch Number', rotation = 0, labelpad = 17.0, fontsize = 18)
+    # (X): Define a Figure object for plotting network loss:
+    evaluation_figure = plt.figure(
+        figsize = (10, 5.5))
+    
+    # (X): Add the subplot, which returns an Axes:
+    evaluation_axis = evaluation_figure.add_subplot(1, 1, 1)
+    
+    # (X): Add a simple horizonal line that shows the *initial value* of the MSEl
+    evaluation_axis.plot(
+        trained_epochs,
+        np.array([np.max(training_loss_data) for number in training_loss_data]),
+        color = "red",
+        label = "Initial MSE Loss")
+    
+    # (X): Add a simple horizonal line that shows where MSE = 0:
+    evaluation_axis.plot(
+        trained_epochs,
+        np.zeros(shape = len(trained_epochs)),
+        color = "green",
+        label = r"MSE $=0$")
+    
+    # (X): Add a line plot that shows MSE loss vs. epoch:
+    evaluation_axis.plot(
+        trained_epochs,
+        training_loss_data,
+        color = "blue",
+        label = "MSE Loss")
+    
+    # (X): Add a line plot that shows the trend of validation loss vs. epoch:
+    evaluation_axis.plot(
+        trained_epochs,
+        validation_loss_history_array,
+        color = "purple",
+        label = "Validation Loss")
+    
+    # (X): Add a descriptive title:
+    evaluation_axis.set_title(rf"Replica ${replica_number}$ Learning Curves")
+    
+    # (X): Add the x-label:
+    evaluation_axis.set_xlabel('Epoch Number', rotation = 0, labelpad = 17.0, fontsize = 18)
 
-        # (X): Add the y-label:
-        evaluation_axis.set_ylabel('MSE', rotation = 0, labelpad = 26.0, fontsize = 18)
+    # (X): Add the y-label:
+    evaluation_axis.set_ylabel('MSE', rotation = 0, labelpad = 26.0, fontsize = 18)
 
-        # (X): Add the legend for clarity:
-        plt.legend(fontsize = 17)
+    # (X): Add the legend for clarity:
+    plt.legend(fontsize = 17)
 
-        # (X): Compute the string that will be the filename of the loss plot:
-        current_replica_loss_plot_filename = f"{current_replica_run_directory}/{_DIRECTORY_REPLICAS}/{_DIRECTORY_REPLICAS_LOSSES}/loss_analytics_replica_{replica_number}_v1"
+    # (X): Compute the string that will be the filename of the loss plot:
+    current_replica_loss_plot_filename = f"{current_replica_run_directory}/{_DIRECTORY_REPLICAS}/{_DIRECTORY_REPLICAS_LOSSES}/loss_analytics_replica_{replica_number}_v1"
 
-        if SETTING_DEBUG or SETTING_VERBOSE:
-            print(f"> Computed replica loss plot file destination:\n> {current_replica_loss_plot_filename}")
+    if SETTING_DEBUG or SETTING_VERBOSE:
+        print(f"> Computed replica loss plot file destination:\n> {current_replica_loss_plot_filename}")
 
-        # (X): Save a version of the figure according to .eps format for Overleaf stuff:
-        evaluation_figure.savefig(
-            fname = f"{current_replica_loss_plot_filename}.{_FIGURE_FORMAT_EPS}",
-            format = _FIGURE_FORMAT_EPS)
-        
-        # (X): Save an immediately-visualizable figure with vector graphics:
-        evaluation_figure.savefig(
-            fname = f"{current_replica_loss_plot_filename}.{_FIGURE_FORMAT_SVG}",
-            format = _FIGURE_FORMAT_SVG)
-        
-        # (X): Save an immediately-visualizable figure with vector graphics:
-        evaluation_figure.savefig(
-            fname = f"{current_replica_loss_plot_filename}.{_FIGURE_FORMAT_PNG}",
-            format = _FIGURE_FORMAT_PNG)
-        
-        # (X): Closing figures:
-        plt.close(evaluation_figure)
+    # (X): Save a version of the figure according to .eps format for Overleaf stuff:
+    evaluation_figure.savefig(
+        fname = f"{current_replica_loss_plot_filename}.{_FIGURE_FORMAT_EPS}",
+        format = _FIGURE_FORMAT_EPS)
+    
+    # (X): Save an immediately-visualizable figure with vector graphics:
+    evaluation_figure.savefig(
+        fname = f"{current_replica_loss_plot_filename}.{_FIGURE_FORMAT_SVG}",
+        format = _FIGURE_FORMAT_SVG)
+    
+    # (X): Save an immediately-visualizable figure with vector graphics:
+    evaluation_figure.savefig(
+        fname = f"{current_replica_loss_plot_filename}.{_FIGURE_FORMAT_PNG}",
+        format = _FIGURE_FORMAT_PNG)
+    
+    # (X): Closing figures:
+    plt.close(evaluation_figure)
+
+    return raw_kinematics
+
+def partition_cpu_cores(number_of_workers: int):
+    """
+    ## Description:
+    Deal the CPU cores that this process may run on out to `number_of_workers`
+    workers, as evenly as possible and without overlap. With more workers than
+    cores, the workers have to share: each then gets one core, round-robin.
+    """
+
+    # (1): The cores we are allowed to use --- not necessarily all of the machine's. (Only
+    # | Linux can tell us, and pin threads to cores.)
+    if hasattr(os, "sched_getaffinity"):
+        available_cores = sorted(os.sched_getaffinity(0))
+    else:
+        available_cores = list(range(os.cpu_count()))
+
+    # (2): Too many workers --- one core each, and some of them shared:
+    if number_of_workers >= len(available_cores):
+        return [[available_cores[worker_index % len(available_cores)]] for worker_index in range(number_of_workers)]
+
+    # (3): Otherwise, contiguous blocks of cores:
+    return [core_block.tolist() for core_block in np.array_split(available_cores, number_of_workers)]
+
+def _initialize_replica_worker(core_assignments):
+    """
+    ## Description:
+    Runs once in every worker of `train_replicas_in_parallel`, before it trains
+    anything: pin the worker to its own cores and size TensorFlow's thread pools
+    to match, so that the workers do not fight over the same cores.
+    """
+
+    # (1): Every worker takes the next block of cores:
+    worker_cores = core_assignments.get()
+
+    # (2): Pin the worker (and every thread it starts from now on) to them:
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, worker_cores)
+
+    # (3): One op at a time, on as many threads as the worker has cores:
+    tf.config.threading.set_intra_op_parallelism_threads(len(worker_cores))
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+
+def create_replica_worker_pool(number_of_workers: int) -> ProcessPoolExecutor:
+    """
+    ## Description:
+    A pool of `number_of_workers` processes, each pinned to its own cores by
+    `_initialize_replica_worker`. The workers are *spawned*, not forked:
+    TensorFlow does not survive a fork.
+    """
+
+    # (1): Spawn the workers, so that each one starts a fresh TensorFlow:
+    spawn_context = multiprocessing.get_context("spawn")
+
+    # (2): The blocks of cores, for the workers to take one by one as they start:
+    core_assignments = spawn_context.Queue()
+
+    for worker_cores in partition_cpu_cores(number_of_workers):
+        core_assignments.put(worker_cores)
+
+    return ProcessPoolExecutor(
+        max_workers = number_of_workers,
+        mp_context = spawn_context,
+        initializer = _initialize_replica_worker,
+        initargs = (core_assignments, ))
+
+def train_replicas_in_parallel(
+        current_replica_run_directory: str,
+        replica_indices: list,
+        number_of_workers: int,
+        optimizer: str = "adam"):
+    """
+    ## Description:
+    `train_replica` for every replica in `replica_indices`, on a pool of
+    `number_of_workers` processes. Every worker has its own cores (see
+    `partition_cpu_cores`) and its own TensorFlow runtime, and writes its
+    replicas into the same run directory.
+    """
+
+    if SETTING_VERBOSE:
+        print(f"> [VERBOSE]: Training {len(replica_indices)} replicas on {number_of_workers} workers...")
+
+    # (1): One task per replica:
+    with create_replica_worker_pool(number_of_workers) as replica_pool:
+
+        replica_futures = [
+            replica_pool.submit(train_replica, current_replica_run_directory, replica_index, optimizer)
+            for replica_index in replica_indices]
+
+        # (2): Wait for all of them --- a failed replica raises here:
+        for replica_future in replica_futures:
+            replica_future.result()
+
+def _work_on_replica_queue_in_worker(
+        current_replica_run_directory: str,
+        kinematics_dataframe_name: str,
+        number_of_replicas: int,
+        optimizer: str = "adam",
+        stale_claim_timeout_in_seconds: float = _REPLICA_QUEUE_STALE_CLAIM_TIMEOUT_IN_SECONDS):
+    """
+    ## Description:
+    What every worker of `train_replicas_from_queue` does: train replicas from
+    the queue of the run directory until there are none left.
+    """
+    replica_queue = ReplicaQueue(current_replica_run_directory, number_of_replicas, kinematics_dataframe_name)
+
+    return work_on_replica_queue(
+        replica_queue,
+        lambda replica_index: train_replica(current_replica_run_directory, replica_index, optimizer),
+        stale_claim_timeout_in_seconds)
+
+def train_replicas_from_queue(
+        current_replica_run_directory: str,
+        kinematics_dataframe_name: str,
+        number_of_replicas: int,
+        number_of_workers: int = 1,
+        run_seed: int = None,
+        optimizer: str = "adam",
+        stale_claim_timeout_in_seconds: float = _REPLICA_QUEUE_STALE_CLAIM_TIMEOUT_IN_SECONDS):
+    """
+    ## Description:
+    Take part in a run whose replicas are shared out through the `ReplicaQueue`
+    of `current_replica_run_directory`: with `number_of_workers` processes, claim
+    and train replicas until none are left. Start this on as many nodes as you
+    like, with the same run directory. Whichever worker finds the queue complete
+    first runs the merge step, `make_predictions`, exactly once.
+
+    A worker that dies (out of memory, a lost node, ...) stops renewing its claim.
+    Once the claim is older than `stale_claim_timeout_in_seconds`, any worker of
+    the run --- including one started later, just to finish the run --- trains
+    that replica again. That is why a worker with nothing left to claim does not
+    stop: it waits until every replica is done, and takes over the replicas of
+    workers that die in the meantime.
+    """
+
+    # (1): Join (or start) the queue --- and the pseudodata of the run, which the first worker draws:
+    replica_queue = ReplicaQueue(current_replica_run_directory, number_of_replicas, kinematics_dataframe_name)
+
+    prepare_replica_pseudodata(current_replica_run_directory, kinematics_dataframe_name, number_of_replicas, run_seed)
+
+    # (2): Take back the replicas of workers that died:
+    released_replica_indices = replica_queue.release_stale_claims(stale_claim_timeout_in_seconds)
+
+    if SETTING_VERBOSE and released_replica_indices:
+        print(f"> [VERBOSE]: Released the stale claims of replicas {[replica_index + 1 for replica_index in released_replica_indices]}.")
+
+    trained_replica_indices = []
+
+    while True:
+
+        # (2.1): Work on the queue --- here, or on a pool of workers:
+        if number_of_workers > 1:
+            with create_replica_worker_pool(number_of_workers) as replica_pool:
+                worker_futures = [
+                    replica_pool.submit(_work_on_replica_queue_in_worker, current_replica_run_directory, kinematics_dataframe_name, number_of_replicas, optimizer, stale_claim_timeout_in_seconds)
+                    for _ in range(number_of_workers)]
+
+                trained_replica_indices += [replica_index for worker_future in worker_futures for replica_index in worker_future.result()]
+
+        else:
+            trained_replica_indices += _work_on_replica_queue_in_worker(current_replica_run_directory, kinematics_dataframe_name, number_of_replicas, optimizer, stale_claim_timeout_in_seconds)
+
+        # (2.2): Wait for the other workers --- unless one of them died, and its replicas are ours, too:
+        if SETTING_VERBOSE and not replica_queue.is_complete():
+            print(f"> [VERBOSE]: Waiting for replicas {[replica_index + 1 for replica_index in replica_queue.pending_replicas()]}, which other workers are training.")
+
+        released_replica_indices = wait_for_other_workers(replica_queue, stale_claim_timeout_in_seconds)
+
+        if replica_queue.is_complete():
+            break
+
+        if SETTING_VERBOSE and released_replica_indices:
+            print(f"> [VERBOSE]: Released the stale claims of replicas {[replica_index + 1 for replica_index in released_replica_indices]}.")
 
+    if SETTING_VERBOSE:
+        print(f"> [VERBOSE]: Trained replicas {[replica_index + 1 for replica_index in trained_replica_indices]}; every replica of the run is done.")
+
+    # (3): Every worker gets here, but only one of them merges:
+    if not replica_queue.claim_merge():
+        return
+
+    # (4): The merge step only needs the kinematics, which every replica shares:
     make_predictions(
         current_replica_run_directory = current_replica_run_directory,
-        input_data = raw_kinematics)
+        input_data = read_experimental_kinematics(kinematics_dataframe_name))
+
+def main(
+        kinematics_dataframe_name: str,
+        number_of_replicas: int,
+        verbose: bool = False,
+        ensemble: bool = False,
+        number_of_workers: int = 1,
+        run_directory: str = None,
+        resume_directory: str = None,
+        seed: int = None,
+        optimizer: str = "adam",
+        stale_claim_timeout_in_seconds: float = _REPLICA_QUEUE_STALE_CLAIM_TIMEOUT_IN_SECONDS):
+    """
+    ## Description:
+    Main entry point to the local fitting procedure.
+
+    ## Arguments:
+    ensemble: bool
+        If `True`, train all of the replicas at once with `train_replica_ensemble`.
+
+    number_of_workers: int
+        If more than 1, train the replicas on a pool of this many processes with
+        `train_replicas_in_parallel`.
+
+    run_directory: str
+        If given, share out the replicas of this (shared) run directory through
+        its queue with `train_replicas_from_queue` --- see there.
+
+    resume_directory: str
+        The run directory of an interrupted run. Only its unfinished replicas
+        are trained, each from its last checkpoint, if it has one.
+
+    seed: int
+        The seed of the run: the same seed (and data) gives every replica the
+        same pseudodata and train/validation split. A new run draws one if not given.
+
+    optimizer: str
+        How every replica is fitted: "adam", "lbfgs", or "gauss-newton" --- see `train_replica`.
+
+    stale_claim_timeout_in_seconds: float
+        With `run_directory`: how long a claimed replica may go without a heartbeat
+        from its worker before it goes back to the queue.
+    """
+
+    if resume_directory is not None and not os.path.isdir(resume_directory):
+        raise FileNotFoundError(f"> [ERROR]: There is no run to resume at {resume_directory}.")
+
+    if resume_directory is not None and (ensemble or run_directory is not None):
+        raise ValueError("> [ERROR]: Only a run of individual replicas can be resumed. (A queue's run directory resumes by itself.)")
+
+    if ensemble and optimizer != "adam":
+        raise ValueError("> [ERROR]: The ensemble is trained with Adam. Full-batch optimizers fit one replica at a time.")
+    
+    # (1): Enforce creation of required directory structure:
+    current_replica_run_directory = create_relevant_directories(
+        data_file_name = kinematics_dataframe_name,
+        number_of_replicas = number_of_replicas,
+        run_directory = run_directory if resume_directory is None else resume_directory)
+
+    # (X): The queue takes care of everything, including the predictions:
+    if run_directory is not None:
+        train_replicas_from_queue(
+            current_replica_run_directory,
+            kinematics_dataframe_name,
+            number_of_replicas,
+            number_of_workers,
+            seed,
+            optimizer,
+            stale_claim_timeout_in_seconds)
+
+        return
+
+    # (X): The pseudodata of all replicas, drawn in one go --- or, when resuming, the one we drew before:
+    prepare_replica_pseudodata(
+        current_replica_run_directory,
+        kinematics_dataframe_name,
+        number_of_replicas,
+        seed)
+
+    # (X): The ensemble does the replica loop (below) in one go:
+    if ensemble:
+        raw_kinematics = train_replica_ensemble(
+            current_replica_run_directory,
+            number_of_replicas)
+
+        make_predictions(
+            current_replica_run_directory = current_replica_run_directory,
+            input_data = raw_kinematics)
+
+        return
+    
+    # (X): A new run trains every replica, and a resumed one only what is missing:
+    replica_indices = find_unfinished_replicas(current_replica_run_directory, number_of_replicas)
+
+    if SETTING_VERBOSE and resume_directory is not None:
+        print(f"> [VERBOSE]: Resuming {current_replica_run_directory}: {number_of_replicas - len(replica_indices)} of {number_of_replicas} replicas are done already.")
+
+    # (1): Begin iteratng over the replicas --- one after another, or on a pool of workers:
+    if number_of_workers > 1:
+        train_replicas_in_parallel(
+            current_replica_run_directory,
+            replica_indices,
+            number_of_workers,
+            optimizer)
+
+    else:
+        for replica_index in replica_indices:
+            train_replica(
+                current_replica_run_directory,
+                replica_index,
+                optimizer)
+
+    make_predictions(
+        current_replica_run_directory = current_replica_run_directory,
+        input_data = read_experimental_kinematics(kinematics_dataframe_name))
 
 
 if __name__ == "__main__":
@@ -1052,10 +1782,80 @@ if __name__ == "__main__":
         required = False,
         action = 'store_false',
         help = _ARGPARSE_ARGUMENT_DESCRIPTION_VERBOSE)
+
+    # (6): Ask, but don't enforce, ensemble training:
+    parser.add_argument(
+        '-e',
+        _ARGPARSE_ARGUMENT_ENSEMBLE,
+        required = False,
+        action = 'store_true',
+        help = _ARGPARSE_ARGUMENT_DESCRIPTION_ENSEMBLE)
+
+    # (7): Ask, but don't enforce, a number of parallel workers:
+    parser.add_argument(
+        '-w',
+        _ARGPARSE_ARGUMENT_WORKERS,
+        type = int,
+        required = False,
+        default = 1,
+        help = _ARGPARSE_ARGUMENT_DESCRIPTION_WORKERS)
+
+    # (8): Ask, but don't enforce, a shared run directory:
+    parser.add_argument(
+        '-rd',
+        _ARGPARSE_ARGUMENT_RUN_DIRECTORY,
+        type = str,
+        required = False,
+        default = None,
+        help = _ARGPARSE_ARGUMENT_DESCRIPTION_RUN_DIRECTORY)
+
+    # (9): Ask, but don't enforce, a run to resume:
+    parser.add_argument(
+        '-r',
+        _ARGPARSE_ARGUMENT_RESUME,
+        type = str,
+        required = False,
+        default = None,
+        help = _ARGPARSE_ARGUMENT_DESCRIPTION_RESUME)
+
+    # (10): Ask, but don't enforce, the seed of the run:
+    parser.add_argument(
+        '-s',
+        _ARGPARSE_ARGUMENT_SEED,
+        type = int,
+        required = False,
+        default = None,
+        help = _ARGPARSE_ARGUMENT_DESCRIPTION_SEED)
+
+    # (11): Ask, but don't enforce, the optimizer of the replicas:
+    parser.add_argument(
+        '-o',
+        _ARGPARSE_ARGUMENT_OPTIMIZER,
+        type = str,
+        required = False,
+        default = "adam",
+        choices = ["adam", "lbfgs", "gauss-newton"],
+        help = _ARGPARSE_ARGUMENT_DESCRIPTION_OPTIMIZER)
+
+    # (12): Ask, but don't enforce, how long a queue waits for a silent worker:
+    parser.add_argument(
+        '-sct',
+        _ARGPARSE_ARGUMENT_STALE_CLAIM_TIMEOUT,
+        type = float,
+        required = False,
+        default = _REPLICA_QUEUE_STALE_CLAIM_TIMEOUT_IN_SECONDS,
+        help = _ARGPARSE_ARGUMENT_DESCRIPTION_STALE_CLAIM_TIMEOUT)
     
     arguments = parser.parse_args()
 
     main(
         kinematics_dataframe_name = arguments.input_datafile,
         number_of_replicas = arguments.number_of_replicas,
-        verbose = arguments.verbose)
\ No newline at end of file
+        verbose = arguments.verbose,
+        ensemble = arguments.ensemble,
+        number_of_workers = arguments.workers,
+        run_directory = arguments.run_directory,
+        resume_directory = arguments.resume,
+        seed = arguments.seed,
+        optimizer = arguments.optimizer,
+        stale_claim_timeout_in_seconds = arguments.stale_claim_timeout)
\ No newline at end of file
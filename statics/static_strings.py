@@ -30,6 +30,48 @@ _ARGPARSE_ARGUMENT_VERBOSE = '--verbose'
 # (9): argparer's *argument flag* for the datafile:
 _ARGPARSE_ARGUMENT_DESCRIPTION_VERBOSE = 'Enable verbose logging.'
 
+# (X): argparser's *argument flag* for training all the replicas as one ensemble:
+_ARGPARSE_ARGUMENT_ENSEMBLE = '--ensemble'
+
+# (X): argparser's description for the argument `ensemble`:
+_ARGPARSE_ARGUMENT_DESCRIPTION_ENSEMBLE = 'Train all of the replicas at once, as one batched ensemble model.'
+
+# (X): argparser's *argument flag* for the number of parallel workers:
+_ARGPARSE_ARGUMENT_WORKERS = '--workers'
+
+# (X): argparser's description for the argument `workers`:
+_ARGPARSE_ARGUMENT_DESCRIPTION_WORKERS = 'The number of processes that train replicas in parallel, each on its own CPU cores.'
+
+# (X): argparser's *argument flag* for a shared run directory:
+_ARGPARSE_ARGUMENT_RUN_DIRECTORY = '--run-directory'
+
+# (X): argparser's description for the argument `run-directory`:
+_ARGPARSE_ARGUMENT_DESCRIPTION_RUN_DIRECTORY = 'A run directory shared by several workers (or nodes), which claim its replicas from a queue.'
+
+# (X): argparser's *argument flag* for resuming a run:
+_ARGPARSE_ARGUMENT_RESUME = '--resume'
+
+# (X): argparser's description for the argument `resume`:
+_ARGPARSE_ARGUMENT_DESCRIPTION_RESUME = 'The run directory of an interrupted run: train only the replicas it is missing, from their last checkpoint.'
+
+# (X): argparser's *argument flag* for the seed of the run:
+_ARGPARSE_ARGUMENT_SEED = '--seed'
+
+# (X): argparser's description for the argument `seed`:
+_ARGPARSE_ARGUMENT_DESCRIPTION_SEED = 'The seed of the run: with the same seed and data, every replica gets the same pseudodata and train/validation split.'
+
+# (X): argparser's *argument flag* for the optimizer of the replicas:
+_ARGPARSE_ARGUMENT_OPTIMIZER = '--optimizer'
+
+# (X): argparser's description for the argument `optimizer`:
+_ARGPARSE_ARGUMENT_DESCRIPTION_OPTIMIZER = 'How to fit every replica: Adam for a fixed number of epochs, or full-batch L-BFGS or Gauss-Newton until the loss converges.'
+
+# (X): argparser's *argument flag* for the stale-claim timeout of a replica queue:
+_ARGPARSE_ARGUMENT_STALE_CLAIM_TIMEOUT = '--stale-claim-timeout'
+
+# (X): argparser's description for the argument `stale-claim-timeout`:
+_ARGPARSE_ARGUMENT_DESCRIPTION_STALE_CLAIM_TIMEOUT = 'With a shared run directory: the seconds after which a replica whose worker has stopped sending heartbeats goes back to the queue.'
+
 # (10): "Generalized" column name for kinematic set/bin:
 _COLUMN_NAME_KINEMATIC_BIN = "bin"
 
@@ -57,6 +99,12 @@ _DIRECTORY_DATA_RAW = 'raw'
 # (X): Required subdirectories | analysis > data > replicas:
 _DIRECTORY_DATA_REPLICAS = 'replicas'
 
+# (X): Required subdirectories | analysis > data > checkpoints:
+_DIRECTORY_DATA_CHECKPOINTS = 'checkpoints'
+
+# (X): The pseudodata of every replica, in analysis > data > raw:
+_FILE_NAME_REPLICA_PSEUDODATA = 'pseudodata.npz'
+
 # (X): Required subdirectories | analysis > replicas:
 _DIRECTORY_REPLICAS = 'replicas'
 
@@ -76,6 +124,7 @@ _DIRECTORY_REPLICAS_PSEUDODATA = 'pseudodata'
 REQUIRED_SUBDIRECTORIES_LIST = [
     f"{_DIRECTORY_DATA}/{_DIRECTORY_DATA_RAW}",
     f"{_DIRECTORY_DATA}/{_DIRECTORY_DATA_REPLICAS}",
+    f"{_DIRECTORY_DATA}/{_DIRECTORY_DATA_CHECKPOINTS}",
     f"{_DIRECTORY_REPLICAS}/{_DIRECTORY_REPLICAS_FITS}",
     f"{_DIRECTORY_REPLICAS}/{_DIRECTORY_REPLICAS_LOSSES}",
     f"{_DIRECTORY_REPLICAS}/{_DIRECTORY_REPLICAS_PERFORMANCE}",
@@ -118,6 +167,15 @@ _HYPERPARAMETER_NUMBER_OF_EPOCHS = 400
 # (X): DNN Training Settings | Number of Replicas:
 _HYPERPARAMETER_BATCH_SIZE = 16
 
+# (X): DNN Training Settings | Epochs between two checkpoints of a replica:
+_HYPERPARAMETER_CHECKPOINT_FREQUENCY_IN_EPOCHS = 20
+
+# (X): DNN Training Settings | Relative decrease of the loss below which a full-batch fit has converged:
+_HYPERPARAMETER_FULL_BATCH_TOLERANCE = 1e-6
+
+# (X): DNN Training Settings | Most iterations of a full-batch fit:
+_HYPERPARAMETER_FULL_BATCH_MAXIMUM_ITERATIONS = 500
+
 # (X): DNN train/test split *decimal*:
 _DNN_TRAIN_TEST_SPLIT_PERCENTAGE = 0.2
 
@@ -141,4 +199,7 @@ _FIGURE_FORMAT_PNG = "png"
 
 # TEMPORARY!
 _COLUMN_NAME_CROSS_SECTION = "sigma"
-_COLUMN_NAME_CROSS_SECTION_ERROR = "sigma_stat_plus"
\ No newline at end of file
+_COLUMN_NAME_CROSS_SECTION_ERROR = "sigma_stat_plus"
+
+# (X): The names of the beam-spin asymmetry in the data files --- a replica fits the first one it has:
+_COLUMN_NAMES_BEAM_SPIN_ASYMMETRY = ("ALU", "BSA")
\ No newline at end of file
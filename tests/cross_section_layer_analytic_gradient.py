@@ -0,0 +1,124 @@
+"""
+Testing that the closed-form CFF gradient of the CrossSectionLayer is the one
+that autodiff finds.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | Pandas:
+import pandas as pd
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# models > architecture
+from models.architecture import BSALayer, CrossSectionLayer
+
+# models > numpy_backend > NumPyCrossSectionLayer
+from models.numpy_backend import NumPyCrossSectionLayer
+
+def _value_and_cff_gradient(layer, kinematic_inputs, cffs):
+    """
+    ## Description:
+    The layer output and the gradient of a (non-linear) scalar function of it with
+    respect to the CFFs, so that every row gets a different upstream gradient.
+    """
+    cffs = tf.Variable(cffs)
+
+    with tf.GradientTape() as tape:
+        output = layer(tf.concat([kinematic_inputs, cffs], axis = 1))
+        scalar_output = tf.reduce_sum(tf.sin(output))
+
+    return output.numpy(), tape.gradient(scalar_output, cffs).numpy()
+
+class TestAnalyticCFFGradient(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        dataframe = pd.read_csv('data/kinematic_set_1.csv')
+        cls.kinematics = tf.constant(dataframe[['q_squared', 'x_b', 't', 'k', 'phi']].to_numpy(dtype = np.float64))
+        cls.cffs = tf.constant(np.random.default_rng(42).uniform(-3., 3., size = (cls.kinematics.shape[0], 8)))
+
+    def test_agrees_with_autodiff(self):
+        """
+        ## Description:
+        Same values and same ∂/∂CFFs, for both beam helicities and charges and for
+        precomputed inputs. (The raw kinematics are covered below.)
+        """
+        bundle_layer = CrossSectionLayer(use_kinematic_bundle = True, precision = "float64", autocast = False)
+        design_matrix_layer = CrossSectionLayer(use_design_matrix = True, precision = "float64", autocast = False)
+        inputs_by_setting = {
+            "use_kinematic_bundle": bundle_layer.precompute_kinematic_bundle(self.kinematics),
+            "use_design_matrix": design_matrix_layer.precompute_design_matrix(self.kinematics),
+        }
+
+        for lepton_beam_polarization, lepton_beam_charge in ((0.0, -1.0), (1.0, -1.0), (-1.0, 1.0)):
+            for input_setting, kinematic_inputs in inputs_by_setting.items():
+                layer_settings = {
+                    "lepton_beam_polarization": lepton_beam_polarization,
+                    "lepton_beam_charge": lepton_beam_charge,
+                    "precision": "float64",
+                    "autocast": False,
+                    input_setting: True,
+                }
+
+                value, gradient = _value_and_cff_gradient(CrossSectionLayer(**layer_settings), kinematic_inputs, self.cffs)
+                analytic_value, analytic_gradient = _value_and_cff_gradient(
+                    CrossSectionLayer(analytic_cff_gradient = True, **layer_settings), kinematic_inputs, self.cffs)
+
+                np.testing.assert_allclose(analytic_value, value, rtol = 1e-10)
+                np.testing.assert_allclose(analytic_gradient, gradient, rtol = 1e-9, atol = 1e-12 * np.abs(gradient).max())
+
+    def test_channels_and_asymmetry(self):
+        """
+        ## Description:
+        Whatever is computed *from* the three parts is still differentiated by autodiff.
+        """
+        for layer_class, layer_settings in (
+                (CrossSectionLayer, {"polarization_channels": [(1.0, -1.0), (0.0, 1.0)]}),
+                (BSALayer, {})):
+            _, gradient = _value_and_cff_gradient(
+                layer_class(precision = "float64", autocast = False, **layer_settings), self.kinematics, self.cffs)
+            _, analytic_gradient = _value_and_cff_gradient(
+                layer_class(precision = "float64", autocast = False, analytic_cff_gradient = True, **layer_settings), self.kinematics, self.cffs)
+
+            np.testing.assert_allclose(analytic_gradient, gradient, rtol = 1e-9, atol = 1e-12 * np.abs(gradient).max())
+
+    def test_design_matrix_gradient(self):
+        """
+        ## Description:
+        The gradient also flows back into the design matrix, and from there into the kinematics.
+        """
+        # (X): Keep a reference to the layer --- its `tf.function`s only hold a weak one:
+        reference_layer = CrossSectionLayer(precision = "float64", autocast = False)
+        design_matrix = tf.Variable(reference_layer.precompute_design_matrix(self.kinematics))
+        gradients = []
+
+        for analytic_cff_gradient in (False, True):
+            layer = CrossSectionLayer(
+                use_design_matrix = True,
+                lepton_beam_polarization = 1.0,
+                analytic_cff_gradient = analytic_cff_gradient,
+                precision = "float64",
+                autocast = False)
+
+            with tf.GradientTape() as tape:
+                cross_section = layer(tf.concat([design_matrix, self.cffs], axis = 1))
+
+            gradients.append(tape.gradient(cross_section, design_matrix).numpy())
+
+        np.testing.assert_allclose(gradients[1], gradients[0], rtol = 1e-12, atol = 1e-15)
+
+    def test_numpy_backend(self):
+        np.testing.assert_allclose(
+            NumPyCrossSectionLayer(analytic_cff_gradient = True, precision = "float64")(
+                np.concatenate([self.kinematics.numpy(), self.cffs.numpy()], axis = 1)),
+            CrossSectionLayer(precision = "float64", autocast = False)(tf.concat([self.kinematics, self.cffs], axis = 1)).numpy(),
+            rtol = 1e-10)
+
+if __name__ == "__main__":
+    unittest.main()
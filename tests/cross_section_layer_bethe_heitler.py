@@ -0,0 +1,94 @@
+"""
+Testing the |BH|² term of the CrossSectionLayer against the bkm10 library, and
+the caching of the precomputed kinematics that carry it.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# 3rd Party Library | bkm10:
+from bkm10_lib import DifferentialCrossSection, CFFInputs, BKM10Inputs
+
+# models > architecture
+from models.architecture import CrossSectionLayer, precompute_kinematic_bundle, clear_precomputation_cache
+
+# (X): A few kinematic settings [Q², x_B, t, k] from JLab to HERMES:
+_TEST_KINEMATIC_SETTINGS = [
+    (1.82, 0.343, -0.172, 5.75),
+    (2.50, 0.250, -0.300, 10.6),
+    (1.10, 0.150, -0.120, 5.50),
+]
+
+def _bkm10_bethe_heitler(q_squared, x_bjorken, t, k, phi_values):
+    """
+    ## Description:
+    The pure |BH|² cross-section from the bkm10 library.
+    """
+    zero_cff = complex(0., 0.)
+    configuration = {
+        "kinematics": BKM10Inputs(
+            squared_Q_momentum_transfer = q_squared,
+            x_Bjorken = x_bjorken,
+            squared_hadronic_momentum_transfer_t = t,
+            lab_kinematics_k = k),
+        "cff_inputs": CFFInputs(
+            compton_form_factor_h = zero_cff,
+            compton_form_factor_h_tilde = zero_cff,
+            compton_form_factor_e = zero_cff,
+            compton_form_factor_e_tilde = zero_cff),
+        "target_polarization": 0.0,
+        "lepton_beam_polarization": 0.0,
+        "using_ww": True,
+    }
+    cross_section = DifferentialCrossSection(configuration, bh_setting = True, dvcs_setting = False, interference_setting = False)
+    return cross_section.compute_cross_section(np.radians(phi_values), 0.0, 0.0)
+
+class TestBetheHeitler(unittest.TestCase):
+
+    def test_agrees_with_bkm10(self):
+        """
+        ## Description:
+        With every CFF set to zero, only |BH|² is left, and it must be the
+        same as in the bkm10 library.
+        """
+        phi_values = np.linspace(0., 360., 25)
+        layer = CrossSectionLayer(precision = "float64", autocast = False)
+
+        for q_squared, x_bjorken, t, k in _TEST_KINEMATIC_SETTINGS:
+            layer_input = np.column_stack([
+                np.full_like(phi_values, q_squared),
+                np.full_like(phi_values, x_bjorken),
+                np.full_like(phi_values, t),
+                np.full_like(phi_values, k),
+                phi_values,
+                np.zeros((phi_values.shape[0], 8))])
+
+            np.testing.assert_allclose(
+                layer(tf.constant(layer_input)).numpy(),
+                _bkm10_bethe_heitler(q_squared, x_bjorken, t, k, phi_values),
+                rtol = 1e-10)
+
+    def test_bundle_cache(self):
+        """
+        ## Description:
+        The same kinematics and settings give back the very same array; other
+        settings get their own entry.
+        """
+        clear_precomputation_cache()
+        kinematics = np.array([list(setting) + [45.] for setting in _TEST_KINEMATIC_SETTINGS], dtype = np.float32)
+
+        first_bundle = precompute_kinematic_bundle(kinematics)
+        self.assertIs(precompute_kinematic_bundle(kinematics.copy()), first_bundle)
+        self.assertFalse(first_bundle.flags.writeable)
+
+        self.assertIsNot(precompute_kinematic_bundle(kinematics, lepton_beam_polarization = 1.0), first_bundle)
+        self.assertIsNot(precompute_kinematic_bundle(kinematics, use_cache = False), first_bundle)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Testing that the BSALayer is the beam-spin asymmetry of the CrossSectionLayer.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | Pandas:
+import pandas as pd
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# models > architecture
+from models.architecture import BSALayer, CrossSectionLayer, build_simultaneous_model, precompute_kinematic_bundle
+
+# models > full_batch_fit
+from models.full_batch_fit import fit_full_batch
+
+class TestBSALayer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        dataframe = pd.read_csv('data/kinematic_set_1.csv')
+        kinematics = dataframe[['q_squared', 'x_b', 't', 'k', 'phi']].to_numpy(dtype = np.float64)
+        cffs = np.random.default_rng(42).uniform(-3., 3., size = (kinematics.shape[0], 8))
+        cls.layer_input = tf.constant(np.concatenate([kinematics, cffs], axis = 1))
+
+    def test_agrees_with_two_cross_sections(self):
+        """
+        ## Description:
+        (σ⁺ - σ⁻) / (σ⁺ + σ⁻) from two CrossSectionLayers, for both beam charges.
+        """
+        for lepton_beam_charge in (-1.0, 1.0):
+            cross_section_plus, cross_section_minus = (
+                CrossSectionLayer(
+                    lepton_beam_polarization = lepton_beam_polarization,
+                    lepton_beam_charge = lepton_beam_charge,
+                    precision = "float64",
+                    autocast = False)(self.layer_input).numpy()
+                for lepton_beam_polarization in (1.0, -1.0))
+
+            beam_spin_asymmetry = BSALayer(
+                lepton_beam_charge = lepton_beam_charge,
+                precision = "float64",
+                autocast = False)(self.layer_input).numpy()
+
+            self.assertEqual(beam_spin_asymmetry.shape, (self.layer_input.shape[0], ))
+            np.testing.assert_allclose(
+                beam_spin_asymmetry,
+                (cross_section_plus - cross_section_minus) / (cross_section_plus + cross_section_minus),
+                rtol = 1e-10)
+
+    def test_design_matrix(self):
+        """
+        ## Description:
+        The BSA from a precomputed design matrix is the same, and it is
+        differentiable in the CFFs.
+        """
+        layer = BSALayer(use_design_matrix = True, precision = "float64", autocast = False)
+        design_matrix = layer.precompute_design_matrix(self.layer_input[:, :5])
+        cffs = tf.Variable(self.layer_input[:, 5:])
+
+        with tf.GradientTape() as tape:
+            beam_spin_asymmetry = layer(tf.concat([design_matrix, cffs], axis = 1))
+
+        np.testing.assert_allclose(
+            beam_spin_asymmetry.numpy(),
+            BSALayer(precision = "float64", autocast = False)(self.layer_input).numpy(),
+            rtol = 1e-10)
+        self.assertTrue(np.all(np.isfinite(tape.gradient(beam_spin_asymmetry, cffs).numpy())))
+
+    def test_no_channels(self):
+        with self.assertRaises(ValueError):
+            BSALayer(polarization_channels = [(1.0, -1.0)])
+
+    def test_no_beam_polarization(self):
+        with self.assertRaises(ValueError):
+            BSALayer(lepton_beam_polarization = 1.0)
+
+    def test_fit_bsa(self):
+        """
+        ## Description:
+        With `fit_bsa = True`, the model returns (cross-section, BSA), and it trains
+        on targets where each row has only one of the two.
+        """
+        kinematics = self.layer_input[:, :5].numpy().astype(np.float32)
+        model_inputs = [kinematics, precompute_kinematic_bundle(kinematics)]
+        model = build_simultaneous_model(use_kinematic_bundle = True, fit_bsa = True)
+
+        cross_section, beam_spin_asymmetry = model.predict(model_inputs, verbose = 0)
+        self.assertEqual(len(model.outputs), 2)
+        self.assertEqual(np.size(beam_spin_asymmetry), len(kinematics))
+
+        # (1): Every other row has a cross-section; the rest have a BSA:
+        measured_cross_section = np.where(np.arange(len(kinematics)) % 2 == 0, 0.5 * np.ravel(cross_section), np.nan)
+        measured_beam_spin_asymmetry = np.where(np.arange(len(kinematics)) % 2 == 1, 0.5 * np.ravel(beam_spin_asymmetry), np.nan)
+
+        history = model.fit(model_inputs, [measured_cross_section, measured_beam_spin_asymmetry], epochs = 5, verbose = 0)
+
+        self.assertTrue(np.all(np.isfinite(history.history["loss"])))
+        self.assertLess(history.history["loss"][-1], history.history["loss"][0])
+
+        # (2): The full-batch fits only know the cross-section:
+        with self.assertRaises(ValueError):
+            fit_full_batch(model, model_inputs, measured_cross_section)
+
+if __name__ == "__main__":
+    unittest.main()
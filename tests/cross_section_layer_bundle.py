@@ -0,0 +1,64 @@
+"""
+Testing that a precomputed kinematic bundle gives the same cross-section as the raw kinematics.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | Pandas:
+import pandas as pd
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# models > architecture
+from models.architecture import CrossSectionLayer, build_simultaneous_model, precompute_kinematic_bundle
+
+# (X): The KM15 CFFs at (Q², x_B, t) = (1.82, 0.343, -0.172):
+_TEST_CFFS = [-0.897, 2.421, 2.444, 0.0, 1.131, 1.047, 4.000, 0.0]
+
+class TestKinematicBundle(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        dataframe = pd.read_csv('data/kinematic_set_1.csv')
+        cls.kinematics = dataframe[['q_squared', 'x_b', 't', 'k', 'phi']].to_numpy(dtype = np.float32)
+        cls.cffs = np.tile(np.array(_TEST_CFFS, dtype = np.float32), (cls.kinematics.shape[0], 1))
+        cls.kinematic_bundle = precompute_kinematic_bundle(cls.kinematics)
+
+    def test_layer_parity(self):
+        """
+        ## Description:
+        The layer fed with the bundle agrees with the layer fed with the kinematics.
+        """
+        for lepton_beam_polarization in (0.0, 1.0, -1.0):
+
+            cross_section = CrossSectionLayer(lepton_beam_polarization = lepton_beam_polarization)(
+                tf.constant(np.concatenate([self.kinematics, self.cffs], axis = 1))).numpy()
+
+            cross_section_from_bundle = CrossSectionLayer(lepton_beam_polarization = lepton_beam_polarization, use_kinematic_bundle = True)(
+                tf.constant(np.concatenate([self.kinematic_bundle, self.cffs], axis = 1))).numpy()
+
+            np.testing.assert_allclose(cross_section_from_bundle, cross_section, rtol = 1e-5, atol = 1e-7)
+
+    def test_model_parity(self):
+        """
+        ## Description:
+        Two models with the same weights make the same predictions whether they
+        use the bundle or not.
+        """
+        standard_model = build_simultaneous_model()
+        bundle_model = build_simultaneous_model(use_kinematic_bundle = True)
+        bundle_model.set_weights(standard_model.get_weights())
+
+        np.testing.assert_allclose(
+            bundle_model.predict_on_batch([self.kinematics, self.kinematic_bundle]),
+            standard_model.predict_on_batch(self.kinematics),
+            rtol = 1e-5,
+            atol = 1e-7)
+
+if __name__ == "__main__":
+    unittest.main()
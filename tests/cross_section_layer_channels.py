@@ -0,0 +1,122 @@
+"""
+Testing that a CrossSectionLayer with several polarization channels returns
+what one layer per configuration would.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | Pandas:
+import pandas as pd
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# models > architecture > CrossSectionLayer
+from models.architecture import CrossSectionLayer
+
+# models > numpy_backend > NumPyCrossSectionLayer
+from models.numpy_backend import NumPyCrossSectionLayer
+
+# (X): (λ, e_ℓ): both helicities and no helicity, for electrons and positrons:
+_TEST_POLARIZATION_CHANNELS = (
+    (0.0, -1.0),
+    (1.0, -1.0),
+    (-1.0, -1.0),
+    (0.0, 1.0),
+    (1.0, 1.0),
+    (-1.0, 1.0),
+)
+
+class TestPolarizationChannels(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        dataframe = pd.read_csv('data/kinematic_set_1.csv')
+        kinematics = dataframe[['q_squared', 'x_b', 't', 'k', 'phi']].to_numpy(dtype = np.float64)
+        cffs = np.random.default_rng(42).uniform(-3., 3., size = (kinematics.shape[0], 8))
+        cls.layer_input = tf.constant(np.concatenate([kinematics, cffs], axis = 1))
+
+        cls.channel_layer = CrossSectionLayer(
+            polarization_channels = _TEST_POLARIZATION_CHANNELS,
+            precision = "float64",
+            autocast = False)
+        cls.cross_section_channels = cls.channel_layer(cls.layer_input).numpy()
+
+    def test_shape(self):
+        self.assertEqual(self.cross_section_channels.shape, (self.layer_input.shape[0], len(_TEST_POLARIZATION_CHANNELS)))
+
+    def test_agrees_with_single_configuration_layers(self):
+        """
+        ## Description:
+        Every channel is the cross-section of a layer built for that configuration alone.
+        """
+        for channel_index, (lepton_beam_polarization, lepton_beam_charge) in enumerate(_TEST_POLARIZATION_CHANNELS):
+            cross_section = CrossSectionLayer(
+                lepton_beam_polarization = lepton_beam_polarization,
+                lepton_beam_charge = lepton_beam_charge,
+                precision = "float64",
+                autocast = False)(self.layer_input).numpy()
+
+            np.testing.assert_allclose(self.cross_section_channels[:, channel_index], cross_section, rtol = 1e-12)
+
+    def test_charge_only_flips_interference(self):
+        """
+        ## Description:
+        σ(e⁻) + σ(e⁺) = 2 (σ_BH + σ_DVCS), which does not depend on the beam helicity.
+        """
+        charge_sum_unpolarized = self.cross_section_channels[:, 0] + self.cross_section_channels[:, 3]
+        charge_sum_polarized = self.cross_section_channels[:, 1] + self.cross_section_channels[:, 4]
+
+        np.testing.assert_allclose(charge_sum_polarized, charge_sum_unpolarized, rtol = 1e-12)
+
+    def test_precomputed_inputs_and_backends(self):
+        """
+        ## Description:
+        The channels come out the same from a design matrix and with NumPy.
+        """
+        design_matrix_layer = CrossSectionLayer(
+            polarization_channels = _TEST_POLARIZATION_CHANNELS,
+            use_design_matrix = True,
+            precision = "float64",
+            autocast = False)
+        design_matrix = design_matrix_layer.precompute_design_matrix(self.layer_input[:, :5])
+
+        np.testing.assert_allclose(
+            design_matrix_layer(tf.concat([design_matrix, self.layer_input[:, 5:]], axis = 1)).numpy(),
+            self.cross_section_channels,
+            rtol = 1e-10)
+
+        np.testing.assert_allclose(
+            NumPyCrossSectionLayer(polarization_channels = _TEST_POLARIZATION_CHANNELS, precision = "float64")(self.layer_input.numpy()),
+            self.cross_section_channels,
+            rtol = 1e-12)
+
+    def test_phi_grid(self):
+        cross_section_on_grid = self.channel_layer.compute_cross_section_on_phi_grid(
+            self.layer_input[:2, :4],
+            self.layer_input[:2, 5:],
+            tf.constant([0., 90., 180.], dtype = tf.float64))
+
+        self.assertEqual(cross_section_on_grid.shape, (2, 3, len(_TEST_POLARIZATION_CHANNELS)))
+
+    def test_invalid_channels(self):
+
+        # (X): There are only unpolarized-target coefficients --- so no target polarization, in a channel or not:
+        with self.assertRaises(ValueError):
+            CrossSectionLayer(polarization_channels = [(0.0, -1.0, 1.0)])
+
+        with self.assertRaises(NotImplementedError):
+            CrossSectionLayer(target_polarization = 1.0)
+
+        with self.assertRaises(ValueError):
+            CrossSectionLayer(polarization_channels = [(0.5, -1.0)])
+
+        with self.assertRaises(ValueError):
+            CrossSectionLayer(lepton_beam_charge = 0.0)
+
+if __name__ == "__main__":
+    unittest.main()
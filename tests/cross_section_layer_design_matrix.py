@@ -0,0 +1,94 @@
+"""
+Testing that the linear design-matrix mode of the CrossSectionLayer agrees with the standard one.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | Pandas:
+import pandas as pd
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# models > architecture
+from models.architecture import CrossSectionLayer, build_simultaneous_model, precompute_design_matrix
+
+# scripts > train_local_fit
+from scripts.train_local_fit import predict_cross_section
+
+class TestDesignMatrix(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        dataframe = pd.read_csv('data/kinematic_set_1.csv')
+        cls.kinematics = dataframe[['q_squared', 'x_b', 't', 'k', 'phi']].to_numpy(dtype = np.float32)
+        cls.design_matrix = precompute_design_matrix(cls.kinematics)
+
+        # (X): Random CFFs for every point, so that every column of the design matrix matters:
+        cls.cffs = np.random.default_rng(42).uniform(-3., 3., size = (cls.kinematics.shape[0], 8)).astype(np.float32)
+
+    def test_shape(self):
+        """
+        ## Description:
+        Eight even columns, eight odd columns, the constant term, and the 8 x 8 |DVCS|² matrix.
+        """
+        self.assertEqual(self.design_matrix.shape, (self.kinematics.shape[0], 81))
+
+    def test_layer_parity(self):
+        """
+        ## Description:
+        The dot product agrees with the full computation for every beam polarization.
+        """
+        for lepton_beam_polarization in (0.0, 1.0, -1.0):
+
+            cross_section = CrossSectionLayer(lepton_beam_polarization = lepton_beam_polarization)(
+                tf.constant(np.concatenate([self.kinematics, self.cffs], axis = 1))).numpy()
+
+            cross_section_from_design_matrix = CrossSectionLayer(lepton_beam_polarization = lepton_beam_polarization, use_design_matrix = True)(
+                tf.constant(np.concatenate([self.design_matrix, self.cffs], axis = 1))).numpy()
+
+            np.testing.assert_allclose(
+                cross_section_from_design_matrix,
+                cross_section,
+                rtol = 1e-5,
+                atol = 1e-6 * np.abs(cross_section).max())
+
+    def test_model_parity(self):
+        """
+        ## Description:
+        Two models with the same weights make the same predictions.
+        """
+        standard_model = build_simultaneous_model()
+        design_matrix_model = build_simultaneous_model(use_design_matrix = True)
+        design_matrix_model.set_weights(standard_model.get_weights())
+
+        np.testing.assert_allclose(
+            design_matrix_model.predict_on_batch([self.kinematics, self.design_matrix]),
+            standard_model.predict_on_batch(self.kinematics),
+            rtol = 1e-5,
+            atol = 1e-7)
+
+    def test_model_inputs(self):
+        """
+        ## Description:
+        The training script gives a model with two inputs the second input it was
+        built for --- the kinematic bundle or the design matrix.
+        """
+        standard_model = build_simultaneous_model()
+
+        for model_settings in ({"use_kinematic_bundle": True}, {"use_design_matrix": True}):
+            two_input_model = build_simultaneous_model(**model_settings)
+            two_input_model.set_weights(standard_model.get_weights())
+
+            np.testing.assert_allclose(
+                predict_cross_section(two_input_model, self.kinematics),
+                predict_cross_section(standard_model, self.kinematics),
+                rtol = 1e-5,
+                atol = 1e-7)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Testing the |DVCS|² term of the CrossSectionLayer, a quadratic form in the CFFs,
+against the bkm10 library.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# 3rd Party Library | bkm10:
+from bkm10_lib import DifferentialCrossSection, CFFInputs, BKM10Inputs
+
+# models > architecture
+from models.architecture import CrossSectionLayer
+
+# (X): A few kinematic settings [Q², x_B, t, k] from JLab to HERMES:
+_TEST_KINEMATIC_SETTINGS = [
+    (1.82, 0.343, -0.172, 5.75),
+    (2.50, 0.250, -0.300, 10.6),
+    (1.10, 0.150, -0.120, 5.50),
+]
+
+# (X): The KM15 CFFs at (Q², x_B, t) = (1.82, 0.343, -0.172):
+_TEST_CFFS = [-0.897, 2.421, 2.444, 0.0, 1.131, 1.047, 4.000, 0.0]
+
+def _bkm10_dvcs(q_squared, x_bjorken, t, k, phi_values, cffs, using_ww):
+    """
+    ## Description:
+    The pure |DVCS|² cross-section from the bkm10 library.
+
+    ## Notes:
+    bkm10 keeps the interference c_{1} even with `interference_setting = False`,
+    so we subtract the same computation without the |DVCS|² term.
+    """
+    configuration = {
+        "kinematics": BKM10Inputs(
+            squared_Q_momentum_transfer = q_squared,
+            x_Bjorken = x_bjorken,
+            squared_hadronic_momentum_transfer_t = t,
+            lab_kinematics_k = k),
+        "cff_inputs": CFFInputs(
+            compton_form_factor_h = complex(cffs[0], cffs[1]),
+            compton_form_factor_e = complex(cffs[2], cffs[3]),
+            compton_form_factor_h_tilde = complex(cffs[4], cffs[5]),
+            compton_form_factor_e_tilde = complex(cffs[6], cffs[7])),
+        "target_polarization": 0.0,
+        "lepton_beam_polarization": 0.0,
+        "using_ww": using_ww,
+    }
+    return (
+        DifferentialCrossSection(configuration, bh_setting = False, dvcs_setting = True, interference_setting = False).compute_cross_section(np.radians(phi_values), 0.0, 0.0) -
+        DifferentialCrossSection(configuration, bh_setting = False, dvcs_setting = False, interference_setting = False).compute_cross_section(np.radians(phi_values), 0.0, 0.0))
+
+class TestDVCS(unittest.TestCase):
+
+    def test_agrees_with_bkm10(self):
+        """
+        ## Description:
+        CFFs^T D CFFs is the |DVCS|² cross-section of the bkm10 library.
+        """
+        phi_values = np.linspace(0., 360., 25)
+        cffs = np.random.default_rng(42).uniform(-3., 3., size = 8)
+
+        for using_ww in (True, False):
+            layer = CrossSectionLayer(precision = "float64", autocast = False, using_ww = using_ww)
+
+            for q_squared, x_bjorken, t, k in _TEST_KINEMATIC_SETTINGS:
+                kinematics = np.column_stack([
+                    np.full_like(phi_values, q_squared),
+                    np.full_like(phi_values, x_bjorken),
+                    np.full_like(phi_values, t),
+                    np.full_like(phi_values, k),
+                    phi_values])
+                design_matrix = layer.precompute_design_matrix(tf.constant(kinematics)).numpy()
+
+                np.testing.assert_allclose(
+                    layer.contract_dvcs_bilinear_form(design_matrix[:, 17:], np.tile(cffs, (phi_values.shape[0], 1))).numpy(),
+                    _bkm10_dvcs(q_squared, x_bjorken, t, k, phi_values, cffs, using_ww),
+                    rtol = 1e-10)
+
+    def test_helicity_odd_part_is_linear(self):
+        """
+        ## Description:
+        |DVCS|² adds nothing to σ(λ = +1) - σ(λ = -1), which stays linear in the CFFs.
+        """
+        phi_values = np.linspace(0., 360., 37)
+        kinematics = tf.constant(np.column_stack([
+            np.full_like(phi_values, 1.82),
+            np.full_like(phi_values, 0.343),
+            np.full_like(phi_values, -0.172),
+            np.full_like(phi_values, 5.75),
+            phi_values]))
+        cffs = tf.constant(np.tile(_TEST_CFFS, (phi_values.shape[0], 1)))
+        layer = CrossSectionLayer(precision = "float64", autocast = False)
+
+        np.testing.assert_allclose(
+            layer.compute_helicity_difference([kinematics, 2. * cffs]).numpy(),
+            2. * layer.compute_helicity_difference([kinematics, cffs]).numpy(),
+            rtol = 1e-10,
+            atol = 1e-12)
+
+if __name__ == "__main__":
+    unittest.main()
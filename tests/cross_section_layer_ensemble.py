@@ -0,0 +1,90 @@
+"""
+Testing that an ensemble of replicas trains and exports like the replicas would on their own.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | Pandas:
+import pandas as pd
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# models > architecture
+from models.architecture import build_ensemble_model, extract_replica_model, precompute_kinematic_bundle
+
+# models > loss_functions
+from models.loss_functions import ensemble_training_loss
+
+_NUMBER_OF_REPLICAS = 3
+
+class TestReplicaEnsemble(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        dataframe = pd.read_csv('data/kinematic_set_1.csv')
+        cls.kinematics = dataframe[['q_squared', 'x_b', 't', 'k', 'phi']].to_numpy(dtype = np.float32)
+        cls.cross_sections = dataframe['F'].to_numpy(dtype = np.float32)
+        cls.kinematic_bundle = np.asarray(precompute_kinematic_bundle(cls.kinematics))
+
+    def test_exported_replicas_match_the_ensemble(self):
+        """
+        ## Description:
+        Every exported replica predicts exactly its column of the ensemble.
+        """
+        ensemble_model = build_ensemble_model(_NUMBER_OF_REPLICAS, use_kinematic_bundle = True)
+        ensemble_prediction = ensemble_model.predict([self.kinematics, self.kinematic_bundle], verbose = 0)
+
+        self.assertEqual(ensemble_prediction.shape, (self.kinematics.shape[0], _NUMBER_OF_REPLICAS))
+
+        for replica_index in range(_NUMBER_OF_REPLICAS):
+            replica_model = extract_replica_model(ensemble_model, replica_index, use_kinematic_bundle = True)
+            replica_prediction = replica_model.predict([self.kinematics, self.kinematic_bundle], verbose = 0)
+
+            np.testing.assert_allclose(replica_prediction.ravel(), ensemble_prediction[:, replica_index], rtol = 1e-5)
+
+        # (X): ... and they are not all the same replica:
+        self.assertGreater(np.std(ensemble_prediction[0]), 0.)
+
+    def test_replicas_only_see_their_own_loss(self):
+        """
+        ## Description:
+        A loss on one replica's rows moves none of the other replicas' weights.
+        """
+        ensemble_model = build_ensemble_model(_NUMBER_OF_REPLICAS, use_kinematic_bundle = True)
+
+        # (1): Only replica #2 has any training rows:
+        training_masks = np.zeros((self.kinematics.shape[0], _NUMBER_OF_REPLICAS), dtype = np.float32)
+        training_masks[::2, 1] = 1.
+        targets = np.concatenate([np.tile(self.cross_sections[:, np.newaxis], (1, _NUMBER_OF_REPLICAS)), training_masks], axis = 1)
+
+        with tf.GradientTape() as tape:
+            loss = ensemble_training_loss(targets, ensemble_model([self.kinematics, self.kinematic_bundle]))
+
+        for variable, gradient in zip(ensemble_model.trainable_variables, tape.gradient(loss, ensemble_model.trainable_variables)):
+            gradient = gradient.numpy()
+
+            self.assertEqual(np.count_nonzero(gradient[[0, 2]]), 0, variable.name)
+            self.assertGreater(np.count_nonzero(gradient[1]), 0, variable.name)
+
+    def test_fit(self):
+        """
+        ## Description:
+        The ensemble fits with the per-replica loss and reports the held-out one.
+        """
+        ensemble_model = build_ensemble_model(_NUMBER_OF_REPLICAS, use_kinematic_bundle = True)
+
+        training_masks = (np.random.default_rng(42).uniform(size = (self.kinematics.shape[0], _NUMBER_OF_REPLICAS)) < 0.8).astype(np.float32)
+        targets = np.concatenate([np.tile(self.cross_sections[:, np.newaxis], (1, _NUMBER_OF_REPLICAS)), training_masks], axis = 1)
+
+        history = ensemble_model.fit([self.kinematics, self.kinematic_bundle], targets, epochs = 2, batch_size = 16, verbose = 0)
+
+        self.assertTrue(np.all(np.isfinite(history.history['loss'])))
+        self.assertIn('ensemble_validation_loss', history.history)
+
+if __name__ == "__main__":
+    unittest.main()
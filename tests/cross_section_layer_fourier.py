@@ -0,0 +1,93 @@
+"""
+Testing that the φ harmonics of the CrossSectionLayer reproduce the cross-section
+at every φ.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# models > architecture
+from models.architecture import CrossSectionLayer, precompute_fourier_harmonics
+
+# (X): A few kinematic settings [Q², x_B, t, k] from JLab to HERMES:
+_TEST_KINEMATIC_SETTINGS = [
+    (1.82, 0.343, -0.172, 5.75),
+    (2.50, 0.250, -0.300, 10.6),
+    (1.10, 0.150, -0.120, 5.50),
+]
+
+class TestFourierHarmonics(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.kinematics = np.array(_TEST_KINEMATIC_SETTINGS)
+        cls.cffs = np.random.default_rng(42).uniform(-3., 3., size = (cls.kinematics.shape[0], 8))
+
+        # (X): Deliberately *not* one of the nodes:
+        cls.phi_values = np.linspace(0., 360., 361)
+
+    def test_shape(self):
+        """
+        ## Description:
+        Seven harmonics of the 81 design-matrix columns and of P_{1} P_{2}.
+        """
+        fourier_harmonics = precompute_fourier_harmonics(self.kinematics.astype(np.float32), use_cache = False)
+        self.assertEqual(fourier_harmonics.shape, (self.kinematics.shape[0], 7, 82))
+
+    def test_agrees_with_layer(self):
+        """
+        ## Description:
+        The harmonics are exact, so in float64 they reproduce the layer on a
+        dense φ grid to rounding, for every beam polarization.
+        """
+        for lepton_beam_polarization in (0.0, 1.0, -1.0):
+            layer = CrossSectionLayer(lepton_beam_polarization = lepton_beam_polarization, precision = "float64", autocast = False)
+
+            cross_section_on_grid = layer.compute_cross_section_on_phi_grid(
+                tf.constant(self.kinematics),
+                tf.constant(self.cffs),
+                tf.constant(self.phi_values)).numpy()
+
+            for setting_index in range(self.kinematics.shape[0]):
+                layer_input = np.column_stack([
+                    np.tile(self.kinematics[setting_index], (self.phi_values.shape[0], 1)),
+                    self.phi_values,
+                    np.tile(self.cffs[setting_index], (self.phi_values.shape[0], 1))])
+                cross_section = layer(tf.constant(layer_input)).numpy()
+
+                np.testing.assert_allclose(
+                    cross_section_on_grid[setting_index],
+                    cross_section,
+                    rtol = 1e-10,
+                    atol = 1e-12 * np.abs(cross_section).max())
+
+    def test_agrees_with_layer_scan(self):
+        """
+        ## Description:
+        The 1° scan of tests/cross_section_layer.py --- the default (float32) layer,
+        row by row --- comes out the same from the harmonics of its one kinematic setting.
+        """
+        fixed_kinematics_values = [1.82, 0.34, -0.17, 5.75]
+        cffs_values = [-0.897, 2.421, 2.444, 1.131, -0.541, 0.903, 2.207, 5.383]
+        phi_values = np.arange(0., 361., 1., dtype = np.float32)
+
+        layer = CrossSectionLayer()
+
+        layer_input = np.array([fixed_kinematics_values + [phi] + cffs_values for phi in phi_values], dtype = np.float32)
+        cross_section = layer(tf.constant(layer_input)).numpy().flatten()
+
+        cross_section_on_grid = layer.compute_cross_section_on_phi_grid(
+            tf.constant([fixed_kinematics_values], dtype = tf.float32),
+            tf.constant([cffs_values], dtype = tf.float32),
+            tf.constant(phi_values)).numpy().flatten()
+
+        np.testing.assert_allclose(cross_section_on_grid, cross_section, rtol = 1e-4, atol = 1e-5 * np.abs(cross_section).max())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Testing the full-batch (L-BFGS and Gauss-Newton) fits of the simultaneous model.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | Pandas:
+import pandas as pd
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# models > architecture
+from models.architecture import build_simultaneous_model, precompute_kinematic_bundle
+
+# models > full_batch_fit
+from models.full_batch_fit import fit_full_batch
+
+# (X): Enough to converge on one kinematic set, but not so many that the tests take long:
+_MAXIMUM_ITERATIONS = 30
+
+class TestFullBatchFit(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        dataframe = pd.read_csv('data/kinematic_set_1.csv')
+        kinematics = dataframe[['q_squared', 'x_b', 't', 'k', 'phi']].to_numpy(dtype = np.float32)
+        cross_sections = dataframe['F'].to_numpy(dtype = np.float32)
+        kinematic_bundle = np.asarray(precompute_kinematic_bundle(kinematics))
+
+        cls.training_inputs = [kinematics[4:], kinematic_bundle[4:]]
+        cls.training_targets = cross_sections[4:]
+        cls.validation_data = ([kinematics[:4], kinematic_bundle[:4]], cross_sections[:4])
+
+    def _compute_training_loss(self, dnn_model):
+        prediction = dnn_model.predict(self.training_inputs, verbose = 0).ravel()
+
+        return float(np.mean((prediction - self.training_targets)**2))
+
+    def test_both_methods_fit(self):
+        """
+        ## Description:
+        Both methods lower the loss by an order of magnitude, report it like `model.fit`
+        does, and leave the model at the weights of their last iteration.
+        """
+        for method in ("lbfgs", "gauss-newton"):
+            with self.subTest(method = method):
+                tf.keras.utils.set_random_seed(0)
+                dnn_model = build_simultaneous_model(use_kinematic_bundle = True)
+                initial_loss = self._compute_training_loss(dnn_model)
+
+                training_history = fit_full_batch(
+                    dnn_model,
+                    self.training_inputs,
+                    self.training_targets,
+                    validation_data = self.validation_data,
+                    method = method,
+                    maximum_iterations = _MAXIMUM_ITERATIONS)
+
+                self.assertEqual(len(training_history.history['loss']), len(training_history.history['val_loss']))
+                self.assertEqual(list(training_history.epoch), list(range(training_history.params['iterations'])))
+                self.assertLessEqual(training_history.params['iterations'], _MAXIMUM_ITERATIONS)
+
+                self.assertLess(training_history.history['loss'][-1], 1e-1 * initial_loss)
+                self.assertAlmostEqual(self._compute_training_loss(dnn_model), training_history.history['loss'][-1], delta = 1e-3 * training_history.history['loss'][-1])
+
+    def test_km15_prior(self):
+        """
+        ## Description:
+        L-BFGS minimizes the prior along with the MSE. Gauss-Newton only does least squares, and refuses.
+        """
+        dnn_model = build_simultaneous_model(use_kinematic_bundle = True, km15_prior_weight = 1.)
+
+        with self.assertRaises(ValueError):
+            fit_full_batch(dnn_model, self.training_inputs, self.training_targets, method = "gauss-newton")
+
+        training_history = fit_full_batch(dnn_model, self.training_inputs, self.training_targets, method = "lbfgs", maximum_iterations = 5)
+
+        self.assertLess(training_history.history['loss'][-1], training_history.history['loss'][0])
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            fit_full_batch(build_simultaneous_model(use_kinematic_bundle = True), self.training_inputs, self.training_targets, method = "sgd")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Testing the helicity-even/odd decomposition of the CrossSectionLayer.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# models > architecture > CrossSectionLayer
+from models.architecture import CrossSectionLayer
+
+# (X): The KM15 CFFs at (Q², x_B, t) = (1.82, 0.343, -0.172):
+_TEST_CFFS = [-0.897, 2.421, 2.444, 0.0, 1.131, 1.047, 4.000, 0.0]
+
+class TestCrossSectionLayerHelicity(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        phi_values = np.linspace(0., 360., 361)
+        kinematics = np.column_stack([
+            np.full_like(phi_values, 1.82),
+            np.full_like(phi_values, 0.343),
+            np.full_like(phi_values, -0.172),
+            np.full_like(phi_values, 5.75),
+            phi_values]).astype(np.float32)
+        cffs = np.tile(np.array(_TEST_CFFS, dtype = np.float32), (kinematics.shape[0], 1))
+
+        cls.kinematics = tf.constant(kinematics)
+        cls.cffs = tf.constant(cffs)
+        cls.layer_input = tf.concat([cls.kinematics, cls.cffs], axis = -1)
+
+        cls.cross_section_unpolarized = CrossSectionLayer(lepton_beam_polarization = 0.0)(cls.layer_input).numpy()
+        cls.cross_section_plus = CrossSectionLayer(lepton_beam_polarization = 1.0)(cls.layer_input).numpy()
+        cls.cross_section_minus = CrossSectionLayer(lepton_beam_polarization = -1.0)(cls.layer_input).numpy()
+
+    def test_unpolarized_is_helicity_average(self):
+        """
+        ## Description:
+        The unpolarized cross-section is the average over λ = ±1.
+        """
+        np.testing.assert_allclose(
+            self.cross_section_unpolarized,
+            0.5 * (self.cross_section_plus + self.cross_section_minus),
+            rtol = 1e-5,
+            atol = 1e-6 * np.abs(self.cross_section_unpolarized).max())
+
+    def test_helicity_difference(self):
+        """
+        ## Description:
+        `compute_helicity_difference` is σ(λ = +1) - σ(λ = -1).
+        """
+        # (X): Keep a reference to the layer --- its `tf.function`s only hold a weak one:
+        cross_section_layer = CrossSectionLayer()
+        helicity_difference = cross_section_layer.compute_helicity_difference([self.kinematics, self.cffs]).numpy()
+
+        np.testing.assert_allclose(
+            helicity_difference,
+            self.cross_section_plus - self.cross_section_minus,
+            rtol = 1e-4,
+            atol = 1e-5 * np.abs(helicity_difference).max())
+
+    def test_helicity_odd_part_vanishes_at_zero_and_pi(self):
+        """
+        ## Description:
+        The helicity-odd part is a sum of sin(n(π - φ)), so it vanishes at φ = 0 and φ = 180.
+        """
+        helicity_difference = self.cross_section_plus - self.cross_section_minus
+        scale = np.abs(helicity_difference).max()
+
+        self.assertLess(abs(helicity_difference[0]), 1e-4 * scale)
+        self.assertLess(abs(helicity_difference[180]), 1e-4 * scale)
+
+if __name__ == "__main__":
+    unittest.main()
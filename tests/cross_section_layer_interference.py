@@ -0,0 +1,100 @@
+"""
+Testing which CFF each of the eight outputs of the DNN is in the interference
+term of the CrossSectionLayer, against the curly C's of the bkm10 library.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# 3rd Party Library | bkm10:
+from bkm10_lib import BKMFormalism, CFFInputs, BKM10Inputs
+
+# models > architecture
+from models.architecture import CrossSectionLayer
+
+# models > cross_section_formulas
+from models.cross_section_formulas import _INTERFERENCE_WEIGHT_FIELDS, _KINEMATIC_BUNDLE_FIELDS
+
+# (X): A few kinematic settings [Q², x_B, t, k] from JLab to HERMES:
+_TEST_KINEMATIC_SETTINGS = [
+    (1.82, 0.343, -0.172, 5.75),
+    (2.50, 0.250, -0.300, 10.6),
+    (1.10, 0.150, -0.120, 5.50),
+]
+
+# (X): [H, E, Ht, Et], with E and Ht far apart, so that mixing them up shows:
+_TEST_CFFS = [-0.897, 2.421, 2.444, -1.300, -1.131, 0.347, 4.000, 0.700]
+
+def _bkm10_curly_cs(q_squared, x_bjorken, t, k, cffs, using_ww):
+    """
+    ## Description:
+    The six curly C's of the unpolarized interference --- C, C^V, C^A, and then
+    the same with the effective CFFs --- from the bkm10 library, with the CFFs
+    read as [H, E, Ht, Et].
+    """
+    formalism = BKMFormalism(
+        inputs = BKM10Inputs(
+            squared_Q_momentum_transfer = q_squared,
+            x_Bjorken = x_bjorken,
+            squared_hadronic_momentum_transfer_t = t,
+            lab_kinematics_k = k),
+        cff_values = CFFInputs(
+            compton_form_factor_h = complex(cffs[0], cffs[1]),
+            compton_form_factor_e = complex(cffs[2], cffs[3]),
+            compton_form_factor_h_tilde = complex(cffs[4], cffs[5]),
+            compton_form_factor_e_tilde = complex(cffs[6], cffs[7])),
+        lepton_polarization = 0.0,
+        target_polarization = 0.0,
+        using_ww = using_ww)
+
+    return np.array([
+        curly_c(effective_cffs = effective_cffs)
+        for effective_cffs in (False, True)
+        for curly_c in (
+            formalism.calculate_curly_c_unpolarized_interference,
+            formalism.calculate_curly_c_unpolarized_v,
+            formalism.calculate_curly_c_unpolarized_a)])
+
+class TestInterference(unittest.TestCase):
+
+    def test_cff_order(self):
+        """
+        ## Description:
+        The interference of the layer is its own harmonic weights contracted
+        against bkm10's curly C's of the *same* CFFs [H, E, Ht, Et] that the
+        |DVCS|² term reads.
+        """
+        phi_values = np.linspace(0., 360., 25)
+
+        for using_ww in (True, False):
+            layer = CrossSectionLayer(precision = "float64", autocast = False, using_ww = using_ww)
+
+            for q_squared, x_bjorken, t, k in _TEST_KINEMATIC_SETTINGS:
+                kinematics = np.column_stack([
+                    np.full_like(phi_values, q_squared),
+                    np.full_like(phi_values, x_bjorken),
+                    np.full_like(phi_values, t),
+                    np.full_like(phi_values, k),
+                    phi_values])
+                kinematic_bundle = layer.precompute_kinematic_bundle(tf.constant(kinematics))
+                interference_even, interference_odd = layer.compute_interference_from_bundle(
+                    kinematic_bundle,
+                    tf.constant(np.tile(_TEST_CFFS, (phi_values.shape[0], 1))))
+
+                # (1): The weights of the curly C's, as the layer has them:
+                harmonic_weights = np.stack([
+                    kinematic_bundle.numpy()[:, _KINEMATIC_BUNDLE_FIELDS.index(field)]
+                    for field in _INTERFERENCE_WEIGHT_FIELDS], axis = -1)
+                curly_cs = _bkm10_curly_cs(q_squared, x_bjorken, t, k, _TEST_CFFS, using_ww)
+
+                np.testing.assert_allclose(interference_even.numpy(), harmonic_weights[:, :6] @ curly_cs.real, rtol = 1e-10)
+                np.testing.assert_allclose(interference_odd.numpy(), harmonic_weights[:, 6:] @ curly_cs.imag, rtol = 1e-10)
+
+if __name__ == "__main__":
+    unittest.main()
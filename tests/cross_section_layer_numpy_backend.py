@@ -0,0 +1,140 @@
+"""
+Testing that the NumPy backend of the CrossSectionLayer agrees with the TensorFlow one.
+"""
+
+# Native Library | ast
+import ast
+
+# Native Library | os
+import os
+
+# Native Library | subprocess
+import subprocess
+
+# Native Library | sys
+import sys
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | Pandas:
+import pandas as pd
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# models > architecture > CrossSectionLayer
+from models.architecture import CrossSectionLayer
+
+# models > cross_section_formulas
+import models.cross_section_formulas as cross_section_formulas
+
+# models > numpy_backend
+from models.numpy_backend import NumPyCrossSectionLayer, get_cross_section_layer, _NumPyOperations
+
+class TestNumPyBackend(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        dataframe = pd.read_csv('data/kinematic_set_1.csv')
+        cls.kinematics = dataframe[['q_squared', 'x_b', 't', 'k', 'phi']].to_numpy(dtype = np.float64)
+        cls.cffs = np.random.default_rng(42).uniform(-3., 3., size = (cls.kinematics.shape[0], 8))
+        cls.layer_input = np.concatenate([cls.kinematics, cls.cffs], axis = 1)
+
+    def test_cross_section_parity(self):
+        """
+        ## Description:
+        Same formulas, same numbers: to rounding in float64, and to float32
+        reassociation otherwise.
+        """
+        for precision, tolerance in (("float64", 1e-12), ("float32", 1e-5), ("mixed", 1e-5)):
+            for lepton_beam_polarization in (0.0, 1.0, -1.0):
+                for using_ww in (True, False):
+                    layer_settings = {
+                        "precision": precision,
+                        "lepton_beam_polarization": lepton_beam_polarization,
+                        "using_ww": using_ww,
+                    }
+                    input_dtype = np.float64 if precision == "float64" else np.float32
+
+                    cross_section_tensorflow = CrossSectionLayer(autocast = False, **layer_settings)(
+                        tf.constant(self.layer_input.astype(input_dtype))).numpy()
+                    cross_section_numpy = NumPyCrossSectionLayer(**layer_settings)(self.layer_input.astype(input_dtype))
+
+                    self.assertIsInstance(cross_section_numpy, np.ndarray)
+                    self.assertEqual(cross_section_numpy.dtype, input_dtype)
+                    np.testing.assert_allclose(cross_section_numpy, cross_section_tensorflow, rtol = tolerance)
+
+    def test_precomputation_parity(self):
+        """
+        ## Description:
+        The design matrix and the Fourier harmonics come out the same, too.
+        """
+        numpy_layer = NumPyCrossSectionLayer(precision = "float64")
+        tensorflow_layer = CrossSectionLayer(precision = "float64", autocast = False)
+
+        np.testing.assert_allclose(
+            numpy_layer.precompute_design_matrix(self.kinematics),
+            tensorflow_layer.precompute_design_matrix(tf.constant(self.kinematics)).numpy(),
+            rtol = 1e-12,
+            atol = 1e-15)
+
+        np.testing.assert_allclose(
+            numpy_layer.compute_fourier_harmonics(self.kinematics[:3, :4]),
+            tensorflow_layer.compute_fourier_harmonics(tf.constant(self.kinematics[:3, :4])).numpy(),
+            rtol = 1e-10,
+            atol = 1e-15)
+
+    def test_numpy_namespace_is_complete(self):
+        """
+        ## Description:
+        Every `self.xp` operation of the formulas has a NumPy version --- otherwise the
+        NumPy backend would only find out on the first call that takes that path.
+        """
+        with open(cross_section_formulas.__file__, "r", encoding = "utf-8") as formulas_file:
+            formulas_module = ast.parse(formulas_file.read())
+
+        operation_names = {
+            node.attr for node in ast.walk(formulas_module)
+            if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Attribute) and node.value.attr == "xp"}
+
+        self.assertIn("sqrt", operation_names)
+        self.assertEqual([name for name in sorted(operation_names) if not hasattr(_NumPyOperations, name)], [])
+
+    def test_backend_switch(self):
+        self.assertIsInstance(get_cross_section_layer("numpy"), NumPyCrossSectionLayer)
+        self.assertIsInstance(get_cross_section_layer("tensorflow"), CrossSectionLayer)
+
+        with self.assertRaises(ValueError):
+            get_cross_section_layer("jax")
+
+        with self.assertRaises(ValueError):
+            get_cross_section_layer("numpy", jit_compile = True)
+
+    def test_does_not_import_tensorflow(self):
+        """
+        ## Description:
+        The whole point: scoring a cross-section with NumPy never imports TensorFlow.
+        """
+        repository_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = (
+            "import sys\n"
+            "from models.numpy_backend import get_cross_section_layer\n"
+            "get_cross_section_layer('numpy')([[1.82, 0.343, -0.172, 5.75, 45.] + [1.] * 8])\n"
+            "print('tensorflow' in sys.modules)\n")
+
+        completed_process = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd = repository_root,
+            env = dict(os.environ, PYTHONPATH = repository_root),
+            capture_output = True,
+            text = True,
+            check = True)
+
+        self.assertEqual(completed_process.stdout.strip(), "False")
+
+if __name__ == "__main__":
+    unittest.main()
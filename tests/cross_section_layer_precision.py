@@ -0,0 +1,83 @@
+"""
+Testing the floating-point policies ("float32", "float64", "mixed") of the CrossSectionLayer.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | Pandas:
+import pandas as pd
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# models > architecture > CrossSectionLayer
+from models.architecture import CrossSectionLayer
+
+# (X): The KM15 CFFs at (Q², x_B, t) = (1.82, 0.343, -0.172):
+_TEST_CFFS = [-0.897, 2.421, 2.444, 0.0, 1.131, 1.047, 4.000, 0.0]
+
+class TestCrossSectionLayerPrecision(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        dataframe = pd.read_csv('data/kinematic_set_1.csv')
+        kinematics = dataframe[['q_squared', 'x_b', 't', 'k', 'phi']].to_numpy(dtype = np.float32)
+        cffs = np.tile(np.array(_TEST_CFFS, dtype = np.float32), (kinematics.shape[0], 1))
+        cls.layer_input = np.concatenate([kinematics, cffs], axis = 1)
+
+        # (X): The reference is evaluated entirely in float64, on the very same (float32) numbers:
+        cls.cross_sections_float64 = {
+            lepton_beam_polarization: CrossSectionLayer(
+                lepton_beam_polarization = lepton_beam_polarization,
+                precision = "float64",
+                autocast = False)(tf.constant(cls.layer_input, dtype = tf.float64)).numpy()
+            for lepton_beam_polarization in (0.0, 1.0)
+        }
+
+    def _relative_error(self, precision: str, lepton_beam_polarization: float) -> float:
+        cross_section = CrossSectionLayer(
+            lepton_beam_polarization = lepton_beam_polarization,
+            precision = precision)(tf.constant(self.layer_input)).numpy()
+
+        # (X): Whatever the policy, a float32 network gets float32 back:
+        self.assertEqual(cross_section.dtype, np.float32)
+
+        reference = self.cross_sections_float64[lepton_beam_polarization]
+        return np.max(np.abs(cross_section - reference) / np.abs(reference))
+
+    def test_float64_policy(self):
+        """
+        ## Description:
+        Computing in float64 leaves only the final rounding to float32.
+        """
+        for lepton_beam_polarization in (0.0, 1.0):
+            self.assertLess(self._relative_error("float64", lepton_beam_polarization), 1e-6)
+
+    def test_mixed_policy_beats_float32(self):
+        """
+        ## Description:
+        Moving t_min and K̃ to float64 takes the error on this data from about
+        1.5e-6 to below 1e-6 --- less than 60% of the float32 error --- so the
+        float64 path is actually taken.
+        """
+        for lepton_beam_polarization in (0.0, 1.0):
+            mixed_error = self._relative_error("mixed", lepton_beam_polarization)
+
+            self.assertLess(mixed_error, 1e-6)
+            self.assertLess(mixed_error, 0.6 * self._relative_error("float32", lepton_beam_polarization))
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            CrossSectionLayer(precision = "float16")
+
+    def test_config_round_trip(self):
+        layer = CrossSectionLayer.from_config(CrossSectionLayer(precision = "mixed").get_config())
+        self.assertEqual(layer.precision, "mixed")
+        self.assertEqual(layer.kernel_dtype, tf.float32)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Testing that the CrossSectionLayer does not retrace for every new batch size.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# models > architecture
+from models.architecture import CrossSectionLayer, build_simultaneous_model, precompute_design_matrix
+
+def _random_kinematics(number_of_points, seed = 0):
+    """
+    ## Description:
+    [Q², x_B, t, k, φ] around a JLab kinematic setting.
+    """
+    rng = np.random.default_rng(seed)
+
+    return np.column_stack([
+        rng.uniform(1.5, 2.0, number_of_points),
+        rng.uniform(0.30, 0.35, number_of_points),
+        rng.uniform(-0.30, -0.15, number_of_points),
+        np.full(number_of_points, 5.75),
+        rng.uniform(0., 360., number_of_points)]).astype(np.float32)
+
+class TestTracing(unittest.TestCase):
+
+    def test_batch_sizes(self):
+        """
+        ## Description:
+        After the first two batch sizes, the shape is relaxed and nothing retraces.
+        """
+        layer = CrossSectionLayer()
+        self.assertEqual(layer.get_tracing_counts(), {})
+
+        for number_of_points in (16, 7, 33, 500, 16, 9):
+            layer(tf.constant(np.concatenate([_random_kinematics(number_of_points), np.ones((number_of_points, 8), np.float32)], axis = 1)))
+
+        tracing_counts = layer.get_tracing_counts()
+        self.assertLessEqual(tracing_counts["compute_cross_section"], 2)
+        self.assertLessEqual(max(tracing_counts.values()), 2)
+
+    def test_phi_grid(self):
+        layer = CrossSectionLayer()
+        kinematics = tf.constant(_random_kinematics(2)[:, :4])
+
+        for number_of_angles in (500, 361, 100, 500):
+            layer.compute_cross_section_on_phi_grid(kinematics, tf.ones((2, 8)), tf.linspace(0., 360., number_of_angles))
+
+        self.assertLessEqual(layer.get_tracing_counts()["compute_cross_section_on_phi_grid"], 2)
+
+    def test_fit_and_predict(self):
+        """
+        ## Description:
+        A replica --- `fit` with a smaller last batch, then `predict` on a dense φ
+        grid --- traces the cross-section once.
+        """
+        kinematics = _random_kinematics(37)
+        model = build_simultaneous_model(use_design_matrix = True)
+        model.fit([kinematics, precompute_design_matrix(kinematics)], np.ones(37), batch_size = 16, epochs = 2, verbose = 0)
+
+        dense_kinematics = np.repeat(kinematics[:1], 500, axis = 0)
+        dense_kinematics[:, 4] = np.linspace(0., 360., 500)
+        model.predict([dense_kinematics, precompute_design_matrix(dense_kinematics)], verbose = 0)
+
+        layer = next(layer for layer in model.layers if isinstance(layer, CrossSectionLayer))
+        self.assertEqual(layer.get_tracing_counts()["compute_cross_section"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Testing that the XLA-compiled CrossSectionLayer agrees with the standard one.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | Pandas:
+import pandas as pd
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# models > architecture > CrossSectionLayer
+from models.architecture import CrossSectionLayer
+
+# (X): The KM15 CFFs at (Q², x_B, t) = (1.82, 0.343, -0.172):
+_TEST_CFFS = [-0.897, 2.421, 2.444, 0.0, 1.131, 1.047, 4.000, 0.0]
+
+def _make_layer_input(kinematics: np.ndarray) -> tf.Tensor:
+    """
+    ## Description:
+    Glue the same set of CFFs onto every row of `kinematics`.
+    """
+    cffs = np.tile(np.array(_TEST_CFFS, dtype = np.float32), (kinematics.shape[0], 1))
+    return tf.constant(np.concatenate([kinematics.astype(np.float32), cffs], axis = 1))
+
+class TestCrossSectionLayerXLA(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.standard_layer = CrossSectionLayer()
+        cls.xla_layer = CrossSectionLayer(jit_compile = True)
+
+    def test_phi_scan_parity(self):
+        """
+        ## Description:
+        The 361-point φ scan at one kinematic setting must agree.
+        """
+        phi_values = np.linspace(0., 360., 361)
+        kinematics = np.column_stack([
+            np.full_like(phi_values, 1.82),
+            np.full_like(phi_values, 0.343),
+            np.full_like(phi_values, -0.172),
+            np.full_like(phi_values, 5.75),
+            phi_values])
+        layer_input = _make_layer_input(kinematics)
+
+        np.testing.assert_allclose(
+            self.xla_layer(layer_input).numpy(),
+            self.standard_layer(layer_input).numpy(),
+            rtol = 1e-5,
+            atol = 1e-7)
+
+    def test_kinematic_set_parity(self):
+        """
+        ## Description:
+        Every row of `kinematic_set_1.csv` must agree.
+        """
+        dataframe = pd.read_csv('data/kinematic_set_1.csv')
+        kinematics = dataframe[['q_squared', 'x_b', 't', 'k', 'phi']].to_numpy()
+        layer_input = _make_layer_input(kinematics)
+
+        np.testing.assert_allclose(
+            self.xla_layer(layer_input).numpy(),
+            self.standard_layer(layer_input).numpy(),
+            rtol = 1e-5,
+            atol = 1e-7)
+
+    def test_cff_gradient_parity(self):
+        """
+        ## Description:
+        The gradients with respect to the CFFs --- what the optimizer actually
+        sees --- must agree too.
+        """
+        dataframe = pd.read_csv('data/kinematic_set_1.csv')
+        kinematics = dataframe[['q_squared', 'x_b', 't', 'k', 'phi']].to_numpy()
+        layer_input = _make_layer_input(kinematics)
+
+        gradients = []
+        for layer in (self.standard_layer, self.xla_layer):
+            with tf.GradientTape() as tape:
+                tape.watch(layer_input)
+                cross_section = tf.reduce_sum(layer(layer_input))
+            gradients.append(tape.gradient(cross_section, layer_input)[:, 5:].numpy())
+
+        np.testing.assert_allclose(gradients[1], gradients[0], rtol = 1e-4, atol = 1e-6)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Testing the KM15 lookup table.
+"""
+
+# Native Library | os
+import os
+
+# Native Library | tempfile
+import tempfile
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# utilities > km15
+from utilities.km15 import compute_km15_cffs_vectorized
+
+# utilities > km15_grid
+from utilities.km15_grid import load_km15_grid
+
+# (X): A small grid, so that the tests are quick:
+_TEST_GRID_SETTINGS = {
+    "x_bjorken_range": (1e-3, 0.7),
+    "t_range": (-1.5, 0.0),
+    "number_of_x_bjorken_nodes": 96,
+    "number_of_t_nodes": 48,
+    "tolerance": 1e-3,
+}
+
+class TestKM15Grid(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.grid_directory = os.path.join(self.temporary_directory.name, "km15_grid")
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_error_bound(self):
+        """
+        ## Description:
+        At random points, the interpolation is as good as the error bound says.
+        """
+        km15_grid = load_km15_grid(self.grid_directory, **_TEST_GRID_SETTINGS)
+        self.assertIsInstance(km15_grid.values, np.memmap)
+        self.assertTrue(np.all(km15_grid.error_bound <= _TEST_GRID_SETTINGS["tolerance"]))
+
+        rng = np.random.default_rng(42)
+        x_bjorken = np.exp(rng.uniform(np.log(1e-3), np.log(0.7), 2000))
+        t = rng.uniform(-1.5, 0.0, 2000)
+
+        interpolated_cffs = np.array(km15_grid(1., x_bjorken, t))
+        exact_cffs = np.array(compute_km15_cffs_vectorized(1., x_bjorken, t))
+
+        relative_error = np.max(np.abs(interpolated_cffs - exact_cffs) / (1. + np.abs(exact_cffs)), axis = 1)
+        self.assertTrue(np.all(relative_error <= 2. * km15_grid.error_bound), msg = f"{relative_error} vs. {km15_grid.error_bound}")
+
+    def test_outside_of_grid(self):
+        """
+        ## Description:
+        Points the table does not cover are computed exactly.
+        """
+        km15_grid = load_km15_grid(self.grid_directory, **_TEST_GRID_SETTINGS)
+
+        np.testing.assert_allclose(
+            np.array(km15_grid(1., [1e-4, 0.8], [-0.3, -2.0])),
+            np.array(compute_km15_cffs_vectorized(1., [1e-4, 0.8], [-0.3, -2.0])))
+
+    def test_rebuild(self):
+        """
+        ## Description:
+        The table is reused as long as nothing changed, and rebuilt otherwise.
+        """
+        load_km15_grid(self.grid_directory, **_TEST_GRID_SETTINGS)
+        values_path = os.path.join(self.grid_directory, "km15_grid.npy")
+
+        # (1): Same settings, same table:
+        os.utime(values_path, ns = (0, 0))
+        load_km15_grid(self.grid_directory, **_TEST_GRID_SETTINGS)
+        self.assertEqual(os.stat(values_path).st_mtime_ns, 0)
+
+        # (2): Other settings, new table:
+        km15_grid = load_km15_grid(self.grid_directory, **{**_TEST_GRID_SETTINGS, "number_of_t_nodes": 64})
+        self.assertNotEqual(os.stat(values_path).st_mtime_ns, 0)
+        self.assertEqual(km15_grid.values.shape[2], 64)
+
+if __name__ == "__main__":
+    unittest.main()
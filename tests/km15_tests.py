@@ -8,8 +8,11 @@ import unittest
 # 3rd Party Library | NumPy:
 import numpy as np
 
+# 3rd Party Library | Pandas:
+import pandas as pd
+
 # utilities > km15
-from utilities.km15 import compute_km15_cffs
+from utilities.km15 import compute_km15_cffs, compute_km15_cffs_vectorized
 
 class TestKM15CFFs(unittest.TestCase):
 
@@ -23,6 +26,33 @@ class TestKM15CFFs(unittest.TestCase):
         for value in result:
             print(value)
 
+    def test_vectorized_agrees_with_quad(self):
+        """
+        ## Description:
+        The fixed-node dispersion integrals reproduce `quad` for every kinematic
+        set in `revised_data.csv`.
+        """
+        kinematic_sets = pd.read_csv('data/revised_data.csv').drop_duplicates('set')
+        q_squared, x_bjorken, t = (kinematic_sets[column].to_numpy() for column in ('q_squared', 'x_b', 't'))
+
+        vectorized_cffs = np.array(compute_km15_cffs_vectorized(q_squared, x_bjorken, t))
+        quad_cffs = np.array([compute_km15_cffs(*kinematics) for kinematics in zip(q_squared, x_bjorken, t)]).T
+
+        self.assertEqual(vectorized_cffs.shape, (6, len(kinematic_sets)))
+        np.testing.assert_allclose(vectorized_cffs, quad_cffs, rtol = 1e-8)
+
+    def test_vectorized_agrees_with_quad_at_small_x(self):
+        """
+        ## Description:
+        Down at HERA kinematics, the dispersion integrals are dominated by x ~ ξ.
+        """
+        x_bjorken, t = (np.ravel(grid) for grid in np.meshgrid([1e-4, 1e-3, 1e-2, 0.7], [-0.05, -0.3, -1.0]))
+
+        vectorized_cffs = np.array(compute_km15_cffs_vectorized(np.ones_like(t), x_bjorken, t))
+        quad_cffs = np.array([compute_km15_cffs(1., *kinematics) for kinematics in zip(x_bjorken, t)]).T
+
+        np.testing.assert_allclose(vectorized_cffs, quad_cffs, rtol = 1e-8)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,80 @@
+"""
+Testing the TensorFlow version of KM15.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | Pandas:
+import pandas as pd
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+# models > architecture > build_simultaneous_model
+from models.architecture import build_simultaneous_model
+
+# models > km15
+from models.km15 import KM15PriorLayer, compute_km15_cffs_tf
+
+# utilities > km15
+from utilities.km15 import compute_km15_cffs_vectorized
+
+class TestKM15TensorFlow(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        x_bjorken, t = (np.ravel(grid) for grid in np.meshgrid([1e-4, 1e-3, 0.1, 0.343, 0.7], [-0.05, -0.172, -1.0]))
+        cls.kinematics = np.column_stack([np.full_like(t, 1.82), x_bjorken, t, np.full_like(t, 5.75), np.full_like(t, 45.)])
+
+    def test_agrees_with_numpy(self):
+        """
+        ## Description:
+        Same formulas and same nodes as the NumPy version, in the order of the network.
+        """
+        km15_cffs = compute_km15_cffs_tf(tf.constant(self.kinematics)).numpy()
+        real_h, imag_h, real_e, real_ht, imag_ht, real_et = compute_km15_cffs_vectorized(*self.kinematics[:, :3].T)
+
+        np.testing.assert_allclose(
+            km15_cffs,
+            np.column_stack([real_h, imag_h, real_e, np.zeros_like(real_h), real_ht, imag_ht, real_et, np.zeros_like(real_h)]),
+            rtol = 1e-12)
+
+        self.assertEqual(compute_km15_cffs_tf(tf.constant(self.kinematics, dtype = tf.float32)).dtype, tf.float32)
+
+    def test_differentiable(self):
+        kinematics = tf.Variable(self.kinematics)
+
+        with tf.GradientTape() as tape:
+            km15_cffs = compute_km15_cffs_tf(kinematics)
+
+        self.assertTrue(np.all(np.isfinite(tape.gradient(km15_cffs, kinematics).numpy())))
+
+    def test_prior(self):
+        """
+        ## Description:
+        The prior layer passes the CFFs through and adds a loss that vanishes at KM15.
+        """
+        kinematics = tf.constant(self.kinematics, dtype = tf.float32)
+        km15_cffs = compute_km15_cffs_tf(kinematics)
+
+        prior_layer = KM15PriorLayer(prior_weight = 2.)
+        self.assertIs(prior_layer([kinematics, km15_cffs]), km15_cffs)
+        self.assertAlmostEqual(float(prior_layer.losses[0]), 0.)
+
+        prior_layer([kinematics, km15_cffs + 1.])
+        self.assertAlmostEqual(float(prior_layer.losses[0]), 2., places = 5)
+
+    def test_model_with_prior(self):
+        model = build_simultaneous_model(km15_prior_weight = 0.1)
+        kinematics = pd.read_csv('data/kinematic_set_1.csv')[['q_squared', 'x_b', 't', 'k', 'phi']].to_numpy(dtype = np.float32)
+        history = model.fit(kinematics, np.ones(kinematics.shape[0], dtype = np.float32), epochs = 1, verbose = 0)
+
+        self.assertTrue(np.isfinite(history.history["loss"][0]))
+        self.assertEqual(len(model.losses), 1)
+
+if __name__ == "__main__":
+    unittest.main()
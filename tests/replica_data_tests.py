@@ -0,0 +1,140 @@
+"""
+Testing that the pseudodata of all replicas, drawn at once, is the pseudodata that
+`generate_replica_data` draws one replica at a time --- and that it is reproducible.
+"""
+
+# Native Library | io
+import io
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | Pandas:
+import pandas as pd
+
+# scripts > replica_data
+from scripts.replica_data import ReplicaPseudodata, build_observable_covariance, generate_replica_data, generate_replica_pseudodata
+
+_NUMBER_OF_REPLICAS = 4000
+
+class TestReplicaPseudodata(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dataframe = pd.DataFrame({
+            "phi": np.linspace(0., 360., 12),
+            "ALU": np.linspace(0.01, 0.03, 12),
+            "ALU_stat_plus": np.full(12, 0.001),
+            "ALU_sys_plus": np.linspace(0.001, 0.002, 12),
+            "link": ["https://arxiv.org"] * 12})
+
+    def test_shape_and_statistics(self):
+        """
+        ## Description:
+        Every replica gets its own draw, with the central values and the covariance
+        of the data: the statistical and the systematic uncertainties add up, and the
+        systematic ones are correlated.
+        """
+        replica_pseudodata = generate_replica_pseudodata(self.dataframe, _NUMBER_OF_REPLICAS, run_seed = 7)
+        asymmetries = replica_pseudodata.get_column_for_all_replicas("ALU")
+
+        self.assertEqual(asymmetries.shape, (_NUMBER_OF_REPLICAS, 12))
+        self.assertEqual(replica_pseudodata.observable_names, ["ALU"])
+
+        expected_widths = np.hypot(self.dataframe["ALU_stat_plus"], self.dataframe["ALU_sys_plus"])
+        expected_covariance = np.outer(self.dataframe["ALU_sys_plus"], self.dataframe["ALU_sys_plus"]) + np.diag(self.dataframe["ALU_stat_plus"]**2)
+
+        np.testing.assert_allclose(asymmetries.mean(axis = 0), self.dataframe["ALU"], atol = 2e-4)
+        np.testing.assert_allclose(asymmetries.std(axis = 0), expected_widths, rtol = 0.1)
+        np.testing.assert_allclose(np.cov(asymmetries, rowvar = False), expected_covariance, atol = 3e-7)
+
+        # (X): Columns that are not resampled are the data, for every replica:
+        np.testing.assert_array_equal(replica_pseudodata.get_column_for_all_replicas("phi")[-1], self.dataframe["phi"])
+
+    def test_covariance(self):
+        """
+        ## Description:
+        Asymmetric uncertainties (of either sign) shift the central values, unmeasured
+        points are left out, and experiments are not correlated with each other.
+        """
+        dataframe = pd.DataFrame({
+            "BSA": [0.2, np.nan, 0.3, 0.4],
+            "BSA_stat_plus": [0.02, np.nan, 0.02, 0.02],
+            "BSA_stat_minus": [-0.04, np.nan, 0.02, 0.02],
+            "BSA_sys_plus": [0.01, np.nan, 0.01, 0.01],
+            "link": ["https://doi.org/1", None, "https://doi.org/2", None]})
+
+        measured_rows, central_values, covariance = build_observable_covariance(dataframe, "BSA", normalization_uncertainty = 0.1)
+
+        np.testing.assert_array_equal(measured_rows, [0, 2, 3])
+        np.testing.assert_allclose(central_values, [0.19, 0.3, 0.4])
+        np.testing.assert_allclose(np.diag(covariance), [0.03**2 + 0.01**2 + 0.019**2, 0.02**2 + 0.01**2 + 0.03**2, 0.02**2 + 0.01**2 + 0.04**2])
+        np.testing.assert_allclose(covariance[1, 2], 0.01**2 + 0.1**2 * 0.3 * 0.4)
+        self.assertEqual(covariance[0, 1], 0.)
+
+        # (X): The pseudodata stays NaN where there is no data:
+        pseudodata = generate_replica_pseudodata(dataframe, 2).get_column_for_all_replicas("BSA")
+
+        self.assertTrue(np.all(np.isnan(pseudodata[:, 1])))
+        self.assertTrue(np.all(np.isfinite(pseudodata[:, [0, 2, 3]])))
+
+    def test_replica_dataframe(self):
+        """
+        ## Description:
+        A replica's DF has the same (numerical) columns as `generate_replica_data` gives.
+        """
+        replica_pseudodata = generate_replica_pseudodata(self.dataframe, 3)
+        replica_dataframe = replica_pseudodata.get_replica_dataframe(1)
+
+        self.assertEqual(list(replica_dataframe.columns), [column for column in generate_replica_data(self.dataframe).columns if column != "link"])
+        np.testing.assert_array_equal(replica_dataframe["ALU"], replica_pseudodata.pseudodata[0, 1])
+        np.testing.assert_array_equal(replica_dataframe["ALU_stat_plus"], self.dataframe["ALU_stat_plus"])
+
+    def test_save_and_load(self):
+        replica_pseudodata = generate_replica_pseudodata(self.dataframe, 3)
+
+        npz_file = io.BytesIO()
+        replica_pseudodata.save(npz_file)
+        npz_file.seek(0)
+
+        loaded_replica_pseudodata = ReplicaPseudodata.load(npz_file)
+
+        self.assertEqual(loaded_replica_pseudodata.column_names, replica_pseudodata.column_names)
+        self.assertEqual(loaded_replica_pseudodata.number_of_replicas, 3)
+        self.assertEqual(loaded_replica_pseudodata.run_seed, replica_pseudodata.run_seed)
+        np.testing.assert_array_equal(loaded_replica_pseudodata.pseudodata, replica_pseudodata.pseudodata)
+
+    def test_replicas_are_reproducible(self):
+        """
+        ## Description:
+        With the same seed, replica r has the same pseudodata and split, no matter
+        how many replicas there are --- and different replicas are different.
+        """
+        few_replicas = generate_replica_pseudodata(self.dataframe, 3, run_seed = 1234)
+        many_replicas = generate_replica_pseudodata(self.dataframe, 10, run_seed = 1234)
+
+        np.testing.assert_array_equal(few_replicas.pseudodata, many_replicas.pseudodata[:, :3])
+        self.assertFalse(np.array_equal(many_replicas.pseudodata[0, 0], many_replicas.pseudodata[0, 1]))
+
+        for replica_index in (2, 0, 1):
+            np.testing.assert_array_equal(few_replicas.split_training_indices(replica_index, 0.2)[0], many_replicas.split_training_indices(replica_index, 0.2)[0])
+
+        # (X): ... and a different seed, or different data, gives different pseudodata:
+        self.assertFalse(np.array_equal(generate_replica_pseudodata(self.dataframe, 3, run_seed = 1235).pseudodata, few_replicas.pseudodata))
+        self.assertFalse(np.array_equal(generate_replica_pseudodata(self.dataframe.assign(phi = self.dataframe["phi"] + 1.), 3, run_seed = 1234).pseudodata, few_replicas.pseudodata))
+
+    def test_training_split(self):
+        """
+        ## Description:
+        The split has the sizes of `train_test_split`, and covers every point once.
+        """
+        training_indices, validation_indices = generate_replica_pseudodata(self.dataframe, 1).split_training_indices(0, 0.2)
+
+        self.assertEqual((len(training_indices), len(validation_indices)), (9, 3))
+        self.assertEqual(sorted(np.concatenate([training_indices, validation_indices])), list(range(12)))
+
+if __name__ == "__main__":
+    unittest.main()
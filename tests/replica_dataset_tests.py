@@ -0,0 +1,94 @@
+"""
+Testing the `tf.data` pipeline that the replicas share.
+"""
+
+# Native Library | unittest
+import unittest
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# utilities > replica_dataset
+from utilities.replica_dataset import ReplicaDatasets
+
+_NUMBER_OF_DATA_POINTS = 50
+
+class TestReplicaDatasets(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.kinematics = np.arange(_NUMBER_OF_DATA_POINTS * 5, dtype = np.float32).reshape(_NUMBER_OF_DATA_POINTS, 5)
+        cls.kinematic_bundle = -np.arange(_NUMBER_OF_DATA_POINTS * 3, dtype = np.float32).reshape(_NUMBER_OF_DATA_POINTS, 3)
+        cls.replica_cross_sections = np.stack([np.arange(_NUMBER_OF_DATA_POINTS), 100 + np.arange(_NUMBER_OF_DATA_POINTS)]).astype(np.float32)
+        cls.replica_datasets = ReplicaDatasets(cls.kinematics, cls.kinematic_bundle, cls.replica_cross_sections)
+
+    def _collect_rows(self, dataset):
+        """
+        ## Description:
+        Every (kinematics, bundle, target) of one pass over `dataset`, in order.
+        """
+        batches = [(kinematics.numpy(), kinematic_bundle.numpy(), targets.numpy()) for (kinematics, kinematic_bundle), targets in dataset]
+
+        return [np.concatenate(rows) for rows in zip(*batches)]
+
+    def test_rows_belong_together(self):
+        """
+        ## Description:
+        Every batch has the rows `row_indices` of the replica --- all of them, and nothing else.
+        """
+        row_indices = np.arange(0, _NUMBER_OF_DATA_POINTS, 3)
+        kinematics, kinematic_bundle, targets = self._collect_rows(self.replica_datasets.get_dataset(1, row_indices, batch_size = 4, shuffle_seed = 7))
+        rows = targets.astype(int) - 100
+
+        self.assertEqual(sorted(rows), list(row_indices))
+        np.testing.assert_array_equal(kinematics, self.kinematics[rows])
+        np.testing.assert_array_equal(kinematic_bundle, self.kinematic_bundle[rows])
+
+    def test_shuffle_is_reproducible(self):
+        """
+        ## Description:
+        The same seed gives the same order --- every epoch a different one --- and no seed keeps the order.
+        """
+        row_indices = np.arange(_NUMBER_OF_DATA_POINTS)
+        dataset = self.replica_datasets.get_dataset(0, row_indices, batch_size = 8, shuffle_seed = 7)
+
+        first_epoch, second_epoch = self._collect_rows(dataset)[2], self._collect_rows(dataset)[2]
+        self.assertFalse(np.array_equal(first_epoch, second_epoch))
+
+        np.testing.assert_array_equal(self._collect_rows(self.replica_datasets.get_dataset(0, row_indices, batch_size = 8, shuffle_seed = 7))[2], first_epoch)
+        np.testing.assert_array_equal(self._collect_rows(self.replica_datasets.get_dataset(0, row_indices, batch_size = 8))[2], row_indices)
+
+    def test_full_batch(self):
+        row_indices = np.array([5, 1, 7])
+        (kinematics, kinematic_bundle), targets = self.replica_datasets.get_full_batch(1, row_indices)
+
+        np.testing.assert_array_equal(kinematics.numpy(), self.kinematics[row_indices])
+        np.testing.assert_array_equal(kinematic_bundle.numpy(), self.kinematic_bundle[row_indices])
+        np.testing.assert_array_equal(targets.numpy(), self.replica_cross_sections[1, row_indices])
+
+    def test_beam_spin_asymmetry_targets(self):
+        """
+        ## Description:
+        With the BSA of every replica, the targets are (cross-section, BSA) of the same rows.
+        """
+        replica_beam_spin_asymmetries = -self.replica_cross_sections
+        replica_datasets = ReplicaDatasets(self.kinematics, self.kinematic_bundle, self.replica_cross_sections, replica_beam_spin_asymmetries)
+        row_indices = np.array([5, 1, 7])
+
+        _, (cross_sections, beam_spin_asymmetries) = replica_datasets.get_full_batch(1, row_indices)
+        np.testing.assert_array_equal(cross_sections.numpy(), self.replica_cross_sections[1, row_indices])
+        np.testing.assert_array_equal(beam_spin_asymmetries.numpy(), replica_beam_spin_asymmetries[1, row_indices])
+
+        for _, (cross_sections, beam_spin_asymmetries) in replica_datasets.get_dataset(0, row_indices, batch_size = 2, shuffle_seed = 7):
+            np.testing.assert_array_equal(beam_spin_asymmetries.numpy(), -cross_sections.numpy())
+
+    def test_ensemble_dataset(self):
+        replica_training_masks = np.zeros((_NUMBER_OF_DATA_POINTS, 2), dtype = np.float32)
+        replica_training_masks[::2, 0] = 1.
+
+        _, _, targets = self._collect_rows(self.replica_datasets.get_ensemble_dataset(replica_training_masks, batch_size = 16))
+
+        np.testing.assert_array_equal(targets, np.concatenate([self.replica_cross_sections.T, replica_training_masks], axis = 1))
+
+if __name__ == "__main__":
+    unittest.main()
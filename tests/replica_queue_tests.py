@@ -0,0 +1,237 @@
+"""
+Testing the file-based replica queue, with local processes standing in for the nodes of a cluster.
+"""
+
+# Native Library | multiprocessing
+import multiprocessing
+
+# Native Library | os
+import os
+
+# Native Library | tempfile
+import tempfile
+
+# Native Library | threading
+import threading
+
+# Native Library | time
+import time
+
+# Native Library | unittest
+import unittest
+
+# Native Library | unittest.mock
+from unittest import mock
+
+# utilities > replica_queue
+from utilities.replica_queue import ReplicaQueue, atomic_output_path, wait_for_other_workers, work_on_replica_queue
+
+_NUMBER_OF_REPLICAS = 24
+
+# (X): Short enough for a test --- a live worker renews its claim ten times as often:
+_STALE_CLAIM_TIMEOUT_IN_SECONDS = 1.
+
+def _write_replica_result(run_directory: str, replica_index: int):
+    """
+    ## Description:
+    A stand-in for training a replica: take a moment, and write a result.
+    """
+    time.sleep(0.01)
+
+    with atomic_output_path(os.path.join(run_directory, f"replica_{replica_index + 1}.txt")) as temporary_path:
+        with open(temporary_path, "w", encoding = "utf-8") as result_file:
+            result_file.write(str(os.getpid()))
+
+def _run_queue_worker(run_directory: str, stale_claim_timeout_in_seconds: float = _STALE_CLAIM_TIMEOUT_IN_SECONDS):
+    """
+    ## Description:
+    One "node": work on the queue, and try to merge at the end.
+    """
+    replica_queue = ReplicaQueue(run_directory, _NUMBER_OF_REPLICAS, "kinematic_set_1.csv")
+    trained_replica_indices = work_on_replica_queue(
+        replica_queue,
+        lambda replica_index: _write_replica_result(run_directory, replica_index),
+        stale_claim_timeout_in_seconds)
+
+    return trained_replica_indices, replica_queue.claim_merge()
+
+def _run_hanging_queue_worker(run_directory: str):
+    """
+    ## Description:
+    A "node" that claims the first replica and never finishes it --- until it is killed.
+    """
+    def hang(replica_index):
+        with open(os.path.join(run_directory, "hanging"), "w", encoding = "utf-8") as marker_file:
+            marker_file.write(str(replica_index))
+
+        time.sleep(3600.)
+
+    work_on_replica_queue(ReplicaQueue(run_directory, _NUMBER_OF_REPLICAS, "kinematic_set_1.csv"), hang, _STALE_CLAIM_TIMEOUT_IN_SECONDS)
+
+class TestReplicaQueue(unittest.TestCase):
+
+    def test_every_replica_is_trained_once(self):
+        """
+        ## Description:
+        Four processes share 24 replicas: each replica is trained by exactly one of
+        them, and exactly one of them merges.
+        """
+        with tempfile.TemporaryDirectory() as run_directory:
+            with multiprocessing.get_context("spawn").Pool(4) as worker_pool:
+                worker_results = worker_pool.map(_run_queue_worker, [run_directory] * 4)
+
+            trained_replica_indices = sorted(replica_index for indices, _ in worker_results for replica_index in indices)
+            self.assertEqual(trained_replica_indices, list(range(_NUMBER_OF_REPLICAS)))
+            self.assertEqual(sum(merged for _, merged in worker_results), 1)
+
+            # (X): Every result is there, and nothing was left half-written:
+            self.assertEqual(len([name for name in os.listdir(run_directory) if name.endswith(".txt")]), _NUMBER_OF_REPLICAS)
+            self.assertFalse([name for name in os.listdir(run_directory) if name.startswith(".")])
+            self.assertTrue(ReplicaQueue(run_directory, _NUMBER_OF_REPLICAS, "kinematic_set_1.csv").is_complete())
+
+    def test_replicas_of_killed_workers_are_trained_again(self):
+        """
+        ## Description:
+        A worker that is alive keeps its replica, however long it takes. Once it is
+        killed, its claim goes stale, the other workers train its replica, and the
+        merge still runs exactly once.
+        """
+        with tempfile.TemporaryDirectory() as run_directory:
+            spawn_context = multiprocessing.get_context("spawn")
+            hanging_worker = spawn_context.Process(target = _run_hanging_queue_worker, args = (run_directory, ))
+            hanging_worker.start()
+
+            while not os.path.exists(os.path.join(run_directory, "hanging")):
+                time.sleep(0.05)
+
+            # (1): Alive, with a heartbeat, for longer than the timeout --- so the claim is not stale:
+            replica_queue = ReplicaQueue(run_directory, _NUMBER_OF_REPLICAS, "kinematic_set_1.csv")
+            time.sleep(2. * _STALE_CLAIM_TIMEOUT_IN_SECONDS)
+            self.assertEqual(replica_queue.release_stale_claims(_STALE_CLAIM_TIMEOUT_IN_SECONDS), [])
+
+            # (2): Killed --- no chance to release anything:
+            hanging_worker.kill()
+            hanging_worker.join()
+            self.assertEqual(replica_queue.pending_replicas(), list(range(_NUMBER_OF_REPLICAS)))
+
+            time.sleep(1.5 * _STALE_CLAIM_TIMEOUT_IN_SECONDS)
+
+            with spawn_context.Pool(2) as worker_pool:
+                worker_results = worker_pool.map(_run_queue_worker, [run_directory] * 2)
+
+            trained_replica_indices = sorted(replica_index for indices, _ in worker_results for replica_index in indices)
+            self.assertEqual(trained_replica_indices, list(range(_NUMBER_OF_REPLICAS)))
+            self.assertEqual(sum(merged for _, merged in worker_results), 1)
+
+    def test_failed_replicas_go_back_to_the_queue(self):
+        with tempfile.TemporaryDirectory() as run_directory:
+            replica_queue = ReplicaQueue(run_directory, 3)
+
+            def fail_on_second_replica(replica_index):
+                if replica_index == 1:
+                    raise RuntimeError("NaN loss")
+
+            with self.assertRaises(RuntimeError):
+                work_on_replica_queue(replica_queue, fail_on_second_replica)
+
+            self.assertEqual(replica_queue.pending_replicas(), [1, 2])
+            self.assertFalse(replica_queue.claim_merge())
+
+            # (X): The next worker picks up where it failed:
+            self.assertEqual(work_on_replica_queue(replica_queue, lambda replica_index: None), [1, 2])
+            self.assertTrue(replica_queue.claim_merge())
+            self.assertFalse(replica_queue.claim_merge())
+
+    def test_stale_claims(self):
+        with tempfile.TemporaryDirectory() as run_directory:
+            replica_queue = ReplicaQueue(run_directory, 2)
+
+            self.assertTrue(replica_queue.claim(0))
+            self.assertFalse(replica_queue.claim(0))
+            self.assertEqual(replica_queue.release_stale_claims(maximum_age_in_seconds = 3600.), [])
+            self.assertEqual(replica_queue.release_stale_claims(maximum_age_in_seconds = -1.), [0])
+            self.assertEqual(replica_queue.claim_next(), 0)
+
+    def test_stale_claim_is_released_once(self):
+        """
+        ## Description:
+        Two workers release the same stale claim at the same time: only one of them
+        does, and a claim that was taken again in the meantime is left alone.
+        """
+        with tempfile.TemporaryDirectory() as run_directory:
+            replica_queues = [ReplicaQueue(run_directory, 1) for _ in range(2)]
+
+            # (1): Both see the stale claim, and both try to release it:
+            for _ in range(20):
+                self.assertTrue(replica_queues[0].claim(0))
+                os.utime(replica_queues[0]._claim_path(0), (0., 0.))
+
+                both_ready = threading.Barrier(2)
+                released_replica_indices = []
+
+                def release_stale_claims(replica_queue):
+                    both_ready.wait()
+                    released_replica_indices.extend(replica_queue.release_stale_claims(60.))
+
+                workers = [threading.Thread(target = release_stale_claims, args = (replica_queue, )) for replica_queue in replica_queues]
+
+                for worker in workers:
+                    worker.start()
+
+                for worker in workers:
+                    worker.join()
+
+                self.assertEqual(released_replica_indices, [0])
+
+            # (2): The second worker still thinks the claim is stale, but the first one has claimed the replica again:
+            self.assertTrue(replica_queues[0].claim(0))
+
+            with mock.patch("utilities.replica_queue.os.path.getmtime", return_value = 0.):
+                self.assertEqual(replica_queues[1].release_stale_claims(60.), [])
+
+            self.assertFalse(replica_queues[1].claim(0))
+            self.assertEqual(sorted(os.listdir(replica_queues[0].queue_directory)), ["manifest.json", "replica_1.claimed"])
+
+    def test_workers_wait_for_each_other(self):
+        """
+        ## Description:
+        A worker with nothing left to claim waits until the replicas of live
+        workers are done, and returns as soon as a replica is back in the queue.
+        """
+        with tempfile.TemporaryDirectory() as run_directory:
+            replica_queue = ReplicaQueue(run_directory, 2)
+            replica_queue.mark_done(1)
+
+            # (1): A live worker finishes its replica:
+            self.assertTrue(replica_queue.claim(0))
+            threading.Timer(0.5, replica_queue.mark_done, args = (0, )).start()
+
+            self.assertEqual(wait_for_other_workers(replica_queue, _STALE_CLAIM_TIMEOUT_IN_SECONDS), [])
+            self.assertTrue(replica_queue.is_complete())
+
+        with tempfile.TemporaryDirectory() as run_directory:
+            replica_queue = ReplicaQueue(run_directory, 2)
+
+            # (2): A worker gives its replica up:
+            self.assertTrue(replica_queue.claim(0))
+            replica_queue.release(0)
+            self.assertEqual(wait_for_other_workers(replica_queue, _STALE_CLAIM_TIMEOUT_IN_SECONDS), [])
+            self.assertEqual(replica_queue.unclaimed_replicas(), [0, 1])
+
+            # (3): A worker dies with its claim, which goes stale:
+            self.assertEqual([replica_queue.claim_next(), replica_queue.claim_next()], [0, 1])
+            replica_queue.mark_done(1)
+
+            self.assertEqual(wait_for_other_workers(replica_queue, _STALE_CLAIM_TIMEOUT_IN_SECONDS), [0])
+            self.assertEqual(replica_queue.claim_next(), 0)
+
+    def test_workers_have_to_agree_on_the_run(self):
+        with tempfile.TemporaryDirectory() as run_directory:
+            ReplicaQueue(run_directory, 10, "kinematic_set_1.csv")
+            ReplicaQueue(run_directory, 10, "kinematic_set_1.csv")
+
+            with self.assertRaises(ValueError):
+                ReplicaQueue(run_directory, 20, "kinematic_set_1.csv")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,6 +23,52 @@ Msea = sqrt(0.482)
 rpi = 2.646
 Mpi = 4.
 
+# (X): The lower limit of the dispersion integrals:
+_KM15_DISPERSION_INTEGRAL_LOWER_LIMIT = 1e-6
+
+# (X): The number of Gauss-Legendre nodes on *each* of the three panels of the vectorized
+# | dispersion integrals. With the subtraction below, 64 already agrees with `quad` to ~1e-10:
+_KM15_NUMBER_OF_QUADRATURE_NODES = 64
+
+# (X): The number of subintervals that `quad` may use. The default (50) is not enough at
+# | small x_B, where everything happens between ξ and a few ξ:
+_KM15_QUAD_SUBDIVISION_LIMIT = 200
+
+def _compute_km15_imag_h(x, t):
+    """
+    ## Description:
+    Im[H] of KM15 at momentum fraction x (valence + sea). Works on scalars
+    and (broadcastable) arrays alike.
+    """
+    alpha_val = 0.43 + 0.85 * t
+    alpha_sea = 1.13 + 0.15 * t
+
+    fHval = (nval * rval / (1 + x) *
+             ((2 * x) / (1 + x))**(-alpha_val) *
+             ((1 - x) / (1 + x))**bval /
+             (1 - ((1 - x) / (1 + x)) * (t / Mval**2))**pval)
+
+    fHsea = (nsea * rsea / (1 + x) *
+             ((2 * x) / (1 + x))**(-alpha_sea) *
+             ((1 - x) / (1 + x))**bsea /
+             (1 - ((1 - x) / (1 + x)) * (t / Msea**2))**psea)
+
+    return pi * ((8. / 9.) * fHval + (1. / 9.) * fHsea)
+
+def _compute_km15_imag_ht(x, t):
+    """
+    ## Description:
+    Im[Ht] of KM15 at momentum fraction x (valence only).
+    """
+    alpha_val = 0.43 + 0.85 * t
+
+    fHtval = (ntval * rtval / (1 + x) *
+              ((2 * x) / (1 + x))**(-alpha_val) *
+              ((1 - x) / (1 + x))**btval /
+              (1 - ((1 - x) / (1 + x)) * (t / Mtval**2)))
+
+    return pi * (8. / 9.) * fHtval
+
 def compute_km15_cffs(QQ, xB, t, k = 0.0):
     """
     ## Description:
@@ -35,48 +81,139 @@ def compute_km15_cffs(QQ, xB, t, k = 0.0):
     # (X): Calculate the skewnesss, xi:
     xi = xB / (2.0 - xB)
     
-    alpha_val = 0.43 + 0.85 * t
-    alpha_sea = 1.13 + 0.15 * t
     Ct = C0 / (1.0 - t / Msub**2)**2
 
-    def fHval(x):
-        return (nval * rval / (1 + x) *
-                ((2 * x) / (1 + x))**(-alpha_val) *
-                ((1 - x) / (1 + x))**bval /
-                (1 - ((1 - x) / (1 + x)) * (t / Mval**2))**pval)
+    def fPV_ReH(x):
+        return -2. * x / (x + xi) * _compute_km15_imag_h(x, t)
+
+    def fPV_ReHt(x):
+        return -2. * xi / (x + xi) * _compute_km15_imag_ht(x, t)
 
-    def fHsea(x):
-        return (nsea * rsea / (1 + x) *
-                ((2 * x) / (1 + x))**(-alpha_sea) *
-                ((1 - x) / (1 + x))**bsea /
-                (1 - ((1 - x) / (1 + x)) * (t / Msea**2))**psea)
+    DR_ReH, _ = quad(fPV_ReH, _KM15_DISPERSION_INTEGRAL_LOWER_LIMIT, 1.0, weight = 'cauchy', wvar = xi, limit = _KM15_QUAD_SUBDIVISION_LIMIT)
+    DR_ReHt, _ = quad(fPV_ReHt, _KM15_DISPERSION_INTEGRAL_LOWER_LIMIT, 1.0, weight = 'cauchy', wvar = xi, limit = _KM15_QUAD_SUBDIVISION_LIMIT)
 
-    def fHtval(x):
-        return (ntval * rtval / (1 + x) *
-                ((2 * x) / (1 + x))**(-alpha_val) *
-                ((1 - x) / (1 + x))**btval /
-                (1 - ((1 - x) / (1 + x)) * (t / Mtval**2)))
+    # (X): Re[H]:
+    real_h_km15 = DR_ReH / pi - Ct
+    
+    # (X): Im[H]:
+    imag_h_km15 = _compute_km15_imag_h(xi, t)
 
-    def fImH(x):
-        return pi * ((8. / 9.) * fHval(x) + (1. / 9.) * fHsea(x))
+    # (X): Re[E]:
+    real_e_km15 = Ct
 
-    def fImHt(x):
-        return pi * (8. / 9.) * fHtval(x)
+    # (X): Re[Ht]:
+    real_ht_km15 = DR_ReHt / pi
 
-    def fPV_ReH(x):
-        return -2. * x / (x + xi) * fImH(x)
+    # (X): Im[Ht]:
+    imag_ht_km15 = _compute_km15_imag_ht(xi, t)
 
-    def fPV_ReHt(x):
-        return -2. * xi / (x + xi) * fImHt(x)
+    # (X): Re[Et]:
+    real_et_km15 = rpi / xi * 2.164 / ((0.0196 - t) * (1.0 - t / Mpi**2)**2)
 
-    DR_ReH, _ = quad(fPV_ReH, 1e-6, 1.0, weight = 'cauchy', wvar = xi)
-    DR_ReHt, _ = quad(fPV_ReHt, 1e-6, 1.0, weight = 'cauchy', wvar = xi)
+    return real_h_km15, imag_h_km15, real_e_km15, real_ht_km15, imag_ht_km15, real_et_km15
+
+def _compute_principal_value_integral(numerator, xi, t):
+    """
+    ## Description:
+    PV ∫ numerator(x, t) / (x - ξ) dx from `_KM15_DISPERSION_INTEGRAL_LOWER_LIMIT`
+    to 1, for every (ξ, t) at once. We subtract the pole,
+
+        PV ∫ f(x) / (x - ξ) dx = ∫ (f(x) - f(ξ)) / (x - ξ) dx + f(ξ) ln((1 - ξ) / (ξ - x_min)),
+
+    so that what is left is smooth at x = ξ. Then we integrate it on three panels
+    with the same fixed Gauss-Legendre nodes, after substitutions that follow the
+    integrand: logarithmically-spaced x on [x_min, ξ] (the small-x power law) and on
+    [ξ, x_c] (structure on the scale of ξ itself), and x bunched up towards 1 on
+    [x_c, 1] (the (1 - x)^b behavior), where x_c = (1 + ξ) / 2.
+
+    ## Arguments:
+        numerator: callable
+            f(x, t), written with NumPy operations.
+
+        xi: np.ndarray
+            Shape (N,).
+
+        t: np.ndarray
+            Shape (N,).
+
+    ## Returns:
+        An array of shape (N,).
+    """
+
+    # (1): Gauss-Legendre nodes and weights, mapped from [-1, 1] onto [0, 1]:
+    nodes, weights = np.polynomial.legendre.leggauss(_KM15_NUMBER_OF_QUADRATURE_NODES)
+    nodes = 0.5 * (nodes + 1.)
+    weights = 0.5 * weights
+
+    # (2): Every point gets a row of nodes:
+    xi = xi[:, np.newaxis]
+    t = t[:, np.newaxis]
+    lower_limit = _KM15_DISPERSION_INTEGRAL_LOWER_LIMIT
+
+    # (3): The value at the pole, which we subtract:
+    numerator_at_pole = numerator(xi, t)
+
+    # (4): Where the logarithmic panel above the pole hands over to the last one:
+    x_crossover = 0.5 * (1. + xi)
+
+    # (5): Below the pole --- logarithmically-spaced x:
+    log_ratio_below = np.log(xi / lower_limit)
+    x_below = lower_limit * np.exp(nodes * log_ratio_below)
+    jacobian_below = x_below * log_ratio_below
+
+    # (6): Just above the pole --- logarithmically-spaced x again:
+    log_ratio_above = np.log(x_crossover / xi)
+    x_above = xi * np.exp(nodes * log_ratio_above)
+    jacobian_above = x_above * log_ratio_above
+
+    # (7): Up to x = 1 --- x bunched up towards x = 1:
+    x_upper = 1. - (1. - x_crossover) * (1. - nodes)**2
+    jacobian_upper = 2. * (1. - x_crossover) * (1. - nodes)
+
+    # (8): The subtracted integral on all three panels:
+    subtracted_integral = sum(
+        np.sum(weights * (numerator(x, t) - numerator_at_pole) / (x - xi) * jacobian, axis = -1)
+        for x, jacobian in ((x_below, jacobian_below), (x_above, jacobian_above), (x_upper, jacobian_upper)))
+
+    # (9): Add back the pole term, which is just a logarithm:
+    return subtracted_integral + numerator_at_pole[:, 0] * np.log((1. - xi[:, 0]) / (xi[:, 0] - lower_limit))
+
+def compute_km15_cffs_vectorized(QQ, xB, t):
+    """
+    ## Description:
+    `compute_km15_cffs` for arrays of kinematics: the dispersion integrals for
+    all points are done at once, with a fixed set of quadrature nodes (see
+    `_compute_principal_value_integral`), instead of two adaptive `quad` calls
+    per point. The two agree to about 1e-10.
+
+    ## Arguments:
+        QQ, xB, t: array-like
+            Shape (N,) each. (KM15 does not depend on Q².)
+
+    ## Returns:
+        ReH, ImH, ReE, ReHt, ImHt, ReEt, each an array of shape (N,).
+    """
+
+    # (X): Broadcast everything into flat float64 arrays:
+    QQ, xB, t = (np.ravel(value) for value in np.broadcast_arrays(
+        np.asarray(QQ, dtype = np.float64),
+        np.asarray(xB, dtype = np.float64),
+        np.asarray(t, dtype = np.float64)))
+
+    # (X): Calculate the skewnesss, xi:
+    xi = xB / (2.0 - xB)
+
+    Ct = C0 / (1.0 - t / Msub**2)**2
+
+    # (X): The two dispersion integrals, for every point:
+    DR_ReH = _compute_principal_value_integral(lambda x, t: -2. * x / (x + xi[:, np.newaxis]) * _compute_km15_imag_h(x, t), xi, t)
+    DR_ReHt = _compute_principal_value_integral(lambda x, t: -2. * xi[:, np.newaxis] / (x + xi[:, np.newaxis]) * _compute_km15_imag_ht(x, t), xi, t)
 
     # (X): Re[H]:
     real_h_km15 = DR_ReH / pi - Ct
-    
+
     # (X): Im[H]:
-    imag_h_km15 = fImH(xi)
+    imag_h_km15 = _compute_km15_imag_h(xi, t)
 
     # (X): Re[E]:
     real_e_km15 = Ct
@@ -85,9 +222,9 @@ def compute_km15_cffs(QQ, xB, t, k = 0.0):
     real_ht_km15 = DR_ReHt / pi
 
     # (X): Im[Ht]:
-    imag_ht_km15 = fImHt(xi)
+    imag_ht_km15 = _compute_km15_imag_ht(xi, t)
 
     # (X): Re[Et]:
     real_et_km15 = rpi / xi * 2.164 / ((0.0196 - t) * (1.0 - t / Mpi**2)**2)
 
-    return real_h_km15, imag_h_km15, real_e_km15, real_ht_km15, imag_ht_km15, real_et_km15
\ No newline at end of file
+    return real_h_km15, imag_h_km15, real_e_km15, real_ht_km15, imag_ht_km15, real_et_km15
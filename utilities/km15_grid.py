@@ -0,0 +1,273 @@
+"""
+A lookup table for the KM15 CFFs: we tabulate the six CFFs once on an (x_B, t)
+grid, keep the table in a memory-mapped file, and interpolate from it with
+bicubic splines. Comparing to KM15 at thousands of points, or on a dense plotting
+grid, then costs a spline evaluation instead of two dispersion integrals per point.
+"""
+
+# Native Library | hashlib
+import hashlib
+
+# Native Library | json
+import json
+
+# Native Library | os
+import os
+
+# 3rd Party Library | NumPy
+import numpy as np
+
+# 3rd Party Library | SciPy
+from scipy.interpolate import RectBivariateSpline
+
+# utilities > km15
+from utilities import km15
+from utilities.km15 import compute_km15_cffs_vectorized
+
+# utilities > replica_queue > atomic_output_path
+from utilities.replica_queue import atomic_output_path
+
+# (X): Where the table lives unless we are told otherwise:
+_KM15_GRID_DEFAULT_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "km15_grid")
+
+# (X): The two files of a table --- the CFFs at the nodes, and what they were computed with:
+_KM15_GRID_VALUES_FILE_NAME = "km15_grid.npy"
+_KM15_GRID_METADATA_FILE_NAME = "km15_grid.json"
+
+# (X): The default grid. x_B goes from HERA to JLab, and t from -2 GeV² up to 0:
+_KM15_GRID_DEFAULT_SETTINGS = {
+    "x_bjorken_range": (1e-4, 0.7),
+    "t_range": (-2.0, 0.0),
+    "number_of_x_bjorken_nodes": 256,
+    "number_of_t_nodes": 128,
+    "tolerance": 1e-4,
+}
+
+# (X): The grid is uniform in log(x_B) and in log(m² - t), where m² = 0.0196 GeV² is the
+# | pion pole in Re[Et] --- the one place where KM15 changes quickly with t:
+_KM15_GRID_T_POLE = 0.0196
+
+# (X): How many times we may double the number of nodes to meet the tolerance:
+_KM15_GRID_MAXIMUM_REFINEMENTS = 3
+
+def _transform_kinematics(x_bjorken, t):
+    """
+    ## Description:
+    Map (x_B, t) onto the coordinates that the grid is uniform in.
+    """
+    return np.log(x_bjorken), np.log(_KM15_GRID_T_POLE - t)
+
+def _complete_grid_settings(grid_settings: dict) -> dict:
+    """
+    ## Description:
+    Fill in the default grid settings, in a form that hashes the same every time.
+    """
+    grid_settings = {**_KM15_GRID_DEFAULT_SETTINGS, **grid_settings}
+    grid_settings["x_bjorken_range"] = [float(value) for value in grid_settings["x_bjorken_range"]]
+    grid_settings["t_range"] = [float(value) for value in grid_settings["t_range"]]
+
+    return grid_settings
+
+def _compute_km15_fingerprint(grid_settings: dict) -> str:
+    """
+    ## Description:
+    A hash of `utilities/km15.py` (its parameters *and* its formulas) and of the
+    grid settings. A table is only reused if its fingerprint matches.
+    """
+    with open(km15.__file__, "rb") as km15_source_file:
+        km15_source = km15_source_file.read()
+
+    return hashlib.sha256(km15_source + json.dumps(grid_settings, sort_keys = True).encode()).hexdigest()
+
+def _fit_splines(x_nodes, t_nodes, values):
+    """
+    ## Description:
+    One bicubic spline per CFF through the tabulated values, in the grid coordinates.
+    """
+    return [RectBivariateSpline(x_nodes, t_nodes, cff_values, kx = 3, ky = 3) for cff_values in values]
+
+def _tabulate_km15_cffs(grid_settings: dict, number_of_x_bjorken_nodes: int, number_of_t_nodes: int):
+    """
+    ## Description:
+    The six KM15 CFFs at every node of the grid, and the interpolation error,
+    estimated at the center of every cell.
+
+    ## Returns:
+        The nodes in the grid coordinates, the (6, N_x, N_t) table, and the
+        error bound of each CFF.
+    """
+
+    # (1): The nodes, uniform in the grid coordinates:
+    x_limits, t_limits = _transform_kinematics(np.array(grid_settings["x_bjorken_range"]), np.array(grid_settings["t_range"]))
+    x_nodes = np.linspace(x_limits[0], x_limits[1], number_of_x_bjorken_nodes)
+
+    # (1.1): log(m² - t) *decreases* with t, so we flip it around to keep the nodes ascending:
+    t_nodes = np.linspace(t_limits[1], t_limits[0], number_of_t_nodes)
+
+    # (2): KM15 at every node:
+    x_grid, t_grid = np.meshgrid(np.exp(x_nodes), _KM15_GRID_T_POLE - np.exp(t_nodes), indexing = "ij")
+    values = np.array(compute_km15_cffs_vectorized(np.ones_like(x_grid), x_grid, t_grid)).reshape(6, number_of_x_bjorken_nodes, number_of_t_nodes)
+
+    # (3): KM15 at the center of every cell, which is as far from the nodes as it gets:
+    x_centers = 0.5 * (x_nodes[1:] + x_nodes[:-1])
+    t_centers = 0.5 * (t_nodes[1:] + t_nodes[:-1])
+    x_center_grid, t_center_grid = np.meshgrid(np.exp(x_centers), _KM15_GRID_T_POLE - np.exp(t_centers), indexing = "ij")
+    exact_values = np.array(compute_km15_cffs_vectorized(np.ones_like(x_center_grid), x_center_grid, t_center_grid)).reshape(6, len(x_centers), len(t_centers))
+
+    # (4): The error of the splines there, relative to 1 + |CFF|:
+    interpolated_values = np.array([spline(x_centers, t_centers) for spline in _fit_splines(x_nodes, t_nodes, values)])
+    error_bound = np.max(np.abs(interpolated_values - exact_values) / (1. + np.abs(exact_values)), axis = (1, 2))
+
+    return x_nodes, t_nodes, values, error_bound
+
+def build_km15_grid(directory: str = _KM15_GRID_DEFAULT_DIRECTORY, **grid_settings) -> str:
+    """
+    ## Description:
+    Tabulate the six KM15 CFFs on an (x_B, t) grid and save the table to
+    `directory`. If the interpolation error (relative to 1 + |CFF|) is above
+    the tolerance, we double the number of nodes along both axes and try again.
+
+    ## Arguments:
+        directory: str
+            Where to put the table.
+
+        grid_settings:
+            Any of `x_bjorken_range`, `t_range`, `number_of_x_bjorken_nodes`,
+            `number_of_t_nodes`, and `tolerance` --- see `_KM15_GRID_DEFAULT_SETTINGS`.
+
+    ## Returns:
+        The directory of the table.
+    """
+
+    # (1): Fill in the defaults:
+    grid_settings = _complete_grid_settings(grid_settings)
+
+    # (2): Refine the grid until the splines are accurate enough:
+    number_of_x_bjorken_nodes = grid_settings["number_of_x_bjorken_nodes"]
+    number_of_t_nodes = grid_settings["number_of_t_nodes"]
+
+    for refinement in range(_KM15_GRID_MAXIMUM_REFINEMENTS + 1):
+
+        x_nodes, t_nodes, values, error_bound = _tabulate_km15_cffs(grid_settings, number_of_x_bjorken_nodes, number_of_t_nodes)
+
+        if np.all(error_bound <= grid_settings["tolerance"]) or refinement == _KM15_GRID_MAXIMUM_REFINEMENTS:
+            break
+
+        number_of_x_bjorken_nodes = 2 * number_of_x_bjorken_nodes - 1
+        number_of_t_nodes = 2 * number_of_t_nodes - 1
+
+    if np.any(error_bound > grid_settings["tolerance"]):
+        print(f"> [WARNING]: The KM15 grid only reaches an error of {error_bound.max():.2e} (tolerance: {grid_settings['tolerance']:.2e}).")
+
+    os.makedirs(directory, exist_ok = True)
+
+    # (3): Write the table into a memory-mapped .npy file --- first under a temporary name of our own, so
+    # | that nobody ever loads half a table, even if two processes build it at once:
+    with atomic_output_path(os.path.join(directory, _KM15_GRID_VALUES_FILE_NAME)) as temporary_values_path:
+        memory_mapped_values = np.lib.format.open_memmap(temporary_values_path, mode = "w+", dtype = np.float64, shape = values.shape)
+        memory_mapped_values[:] = values
+        memory_mapped_values.flush()
+        del memory_mapped_values
+
+    # (4): ... and then what it was computed with:
+    metadata = {
+        "fingerprint": _compute_km15_fingerprint(grid_settings),
+        "grid_settings": grid_settings,
+        "x_nodes": x_nodes.tolist(),
+        "t_nodes": t_nodes.tolist(),
+        "error_bound": error_bound.tolist(),
+    }
+
+    with atomic_output_path(os.path.join(directory, _KM15_GRID_METADATA_FILE_NAME)) as temporary_metadata_path:
+        with open(temporary_metadata_path, "w", encoding = "utf-8") as metadata_file:
+            json.dump(metadata, metadata_file)
+
+    return directory
+
+class KM15Grid:
+    """
+    ## Description:
+    The KM15 CFFs, interpolated from a table made by `build_km15_grid`. Call it
+    like `compute_km15_cffs_vectorized`. Points outside of the table are
+    computed exactly instead.
+
+    ## Attributes:
+        values: np.memmap
+            The (6, N_x, N_t) table.
+
+        error_bound: np.ndarray
+            For each of the six CFFs, the largest interpolation error found on
+            the grid, relative to 1 + |CFF|.
+    """
+
+    def __init__(self, directory: str):
+
+        with open(os.path.join(directory, _KM15_GRID_METADATA_FILE_NAME), "r", encoding = "utf-8") as metadata_file:
+            self.metadata = json.load(metadata_file)
+
+        self.values = np.load(os.path.join(directory, _KM15_GRID_VALUES_FILE_NAME), mmap_mode = "r")
+        self.error_bound = np.array(self.metadata["error_bound"])
+
+        self.x_nodes = np.array(self.metadata["x_nodes"])
+        self.t_nodes = np.array(self.metadata["t_nodes"])
+
+        # (X): The splines are fitted the first time they are needed:
+        self._splines = None
+
+    def __call__(self, QQ, xB, t):
+        """
+        ## Returns:
+            ReH, ImH, ReE, ReHt, ImHt, ReEt, each an array of shape (N,).
+        """
+
+        # (1): Broadcast everything into flat float64 arrays:
+        QQ, xB, t = (np.ravel(value) for value in np.broadcast_arrays(
+            np.asarray(QQ, dtype = np.float64),
+            np.asarray(xB, dtype = np.float64),
+            np.asarray(t, dtype = np.float64)))
+
+        if self._splines is None:
+            self._splines = _fit_splines(self.x_nodes, self.t_nodes, self.values)
+
+        # (2): Which points the table covers (unphysical ones come out as NaN, i.e., not covered):
+        with np.errstate(invalid = "ignore", divide = "ignore"):
+            x_coordinates, t_coordinates = _transform_kinematics(xB, t)
+
+        is_on_grid = (
+            (x_coordinates >= self.x_nodes[0]) & (x_coordinates <= self.x_nodes[-1]) &
+            (t_coordinates >= self.t_nodes[0]) & (t_coordinates <= self.t_nodes[-1]))
+
+        # (3): Interpolate those:
+        cffs = np.empty((6, xB.shape[0]))
+        cffs[:, is_on_grid] = [spline.ev(x_coordinates[is_on_grid], t_coordinates[is_on_grid]) for spline in self._splines]
+
+        # (4): Compute the rest exactly:
+        if not np.all(is_on_grid):
+            cffs[:, ~is_on_grid] = compute_km15_cffs_vectorized(QQ[~is_on_grid], xB[~is_on_grid], t[~is_on_grid])
+
+        return tuple(cffs)
+
+def load_km15_grid(directory: str = _KM15_GRID_DEFAULT_DIRECTORY, **grid_settings) -> KM15Grid:
+    """
+    ## Description:
+    Open the KM15 table in `directory`. It is (re)built first if it does not
+    exist, if `utilities/km15.py` has changed since it was built, or if it was
+    built with different `grid_settings`.
+    """
+
+    # (1): The fingerprint that the table should have:
+    expected_fingerprint = _compute_km15_fingerprint(_complete_grid_settings(grid_settings))
+
+    # (2): The fingerprint that it does have, if there is one:
+    metadata_path = os.path.join(directory, _KM15_GRID_METADATA_FILE_NAME)
+    current_fingerprint = None
+
+    if os.path.exists(metadata_path) and os.path.exists(os.path.join(directory, _KM15_GRID_VALUES_FILE_NAME)):
+        with open(metadata_path, "r", encoding = "utf-8") as metadata_file:
+            current_fingerprint = json.load(metadata_file).get("fingerprint")
+
+    # (3): Rebuild only if they differ:
+    if current_fingerprint != expected_fingerprint:
+        build_km15_grid(directory, **grid_settings)
+
+    return KM15Grid(directory)
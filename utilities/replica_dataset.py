@@ -0,0 +1,146 @@
+"""
+The input pipeline of the replicas: the data of a run becomes tensors *once*, and
+every replica (and every subset of the data, e.g. one kinematic set) is a
+`tf.data` pipeline of row indices into them. Nothing is converted or copied per
+replica --- a batch is gathered from the shared tensors just before it is needed.
+"""
+
+# 3rd Party Library | NumPy:
+import numpy as np
+
+# 3rd Party Library | TensorFlow:
+import tensorflow as tf
+
+class ReplicaDatasets:
+    """
+    ## Description:
+    The kinematics, the kinematic bundle, and the pseudodata of every replica,
+    as tensors, from which `get_dataset` builds the (inputs, targets) batches of
+    one replica, in the input format of `build_simultaneous_model(use_kinematic_bundle = True)`.
+
+    ## Arguments:
+        kinematics: np.ndarray
+            Shape (N, 5): [Q², x_B, t, k, φ] --- in memory, or a memory-mapped array.
+
+        kinematic_bundle: np.ndarray
+            Shape (N, ...): see `precompute_kinematic_bundle`.
+
+        replica_cross_sections: np.ndarray
+            Shape (R, N): the pseudodata of every replica.
+
+        replica_beam_spin_asymmetries: np.ndarray
+            Optional, shape (R, N): the BSA pseudodata of every replica, NaN where
+            there is no BSA. With it, the targets of `get_dataset` and `get_full_batch`
+            are (cross-section, BSA), for `build_simultaneous_model(fit_bsa = True)`.
+    """
+
+    def __init__(self, kinematics, kinematic_bundle, replica_cross_sections, replica_beam_spin_asymmetries = None):
+
+        # (1): The one and only conversion to tensors:
+        self.kinematics = tf.convert_to_tensor(np.asarray(kinematics, dtype = np.float32))
+        self.kinematic_bundle = tf.convert_to_tensor(np.asarray(kinematic_bundle, dtype = np.float32))
+        self.replica_cross_sections = tf.convert_to_tensor(np.asarray(replica_cross_sections, dtype = np.float32))
+
+        # (2): The BSA, if the replicas fit it, too:
+        self.replica_beam_spin_asymmetries = None
+
+        if replica_beam_spin_asymmetries is not None:
+            self.replica_beam_spin_asymmetries = tf.convert_to_tensor(np.asarray(replica_beam_spin_asymmetries, dtype = np.float32))
+
+    @property
+    def number_of_replicas(self) -> int:
+        return int(self.replica_cross_sections.shape[0])
+
+    def _gather_replica_targets(self, replica_index: int, row_indices):
+        """
+        ## Description:
+        The targets of replica `replica_index` at `row_indices`: its cross-section
+        --- and its BSA, if there is one.
+        """
+        cross_section = tf.gather(self.replica_cross_sections[replica_index], row_indices)
+
+        if self.replica_beam_spin_asymmetries is None:
+            return cross_section
+
+        return cross_section, tf.gather(self.replica_beam_spin_asymmetries[replica_index], row_indices)
+
+    def _batch_rows(self, row_indices, batch_size: int, shuffle_seed, gather_targets) -> tf.data.Dataset:
+        """
+        ## Description:
+        The pipeline behind `get_dataset` and `get_ensemble_dataset`: only the indices
+        are cached; the rows of a batch are gathered from the shared tensors, and the
+        next batch is prefetched while the model trains on this one.
+        """
+
+        # (1): The rows of this dataset, as a (small) tensor of indices:
+        index_dataset = tf.data.Dataset.from_tensor_slices(np.asarray(row_indices, dtype = np.int64)).cache()
+
+        # (2): A deterministic shuffle, if we want one:
+        if shuffle_seed is not None:
+            index_dataset = index_dataset.shuffle(
+                buffer_size = len(row_indices),
+                seed = shuffle_seed,
+                reshuffle_each_iteration = True)
+
+        # (3): Gather whole batches at once, rather than row by row:
+        return index_dataset.batch(batch_size).map(
+            lambda batch_indices: (
+                (tf.gather(self.kinematics, batch_indices), tf.gather(self.kinematic_bundle, batch_indices)),
+                gather_targets(batch_indices)),
+            num_parallel_calls = tf.data.AUTOTUNE,
+            deterministic = True).prefetch(tf.data.AUTOTUNE)
+
+    def get_dataset(
+            self,
+            replica_index: int,
+            row_indices,
+            batch_size: int,
+            shuffle_seed: int = None) -> tf.data.Dataset:
+        """
+        ## Description:
+        The batches of replica `replica_index` over the rows `row_indices` (e.g. its
+        training split). With a `shuffle_seed`, the rows are reshuffled every epoch
+        --- in the same order, every time the replica is trained with that seed.
+        """
+        return self._batch_rows(
+            row_indices,
+            batch_size,
+            shuffle_seed,
+            lambda batch_indices: self._gather_replica_targets(replica_index, batch_indices))
+
+    def get_full_batch(self, replica_index: int, row_indices) -> tuple:
+        """
+        ## Description:
+        All of the rows `row_indices` of replica `replica_index` as one batch,
+        ((kinematics, kinematic bundle), pseudodata), for `fit_full_batch`.
+        """
+        row_indices = tf.convert_to_tensor(np.asarray(row_indices, dtype = np.int64))
+
+        return (
+            (tf.gather(self.kinematics, row_indices), tf.gather(self.kinematic_bundle, row_indices)),
+            self._gather_replica_targets(replica_index, row_indices))
+
+    def get_ensemble_dataset(
+            self,
+            replica_training_masks,
+            batch_size: int,
+            shuffle_seed: int = None) -> tf.data.Dataset:
+        """
+        ## Description:
+        The batches of `build_ensemble_model`: every row, with the targets
+        [pseudodata of every replica | training mask of every replica] that
+        `ensemble_training_loss` wants.
+
+        ## Arguments:
+            replica_training_masks: np.ndarray
+                Shape (N, R): 1 where a row is in the training split of a replica, 0 elsewhere.
+        """
+        ensemble_targets = tf.concat([
+            tf.transpose(self.replica_cross_sections),
+            tf.convert_to_tensor(np.asarray(replica_training_masks, dtype = np.float32))], axis = 1)
+
+        return self._batch_rows(
+            np.arange(ensemble_targets.shape[0]),
+            batch_size,
+            shuffle_seed,
+            lambda batch_indices: tf.gather(ensemble_targets, batch_indices))
@@ -0,0 +1,375 @@
+"""
+A queue of replicas that lives entirely in a (shared) run directory, so that any
+number of workers --- processes on one machine, or jobs on several nodes of a
+cluster with a shared filesystem --- can train the replicas of one run together.
+There is no server: a replica is *claimed* by creating its claim file, which only
+one worker can do, and it is *done* once its done file exists.
+"""
+
+# Native Library | contextlib
+import contextlib
+
+# Native Library | datetime
+import datetime
+
+# Native Library | json
+import json
+
+# Native Library | os
+import os
+
+# Native Library | socket
+import socket
+
+# Native Library | threading
+import threading
+
+# Native Library | time
+import time
+
+# (X): The subdirectory of the run directory that holds the queue:
+_REPLICA_QUEUE_DIRECTORY_NAME = "queue"
+
+# (X): What the queue was made for --- every worker has to agree on it:
+_REPLICA_QUEUE_MANIFEST_FILE_NAME = "manifest.json"
+
+# (X): Whoever claims this file runs the merge step:
+_REPLICA_QUEUE_MERGE_CLAIM_FILE_NAME = "merge.claimed"
+
+# (X): A claim that nobody has renewed for this long belongs to a dead worker:
+_REPLICA_QUEUE_STALE_CLAIM_TIMEOUT_IN_SECONDS = 1800.
+
+# (X): How many times a live worker renews its claim within the timeout:
+_REPLICA_QUEUE_HEARTBEATS_PER_TIMEOUT = 10
+
+def _compute_temporary_path(path: str) -> str:
+    """
+    ## Description:
+    A hidden name next to `path` that no other writer uses --- not even one on another node.
+    """
+    directory, file_name = os.path.split(path)
+
+    return os.path.join(directory, f".{socket.gethostname()}.{os.getpid()}.{file_name}")
+
+@contextlib.contextmanager
+def atomic_output_path(path: str):
+    """
+    ## Description:
+    Write a file under a temporary name in the same directory, and move it to
+    `path` only once it has been written in full. Someone reading `path` (e.g.
+    the merge step) never sees half a file, and a crash leaves no file behind.
+    The temporary name keeps the extension, for writers that look at it (Keras does).
+
+    ## Example:
+        with atomic_output_path("replica_1.keras") as temporary_path:
+            model.save(temporary_path)
+    """
+
+    # (1): A name that no other writer uses:
+    temporary_path = _compute_temporary_path(path)
+
+    try:
+        yield temporary_path
+
+        # (2): Only a complete file gets the real name:
+        os.replace(temporary_path, path)
+
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+def create_file_exclusively(path: str, write_file) -> bool:
+    """
+    ## Description:
+    Create `path` with `write_file(temporary_path)` --- unless it exists already,
+    in which case return `False`. Exactly one of several concurrent callers gets
+    `True`, and nobody ever sees the file half-written: it is written under a
+    temporary name first, and then hard-linked to `path`, which fails if `path` exists.
+    """
+    temporary_path = _compute_temporary_path(path)
+
+    try:
+        write_file(temporary_path)
+        os.link(temporary_path, path)
+
+    except FileExistsError:
+        return False
+
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+    return True
+
+class ReplicaQueue:
+    """
+    ## Description:
+    The replicas 1, ..., R of one run, as a queue of tasks in `run_directory/queue`.
+
+    ## Notes:
+    1. A claim is a file that is created with a hard link: that is atomic, also on
+    NFS and the like, and it fails if the file is there already. The claim records
+    who claimed the replica, and when.
+
+    2. A worker renews its claim while it trains (see `keep_claim_alive`), so a
+    claim that has not been renewed for a while belongs to a worker that died.
+    `release_stale_claims` hands such replicas back to the queue.
+
+    3. A stale claim is released by renaming it first: of several workers that
+    found the same stale claim, only one can rename it, and if the claim it got
+    hold of is fresh after all (another worker has released and claimed the
+    replica in the meantime), it is put back untouched.
+    """
+
+    def __init__(self, run_directory: str, number_of_replicas: int, data_file_name: str = None):
+
+        # (1): The queue lives with the results:
+        self.run_directory = run_directory
+        self.number_of_replicas = number_of_replicas
+        self.queue_directory = os.path.join(run_directory, _REPLICA_QUEUE_DIRECTORY_NAME)
+
+        os.makedirs(self.queue_directory, exist_ok = True)
+
+        # (2): The first worker writes down what the queue is for --- everyone else checks it:
+        manifest = {"number_of_replicas": number_of_replicas, "data_file_name": data_file_name}
+        manifest_path = os.path.join(self.queue_directory, _REPLICA_QUEUE_MANIFEST_FILE_NAME)
+
+        if not self._create_exclusively(manifest_path, manifest):
+            with open(manifest_path, "r", encoding = "utf-8") as manifest_file:
+                existing_manifest = json.load(manifest_file)
+
+            if existing_manifest != manifest:
+                raise ValueError(f"> [ERROR]: The queue in {self.queue_directory} is for {existing_manifest}, not {manifest}.")
+
+    def _claim_path(self, replica_index: int) -> str:
+        return os.path.join(self.queue_directory, f"replica_{replica_index + 1}.claimed")
+
+    def _done_path(self, replica_index: int) -> str:
+        return os.path.join(self.queue_directory, f"replica_{replica_index + 1}.done")
+
+    def _create_exclusively(self, path: str, contents: dict) -> bool:
+        """
+        ## Description:
+        Create the JSON file `path` with `contents`, if nobody else has --- see `create_file_exclusively`.
+        """
+        def write_claim_file(temporary_path):
+            with open(temporary_path, "w", encoding = "utf-8") as claim_file:
+                json.dump(contents, claim_file)
+
+        return create_file_exclusively(path, write_claim_file)
+
+    def _describe_worker(self) -> dict:
+        return {"host": socket.gethostname(), "pid": os.getpid(), "time": datetime.datetime.now().isoformat()}
+
+    def is_done(self, replica_index: int) -> bool:
+        return os.path.exists(self._done_path(replica_index))
+
+    def claim(self, replica_index: int) -> bool:
+        """
+        ## Description:
+        Try to take replica `replica_index` (from 0). `True` means that it is ours to train.
+        """
+        if self.is_done(replica_index):
+            return False
+
+        return self._create_exclusively(self._claim_path(replica_index), self._describe_worker())
+
+    def claim_next(self):
+        """
+        ## Description:
+        Take the first replica that nobody has claimed yet, or return `None` if
+        there is no such replica left.
+        """
+        for replica_index in range(self.number_of_replicas):
+            if self.claim(replica_index):
+                return replica_index
+
+        return None
+
+    def renew_claim(self, replica_index: int):
+        """
+        ## Description:
+        Show that the worker of replica `replica_index` is still alive: the age of a claim is
+        the time since it was last renewed.
+        """
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(self._claim_path(replica_index))
+
+    def mark_done(self, replica_index: int):
+        """
+        ## Description:
+        Record that the results of replica `replica_index` are all written.
+        """
+        with atomic_output_path(self._done_path(replica_index)) as temporary_path:
+            with open(temporary_path, "w", encoding = "utf-8") as done_file:
+                json.dump(self._describe_worker(), done_file)
+
+    def release(self, replica_index: int):
+        """
+        ## Description:
+        Give up on a claimed replica (e.g. its training failed), so that another worker can take it.
+        """
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._claim_path(replica_index))
+
+    def _release_if_stale(self, replica_index: int, maximum_age_in_seconds: float) -> bool:
+        """
+        ## Description:
+        Release replica `replica_index` if its claim is older than `maximum_age_in_seconds`.
+        `True` means that *this* worker released it --- see Note 3 of the class.
+        """
+        claim_path = self._claim_path(replica_index)
+
+        # (1): A quick look, without touching the claim:
+        try:
+            if time.time() - os.path.getmtime(claim_path) <= maximum_age_in_seconds or self.is_done(replica_index):
+                return False
+
+        except FileNotFoundError:
+            return False
+
+        # (2): Take the claim out of the way --- only one worker can:
+        tombstone_path = f"{_compute_temporary_path(claim_path)}.{threading.get_ident()}.released"
+
+        try:
+            os.rename(claim_path, tombstone_path)
+
+        except FileNotFoundError:
+            return False
+
+        # (3): Was it still the stale claim that we renamed?
+        try:
+            claim_is_stale = time.time() - os.stat(tombstone_path).st_mtime > maximum_age_in_seconds
+
+            # (3.1): No --- it is the claim of a live worker, which gets it back:
+            if not claim_is_stale:
+                with contextlib.suppress(FileExistsError):
+                    os.link(tombstone_path, claim_path)
+
+        finally:
+            os.remove(tombstone_path)
+
+        return claim_is_stale
+
+    def release_stale_claims(self, maximum_age_in_seconds: float) -> list:
+        """
+        ## Description:
+        Release every replica whose claim was last renewed more than `maximum_age_in_seconds`
+        ago and is still not done --- its worker has died. Returns the replica
+        indices that this worker released: of several workers that find the same
+        stale claim at once, only one releases it.
+        """
+        return [
+            replica_index for replica_index in range(self.number_of_replicas)
+            if self._release_if_stale(replica_index, maximum_age_in_seconds)]
+
+    def pending_replicas(self) -> list:
+        return [replica_index for replica_index in range(self.number_of_replicas) if not self.is_done(replica_index)]
+
+    def unclaimed_replicas(self) -> list:
+        return [replica_index for replica_index in self.pending_replicas() if not os.path.exists(self._claim_path(replica_index))]
+
+    def is_complete(self) -> bool:
+        return not self.pending_replicas()
+
+    def claim_merge(self) -> bool:
+        """
+        ## Description:
+        Once every replica is done, exactly one worker gets `True` here, and runs the merge step.
+        """
+        if not self.is_complete():
+            return False
+
+        return self._create_exclusively(os.path.join(self.queue_directory, _REPLICA_QUEUE_MERGE_CLAIM_FILE_NAME), self._describe_worker())
+
+@contextlib.contextmanager
+def keep_claim_alive(replica_queue: ReplicaQueue, replica_index: int, heartbeat_interval_in_seconds: float):
+    """
+    ## Description:
+    Renew the claim of replica `replica_index` every `heartbeat_interval_in_seconds`,
+    from a background thread, for as long as the block runs. If the process dies,
+    so does the thread, and the claim goes stale.
+    """
+    stopped = threading.Event()
+
+    def renew_claim_until_stopped():
+        while not stopped.wait(heartbeat_interval_in_seconds):
+            replica_queue.renew_claim(replica_index)
+
+    heartbeat_thread = threading.Thread(target = renew_claim_until_stopped, daemon = True)
+    heartbeat_thread.start()
+
+    try:
+        yield
+
+    finally:
+        stopped.set()
+        heartbeat_thread.join()
+
+def wait_for_other_workers(
+        replica_queue: ReplicaQueue,
+        stale_claim_timeout_in_seconds: float = _REPLICA_QUEUE_STALE_CLAIM_TIMEOUT_IN_SECONDS) -> list:
+    """
+    ## Description:
+    Once a worker finds nothing left to claim, the replicas that are still pending
+    belong to other workers. Wait --- checking a few times per timeout --- until
+    they are all done, or until one of them is back in the queue: its claim went
+    stale (its worker died), or its worker gave it up.
+
+    ## Returns:
+        The replica indices whose stale claims this worker released. If there are
+        none, and the queue is not complete, a replica was given up: work on the queue again.
+    """
+    while not replica_queue.is_complete():
+
+        # (1): Replicas that nobody trains any more:
+        released_replica_indices = replica_queue.release_stale_claims(stale_claim_timeout_in_seconds)
+
+        if released_replica_indices or replica_queue.unclaimed_replicas():
+            return released_replica_indices
+
+        # (2): Everything pending is in the hands of a live worker --- for now:
+        time.sleep(stale_claim_timeout_in_seconds / _REPLICA_QUEUE_HEARTBEATS_PER_TIMEOUT)
+
+    return []
+
+def work_on_replica_queue(
+        replica_queue: ReplicaQueue,
+        train_replica_function,
+        stale_claim_timeout_in_seconds: float = _REPLICA_QUEUE_STALE_CLAIM_TIMEOUT_IN_SECONDS) -> list:
+    """
+    ## Description:
+    The loop of one worker: claim a replica, `train_replica_function(replica_index)`,
+    mark it done, and again --- until no replica is left to claim. A replica whose
+    training raises is released again before the error is passed on. While it
+    trains, its claim is renewed; before every claim, the replicas of workers whose
+    claims are older than `stale_claim_timeout_in_seconds` go back to the queue.
+
+    ## Returns:
+        The replica indices that this worker trained.
+    """
+    trained_replica_indices = []
+
+    while True:
+
+        # (1): Take back what dead workers left behind, then the next replica --- or stop, if there is none left:
+        replica_queue.release_stale_claims(stale_claim_timeout_in_seconds)
+        replica_index = replica_queue.claim_next()
+
+        if replica_index is None:
+            break
+
+        # (2): Train it, and hand it back if that fails:
+        try:
+            with keep_claim_alive(replica_queue, replica_index, stale_claim_timeout_in_seconds / _REPLICA_QUEUE_HEARTBEATS_PER_TIMEOUT):
+                train_replica_function(replica_index)
+
+        except BaseException:
+            replica_queue.release(replica_index)
+            raise
+
+        # (3): Only now is it done:
+        replica_queue.mark_done(replica_index)
+        trained_replica_indices.append(replica_index)
+
+    return trained_replica_indices